@@ -0,0 +1,19 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2020-2022, Frederico Martins
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Performance benchmarks.
+
+Each `bench_*` module can be run on its own from the project root (with
+the library importable, e.g. installed in the venv):
+
+    python -m benchmarks.bench_format
+
+The regression suite (`benchmarks.suite`) measures the hot paths of the
+library, saves the results to JSON and compares two result files:
+
+    python -m benchmarks.suite run -o results.json
+    python -m benchmarks.suite compare before.json after.json
+"""
@@ -0,0 +1,90 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2020-2022, Frederico Martins
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Allocation benchmarks.
+
+Compares the allocation of a single currency (`allocate`, `split`) and
+of a column of amounts, one currency at a time (list) and in a single
+pass (`CurrencyArray`, with the NumPy and the `array.array` backends).
+
+    python -m benchmarks.bench_allocate [rows]
+"""
+
+from __future__ import annotations
+
+import sys
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+from benchmarks.utils import report, run
+from multicurrency import CurrencyArray, Euro, FixedCurrency, arrays
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+ROWS = 1_000_000
+RATIOS = [Decimal('0.5'), Decimal('0.3'), Decimal('0.2')]
+
+
+def _array_backend(
+        func: Callable[[], object]) -> Callable[[], object]:
+    """Runs `func` with the `array.array` backend.
+
+    Args:
+        func (Callable[[], object]): Function to run.
+
+    Returns:
+        Callable[[], object]: wrapped function.
+    """
+    def wrapper() -> object:
+        numpy, arrays._numpy = arrays._numpy, None
+        try:
+            return func()
+        finally:
+            arrays._numpy = numpy
+    return wrapper
+
+
+def cases(rows: int = ROWS) -> dict[str, Callable[[], object]]:
+    """Allocation benchmark cases.
+
+    Args:
+        rows (int, optional): Number of amounts. Defaults to 1_000_000.
+
+    Returns:
+        dict[str, Callable[[], object]]: benchmark cases.
+    """
+    euro = Euro('1234.57')
+    fixed = FixedCurrency.from_currency(euro)
+    ledger = [Euro(Decimal(i * 7919 % 10 ** 7) / 100) for i in range(rows)]
+    column = CurrencyArray.from_currencies(ledger)
+    cases = {
+        'Euro.allocate': lambda: euro.allocate(RATIOS),
+        'Euro.split': lambda: euro.split(3),
+        'FixedCurrency.allocate': lambda: fixed.allocate(RATIOS),
+        'FixedCurrency.split': lambda: fixed.split(3),
+        f'list allocate [{rows} rows]': lambda: [
+            e.allocate(RATIOS) for e in ledger],
+        f'array allocate [{rows} rows]': lambda: column.allocate(RATIOS),
+        f'array split [{rows} rows]': lambda: column.split(3),
+    }
+    if arrays._numpy is not None:
+        flat = _array_backend(lambda: CurrencyArray.from_currencies(
+            ledger))()
+        cases.update({
+            f'array allocate [{rows} rows, array]': _array_backend(
+                lambda: flat.allocate(RATIOS)),
+            f'array split [{rows} rows, array]': _array_backend(
+                lambda: flat.split(3)),
+        })
+    return cases
+
+
+if __name__ == '__main__':
+    print(f'backend: {"numpy" if arrays._numpy else "array"}')
+    report(run(cases(*(int(arg) for arg in sys.argv[1:2]))))
@@ -0,0 +1,67 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2020-2022, Frederico Martins
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Arithmetic benchmarks.
+
+Compares the operations (that use the trusted construction path) with
+building the result through the class constructor, as the operations
+used to do.
+
+    python -m benchmarks.bench_arithmetic
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+from benchmarks.utils import report, run
+from multicurrency import Currency, Euro
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+ROWS = 10_000
+
+
+def cases() -> dict[str, Callable[[], object]]:
+    """Arithmetic benchmark cases.
+
+    Returns:
+        dict[str, Callable[[], object]]: benchmark cases.
+    """
+    euro = Euro(Decimal('1234.56'))
+    other = Euro(Decimal('0.01'))
+    generic = Currency(Decimal('1234.56'), alpha_code='EUR')
+    generic_other = Currency(Decimal('0.01'), alpha_code='EUR')
+    ledger = [Euro(Decimal(i) / 100) for i in range(ROWS)]
+
+    def legacy_sum() -> Euro:
+        total = Euro(0)
+        for row in ledger:
+            total = Euro(total.amount + row.amount, total.pattern)
+        return total
+
+    return {
+        'legacy Euro add (constructor)': lambda: Euro(
+            euro.amount + other.amount, euro.pattern),
+        'Euro + Euro': lambda: euro + other,
+        'Euro - Euro': lambda: euro - other,
+        'Euro * int': lambda: euro * 3,
+        'Euro * Decimal': lambda: euro * Decimal('1.23'),
+        'Euro / int': lambda: euro / 3,
+        '-Euro': lambda: -euro,
+        'round(Euro, 2)': lambda: round(euro, 2),
+        'Currency + Currency': lambda: generic + generic_other,
+        f'legacy sum of {ROWS} Euro (constructor)': legacy_sum,
+        f'sum of {ROWS} Euro': lambda: sum(ledger, Euro(0)),
+    }
+
+
+if __name__ == '__main__':
+    report(run(cases()))
@@ -0,0 +1,67 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2020-2022, Frederico Martins
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Currency array benchmarks.
+
+Compares batch operations on a `CurrencyArray` with the same operations
+on a list of currencies. The array backend is NumPy when installed
+(`array.array` otherwise).
+
+    python -m benchmarks.bench_arrays [rows]
+"""
+
+from __future__ import annotations
+
+import sys
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+from benchmarks.utils import report, run
+from multicurrency import CurrencyArray, Euro
+from multicurrency.arrays import _numpy
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+ROWS = 100_000
+
+
+def cases(rows: int = ROWS) -> dict[str, Callable[[], object]]:
+    """Currency array benchmark cases.
+
+    Args:
+        rows (int, optional): Number of amounts. Defaults to 100_000.
+
+    Returns:
+        dict[str, Callable[[], object]]: benchmark cases.
+    """
+    ledger = [Euro(Decimal(i) / 100) for i in range(rows)]
+    other = [Euro(Decimal(i) / 1000) for i in range(rows)]
+    array = CurrencyArray.from_currencies(ledger)
+    other_array = CurrencyArray.from_currencies(other)
+    limit = Euro(rows / 200)
+    return {
+        'list sum': lambda: sum(ledger, Euro(0)),
+        'array sum': array.sum,
+        'list add': lambda: [a + b for a, b in zip(ledger, other)],
+        'array add': lambda: array + other_array,
+        'list * Decimal': lambda: [a * Decimal('1.07') for a in ledger],
+        'array * Decimal': lambda: array * Decimal('1.07'),
+        'list max': lambda: max(ledger),
+        'array max': array.max,
+        'list filter': lambda: [a for a in ledger if a > limit],
+        'array filter': lambda: array[array > limit],
+        'array from currencies': lambda: CurrencyArray.from_currencies(
+            ledger),
+        'array to currencies': array.to_currencies,
+    }
+
+
+if __name__ == '__main__':
+    print(f'backend: {"numpy" if _numpy else "array"}')
+    report(run(cases(*(int(arg) for arg in sys.argv[1:2]))))
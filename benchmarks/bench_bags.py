@@ -0,0 +1,95 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2020-2022, Frederico Martins
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Money bag benchmarks.
+
+Measures the throughput of `MoneyBag` accumulating postings spread over
+30 currencies, compared with a hand written dict of totals. The
+postings are streamed (constant memory) from a pool of currencies.
+
+    python -m benchmarks.bench_bags [postings]
+"""
+
+from __future__ import annotations
+
+import sys
+from decimal import Decimal
+from itertools import cycle, islice
+from typing import TYPE_CHECKING
+
+from benchmarks.utils import measure
+from multicurrency import MoneyBag, currencies
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from multicurrency import Currency
+
+
+POSTINGS = 10_000_000
+CURRENCIES = 30
+
+
+def _totals(postings: Iterable[Currency]) -> dict[str, Currency]:
+    """Hand written dict of totals (the usual consumer bookkeeping)."""
+    totals = {}
+    for posting in postings:
+        code = posting.alpha_code
+        totals[code] = totals[code] + posting if code in totals else posting
+    return totals
+
+
+def cases(postings: int = POSTINGS) -> dict[str, Callable[[], object]]:
+    """Money bag benchmark cases.
+
+    Args:
+        postings (int, optional): Number of postings. Defaults to
+            10_000_000.
+
+    Returns:
+        dict[str, Callable[[], object]]: benchmark cases.
+    """
+    types = {}
+    for name in currencies.__all__:
+        currency = getattr(currencies, name)
+        types.setdefault(currency(0).alpha_code, currency)
+        if len(types) == CURRENCIES:
+            break
+    pool = [
+        currency(Decimal(i) / 100)
+        for i in range(1000)
+        for currency in types.values()]
+
+    def stream() -> Iterable[Currency]:
+        return islice(cycle(pool), postings)
+
+    def add() -> MoneyBag:
+        bag = MoneyBag()
+        for posting in stream():
+            bag += posting
+        return bag
+
+    def merge() -> MoneyBag:
+        workers = 8
+        parts = [MoneyBag(islice(stream(), i, None, workers))
+                 for i in range(workers)]
+        return MoneyBag(parts)
+
+    return {
+        'dict of totals': lambda: _totals(stream()),
+        'MoneyBag +=': add,
+        'MoneyBag.update': lambda: MoneyBag().update(stream()),
+        'MoneyBag merge (8 bags)': merge,
+    }
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if sys.argv[1:] else POSTINGS
+    print(f'{count} postings, {CURRENCIES} currencies:')
+    for name, func in cases(count).items():
+        seconds = measure(func, repeat=1)
+        print(f'{name:24}  {seconds:8.3f} s  {count / seconds:12,.0f} /s')
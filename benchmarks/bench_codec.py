@@ -0,0 +1,98 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2020-2022, Frederico Martins
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Currency codec benchmarks.
+
+Compares the size, and the encoding and decoding time, of the codec
+with `pickle` (with the reduce value of the currencies and as the
+currencies used to be pickled, with their specification) for a list of
+`Euro`, a list of mixed currencies and a currency array.
+
+    python -m benchmarks.bench_codec [items]
+"""
+
+from __future__ import annotations
+
+import pickle
+import sys
+from decimal import Decimal
+from io import BytesIO
+from typing import TYPE_CHECKING
+
+from benchmarks.utils import measure
+from multicurrency import Currency, CurrencyArray, currencies
+from multicurrency.codec import dumps, iter_load, loads
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+ITEMS = 1_000_000
+
+
+class LegacyPickler(pickle.Pickler):
+    """Pickles the currencies with their specification."""
+
+    def reducer_override(self: LegacyPickler, obj: object) -> object:
+        """Reduce value of the currencies (as it used to be)."""
+        if isinstance(obj, Currency):
+            return (
+                obj.__class__._from_spec,  # pylint: disable=W0212
+                (obj.amount, obj.spec))
+        return NotImplemented
+
+
+def _legacy_dumps(obj: object) -> bytes:
+    """Pickles `obj` with `LegacyPickler`."""
+    file = BytesIO()
+    LegacyPickler(file, pickle.HIGHEST_PROTOCOL).dump(obj)
+    return file.getvalue()
+
+
+def cases(items: int = ITEMS) -> dict[str, tuple[
+        Callable[[object], bytes], Callable[[bytes], object], object]]:
+    """Currency codec benchmark cases.
+
+    Args:
+        items (int, optional): Number of items. Defaults to 1_000_000.
+
+    Returns:
+        dict[str, tuple[Callable[[object], bytes], Callable[[bytes],
+            object], object]]: encoder, decoder and data of each case.
+    """
+    types = [getattr(currencies, name) for name in currencies.__all__[:30]]
+    amounts = [Decimal(i * 7919 % 10_000_000 - 5_000_000) / 100
+               for i in range(items)]
+    euros = [currencies.Euro(amount) for amount in amounts]
+    mixed = [
+        types[i % len(types)](amount) for i, amount in enumerate(amounts)]
+    array = CurrencyArray(amounts, currencies.Euro)
+
+    def stream(data: bytes) -> list[object]:
+        return list(iter_load(BytesIO(data)))
+
+    benchmarks = {}
+    for name, data in (('Euro', euros), ('mixed', mixed), ('array', array)):
+        benchmarks[f'{name} legacy pickle'] = (
+            _legacy_dumps, pickle.loads, data)
+        benchmarks[f'{name} pickle'] = (pickle.dumps, pickle.loads, data)
+        benchmarks[f'{name} codec'] = (dumps, loads, data)
+        benchmarks[f'{name} codec (iter_load)'] = (dumps, stream, data)
+    return benchmarks
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if sys.argv[1:] else ITEMS
+    print(f'{count} items:')
+    print(f'{"":26}  {"bytes":>12}  {"dumps":>8}  {"loads":>8}')
+    for name, (encode, decode, data) in cases(count).items():
+        encoded = encode(data)
+        dumps_seconds = measure(lambda: encode(data), repeat=1)
+        loads_seconds = measure(lambda: decode(encoded), repeat=1)
+        print(
+            f'{name:26}  {len(encoded):12,}  {dumps_seconds:7.3f}s  '
+            f'{loads_seconds:7.3f}s')
@@ -0,0 +1,73 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2020-2022, Frederico Martins
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Construction benchmarks.
+
+Compares the construction of the currencies created from the currencies
+table with a currency written like the previously generated ones (that
+called the `Currency` constructor with all the currency information).
+
+    python -m benchmarks.bench_construct
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import TYPE_CHECKING, Self
+
+from benchmarks.utils import report, run
+from multicurrency import Currency, Euro
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class LegacyEuro(Currency):
+    """Currency written like the previously generated ones."""
+
+    __slots__ = ()
+
+    def __new__(  # pylint: disable=signature-differs
+            cls: Self,
+            amount: str | float | Decimal,
+            pattern: str = '2,.3%a %s') -> Self:
+        """Class creator.
+
+        Returns:
+            LegacyEuro: new `LegacyEuro` object.
+        """
+        return super().__new__(
+            cls,
+            amount=amount,
+            alpha_code='EUR',
+            numeric_code='978',
+            symbol='€',
+            localized_symbol='€',
+            convertion='',
+            pattern=pattern)
+
+
+def cases() -> dict[str, Callable[[], object]]:
+    """Construction benchmark cases.
+
+    Returns:
+        dict[str, Callable[[], object]]: benchmark cases.
+    """
+    amount = Decimal('1234.56')
+    return {
+        'legacy Euro(Decimal)': lambda: LegacyEuro(amount),
+        'Euro(Decimal)': lambda: Euro(amount),
+        'legacy Euro(str)': lambda: LegacyEuro('1234.56'),
+        'Euro(str)': lambda: Euro('1234.56'),
+        'Euro(Decimal, pattern)': lambda: Euro(amount, '4,.3%a'),
+        'Currency(Decimal, ...)': lambda: Currency(
+            amount, alpha_code='EUR', symbol='€'),
+    }
+
+
+if __name__ == '__main__':
+    report(run(cases()))
@@ -0,0 +1,83 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2020-2022, Frederico Martins
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Money context benchmarks.
+
+Compares an operation (and a formatting) run with a given precision
+and rounding through a `decimal.localcontext` block, a `money_context`
+block and a money context attached to the currency (no block at all).
+
+    python -m benchmarks.bench_context
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal, localcontext
+from typing import TYPE_CHECKING
+
+from benchmarks.utils import report, run
+from multicurrency import Euro, MoneyContext, money_context
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def cases() -> dict[str, Callable[[], object]]:
+    """Money context benchmark cases.
+
+    Returns:
+        dict[str, Callable[[], object]]: benchmark cases.
+    """
+    rate = Decimal('1.0125')
+    context = MoneyContext(precision=12, rounding='ROUND_HALF_UP')
+    decimal_context = context.decimal_context
+    euro = Euro('1234.56')
+    attached = euro.with_context(context)
+
+    def with_localcontext() -> Euro:
+        with localcontext(prec=12, rounding='ROUND_HALF_UP'):
+            return euro * rate
+
+    def with_localcontext_copy() -> Euro:
+        with localcontext(decimal_context):
+            return euro * rate
+
+    def nested_localcontext() -> str:
+        with localcontext(prec=12, rounding='ROUND_HALF_UP'):
+            with localcontext(prec=12, rounding='ROUND_HALF_UP'):
+                return (euro * rate).precision(3)
+
+    def with_money_context() -> Euro:
+        with money_context(context):
+            return euro * rate
+
+    def format_localcontext() -> str:
+        with localcontext(prec=12, rounding='ROUND_HALF_UP'):
+            return euro.precision(1)
+
+    def format_money_context() -> str:
+        with money_context(context):
+            return euro.precision(1)
+
+    return {
+        'Euro * Decimal [no context]': lambda: euro * rate,
+        'Euro * Decimal [localcontext(prec, rounding)]': with_localcontext,
+        'Euro * Decimal [localcontext(Context)]': with_localcontext_copy,
+        'Euro * Decimal [money_context]': with_money_context,
+        'Euro * Decimal [attached]': lambda: attached * rate,
+        '(Euro * Decimal).precision [nested localcontext]': (
+            nested_localcontext),
+        '(Euro * Decimal).precision [attached]': lambda: (
+            attached * rate).precision(3),
+        'Euro.precision [localcontext(prec, rounding)]': format_localcontext,
+        'Euro.precision [money_context]': format_money_context,
+        'Euro.precision [attached]': lambda: attached.precision(1),
+    }
+
+
+if __name__ == '__main__':
+    report(run(cases()))
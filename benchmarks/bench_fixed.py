@@ -0,0 +1,86 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2020-2022, Frederico Martins
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Fixed point benchmarks.
+
+Compares the operations of the fixed point (integer minor units)
+currency with the `Decimal` based one and reports the memory used by
+each object (including its amount).
+
+    python -m benchmarks.bench_fixed
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+from benchmarks.bench_memory import per_instance
+from benchmarks.utils import report, run
+from multicurrency import Euro, FixedCurrency
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+ROWS = 10_000
+INSTANCES = 100_000
+
+
+def cases() -> dict[str, Callable[[], object]]:
+    """Fixed point benchmark cases.
+
+    Returns:
+        dict[str, Callable[[], object]]: benchmark cases.
+    """
+    euro = Euro(Decimal('1234.56'))
+    other = Euro(Decimal('0.01'))
+    fixed = FixedCurrency.from_currency(euro)
+    fixed_other = FixedCurrency.from_currency(other)
+    ledger = [Euro(Decimal(i) / 100) for i in range(ROWS)]
+    fixed_ledger = [FixedCurrency.from_currency(row) for row in ledger]
+    return {
+        'Euro + Euro': lambda: euro + other,
+        'Fixed + Fixed': lambda: fixed + fixed_other,
+        'Euro - Euro': lambda: euro - other,
+        'Fixed - Fixed': lambda: fixed - fixed_other,
+        'Euro < Euro': lambda: euro < other,
+        'Fixed < Fixed': lambda: fixed < fixed_other,
+        'Euro == Euro': lambda: euro == other,
+        'Fixed == Fixed': lambda: fixed == fixed_other,
+        'Euro * int': lambda: euro * 3,
+        'Fixed * int': lambda: fixed * 3,
+        'Euro * Decimal': lambda: euro * Decimal('1.23'),
+        'Fixed * Decimal': lambda: fixed * Decimal('1.23'),
+        'Euro / int': lambda: euro / 3,
+        'Fixed / int': lambda: fixed / 3,
+        'str(Euro)': lambda: str(euro),
+        'str(Fixed)': lambda: str(fixed),
+        f'sum of {ROWS} Euro': lambda: sum(ledger, Euro(0)),
+        f'sum of {ROWS} Fixed': lambda: sum(
+            fixed_ledger, FixedCurrency.from_currency(Euro(0))),
+    }
+
+
+def main(count: int = INSTANCES) -> None:
+    """Prints the operations times and the memory used per object.
+
+    Args:
+        count (int, optional): Number of objects to create. Defaults
+            to 100_000.
+    """
+    report(run(cases()))
+    spec = Euro(0).spec
+    for name, factory in (
+            ('Euro (with amount)', lambda amount: Euro(amount.scaleb(-2))),
+            ('Fixed (with amount)', lambda amount: FixedCurrency._from_units(
+                int(amount) + 1_000_000, spec))):
+        print(f'{name:28}  {per_instance(factory, count):8.1f} bytes')
+
+
+if __name__ == '__main__':
+    main()
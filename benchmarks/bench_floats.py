@@ -0,0 +1,60 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2020-2022, Frederico Martins
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Float ingestion benchmarks.
+
+Compares the construction, and the downstream arithmetic, hashing
+and formatting, of currencies created from floats with the 'exact' (all
+the binary digits), 'repr' (shortest digits) and 'minor' (rounded to
+the minor units) float modes.
+
+    python -m benchmarks.bench_floats
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+from benchmarks.utils import report, run
+from multicurrency import Euro
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def cases() -> dict[str, Callable[[], object]]:
+    """Float ingestion benchmark cases.
+
+    Returns:
+        dict[str, Callable[[], object]]: benchmark cases.
+    """
+    value = 1_000 / 7
+    rate = Decimal('1.0125')
+    result = {}
+    for mode in ('exact', 'repr', 'minor'):
+        euro = Euro.from_float(value, mode)
+        other = Euro.from_float(value / 3, mode)
+        result.update({
+            f'Euro.from_float [{mode}]': (
+                lambda mode=mode: Euro.from_float(value, mode)),
+            f'Euro + Euro [{mode}]': lambda a=euro, b=other: a + b,
+            f'Euro * Decimal [{mode}]': lambda a=euro: a * rate,
+            f'hash(Euro) [{mode}]': lambda a=euro: hash(a._amount),
+            f'Euro * Decimal * ... [{mode}, 12 times]': (
+                lambda a=euro: a * rate * rate * rate * rate * rate * rate *
+                rate * rate * rate * rate * rate * rate),
+            f'str(Euro) [{mode}]': euro.__str__,
+            f'Euro.sum [{mode}]': lambda a=euro, b=other: Euro.sum(
+                (a, b) * 50),
+        })
+    result['Euro(float) [default]'] = lambda: Euro(value)
+    return result
+
+
+if __name__ == '__main__':
+    report(run(cases()))
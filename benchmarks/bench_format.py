@@ -0,0 +1,108 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2020-2022, Frederico Martins
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Formatting benchmarks.
+
+Compares the compiled (cached) formatter with the previous
+implementation, that parsed the pattern and compiled the parts regular
+expression on every call.
+
+    python -m benchmarks.bench_format
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from re import (
+    compile as _compile,
+    escape as _escape,
+    match as _match,
+    sub as _sub,
+)
+from typing import TYPE_CHECKING
+
+from benchmarks.utils import report, run
+from multicurrency import Afghani, Currency, Euro
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def legacy_format(currency: Currency, fmt: str = '') -> str:
+    """Previous (uncompiled) implementation of `Currency.__format__`.
+
+    Args:
+        currency (Currency): Currency to format.
+        fmt (str, optional): Formatting specifications. Defaults to ''.
+
+    Returns:
+        str: Formated currency value.
+    """
+    regxpr = (
+        r'^(?P<decimal_places>\d+)?'
+        r'(?P<decimal_sign>[^\d%])?'
+        r'(?P<grouping_sign>[^\d%])?'
+        r'(?P<grouping_places>\d+)?'
+        r'(?P<format>.+)?$')
+    values = _match(regxpr, currency.pattern).groupdict()
+    matches = _match(regxpr, fmt.strip())
+    new_values = {k: v for k, v in matches.groupdict().items() if v}
+    values = {**values, **new_values}
+    decimal_places = int(values['decimal_places'])
+    grouping_places = int(values['grouping_places'])
+    parts = f'{round(currency.amount, decimal_places):f}'.split('.')
+    parts[0] = _sub(
+        rf'(\d)(?=(\d{{{grouping_places or -1}}})+$)', r'\1,', parts[0])
+    amount = '.'.join(parts)
+    converted = amount
+    if currency.convertion:
+        translator = dict(zip('0123456789-', currency.convertion))
+        converted = ''.join([translator.get(c, c) for c in converted])
+    converted = converted.replace('.', 'X').replace(
+        ',', values['grouping_sign']).replace('X', values['decimal_sign'])
+    rep = {
+        '%s': currency.symbol,
+        '%S': currency.localized_symbol,
+        '%c': currency.alpha_code,
+        '%a': converted,
+        '%A': amount,
+        '%u': converted.lstrip('-'),
+        '%U': amount.lstrip('-'),
+        '%-': '-' * currency.amount.is_signed(),
+        '%%': '%'}
+    rep = {_escape(k): v for k, v in rep.items()}
+    pattern = _compile('|'.join(rep.keys()))
+    return pattern.sub(lambda m: rep[_escape(m.group(0))], values['format'])
+
+
+def cases() -> dict[str, Callable[[], object]]:
+    """Formatting benchmark cases.
+
+    Returns:
+        dict[str, Callable[[], object]]: benchmark cases.
+    """
+    euro = Euro(Decimal('-1234567.891'))
+    afghani = Afghani(Decimal('-1234567.891'))
+    generic = Currency(Decimal('-1234567.891'), pattern='4.,4%-%u')
+    return {
+        'legacy str(Euro)': lambda: legacy_format(euro),
+        'str(Euro)': lambda: str(euro),
+        'legacy format(Euro, spec)': lambda: legacy_format(euro, '4.,%a'),
+        'format(Euro, spec)': lambda: format(euro, '4.,%a'),
+        'legacy str(Afghani)': lambda: legacy_format(afghani),
+        'str(Afghani)': lambda: str(afghani),
+        'legacy str(Currency) [4 digit groups]': lambda: legacy_format(
+            generic),
+        'str(Currency) [4 digit groups]': lambda: str(generic),
+        'Euro.international()': euro.international,
+        'Euro.localized()': euro.localized,
+        'Euro.precision(4)': lambda: euro.precision(4),
+    }
+
+
+if __name__ == '__main__':
+    report(run(cases()))
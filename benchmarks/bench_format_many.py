@@ -0,0 +1,62 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2020-2022, Frederico Martins
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Batch formatting benchmarks.
+
+Compares `format_many` with formatting one currency at a time, for
+Arabic-Indic (`Afghani`, `EgyptianPound`) and Latin (`Euro`) patterns.
+The results are reported per row.
+
+    python -m benchmarks.bench_format_many [rows]
+"""
+
+from __future__ import annotations
+
+import sys
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+from benchmarks.utils import report, run
+from multicurrency import Afghani, CurrencyArray, EgyptianPound, Euro
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+ROWS = 1_000_000
+
+
+def cases(rows: int = ROWS) -> dict[str, Callable[[], object]]:
+    """Batch formatting benchmark cases.
+
+    Args:
+        rows (int, optional): Number of amounts. Defaults to 1_000_000.
+
+    Returns:
+        dict[str, Callable[[], object]]: benchmark cases.
+    """
+    amounts = [Decimal(i * 7919 - rows) / 100 for i in range(rows)]
+    benchmarks = {}
+    for currency in (Afghani, EgyptianPound, Euro):
+        name = currency.__name__
+        ledger = [currency(amount) for amount in amounts]
+        array = CurrencyArray(amounts, currency)
+        benchmarks[f'{name} format'] = (
+            lambda ledger=ledger: [format(c) for c in ledger])
+        benchmarks[f'{name} format_many'] = (
+            lambda currency=currency: list(currency.format_many(amounts)))
+        benchmarks[f'{name} array format_many'] = (
+            lambda array=array: list(array.format_many()))
+    return benchmarks
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if sys.argv[1:] else ROWS
+    print(f'per row ({count} rows):')
+    report({
+        name: seconds / count
+        for name, seconds in run(cases(count)).items()})
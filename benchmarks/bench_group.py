@@ -0,0 +1,57 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2020-2022, Frederico Martins
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Digit grouping benchmarks.
+
+Compares the slicing grouping engine with the previous implementation,
+that grouped the digits with a lookahead regular expression, on long
+(18 decimal places) crypto amounts.
+
+    python -m benchmarks.bench_group
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from re import compile as _compile, sub as _sub
+from typing import TYPE_CHECKING
+
+from benchmarks.utils import report, run
+from multicurrency import Ethereum, IndianRupee
+from multicurrency.pycurrency import _group
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def cases() -> dict[str, Callable[[], object]]:
+    """Digit grouping benchmark cases.
+
+    Returns:
+        dict[str, Callable[[], object]]: benchmark cases.
+    """
+    ether = Ethereum(Decimal('-9876543210.987654321098765432'))
+    rupee = IndianRupee(Decimal('-98765432109876543.21'))
+    integral = f'{round(ether.amount, 18):f}'.partition('.')[0]
+    expression = _compile(r'(\d)(?=(\d{4})+$)')
+    assert _group(integral, (4,)) == expression.sub(r'\1,', integral)
+    return {
+        'legacy re.sub [4 digit groups]': lambda: _sub(
+            r'(\d)(?=(\d{4})+$)', r'\1,', integral),
+        'legacy compiled regex [4 digit groups]': lambda: expression.sub(
+            r'\1,', integral),
+        '_group [4 digit groups]': lambda: _group(integral, (4,)),
+        '_group [3;2 digit groups]': lambda: _group(integral, (3, 2)),
+        'format(Ethereum) [3 digit groups]': lambda: format(ether),
+        'format(Ethereum) [4 digit groups]': lambda: format(ether, '.,4'),
+        'format(IndianRupee) [3;2 digit groups]': lambda: format(
+            rupee, '.,3;2'),
+    }
+
+
+if __name__ == '__main__':
+    report(run(cases()))
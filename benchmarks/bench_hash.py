@@ -0,0 +1,73 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2020-2022, Frederico Martins
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Hashing and equality benchmarks.
+
+Measures the comparison and hashing of currencies and their use as
+`set` and `dict` keys (deduplication and joins). The results are
+reported per operation (per row for the `set` and `dict` cases).
+
+    python -m benchmarks.bench_hash [rows]
+"""
+
+from __future__ import annotations
+
+import sys
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+from benchmarks.utils import report, run
+from multicurrency import Euro, FixedCurrency, USDollar
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+ROWS = 100_000
+
+
+def cases(rows: int = ROWS) -> dict[str, Callable[[], object]]:
+    """Hashing and equality benchmark cases.
+
+    Args:
+        rows (int, optional): Number of rows. Defaults to 100_000.
+
+    Returns:
+        dict[str, Callable[[], object]]: benchmark cases.
+    """
+    euro = Euro('1234.56')
+    same = Euro('1234.560')
+    other = Euro('1234.57')
+    dollar = USDollar('1234.56')
+    fixed = FixedCurrency.from_currency(euro)
+    fixed_same = FixedCurrency.from_currency(same)
+    amounts = [Decimal(i % (rows // 2)) / 100 for i in range(rows)]
+    ledger = [Euro(amount) for amount in amounts]
+    keys = {Euro(amount): i for i, amount in enumerate(amounts)}
+    fixed_ledger = [FixedCurrency.from_currency(c) for c in ledger]
+    return {
+        'hash(Euro)': lambda: hash(euro),
+        'hash(FixedCurrency)': lambda: hash(fixed),
+        'hash(Euro.spec)': lambda: hash(euro.spec),
+        'Euro == Euro (equal)': lambda: euro == same,
+        'Euro == Euro (different)': lambda: euro == other,
+        'Euro == USDollar': lambda: euro == dollar,
+        'FixedCurrency == FixedCurrency': lambda: fixed == fixed_same,
+        'set(ledger) per row': lambda: set(ledger),
+        'set(fixed ledger) per row': lambda: set(fixed_ledger),
+        'dict join per row': lambda: [keys[c] for c in ledger],
+        'dedupe new rows per row': lambda: set(map(Euro, amounts)),
+    }
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if sys.argv[1:] else ROWS
+    results = run(cases(count))
+    for name in results:
+        if name.endswith('per row'):
+            results[name] /= count
+    report(results)
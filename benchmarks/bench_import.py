@@ -0,0 +1,84 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2020-2022, Frederico Martins
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Import time benchmarks.
+
+Uses the `-X importtime` option of the interpreter (on a new process
+for each run) to measure the time spent importing the library modules.
+Importing every currency (`from multicurrency import *`) is the cost
+that every import used to have. The modules bytecode is cached (on a
+temporary directory) by a first, unmeasured, run so that the
+compilation of the modules is not measured.
+
+    python -m benchmarks.bench_import
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import tempfile
+
+
+RUNS = 10
+STATEMENTS = {
+    'import multicurrency': 'import multicurrency',
+    'from multicurrency import Euro': 'from multicurrency import Euro',
+    'from multicurrency import * (all currencies)': (
+        'from multicurrency import *'),
+}
+
+
+def import_time(statement: str, pycache: str) -> float:
+    """Measures the time spent importing the library modules.
+
+    Args:
+        statement (str): Python statement to run.
+        pycache (str): Bytecode cache directory.
+
+    Returns:
+        float: import time (in seconds) of the library modules.
+    """
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    process = subprocess.run(
+        [
+            sys.executable,
+            '-X', 'importtime',
+            '-X', f'pycache_prefix={pycache}',
+            '-c', statement],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True)
+    total = 0
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, name = line.split('|')
+        # only the top level imports (the cumulative time includes the
+        # time of the nested imports)
+        if name.startswith(' multicurrency'):
+            total += int(cumulative)
+    return total / 1e6
+
+
+def main(runs: int = RUNS) -> None:
+    """Prints the import times (best of `runs`).
+
+    Args:
+        runs (int, optional): Number of runs. Defaults to 10.
+    """
+    with tempfile.TemporaryDirectory() as pycache:
+        for name, statement in STATEMENTS.items():
+            import_time(statement, pycache)
+            best = min(import_time(statement, pycache) for _ in range(runs))
+            print(f'{name:46}  {best * 1e3:8.3f} ms')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,53 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2020-2022, Frederico Martins
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Instrumentation benchmarks.
+
+Measures the hot paths with the instrumentation off (the original
+methods) and on (the probes).
+
+    python -m benchmarks.bench_instrumentation
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+from benchmarks.utils import report, run
+from multicurrency import Euro
+from multicurrency.instrumentation import disable, enable
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def cases() -> dict[str, Callable[[], object]]:
+    """Instrumentation benchmark cases.
+
+    Returns:
+        dict[str, Callable[[], object]]: benchmark cases.
+    """
+    amount = Decimal('1234.56')
+    euro = Euro(amount)
+    return {
+        'Euro(Decimal)': lambda: Euro(amount),
+        'Euro + Euro': lambda: euro + euro,
+        'str(Euro)': euro.__str__,
+        'Euro.parse(str)': lambda: Euro.parse('1.234,56 €'),
+    }
+
+
+if __name__ == '__main__':
+    disable()
+    off = run(cases())
+    enable()
+    on = run(cases())
+    disable()
+    report({
+        **{f'{name} [off]': seconds for name, seconds in off.items()},
+        **{f'{name} [on]': seconds for name, seconds in on.items()}})
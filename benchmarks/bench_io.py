@@ -0,0 +1,115 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2020-2022, Frederico Martins
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Currency input benchmarks.
+
+Compares the streaming readers with creating the currencies row by row
+(with `csv.DictReader` and `from_code`) on synthetic CSV and JSON Lines
+files. The results are reported in rows per second, followed by the
+peak memory of the process (which does not grow with the number of
+rows).
+
+    python -m benchmarks.bench_io [rows]
+"""
+
+from __future__ import annotations
+
+import json
+import resource
+import sys
+from csv import DictReader
+from decimal import Decimal
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import TYPE_CHECKING
+
+from benchmarks.utils import measure
+from multicurrency import CurrencyArray, currencies, from_code
+from multicurrency.io import read_csv, read_jsonl
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+ROWS = 10_000_000
+CURRENCIES = 30
+
+
+def _write(directory: Path, rows: int) -> tuple[Path, Path]:
+    """Writes the synthetic CSV and JSON Lines files."""
+    codes = []
+    for name in currencies.__all__:
+        code = getattr(currencies, name)(0).alpha_code
+        if code not in codes:
+            codes.append(code)
+        if len(codes) == CURRENCIES:
+            break
+    csv_path = directory / 'rows.csv'
+    jsonl_path = directory / 'rows.jsonl'
+    with csv_path.open('w', newline='') as csv_file, jsonl_path.open(
+            'w') as jsonl_file:
+        csv_file.write('id,currency,amount\n')
+        for i in range(rows):
+            code = codes[i % CURRENCIES]
+            amount = str(
+                Decimal((i * 7919) % 10_000_000 - 5_000_000).scaleb(-2))
+            csv_file.write(f'{i},{code},{amount}\n')
+            jsonl_file.write(json.dumps(
+                {'id': i, 'currency': code, 'amount': amount}) + '\n')
+    return csv_path, jsonl_path
+
+
+def cases(csv_path: Path, jsonl_path: Path) -> dict[
+        str, Callable[[], object]]:
+    """Currency input benchmark cases.
+
+    Args:
+        csv_path (Path): CSV file.
+        jsonl_path (Path): JSON Lines file.
+
+    Returns:
+        dict[str, Callable[[], object]]: benchmark cases.
+    """
+    def row_by_row() -> None:
+        with csv_path.open(newline='') as lines:
+            for row in DictReader(lines):
+                from_code(row['currency'], row['amount'])
+
+    def csv_chunks() -> None:
+        with csv_path.open(newline='') as lines:
+            for _ in read_csv(lines):
+                pass
+
+    def csv_arrays() -> None:
+        with csv_path.open(newline='') as lines:
+            for chunk in read_csv(lines):
+                for currency, amounts in chunk.items():
+                    CurrencyArray(amounts, currency)
+
+    def jsonl_chunks() -> None:
+        with jsonl_path.open() as lines:
+            for _ in read_jsonl(lines):
+                pass
+
+    return {
+        'row by row (csv)': row_by_row,
+        'read_csv': csv_chunks,
+        'read_csv + CurrencyArray': csv_arrays,
+        'read_jsonl': jsonl_chunks,
+    }
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if sys.argv[1:] else ROWS
+    with TemporaryDirectory() as directory:
+        paths = _write(Path(directory), count)
+        print(f'{count} rows, {CURRENCIES} currencies:')
+        for name, func in cases(*paths).items():
+            seconds = measure(func, repeat=1)
+            print(f'{name:24}  {seconds:8.3f} s  {count / seconds:12,.0f} /s')
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f'peak memory: {peak / 1024:.1f} MiB')
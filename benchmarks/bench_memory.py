@@ -0,0 +1,93 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2020-2022, Frederico Martins
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Memory benchmarks.
+
+Reports the memory used by each currency object (not counting its
+`Decimal` amount) when holding a shared `CurrencySpec` and when holding
+its own information tuple, as the currencies used to do.
+
+    python -m benchmarks.bench_memory [instances]
+"""
+
+from __future__ import annotations
+
+import sys
+import tracemalloc
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+from multicurrency import Euro
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+INSTANCES = 1_000_000
+
+
+class LegacyEuro:
+    """Currency layout with a per instance information tuple."""
+
+    __slots__ = ('_amount', '_info')
+
+    def __init__(  # pylint: disable=too-many-arguments
+            self: LegacyEuro,
+            amount: Decimal,
+            alpha_code: str = 'EUR',
+            numeric_code: str = '978',
+            symbol: str = '€',
+            localized_symbol: str = '€',
+            convertion: str = '',
+            pattern: str = '2,.3%a %s') -> None:
+        self._amount = amount
+        self._info = (
+            alpha_code,
+            numeric_code,
+            symbol,
+            localized_symbol,
+            convertion,
+            pattern)
+
+
+def per_instance(factory: Callable[[Decimal], object], count: int) -> float:
+    """Measures the memory allocated by each object.
+
+    Args:
+        factory (Callable[[Decimal], object]): Object creator.
+        count (int): Number of objects to create.
+
+    Returns:
+        float: bytes per object.
+    """
+    amounts = [Decimal(i) for i in range(count)]
+    objects = [None] * count
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    for index, amount in enumerate(amounts):
+        objects[index] = factory(amount)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (after - before) / count
+
+
+def main(count: int = INSTANCES) -> None:
+    """Prints the memory used per object.
+
+    Args:
+        count (int, optional): Number of objects to create. Defaults
+            to 1_000_000.
+    """
+    Euro(0)  # warms up the specifications cache
+    for name, factory in (
+            ('legacy (per instance tuple)', LegacyEuro),
+            ('Euro (shared spec)', Euro)):
+        print(f'{name:28}  {per_instance(factory, count):8.1f} bytes')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,62 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2020-2022, Frederico Martins
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Parsing benchmarks.
+
+Measures `parse` and `parse_many` on strings formated by the library,
+for Latin (`Euro`) and Arabic-Indic (`Afghani`, `BahrainiDinar`)
+patterns. The results are reported per row.
+
+    python -m benchmarks.bench_parse [rows]
+"""
+
+from __future__ import annotations
+
+import sys
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+from benchmarks.utils import report, run
+from multicurrency import Afghani, BahrainiDinar, Euro
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+ROWS = 100_000
+
+
+def cases(rows: int = ROWS) -> dict[str, Callable[[], object]]:
+    """Parsing benchmark cases.
+
+    Args:
+        rows (int, optional): Number of strings. Defaults to 100_000.
+
+    Returns:
+        dict[str, Callable[[], object]]: benchmark cases.
+    """
+    amounts = [Decimal(i * 7919 - rows) / 100 for i in range(rows)]
+    benchmarks = {}
+    for currency in (Euro, Afghani, BahrainiDinar):
+        name = currency.__name__
+        texts = list(currency.format_many(amounts))
+        international = [currency(a).international() for a in amounts]
+        benchmarks[f'{name} parse'] = (
+            lambda c=currency, t=texts: [c.parse(text) for text in t])
+        benchmarks[f'{name} parse_many'] = (
+            lambda c=currency, t=texts: list(c.parse_many(t)))
+        benchmarks[f'{name} parse_many (international)'] = (
+            lambda c=currency, t=international: list(c.parse_many(t)))
+    return benchmarks
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if sys.argv[1:] else ROWS
+    print(f'per row ({count} rows):')
+    report({
+        name: seconds / count
+        for name, seconds in run(cases(count)).items()})
@@ -0,0 +1,66 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2020-2022, Frederico Martins
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Quantization policy benchmarks.
+
+Measures long multiply and divide chains (monthly compound interest)
+with the quantization policy off (the coefficients grow up to the
+context precision) and on (rounded to the minor units after every
+operation), with the default (28) and larger context precisions.
+
+    python -m benchmarks.bench_quantize
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal, localcontext
+from functools import reduce
+from operator import mul, truediv
+from typing import TYPE_CHECKING
+
+from benchmarks.utils import report, run
+from multicurrency import Euro
+from multicurrency.pycurrency import set_quantize_rounding
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def cases() -> dict[str, Callable[[], object]]:
+    """Quantization policy benchmark cases.
+
+    Returns:
+        dict[str, Callable[[], object]]: benchmark cases.
+    """
+    euro = Euro('1234.56')
+    rates = [Decimal('1.0041666666666667')] * 120
+    divisors = [Decimal('1.0125')] * 120
+
+    def chain(precision: int) -> Euro:
+        with localcontext(prec=precision):
+            return reduce(mul, rates, euro)
+
+    return {
+        'Euro * Decimal': lambda: euro * rates[0],
+        'Euro * Decimal [120 times]': lambda: reduce(mul, rates, euro),
+        'Euro / Decimal [120 times]': lambda: reduce(
+            truediv, divisors, euro),
+        'str(Euro * Decimal [120 times])': lambda: str(
+            reduce(mul, rates, euro)),
+        'Euro * Decimal [120 times, precision 100]': lambda: chain(100),
+        'Euro * Decimal [120 times, precision 1000]': lambda: chain(1_000),
+    }
+
+
+if __name__ == '__main__':
+    off = run(cases())
+    set_quantize_rounding('ROUND_HALF_EVEN')
+    on = run(cases())
+    set_quantize_rounding(None)
+    report({
+        **{f'{name} [off]': seconds for name, seconds in off.items()},
+        **{f'{name} [on]': seconds for name, seconds in on.items()}})
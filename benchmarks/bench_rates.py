@@ -0,0 +1,71 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2020-2022, Frederico Martins
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Exchange rate conversion benchmarks.
+
+Compares the `Converter` with the usual hand written conversion (a
+`Decimal` round trip through `amount` and a new currency), for direct
+and triangulated (through the base currency) rates.
+
+    python -m benchmarks.bench_rates [rows]
+"""
+
+from __future__ import annotations
+
+import sys
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+from benchmarks.utils import report, run
+from multicurrency import (
+    Converter,
+    CurrencyArray,
+    Euro,
+    PoundSterling,
+    RateTable,
+    USDollar)
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+ROWS = 100_000
+
+
+def cases(rows: int = ROWS) -> dict[str, Callable[[], object]]:
+    """Exchange rate conversion benchmark cases.
+
+    Args:
+        rows (int, optional): Number of currencies. Defaults to 100_000.
+
+    Returns:
+        dict[str, Callable[[], object]]: benchmark cases.
+    """
+    rates = RateTable({'USD': '1.0842', 'GBP': '0.8571'}, base='EUR')
+    converter = Converter(rates)
+    ledger = [Euro(Decimal(i) / 100) for i in range(rows)]
+    pounds = [PoundSterling(Decimal(i) / 100) for i in range(rows)]
+    array = CurrencyArray.from_currencies(ledger)
+    rate = Decimal('1.0842')
+    return {
+        'hand written (direct)': lambda: [
+            USDollar(euro.amount * rate) for euro in ledger],
+        'convert (direct)': lambda: [
+            converter.convert(euro, 'USD') for euro in ledger],
+        'convert_many (direct)': lambda: list(
+            converter.convert_many(ledger, 'USD')),
+        'convert (triangulated)': lambda: [
+            converter.convert(pound, 'USD') for pound in pounds],
+        'convert_many (triangulated)': lambda: list(
+            converter.convert_many(pounds, 'USD')),
+        'convert_array (direct)': lambda: converter.convert_array(
+            array, 'USD'),
+    }
+
+
+if __name__ == '__main__':
+    report(run(cases(*(int(arg) for arg in sys.argv[1:2]))))
@@ -0,0 +1,58 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2020-2022, Frederico Martins
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Currency registry benchmarks.
+
+Compares the lookup of a currency class by code with the registry and
+with a scan of `multicurrency.currencies.__all__`.
+
+    python -m benchmarks.bench_registry
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from benchmarks.utils import report, run
+from multicurrency import currencies, currency_type, from_code
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from multicurrency import Currency
+
+
+def _scan(code: str) -> type[Currency]:
+    """Finds the currency class for `code` the hard way."""
+    for name in currencies.__all__:
+        currency = getattr(currencies, name)
+        if currency(0).alpha_code == code:
+            return currency
+    raise LookupError(code)
+
+
+def cases() -> dict[str, Callable[[], object]]:
+    """Currency registry benchmark cases.
+
+    Returns:
+        dict[str, Callable[[], object]]: benchmark cases.
+    """
+    uncached = currency_type.__wrapped__
+    return {
+        'scan (ZWL)': lambda: _scan('ZWL'),
+        'currency_type (ZWL)': lambda: currency_type('ZWL'),
+        'currency_type uncached (ZWL)': lambda: uncached('ZWL'),
+        'currency_type uncached (932)': lambda: uncached('932'),
+        'currency_type uncached (country)': lambda: uncached(
+            'EUR', 'Portugal'),
+        'from_code (EUR)': lambda: from_code('EUR', '1.5'),
+        'Euro()': lambda: currencies.Euro('1.5'),
+    }
+
+
+if __name__ == '__main__':
+    report(run(cases()))
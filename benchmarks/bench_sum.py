@@ -0,0 +1,53 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2020-2022, Frederico Martins
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Aggregation benchmarks.
+
+Compares the builtin `sum` with the single pass `Currency.sum`, for
+`Decimal` and fixed point currencies.
+
+    python -m benchmarks.bench_sum [rows]
+"""
+
+from __future__ import annotations
+
+import sys
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+from benchmarks.utils import report, run
+from multicurrency import Euro, FixedCurrency
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+ROWS = 100_000
+
+
+def cases(rows: int = ROWS) -> dict[str, Callable[[], object]]:
+    """Aggregation benchmark cases.
+
+    Args:
+        rows (int, optional): Number of currencies. Defaults to 100_000.
+
+    Returns:
+        dict[str, Callable[[], object]]: benchmark cases.
+    """
+    ledger = [Euro(Decimal(i) / 100) for i in range(rows)]
+    fixed = [FixedCurrency.from_currency(euro) for euro in ledger]
+    return {
+        'builtin sum': lambda: sum(ledger, Euro(0)),
+        'Euro.sum': lambda: Euro.sum(ledger),
+        'Euro.sum (generator)': lambda: Euro.sum(e for e in ledger),
+        'builtin sum (fixed)': lambda: sum(fixed[1:], fixed[0]),
+        'FixedCurrency.sum': lambda: FixedCurrency.sum(fixed),
+    }
+
+
+if __name__ == '__main__':
+    report(run(cases(*(int(arg) for arg in sys.argv[1:2]))))
@@ -0,0 +1,86 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2020-2022, Frederico Martins
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Digits conversion benchmarks.
+
+Compares the single `str.translate` pass (digits and signs) of the
+currencies with a `convertion` with the previous implementation, that
+translated the digits and then swapped the decimal and grouping signs
+with three `str.replace` calls.
+
+    python -m benchmarks.bench_translate
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+from benchmarks.utils import report, run
+from multicurrency import Afghani, BahrainiDinar, EgyptianPound
+from multicurrency.pycurrency import _formatter
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from multicurrency import Currency
+
+
+def legacy_convert(currency: Currency) -> str:
+    """Previous conversion of the formated amount of `currency`.
+
+    Args:
+        currency (Currency): Currency to convert.
+
+    Returns:
+        str: Converted amount.
+    """
+    formatter = _formatter(currency.pattern)
+    unconverted = format(
+        round(currency.amount, formatter.decimal_places), ',f')
+    converted = unconverted.translate(currency.spec.translation)
+    return converted.replace('.', 'X').replace(
+        ',', formatter.grouping_sign).replace('X', formatter.decimal_sign)
+
+
+def convert(currency: Currency) -> str:
+    """Single pass conversion of the formated amount of `currency`.
+
+    Args:
+        currency (Currency): Currency to convert.
+
+    Returns:
+        str: Converted amount.
+    """
+    formatter = _formatter(currency.pattern)
+    unconverted = format(
+        round(currency.amount, formatter.decimal_places), ',f')
+    return unconverted.translate(
+        formatter._table(currency.spec))  # pylint: disable=protected-access
+
+
+def cases() -> dict[str, Callable[[], object]]:
+    """Digits conversion benchmark cases.
+
+    Returns:
+        dict[str, Callable[[], object]]: benchmark cases.
+    """
+    benchmarks = {}
+    for currency in (Afghani, BahrainiDinar, EgyptianPound):
+        name = currency.__name__
+        value = currency(Decimal('-1234567.891'))
+        assert convert(value) == legacy_convert(value)
+        benchmarks[f'legacy {name} convert'] = (
+            lambda value=value: legacy_convert(value))
+        benchmarks[f'{name} convert'] = lambda value=value: convert(value)
+        benchmarks[f'str({name})'] = value.__str__
+        benchmarks[f'{name}.localized()'] = value.localized
+    return benchmarks
+
+
+if __name__ == '__main__':
+    report(run(cases()))
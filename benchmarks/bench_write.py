@@ -0,0 +1,101 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2020-2022, Frederico Martins
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Currency output benchmarks.
+
+Compares the CSV and fixed-width writers with formatting (`format()`)
+and joining each row by hand, for a ledger of mixed currencies and for
+a currency array. The results are reported in rows per second.
+
+    python -m benchmarks.bench_write [rows]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from decimal import Decimal
+from itertools import cycle, islice
+from typing import TYPE_CHECKING
+
+from benchmarks.utils import measure
+from multicurrency import CurrencyArray, currencies
+from multicurrency.io import write_csv, write_fixed
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from multicurrency import Currency
+
+
+ROWS = 5_000_000
+CURRENCIES = 10
+
+
+def cases(rows: int = ROWS) -> dict[str, Callable[[], object]]:
+    """Currency output benchmark cases.
+
+    Args:
+        rows (int, optional): Number of rows. Defaults to 5_000_000.
+
+    Returns:
+        dict[str, Callable[[], object]]: benchmark cases.
+    """
+    types = [
+        getattr(currencies, name)
+        for name in currencies.__all__[:CURRENCIES]]
+    pool = [
+        currency(Decimal(i * 7919 - 500_000) / 100)
+        for i in range(1000)
+        for currency in types]
+    amounts = [Decimal(i * 7919 - rows) / 100 for i in range(rows)]
+    array = CurrencyArray(amounts, currencies.Euro)
+
+    def ledger() -> Iterable[Currency]:
+        return islice(cycle(pool), rows)
+
+    def by_hand() -> None:
+        with open(os.devnull, 'w', encoding='utf-8') as file:
+            for currency in ledger():
+                file.write(f'{currency.alpha_code},"{format(currency)}"\n')
+
+    def csv() -> None:
+        with open(os.devnull, 'w', encoding='utf-8', newline='') as file:
+            write_csv(file, ledger())
+
+    def csv_binary() -> None:
+        with open(os.devnull, 'wb') as file:
+            write_csv(file, ledger())
+
+    def csv_array() -> None:
+        with open(os.devnull, 'w', encoding='utf-8', newline='') as file:
+            write_csv(file, array)
+
+    def fixed() -> None:
+        with open(os.devnull, 'w', encoding='utf-8') as file:
+            write_fixed(file, ledger())
+
+    def fixed_array() -> None:
+        with open(os.devnull, 'w', encoding='utf-8') as file:
+            write_fixed(file, array)
+
+    return {
+        'format() by hand': by_hand,
+        'write_csv': csv,
+        'write_csv (binary)': csv_binary,
+        'write_csv (array)': csv_array,
+        'write_fixed': fixed,
+        'write_fixed (array)': fixed_array,
+    }
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if sys.argv[1:] else ROWS
+    print(f'{count} rows:')
+    for name, func in cases(count).items():
+        seconds = measure(func, repeat=1)
+        print(f'{name:20}  {seconds:8.3f} s  {count / seconds:12,.0f} /s')
@@ -0,0 +1,425 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2020-2022, Frederico Martins
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Regression benchmark suite.
+
+Measures the hot paths of the library (construction of every currency
+family, arithmetic, formatting of every pattern family, hashing,
+comparison, pickling and import time) and saves the results to a JSON
+file. Two result files can then be compared to find the regressions
+(e.g.: between two releases).
+
+    python -m benchmarks.suite run -o before.json
+    python -m benchmarks.suite run -o after.json -k format
+    python -m benchmarks.suite compare before.json after.json
+
+The cases are measured with `timeit` (the best of `--repeat` runs) or,
+with `--pyperf`, with the `pyperf` runner (the mean of its worker
+processes). The arguments that are not known by the suite are given to
+`pyperf` (e.g.: `--fast` or `--inherit-environ=PYTHONPATH`). The
+import time is always measured on new interpreters (see
+`benchmarks.bench_import`).
+
+`compare` exits with status 1 when a case is slower, by more than
+`--threshold`, on the second file.
+"""
+
+from __future__ import annotations
+
+import json
+import pickle
+import platform
+import re
+import sys
+import tempfile
+from argparse import ArgumentParser
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+from benchmarks.bench_import import import_time
+from benchmarks.utils import measure
+from multicurrency import (
+    Afghani,
+    Currency,
+    Euro,
+    FixedCurrency,
+    USDollar,
+    __version__,
+    currencies,
+)
+
+
+try:
+    import pyperf
+except ImportError:
+    pyperf = None
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+
+FORMAT_VERSION = 1
+IMPORTS = {
+    'import multicurrency': 'import multicurrency',
+    'from multicurrency import Euro': 'from multicurrency import Euro',
+}
+IMPORT_RUNS = 5
+REPEAT = 3
+THRESHOLD = 0.1
+
+
+def _families() -> dict[str, list[type[Currency]]]:
+    """Returns the currency classes of each currencies module.
+
+    Returns:
+        dict[str, list[type[Currency]]]: currency classes (by module).
+    """
+    families: dict[str, list[type[Currency]]] = {}
+    table = currencies._CURRENCIES  # pylint: disable=protected-access
+    for name, (module, *_) in table.items():
+        families.setdefault(module, []).append(getattr(currencies, name))
+    return families
+
+
+def _patterns() -> dict[str, type[Currency]]:
+    """Returns one currency class for each pattern family.
+
+    The pattern family is the number part of the pattern (decimal
+    places, decimal sign, grouping sign and grouping places).
+
+    Returns:
+        dict[str, type[Currency]]: currency class (by pattern family).
+    """
+    patterns: dict[str, type[Currency]] = {}
+    for classes in _families().values():
+        for currency in classes:
+            family = currency(0).pattern.partition('%')[0]
+            patterns.setdefault(family, currency)
+    return dict(sorted(patterns.items()))
+
+
+def cases() -> dict[str, Callable[[], object]]:
+    """Regression benchmark cases.
+
+    Returns:
+        dict[str, Callable[[], object]]: benchmark cases.
+    """
+    amount = Decimal('-1234567.891')
+    euro = Euro(amount)
+    same = Euro(euro.amount)
+    other = Euro('0.01')
+    generic = Currency(amount, alpha_code='EUR', symbol='€')
+    fixed = FixedCurrency.from_currency(euro)
+    fixed_other = FixedCurrency.from_currency(other)
+    afghani = Afghani(amount)
+    dollar = USDollar(amount)
+    pickled = pickle.dumps(euro)
+    benchmarks: dict[str, Callable[[], object]] = {
+        'Currency(str)': lambda: Currency('1234.56'),
+        'Currency(Decimal, ...)': lambda: Currency(
+            amount, alpha_code='EUR', symbol='€'),
+        'Euro(str)': lambda: Euro('1234.56'),
+        'Euro(int)': lambda: Euro(1234),
+        'Euro(float)': lambda: Euro(1234.56),
+        'Euro(Decimal)': lambda: Euro(amount),
+        'Euro(Decimal, pattern)': lambda: Euro(amount, '4,.3%a'),
+        'FixedCurrency(Decimal, ...)': lambda: FixedCurrency(
+            amount, alpha_code='EUR'),
+    }
+    for family, classes in _families().items():
+        benchmarks[f'construct[{family}]'] = (
+            lambda classes=classes: [c(amount) for c in classes])
+    benchmarks.update({
+        'Euro + Euro': lambda: euro + other,
+        'Euro * int': lambda: euro * 3,
+        'Euro * Decimal': lambda: euro * Decimal('1.23'),
+        'Euro / int': lambda: euro / 3,
+        'Euro / Decimal': lambda: euro / Decimal('1.23'),
+        'Currency + Currency': lambda: generic + generic,
+        'FixedCurrency + FixedCurrency': lambda: fixed + fixed_other,
+        'FixedCurrency * int': lambda: fixed * 3,
+        'FixedCurrency / int': lambda: fixed / 3,
+    })
+    for family, currency in _patterns().items():
+        value = currency(amount)
+        name = f'format[{ascii(family)[1:-1]}] {currency.__name__}'
+        benchmarks[name] = value.__str__
+    benchmarks.update({
+        'format(Euro, spec)': lambda: format(euro, '4.,%a'),
+        'format(Currency) [4 digit groups]': lambda: format(
+            generic, '.,4'),
+        'Euro.international()': euro.international,
+        'Euro.localized()': euro.localized,
+        'Afghani.international()': afghani.international,
+        'Afghani.localized()': afghani.localized,
+        'hash(Euro)': lambda: hash(euro),
+        'hash(FixedCurrency)': lambda: hash(fixed),
+        'Euro == Euro': lambda: euro == same,
+        'Euro == USDollar': lambda: euro == dollar,
+        'Euro < Euro': lambda: euro < other,
+        'FixedCurrency == FixedCurrency': lambda: fixed == fixed_other,
+        'FixedCurrency < FixedCurrency': lambda: fixed < fixed_other,
+        'pickle.dumps(Euro)': lambda: pickle.dumps(euro),
+        'pickle.loads(Euro)': lambda: pickle.loads(pickled),  # noqa: S301
+    })
+    return benchmarks
+
+
+def _select(
+        benchmarks: dict[str, object],
+        pattern: str | None) -> dict[str, object]:
+    """Returns the benchmarks with a name that matches `pattern`.
+
+    Args:
+        benchmarks (dict[str, object]): Benchmarks (by name).
+        pattern (str | None): Regular expression (every benchmark if
+            not set).
+
+    Returns:
+        dict[str, object]: selected benchmarks.
+    """
+    if not pattern:
+        return benchmarks
+    search = re.compile(pattern).search
+    return {name: case for name, case in benchmarks.items() if search(name)}
+
+
+def _imports(pattern: str | None) -> dict[str, float]:
+    """Measures the import time of the library (best of a few runs).
+
+    Args:
+        pattern (str | None): Regular expression to select the
+            statements (every statement if not set).
+
+    Returns:
+        dict[str, float]: seconds per import.
+    """
+    results = {}
+    statements = _select(
+        {f'{name} (import time)': s for name, s in IMPORTS.items()},
+        pattern)
+    with tempfile.TemporaryDirectory() as pycache:
+        for name, statement in statements.items():
+            import_time(statement, pycache)
+            results[name] = min(
+                import_time(statement, pycache) for _ in range(IMPORT_RUNS))
+    return results
+
+
+def run_timeit(
+        pattern: str | None = None,
+        repeat: int = REPEAT) -> dict[str, float]:
+    """Measures the cases with `timeit`.
+
+    Args:
+        pattern (str | None, optional): Regular expression to select
+            the cases. Defaults to every case.
+        repeat (int, optional): Number of measurements (the best one
+            is kept). Defaults to 3.
+
+    Returns:
+        dict[str, float]: seconds per call of each case.
+    """
+    results = {
+        name: measure(func, repeat)
+        for name, func in _select(cases(), pattern).items()}
+    results.update(_imports(pattern))
+    return results
+
+
+def run_pyperf(
+        pattern: str | None = None,
+        args: Sequence[str] = ()) -> dict[str, float] | None:
+    """Measures the cases with `pyperf`.
+
+    Args:
+        pattern (str | None, optional): Regular expression to select
+            the cases. Defaults to every case.
+        args (Sequence[str], optional): `pyperf` arguments. Defaults to
+            none.
+
+    Returns:
+        dict[str, float] | None: mean seconds per call of each case
+            (None on the `pyperf` worker processes).
+
+    Raises:
+        SystemExit: If `pyperf` is not installed.
+    """
+    if pyperf is None:
+        msg = 'the pyperf backend requires pyperf (pip install pyperf)'
+        raise SystemExit(msg)
+    program_args = ['-m', 'benchmarks.suite', 'run', '--pyperf']
+    if pattern:
+        program_args.extend(('-k', pattern))
+    runner = pyperf.Runner(program_args=tuple(program_args))
+    runner.parse_args(list(args))
+    benchmarks = {
+        name: runner.bench_func(name, func)
+        for name, func in _select(cases(), pattern).items()}
+    if runner.args.worker:
+        return None
+    results = {name: bench.mean() for name, bench in benchmarks.items()}
+    results.update(_imports(pattern))
+    return results
+
+
+def save(path: str, results: dict[str, float], backend: str) -> None:
+    """Saves the results to the JSON file `path`.
+
+    Args:
+        path (str): Result file.
+        results (dict[str, float]): seconds per call of each case.
+        backend (str): Name of the backend ('timeit' or 'pyperf').
+    """
+    document = {
+        'version': FORMAT_VERSION,
+        'backend': backend,
+        'multicurrency': __version__,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'results': results}
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(document, file, ensure_ascii=False, indent=2)
+        file.write('\n')
+
+
+def load(path: str) -> dict[str, object]:
+    """Loads a JSON result file.
+
+    Args:
+        path (str): Result file.
+
+    Returns:
+        dict[str, object]: result document.
+
+    Raises:
+        ValueError: If the file is not a result file of this suite.
+    """
+    with open(path, encoding='utf-8') as file:
+        document = json.load(file)
+    if not isinstance(document, dict) or document.get(
+            'version') != FORMAT_VERSION:
+        msg = f'{path}: not a benchmark result file'
+        raise ValueError(msg)
+    return document
+
+
+def compare(
+        before: dict[str, float],
+        after: dict[str, float],
+        threshold: float = THRESHOLD) -> list[tuple[str, float, float, str]]:
+    """Compares the results of two runs.
+
+    Args:
+        before (dict[str, float]): seconds per call of each case.
+        after (dict[str, float]): seconds per call of each case.
+        threshold (float, optional): Relative change (e.g.: 0.1 for
+            10%) above which a case is a regression (or an
+            improvement). Defaults to 0.1.
+
+    Returns:
+        list[tuple[str, float, float, str]]: name, before, after and
+            verdict ('regression', 'improvement' or '') of the cases
+            measured on both runs.
+    """
+    rows = []
+    for name, old in before.items():
+        new = after.get(name)
+        if new is None:
+            continue
+        change = new / old - 1 if old else 0.0
+        verdict = ''
+        if change > threshold:
+            verdict = 'regression'
+        elif change < -threshold:
+            verdict = 'improvement'
+        rows.append((name, old, new, verdict))
+    return rows
+
+
+def _unit(seconds: float) -> str:
+    """Formats a duration (in seconds).
+
+    Args:
+        seconds (float): Duration.
+
+    Returns:
+        str: formated duration.
+    """
+    if seconds >= 1e-3:  # noqa: PLR2004
+        return f'{seconds * 1e3:10.3f} ms'
+    return f'{seconds * 1e6:10.3f} us'
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Command line interface of the suite.
+
+    Args:
+        argv (Sequence[str] | None, optional): Arguments. Defaults to
+            the arguments of the program.
+
+    Returns:
+        int: exit status.
+    """
+    parser = ArgumentParser(prog='python -m benchmarks.suite')
+    commands = parser.add_subparsers(dest='command', required=True)
+    runs = commands.add_parser('run', help='measure the cases')
+    runs.add_argument(
+        '-o', '--output', help='JSON file to save the results to')
+    runs.add_argument(
+        '-k', '--select', help='regular expression to select the cases')
+    runs.add_argument(
+        '--repeat', type=int, default=REPEAT,
+        help=f'timeit measurements per case (default: {REPEAT})')
+    runs.add_argument(
+        '--pyperf', action='store_true', help='use the pyperf backend')
+    comparison = commands.add_parser(
+        'compare', help='compare two result files')
+    comparison.add_argument('before', help='JSON result file')
+    comparison.add_argument('after', help='JSON result file')
+    comparison.add_argument(
+        '--threshold', type=float, default=THRESHOLD,
+        help=f'relative change to report (default: {THRESHOLD})')
+    args, extra = parser.parse_known_args(argv)
+    if args.command == 'compare':
+        if extra:
+            parser.error(f'unrecognized arguments: {" ".join(extra)}')
+        before = load(args.before)
+        after = load(args.after)
+        if before['backend'] != after['backend']:
+            print(
+                f'warning: comparing {before["backend"]} with '
+                f'{after["backend"]} results', file=sys.stderr)
+        rows = compare(before['results'], after['results'], args.threshold)
+        missing = sorted(set(before['results']) ^ set(after['results']))
+        width = max(map(len, [row[0] for row in rows] + missing), default=0)
+        for name, old, new, verdict in rows:
+            print(
+                f'{name:{width}}  {_unit(old)}  {_unit(new)}  '
+                f'{(new / old - 1) * 100 if old else 0:+7.1f}%  {verdict}')
+        for name in missing:
+            print(f'{name:{width}}  (measured on only one file)')
+        return int(any(row[3] == 'regression' for row in rows))
+    if args.pyperf:
+        results = run_pyperf(args.select, extra)
+        if results is None:
+            return 0
+    else:
+        if extra:
+            parser.error(f'unrecognized arguments: {" ".join(extra)}')
+        results = run_timeit(args.select, args.repeat)
+        width = max((len(name) for name in results), default=0)
+        for name, seconds in results.items():
+            print(f'{name:{width}}  {_unit(seconds)}')
+    if args.output:
+        save(args.output, results, 'pyperf' if args.pyperf else 'timeit')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,55 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2020-2022, Frederico Martins
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Benchmark helpers."""
+
+from __future__ import annotations
+
+from timeit import Timer
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def measure(func: Callable[[], object], repeat: int = 5) -> float:
+    """Measures the time of one call to `func`.
+
+    Args:
+        func (Callable[[], object]): Function to measure.
+        repeat (int, optional): Number of measurements (the best one is
+            kept). Defaults to 5.
+
+    Returns:
+        float: seconds per call.
+    """
+    timer = Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run(cases: dict[str, Callable[[], object]]) -> dict[str, float]:
+    """Measures every case.
+
+    Args:
+        cases (dict[str, Callable[[], object]]): Cases to measure.
+
+    Returns:
+        dict[str, float]: seconds per call of each case.
+    """
+    return {name: measure(func) for name, func in cases.items()}
+
+
+def report(results: dict[str, float]) -> None:
+    """Prints the results.
+
+    Args:
+        results (dict[str, float]): seconds per call of each case.
+    """
+    width = max(len(name) for name in results)
+    for name, seconds in results.items():
+        print(f'{name:{width}}  {seconds * 1e6:12.3f} us')
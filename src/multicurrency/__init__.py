@@ -141,6 +141,20 @@ value needs to be changed:
     ROUND_UP         142,858 €
     ROUND_05UP       142,857 €
 
+A money context (`multicurrency.context.MoneyContext`) sets the
+precision and rounding for a block (`money_context`), or for a
+currency and the results of its operations (`with_context`), without
+changing the `decimal.Context` of the thread:
+
+    >>> from multicurrency import Euro, MoneyContext, money_context
+    >>> with money_context(MoneyContext(rounding='ROUND_CEILING')):
+    ...     print(Euro(1_000/7).precision(3))
+    142,858 €
+    >>> context = MoneyContext(precision=6, rounding='ROUND_DOWN')
+    >>> euro = Euro(1_000).with_context(context)
+    >>> print((euro / 7).amount)
+    142.857
+
 ## Formatting
 
 The `multicurrency.pycurrency.Currency` class allows you to create
@@ -439,17 +453,87 @@ Several operations are supported by the several library classes.
         True
 """ # pylint: disable=line-too-long  # noqa: E501,W505
 
-from multicurrency.currencies import *
+from importlib import import_module
+from os import environ as _environ
+
+from multicurrency import currencies
+from multicurrency.context import MoneyContext, money_context
 from multicurrency.exceptions import (
+    CurrencyCodeException,
     CurrencyException,
     CurrencyInvalidDivision,
     CurrencyInvalidFormat,
     CurrencyInvalidMultiplication,
     CurrencyInvalidOperation,
     CurrencyMismatchException,
+    CurrencyRateException,
     CurrencyTypeException,
 )
-from multicurrency.pycurrency import Currency
+from multicurrency.fixed import FixedCurrency
+from multicurrency.pycurrency import Currency, CurrencySpec
 
 
 __version__: str = '2.1.0'
+
+# attributes imported (from their modules) only when needed
+_MODULES = {
+    'Converter': 'multicurrency.rates',
+    'CurrencyArray': 'multicurrency.arrays',
+    'MoneyBag': 'multicurrency.bags',
+    'RateTable': 'multicurrency.rates',
+    'currency_type': 'multicurrency.registry',
+    'from_code': 'multicurrency.registry'}
+
+__all__ = (
+    *currencies.__all__,
+    *_MODULES,
+    'Currency',
+    'CurrencyCodeException',
+    'CurrencyException',
+    'CurrencyInvalidDivision',
+    'CurrencyInvalidFormat',
+    'CurrencyInvalidMultiplication',
+    'CurrencyInvalidOperation',
+    'CurrencyMismatchException',
+    'CurrencyRateException',
+    'CurrencySpec',
+    'CurrencyTypeException',
+    'FixedCurrency',
+    'MoneyContext',
+    'money_context')
+
+
+def __getattr__(name: str) -> type:
+    """Returns the currency, or type, `name` (imported when needed).
+
+    Args:
+        name (str): Currency (class), or type, name.
+
+    Returns:
+        type: currency class, or type.
+
+    Raises:
+        AttributeError: If `name` is not a supported currency, or type.
+    """
+    if name in _MODULES:
+        attribute = getattr(import_module(_MODULES[name]), name)
+    elif name in currencies.__all__:
+        attribute = getattr(currencies, name)
+    else:
+        msg = f'module {__name__!r} has no attribute {name!r}'
+        raise AttributeError(msg)
+    globals()[name] = attribute
+    return attribute
+
+
+def __dir__() -> list[str]:
+    """Returns the module attributes (including the currencies).
+
+    Returns:
+        list[str]: module attributes.
+    """
+    return sorted({*globals(), *__all__})
+
+
+if _environ.get('MULTICURRENCY_INSTRUMENTATION', '0') not in ('', '0'):
+    import_module('multicurrency.instrumentation').enable()
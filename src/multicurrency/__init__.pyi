@@ -1,3 +1,9 @@
+from multicurrency.arrays import CurrencyArray as CurrencyArray
+from multicurrency.bags import MoneyBag as MoneyBag
+from multicurrency.context import MoneyContext as MoneyContext, money_context as money_context
 from multicurrency.currencies import *
-from multicurrency.exceptions import CurrencyException as CurrencyException, CurrencyInvalidDivision as CurrencyInvalidDivision, CurrencyInvalidFormat as CurrencyInvalidFormat, CurrencyInvalidMultiplication as CurrencyInvalidMultiplication, CurrencyInvalidOperation as CurrencyInvalidOperation, CurrencyMismatchException as CurrencyMismatchException, CurrencyTypeException as CurrencyTypeException
-from multicurrency.pycurrency import Currency as Currency
+from multicurrency.exceptions import CurrencyCodeException as CurrencyCodeException, CurrencyException as CurrencyException, CurrencyInvalidDivision as CurrencyInvalidDivision, CurrencyInvalidFormat as CurrencyInvalidFormat, CurrencyInvalidMultiplication as CurrencyInvalidMultiplication, CurrencyInvalidOperation as CurrencyInvalidOperation, CurrencyMismatchException as CurrencyMismatchException, CurrencyRateException as CurrencyRateException, CurrencyTypeException as CurrencyTypeException
+from multicurrency.fixed import FixedCurrency as FixedCurrency
+from multicurrency.pycurrency import Currency as Currency, CurrencySpec as CurrencySpec
+from multicurrency.rates import Converter as Converter, RateTable as RateTable
+from multicurrency.registry import currency_type as currency_type, from_code as from_code
@@ -0,0 +1,830 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2020-2022, Frederico Martins
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Currency arrays.
+
+Representation of a sequence of amounts of one currency, stored as a
+contiguous buffer of (64 bits) integer minor units (see
+`multicurrency.fixed`). The buffer is a `numpy.ndarray` when NumPy is
+installed and an `array.array` otherwise.
+
+Simple usage example:
+
+    >>> from multicurrency import Currency
+    >>> from multicurrency.arrays import CurrencyArray
+    >>> prices = CurrencyArray(
+    ...     ['1.50', '2.25', '10'], alpha_code='EUR', symbol='€')
+    >>> print(prices.sum())
+    13.75€
+    >>> print((prices * 3).max())
+    30.00€
+    >>> print(prices[prices < Currency(5, alpha_code='EUR')].sum())
+    3.75€
+    >>> print(prices / 4)
+    CurrencyArray([0.38, 0.56, 2.50], alpha_code: "EUR")
+
+Elements are only created (as objects of the currency type of the
+array) when accessed. Operations are done on the minor units, results
+that need more decimal places are rounded half to even. The minor units
+are limited to 64 bits integers: the sums are exact and the operations
+with results out of that range raise `OverflowError`. The amounts are
+limited accordingly (to about 92 quadrillions with 2 decimal places and
+to about 9.22 units with 18 decimal places, e.g.: `Ethereum`).
+
+Amounts can be allocated (`allocate`, `split`), each one by the largest
+remainder method (see `Currency.allocate`), in a single pass:
+
+    >>> shares = prices.allocate([1, 1, 1])
+    >>> print(shares[0], shares[2].sum())
+    CurrencyArray([0.50, 0.75, 3.34], alpha_code: "EUR") 4.58€
+
+Comparisons return a mask (a `numpy.ndarray` of booleans with NumPy, a
+`list` of `bool` otherwise) that can be used to select elements.
+"""
+
+from __future__ import annotations
+
+from array import array
+from decimal import ROUND_HALF_EVEN, Decimal
+from itertools import compress, repeat
+from operator import add, eq, ge, gt, le, lt, mul, ne, neg, sub
+from typing import TYPE_CHECKING, Any, Self
+
+from multicurrency.exceptions import (
+    CurrencyInvalidDivision,
+    CurrencyInvalidMultiplication,
+    CurrencyMismatchException,
+    CurrencyTypeException,
+)
+from multicurrency.fixed import FixedCurrency, _to_units
+from multicurrency.pycurrency import (
+    Currency,
+    CurrencySpec,
+    _allocate,
+    _formatter,
+    _weights,
+)
+
+
+try:
+    import numpy as _numpy
+except ImportError:
+    _numpy = None
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Sequence
+
+
+_LIMIT = 2 ** 63
+
+
+def _scale(units: int, numerator: int, denominator: int) -> int:
+    """Multiplies `units` by a fraction (rounding half to even).
+
+    Args:
+        units (int): Number of minor units.
+        numerator (int): Fraction numerator.
+        denominator (int): Fraction (positive) denominator.
+
+    Returns:
+        int: number of minor units.
+    """
+    quotient, remainder = divmod(units * numerator, denominator)
+    double = remainder * 2
+    if double > denominator or (double == denominator and quotient & 1):
+        quotient += 1
+    return quotient
+
+
+def _ratio(value: object) -> tuple[int, int]:
+    """Returns `value` as a fraction (with a positive denominator).
+
+    Args:
+        value (object): Number.
+
+    Returns:
+        tuple[int, int]: numerator and denominator.
+
+    Raises:
+        TypeError: If `value` not of types `int`, `float` or `Decimal`
+            (or not finite).
+    """
+    if isinstance(value, int):
+        return value, 1
+    if isinstance(value, (float, Decimal)):
+        try:
+            return Decimal(value).as_integer_ratio()
+        except (OverflowError, ValueError):
+            raise TypeError from None
+    if _numpy is not None and isinstance(value, _numpy.number):
+        return _ratio(value.item())
+    raise TypeError
+
+
+def _buffer(units: Iterable[int]) -> Any:
+    """Returns a buffer (of the available backend) with `units`.
+
+    Args:
+        units (Iterable[int]): Numbers of minor units.
+
+    Returns:
+        array | numpy.ndarray: buffer.
+    """
+    if _numpy is None:
+        return units if isinstance(units, array) else array('q', units)
+    if isinstance(units, _numpy.ndarray):
+        return units.astype(_numpy.int64, copy=False)
+    if isinstance(units, array):
+        return _numpy.frombuffer(units, dtype=_numpy.int64).copy()
+    return _numpy.array(list(units), dtype=_numpy.int64)
+
+
+def _bound(data: Any) -> int:
+    """Returns the largest absolute value of a `numpy.ndarray`.
+
+    Args:
+        data (numpy.ndarray): Buffer.
+
+    Returns:
+        int: largest absolute value (0 if empty).
+    """
+    if not len(data):
+        return 0
+    return max(abs(int(data.min())), abs(int(data.max())))
+
+
+def _scale_buffer(data: Any, numerator: int, denominator: int) -> Any:
+    """Multiplies every element of `data` by a fraction.
+
+    Args:
+        data (array | numpy.ndarray): Buffer.
+        numerator (int): Fraction numerator.
+        denominator (int): Fraction (positive) denominator.
+
+    Returns:
+        array | numpy.ndarray: new buffer (of the same backend).
+    """
+    if isinstance(data, array):
+        if denominator == 1:
+            return array('q', map(mul, data, repeat(numerator)))
+        return array('q', [_scale(u, numerator, denominator) for u in data])
+    bound = _bound(data)
+    if bound * abs(numerator) >= _LIMIT or denominator * 2 >= _LIMIT:
+        return _numpy.array(
+            [_scale(u, numerator, denominator) for u in data.tolist()],
+            dtype=_numpy.int64)
+    if denominator == 1:
+        return data * numerator
+    quotient, remainder = _numpy.divmod(data * numerator, denominator)
+    double = remainder * 2
+    return quotient + (
+        (double > denominator) | ((double == denominator) & (quotient & 1)))
+
+
+class CurrencyArray:
+    """Currency array.
+
+    Sequence of amounts of one currency. The elements are objects of
+    the `currency` type, created with the given `currency` arguments
+    (see `multicurrency.pycurrency.Currency`).
+
+    Args:
+        amounts (Iterable[str | int | float | Decimal], optional):
+            Represented values. Defaults to ().
+        currency (type[Currency], optional): Type of the elements.
+            Defaults to `Currency`.
+        **kwargs (str): `currency` arguments (e.g.: `alpha_code`,
+            `pattern`).
+    """
+
+    __slots__ = ('_data', '_spec', '_type')
+
+    def __new__(
+            cls: Self,
+            amounts: Iterable[str | float | Decimal] = (),
+            currency: type[Currency] = Currency,
+            **kwargs: str) -> Self:
+        """Class creator.
+
+        Returns:
+            CurrencyArray: new opbject.
+
+        Raises:
+            CurrencyInvalidFormat: If `pattern` is not valid.
+        """
+        spec = currency(0, **kwargs).spec
+        places = spec.decimal_places
+        factor = 10 ** places
+        units = [
+            amount * factor if isinstance(amount, int) else
+            _to_units(Decimal(amount), places, ROUND_HALF_EVEN)
+            for amount in amounts]
+        return cls._from_units(units, spec, currency)
+
+    def _element(self: Self, units: int) -> Currency:
+        """Creates an element of this array.
+
+        Args:
+            units (int): Number of minor units.
+
+        Returns:
+            Currency: new currency object.
+        """
+        return self._type._from_spec(  # pylint: disable=protected-access
+            Decimal(units).scaleb(-self._spec.decimal_places),
+            self._spec)
+
+    def _new(self: Self, data: Any) -> Self:
+        """Creates an array of the same currency with `data`.
+
+        Args:
+            data (array | numpy.ndarray): Buffer.
+
+        Returns:
+            CurrencyArray: new object.
+        """
+        new = object.__new__(self.__class__)
+        new._data = data
+        new._spec = self._spec
+        new._type = self._type
+        return new
+
+    def _operand(self: Self, other: object) -> Any:
+        """Validates `other` for an operation with this array.
+
+        Args:
+            other (object): Currency or currency array.
+
+        Returns:
+            int | array | numpy.ndarray: the minor units of `other` (on
+                the scale of this array).
+
+        Raises:
+            CurrencyTypeException: If `other` not instance of
+                'Currency' or 'CurrencyArray'.
+            CurrencyMismatchException: If `other.alpha_code` is
+                differente from `alpha_code`.
+            ValueError: If `other` has a different length.
+        """
+        if not isinstance(other, (Currency, CurrencyArray)):
+            raise CurrencyTypeException
+        spec = other._spec  # pylint: disable=protected-access
+        if spec.alpha_code != self._spec.alpha_code:
+            raise CurrencyMismatchException
+        places = self._spec.decimal_places
+        if isinstance(other, Currency):
+            if (isinstance(other, FixedCurrency) and
+                    spec.decimal_places == places):
+                return other.minor_units
+            return _to_units(other.amount, places, ROUND_HALF_EVEN)
+        if len(other) != len(self):
+            msg = f'length mismatch: {len(self)} and {len(other)}'
+            raise ValueError(msg)
+        data = other._data  # pylint: disable=protected-access
+        if isinstance(self._data, array) is not isinstance(data, array):
+            data = array('q', data) if isinstance(
+                self._data, array) else _buffer(data)
+        if spec.decimal_places != places:
+            data = _scale_buffer(
+                data,
+                10 ** max(places - spec.decimal_places, 0),
+                10 ** max(spec.decimal_places - places, 0))
+        return data
+
+    def _apply(
+            self: Self,
+            operation: Callable[..., Any],
+            other: object) -> Any:
+        """Applies an elementwise operation with `other`.
+
+        Args:
+            operation (Callable[..., Any]): Operation.
+            other (object): Currency or currency array.
+
+        Returns:
+            array | list | numpy.ndarray: operation results.
+        """
+        operand = self._operand(other)
+        if not isinstance(self._data, array):
+            return operation(self._data, operand)
+        operands = repeat(operand) if isinstance(operand, int) else operand
+        return list(map(operation, self._data, operands))
+
+    def _combine(
+            self: Self,
+            operation: Callable[[Any, Any], Any],
+            other: object) -> Self:
+        """Adds, or subtracts, `other` (elementwise) without overflows.
+
+        Args:
+            operation (Callable[[Any, Any], Any]): `add` or `sub`.
+            other (object): Currency or currency array.
+
+        Returns:
+            CurrencyArray: result of the operation.
+
+        Raises:
+            OverflowError: If a result does not fit in 64 bits.
+        """
+        operand = self._operand(other)
+        data = self._data
+        if not isinstance(data, array):
+            bound = abs(operand) if isinstance(
+                operand, int) else _bound(operand)
+            if _bound(data) + bound < _LIMIT:
+                return self._new(operation(data, operand))
+            data = data.tolist()
+            if not isinstance(operand, int):
+                operand = operand.tolist()
+        operands = repeat(operand) if isinstance(operand, int) else operand
+        return self._new(_buffer(list(map(operation, data, operands))))
+
+    def __abs__(self: Self) -> Self:
+        """Returns the absolute values.
+
+        Returns:
+            CurrencyArray: absolute values.
+        """
+        if isinstance(self._data, array):
+            return self._new(array('q', map(abs, self._data)))
+        return self._new(abs(self._data))
+
+    def __add__(self: Self, other: object) -> Self:
+        """Adds `other` (elementwise) to this.
+
+        Args:
+            other (object): Currency or currency array to add.
+
+        Returns:
+            CurrencyArray: result of the adding operation.
+
+        Raises:
+            OverflowError: If a result does not fit in 64 bits.
+        """
+        return self._combine(add, other)
+
+    def __eq__(self: Self, other: object) -> Any:
+        """Elementwise equal comparison.
+
+        Args:
+            other (object): Currency or currency array to compare to.
+
+        Returns:
+            list[bool] | numpy.ndarray: mask.
+        """
+        return self._apply(eq, other)
+
+    def __ge__(self: Self, other: object) -> Any:
+        """Elementwise greater or equal comparison.
+
+        Args:
+            other (object): Currency or currency array to compare to.
+
+        Returns:
+            list[bool] | numpy.ndarray: mask.
+        """
+        return self._apply(ge, other)
+
+    def __getitem__(self: Self, key: int | slice | Sequence[bool]) -> Any:
+        """Returns an element or a selection of this array.
+
+        Args:
+            key (int | slice | Sequence[bool]): Index, slice or mask.
+
+        Returns:
+            Currency | CurrencyArray: element or array with the
+                selected elements.
+
+        Raises:
+            IndexError: If the mask length is different from the array
+                length.
+        """
+        if isinstance(key, int) or (
+                _numpy is not None and isinstance(key, _numpy.integer)):
+            return self._element(int(self._data[key]))
+        if isinstance(key, slice):
+            return self._new(self._data[key])
+        if len(key) != len(self._data):
+            msg = f'mask length {len(key)} differs from {len(self._data)}'
+            raise IndexError(msg)
+        if isinstance(self._data, array):
+            return self._new(array('q', compress(self._data, key)))
+        return self._new(self._data[_numpy.asarray(key, dtype=bool)])
+
+    def __gt__(self: Self, other: object) -> Any:
+        """Elementwise greater comparison.
+
+        Args:
+            other (object): Currency or currency array to compare to.
+
+        Returns:
+            list[bool] | numpy.ndarray: mask.
+        """
+        return self._apply(gt, other)
+
+    def __iter__(self: Self) -> Iterator[Currency]:
+        """Iterates over the elements of this array.
+
+        Yields:
+            Currency: element.
+        """
+        for units in self._data:
+            yield self._element(int(units))
+
+    def __le__(self: Self, other: object) -> Any:
+        """Elementwise less or equal comparison.
+
+        Args:
+            other (object): Currency or currency array to compare to.
+
+        Returns:
+            list[bool] | numpy.ndarray: mask.
+        """
+        return self._apply(le, other)
+
+    def __len__(self: Self) -> int:
+        """Number of elements.
+
+        Returns:
+            int: length.
+        """
+        return len(self._data)
+
+    def __lt__(self: Self, other: object) -> Any:
+        """Elementwise less comparison.
+
+        Args:
+            other (object): Currency or currency array to compare to.
+
+        Returns:
+            list[bool] | numpy.ndarray: mask.
+        """
+        return self._apply(lt, other)
+
+    def __mul__(self: Self, other: object) -> Self:
+        """Returns the multiplication by `other`.
+
+        Args:
+            other (int | float | Decimal | Sequence): amount, or
+                amounts (one per element), to multiply by.
+
+        Returns:
+            CurrencyArray: Result of the multiplication operation.
+
+        Raises:
+            CurrencyInvalidMultiplication: If `other` (or its elements)
+                not of types `int`, `float` or `Decimal` (or not finite).
+            ValueError: If `other` has a different length.
+        """
+        if isinstance(other, (str, bytes, Currency, CurrencyArray)):
+            raise CurrencyInvalidMultiplication
+        try:
+            if not hasattr(other, '__len__'):
+                return self._new(_scale_buffer(self._data, *_ratio(other)))
+            if len(other) != len(self._data):
+                msg = f'length mismatch: {len(self)} and {len(other)}'
+                raise ValueError(msg)
+            if not isinstance(self._data, array):
+                factors = _numpy.asarray(other)
+                if (factors.dtype.kind in 'iu' and
+                        _bound(factors) * _bound(self._data) < _LIMIT):
+                    return self._new(self._data * factors)
+            units = [
+                _scale(u, *_ratio(f))
+                for u, f in zip(self._data.tolist(), other)]
+        except TypeError as exception:
+            raise CurrencyInvalidMultiplication from exception
+        return self._new(_buffer(units))
+
+    def __ne__(self: Self, other: object) -> Any:
+        """Elementwise different comparison.
+
+        Args:
+            other (object): Currency or currency array to compare to.
+
+        Returns:
+            list[bool] | numpy.ndarray: mask.
+        """
+        return self._apply(ne, other)
+
+    def __neg__(self: Self) -> Self:
+        """Returns the amounts with the sign switched.
+
+        Returns:
+            CurrencyArray: amounts with the sign switched.
+        """
+        if isinstance(self._data, array):
+            return self._new(array('q', map(neg, self._data)))
+        return self._new(-self._data)
+
+    def __reduce__(self: Self) -> tuple[object, tuple[object, ...]]:
+        """Returns a `tuple` with this class "reduce value".
+
+        Returns:
+            tuple[object, tuple[object, ...]]: pickle representation of
+                this array.
+        """
+        data = self._data
+        if not isinstance(data, array):
+            data = array('q')
+            data.frombytes(self._data.tobytes())
+        return (
+            self.__class__._from_units,
+            (data, self._spec, self._type))
+
+    def __repr__(self: Self) -> str:
+        """String representation of this class.
+
+        Returns:
+            str: representation
+        """
+        amounts = self.amounts
+        if len(amounts) > 6:  # noqa: PLR2004
+            amounts = [*amounts[:3], '...', *amounts[-3:]]
+        return (
+            f'{self.__class__.__name__}('
+            f'[{", ".join(str(amount) for amount in amounts)}], '
+            f'alpha_code: "{self._spec.alpha_code}")')
+
+    def __sub__(self: Self, other: object) -> Self:
+        """Subtract `other` (elementwise) from this.
+
+        Args:
+            other (object): Currency or currency array to subtract.
+
+        Returns:
+            CurrencyArray: result of the subtraction operation.
+
+        Raises:
+            OverflowError: If a result does not fit in 64 bits.
+        """
+        return self._combine(sub, other)
+
+    def __truediv__(self: Self, other: float | Decimal) -> Self:
+        """Returns the division by `other`.
+
+        Args:
+            other (int | float | Decimal): amount to divide by.
+
+        Returns:
+            CurrencyArray: Result of the division.
+
+        Raises:
+            CurrencyInvalidDivision: If `other` not of types
+                `int`, `float` or `Decimal` (or not finite).
+            ZeroDivisionError: If dividing by zero
+        """
+        try:
+            numerator, denominator = _ratio(other)
+        except TypeError as exception:
+            raise CurrencyInvalidDivision from exception
+        if numerator == 0:
+            raise ZeroDivisionError
+        if numerator < 0:
+            numerator, denominator = -numerator, -denominator
+        return self._new(_scale_buffer(self._data, denominator, numerator))
+
+    __hash__ = None
+
+    __rmul__ = __mul__
+
+    @classmethod
+    def _from_units(
+            cls: type[Self],
+            units: Iterable[int],
+            spec: CurrencySpec,
+            currency: type[Currency] = Currency) -> Self:
+        """Creates an array from numbers of minor units.
+
+        Args:
+            units (Iterable[int]): Numbers of minor units.
+            spec (CurrencySpec): Currency specification.
+            currency (type[Currency], optional): Type of the elements.
+                Defaults to `Currency`.
+
+        Returns:
+            CurrencyArray: new object.
+        """
+        self = object.__new__(cls)
+        self._data = _buffer(units)
+        self._spec = spec
+        self._type = currency
+        return self
+
+    def allocate(
+            self: Self,
+            ratios: Iterable[float | Decimal]) -> list[Self]:
+        """Splits every amount of this array by `ratios`.
+
+        Each amount is distributed by the largest remainder method (see
+        `Currency.allocate`). The columns (one per ratio) add up to this
+        array.
+
+        Args:
+            ratios (Iterable[int | float | Decimal]): Ratios (non
+                negative with a positive sum).
+
+        Returns:
+            list[CurrencyArray]: parts (one array per ratio).
+
+        Raises:
+            CurrencyInvalidDivision: If a ratio not of types `int`,
+                `float` or `Decimal`.
+            ValueError: If there are no ratios, a ratio is negative (or
+                not finite) or if all the ratios are zero.
+        """
+        if _numpy is not None:
+            ratios = [
+                r.item() if isinstance(r, _numpy.number) else r
+                for r in ratios]
+        weights = _weights(ratios)
+        total = sum(weights)
+        data = self._data
+        if isinstance(data, array) or (
+                _bound(data) * max(weights) >= _LIMIT or total >= _LIMIT):
+            columns = [[] for _ in weights]
+            units = data if isinstance(data, array) else data.tolist()
+            for parts in (_allocate(u, weights, total) for u in units):
+                for column, part in zip(columns, parts):
+                    column.append(part)
+            return [self._new(_buffer(column)) for column in columns]
+        sizes = _numpy.abs(data)
+        quotients, remainders = _numpy.divmod(
+            _numpy.array(weights, dtype=_numpy.int64)[:, None] * sizes,
+            total)
+        left = sizes - quotients.sum(axis=0)
+        order = _numpy.argsort(-remainders, axis=0, kind='stable')
+        ranks = _numpy.empty_like(order)
+        _numpy.put_along_axis(
+            ranks,
+            order,
+            _numpy.arange(len(weights))[:, None],
+            axis=0)
+        quotients += ranks < left
+        quotients = _numpy.where(data < 0, -quotients, quotients)
+        return [self._new(column) for column in quotients]
+
+    def format_many(self: Self, fmt: str = '') -> Iterator[str]:
+        """Formats the elements of this array.
+
+        The formating specifications are resolved only once. Each
+        string is the same as the one returned by `format(element,
+        fmt)`.
+
+        Args:
+            fmt (str): formating specifications. See
+                `Currency.__format__`.
+
+        Returns:
+            Iterator[str]: Formated elements.
+
+        Raises:
+            TypeError: If `fmt` not of type `str`.
+        """
+        if not isinstance(fmt, str):
+            msg = f'must be str, not {type(fmt).__qualname__}.'
+            raise TypeError(msg)
+        spec = self._spec
+        places = -spec.decimal_places
+        data = self._data
+        units = data if isinstance(data, array) else data.tolist()
+        return _formatter(spec.pattern, fmt).many(
+            (Decimal(u).scaleb(places) for u in units), spec)
+
+    @classmethod
+    def from_currencies(
+            cls: type[Self],
+            currencies: Iterable[Currency]) -> Self:
+        """Creates an array from currencies.
+
+        The type, and specification, of the elements is the one of the
+        first currency.
+
+        Args:
+            currencies (Iterable[Currency]): Currencies (with the same
+                alpha code).
+
+        Returns:
+            CurrencyArray: new object.
+
+        Raises:
+            CurrencyTypeException: If an element not instance of
+                'Currency'.
+            CurrencyMismatchException: If the elements do not have the
+                same alpha code.
+            ValueError: If `currencies` is empty.
+        """
+        iterator = iter(currencies)
+        first = next(iterator, None)
+        if first is None:
+            msg = 'cannot create an array from an empty sequence'
+            raise ValueError(msg)
+        if not isinstance(first, Currency):
+            raise CurrencyTypeException
+        prototype = cls._from_units((), first.spec, first.__class__)
+        units = [prototype._operand(first)]  # pylint: disable=protected-access
+        units.extend(
+            prototype._operand(c)  # pylint: disable=protected-access
+            for c in iterator)
+        return cls._from_units(units, first.spec, first.__class__)
+
+    def max(self: Self) -> Currency:
+        """Returns the largest element.
+
+        Returns:
+            Currency: largest element.
+
+        Raises:
+            ValueError: If the array is empty.
+        """
+        return self._element(int(max(self._data)) if isinstance(
+            self._data, array) else int(self._data.max()))
+
+    def min(self: Self) -> Currency:
+        """Returns the smallest element.
+
+        Returns:
+            Currency: smallest element.
+
+        Raises:
+            ValueError: If the array is empty.
+        """
+        return self._element(int(min(self._data)) if isinstance(
+            self._data, array) else int(self._data.min()))
+
+    def split(self: Self, parts: int) -> list[Self]:
+        """Splits every amount of this array into `parts` parts.
+
+        The same as `allocate([1] * parts)` (see `Currency.split`).
+
+        Args:
+            parts (int): Number of parts (positive).
+
+        Returns:
+            list[CurrencyArray]: parts (one array per part).
+
+        Raises:
+            CurrencyInvalidDivision: If `parts` not of type `int`.
+            ValueError: If `parts` is not positive.
+        """
+        if not isinstance(parts, int):
+            raise CurrencyInvalidDivision
+        if parts < 1:
+            msg = f'parts must be positive, not {parts}.'
+            raise ValueError(msg)
+        data = self._data
+        if isinstance(data, array) or _bound(data) >= _LIMIT:
+            columns = [[] for _ in range(parts)]
+            for units in data if isinstance(data, array) else data.tolist():
+                quotient, left = divmod(abs(units), parts)
+                sign = -1 if units < 0 else 1
+                for index, column in enumerate(columns):
+                    column.append(sign * (quotient + (index < left)))
+            return [self._new(_buffer(column)) for column in columns]
+        sizes = _numpy.abs(data)
+        quotient, left = _numpy.divmod(sizes, parts)
+        signs = _numpy.where(data < 0, -1, 1)
+        return [
+            self._new(signs * (quotient + (index < left)))
+            for index in range(parts)]
+
+    def sum(self: Self) -> Currency:
+        """Returns the sum of the elements.
+
+        Returns:
+            Currency: sum.
+        """
+        data = self._data
+        if isinstance(data, array) or not len(data):
+            return self._element(sum(data))
+        if _bound(data) * len(data) < _LIMIT:
+            return self._element(int(data.sum()))
+        return self._element(sum(data.tolist()))
+
+    def to_currencies(self: Self) -> list[Currency]:
+        """Returns the elements of this array.
+
+        Returns:
+            list[Currency]: elements.
+        """
+        return list(self)
+
+    @property
+    def amounts(self: Self) -> list[Decimal]:
+        """list[Decimal]: amounts."""
+        places = -self._spec.decimal_places
+        return [Decimal(int(units)).scaleb(places) for units in self._data]
+
+    @property
+    def minor_units(self: Self) -> Any:
+        """array | numpy.ndarray: numbers of minor units (buffer)."""
+        return self._data
+
+    @property
+    def spec(self: Self) -> CurrencySpec:
+        """CurrencySpec: specification."""
+        return self._spec
@@ -0,0 +1,40 @@
+from collections.abc import Iterable, Iterator, Sequence
+from decimal import Decimal
+from multicurrency.pycurrency import Currency, CurrencySpec
+from typing import Any, Self
+
+class CurrencyArray:
+    def __new__(cls, amounts: Iterable[str | float | Decimal] = ..., currency: type[Currency] = ..., **kwargs: str) -> Self: ...
+    def __abs__(self) -> Self: ...
+    def __add__(self, other: object) -> Self: ...
+    def __eq__(self, other: object) -> Any: ...
+    def __ge__(self, other: object) -> Any: ...
+    def __getitem__(self, key: int | slice | Sequence[bool]) -> Any: ...
+    def __gt__(self, other: object) -> Any: ...
+    def __iter__(self) -> Iterator[Currency]: ...
+    def __le__(self, other: object) -> Any: ...
+    def __len__(self) -> int: ...
+    def __lt__(self, other: object) -> Any: ...
+    def __mul__(self, other: object) -> Self: ...
+    def __ne__(self, other: object) -> Any: ...
+    def __neg__(self) -> Self: ...
+    def __reduce__(self) -> tuple[object, tuple[object, ...]]: ...
+    def __sub__(self, other: object) -> Self: ...
+    def __truediv__(self, other: float | Decimal) -> Self: ...
+    __hash__: None  # type: ignore[assignment]
+    __rmul__: Self
+    def allocate(self, ratios: Iterable[float | Decimal]) -> list[Self]: ...
+    def format_many(self, fmt: str = ...) -> Iterator[str]: ...
+    @classmethod
+    def from_currencies(cls, currencies: Iterable[Currency]) -> Self: ...
+    def max(self) -> Currency: ...
+    def min(self) -> Currency: ...
+    def split(self, parts: int) -> list[Self]: ...
+    def sum(self) -> Currency: ...
+    def to_currencies(self) -> list[Currency]: ...
+    @property
+    def amounts(self) -> list[Decimal]: ...
+    @property
+    def minor_units(self) -> Any: ...
+    @property
+    def spec(self) -> CurrencySpec: ...
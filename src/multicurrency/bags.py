@@ -0,0 +1,267 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2020-2022, Frederico Martins
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Money bags.
+
+Representation of amounts of several currencies, grouped by alpha code.
+
+Simple usage example:
+
+    >>> from multicurrency import Currency
+    >>> from multicurrency.bags import MoneyBag
+    >>> bag = MoneyBag()
+    >>> bag += Currency('1.50', alpha_code='EUR', symbol='€')
+    >>> bag += Currency(2, alpha_code='USD', symbol='$')
+    >>> bag.update([Currency(3, alpha_code='EUR'), Currency(-1, 'USD')])
+    >>> print(bag['EUR'])
+    4.50€
+    >>> bag
+    MoneyBag(EUR: 4.50, USD: 1)
+    >>> sorted(bag)
+    ['EUR', 'USD']
+
+The bag keeps one (`Decimal`) total per alpha code. Currencies are only
+created (with the type, and specification, of the first currency added
+with that alpha code) when requested. Bags can be added together and
+pickled (e.g.: to merge the partial totals of several processes).
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Self
+
+from multicurrency.exceptions import CurrencyTypeException
+from multicurrency.pycurrency import Currency
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable, Iterator
+    from decimal import Decimal
+
+
+class MoneyBag:  # pylint: disable=protected-access
+    """Amounts of several currencies.
+
+    Args:
+        currencies (Iterable[Currency], optional): Currencies to add.
+            Defaults to none.
+
+    Raises:
+        CurrencyTypeException: If an element not instance of
+            'Currency'.
+    """
+
+    __slots__ = ('_prototypes', '_totals')
+
+    def __init__(self: Self, currencies: Iterable[Currency] = ()) -> None:
+        """Class initializer."""
+        self._prototypes: dict[str, Currency] = {}
+        self._totals: dict[str, Decimal] = {}
+        self.update(currencies)
+
+    def __add__(self: Self, other: object) -> Self:
+        """Adds `other` to a copy of this bag.
+
+        Args:
+            other (object): Currency or bag to add.
+
+        Returns:
+            MoneyBag: result of the adding operation.
+
+        Raises:
+            CurrencyTypeException: If `other` not instance of 'Currency'
+                or 'MoneyBag'.
+        """
+        bag = self.copy()
+        bag += other
+        return bag
+
+    def __bool__(self: Self) -> bool:
+        """Standard truth testing for this class.
+
+        Returns:
+            bool: False if the bag is empty. True otherwise.
+        """
+        return bool(self._totals)
+
+    def __contains__(self: Self, alpha_code: object) -> bool:
+        """Checks if the bag has a total for `alpha_code`.
+
+        Args:
+            alpha_code (object): Currency alpha code.
+
+        Returns:
+            bool: True if there is a total. False otherwise.
+        """
+        return alpha_code in self._totals
+
+    def __eq__(self: Self, other: object) -> bool:
+        """Checks if self is equal to `other`.
+
+        Args:
+            other (object): Object to compare to.
+
+        Returns:
+            bool: True if `other` is a bag with the same totals. False
+                otherwise.
+        """
+        if not isinstance(other, MoneyBag):
+            return False
+        return self._totals == other._totals
+
+    def __getitem__(self: Self, alpha_code: str) -> Currency:
+        """Returns the total for `alpha_code`.
+
+        Args:
+            alpha_code (str): Currency alpha code.
+
+        Returns:
+            Currency: total.
+
+        Raises:
+            KeyError: If there is no total for `alpha_code`.
+        """
+        total = self._totals[alpha_code]
+        return self._prototypes[alpha_code]._recreate(total)
+
+    def __iadd__(self: Self, other: object) -> Self:
+        """Adds `other` to this bag.
+
+        Args:
+            other (object): Currency or bag to add.
+
+        Returns:
+            MoneyBag: this bag.
+
+        Raises:
+            CurrencyTypeException: If `other` not instance of 'Currency'
+                or 'MoneyBag'.
+        """
+        if isinstance(other, MoneyBag):
+            self._merge(other)
+        else:
+            self.add(other)
+        return self
+
+    def __iter__(self: Self) -> Iterator[str]:
+        """Iterates over the alpha codes.
+
+        Returns:
+            Iterator[str]: alpha codes.
+        """
+        return iter(self._totals)
+
+    def __len__(self: Self) -> int:
+        """Returns the number of totals.
+
+        Returns:
+            int: number of alpha codes.
+        """
+        return len(self._totals)
+
+    def __reduce__(self: Self) -> tuple[object, tuple[object, ...]]:
+        """Returns a `tuple` with this class "reduce value".
+
+        Returns:
+            tuple[object, tuple[object, ...]]: pickle representation of
+                this bag.
+        """
+        return (self.__class__, (self.currencies(),))
+
+    def __repr__(self: Self) -> str:
+        """String representation of this class.
+
+        Returns:
+            str: representation
+        """
+        totals = ', '.join(
+            f'{alpha_code}: {total}'
+            for alpha_code, total in self._totals.items())
+        return f'{self.__class__.__name__}({totals})'
+
+    __hash__ = None
+
+    def _merge(self: Self, other: MoneyBag) -> None:
+        """Adds the totals of the bag `other` to this bag.
+
+        Args:
+            other (MoneyBag): Bag to add.
+        """
+        totals = self._totals
+        prototypes = self._prototypes
+        for alpha_code, total in other._totals.items():
+            if alpha_code in totals:
+                totals[alpha_code] += total
+            else:
+                totals[alpha_code] = total
+                prototypes[alpha_code] = other._prototypes[alpha_code]
+
+    def add(self: Self, currency: Currency) -> None:
+        """Adds `currency` to this bag.
+
+        Args:
+            currency (Currency): Currency to add.
+
+        Raises:
+            CurrencyTypeException: If `currency` not instance of
+                'Currency'.
+        """
+        if not isinstance(currency, Currency):
+            raise CurrencyTypeException
+        alpha_code = currency._spec.alpha_code
+        totals = self._totals
+        if alpha_code in totals:
+            totals[alpha_code] += currency._amount
+        else:
+            totals[alpha_code] = currency._amount
+            self._prototypes[alpha_code] = currency
+
+    def copy(self: Self) -> Self:
+        """Returns a copy of this bag.
+
+        Returns:
+            MoneyBag: new object.
+        """
+        bag = self.__class__()
+        bag._merge(self)
+        return bag
+
+    def currencies(self: Self) -> list[Currency]:
+        """Returns the totals.
+
+        Returns:
+            list[Currency]: one currency for each alpha code.
+        """
+        prototypes = self._prototypes
+        return [
+            prototypes[alpha_code]._recreate(total)
+            for alpha_code, total in self._totals.items()]
+
+    def update(self: Self, currencies: Iterable[Currency | MoneyBag]) -> None:
+        """Adds every currency (or bag) of `currencies` to this bag.
+
+        Args:
+            currencies (Iterable[Currency | MoneyBag]): Currencies, or
+                bags, to add.
+
+        Raises:
+            CurrencyTypeException: If an element not instance of
+                'Currency' or 'MoneyBag'.
+        """
+        totals = self._totals
+        prototypes = self._prototypes
+        for currency in currencies:
+            if not isinstance(currency, Currency):
+                if not isinstance(currency, MoneyBag):
+                    raise CurrencyTypeException
+                self._merge(currency)
+                continue
+            alpha_code = currency._spec.alpha_code
+            if alpha_code in totals:
+                totals[alpha_code] += currency._amount
+            else:
+                totals[alpha_code] = currency._amount
+                prototypes[alpha_code] = currency
@@ -0,0 +1,20 @@
+from collections.abc import Iterable, Iterator
+from multicurrency.pycurrency import Currency
+from typing import Self
+
+class MoneyBag:
+    def __init__(self, currencies: Iterable[Currency] = ...) -> None: ...
+    def __add__(self, other: object) -> Self: ...
+    def __bool__(self) -> bool: ...
+    def __contains__(self, alpha_code: object) -> bool: ...
+    def __eq__(self, other: object) -> bool: ...
+    def __getitem__(self, alpha_code: str) -> Currency: ...
+    def __iadd__(self, other: object) -> Self: ...
+    def __iter__(self) -> Iterator[str]: ...
+    def __len__(self) -> int: ...
+    def __reduce__(self) -> tuple[object, tuple[object, ...]]: ...
+    __hash__: None  # type: ignore[assignment]
+    def add(self, currency: Currency) -> None: ...
+    def copy(self) -> Self: ...
+    def currencies(self) -> list[Currency]: ...
+    def update(self, currencies: Iterable[Currency | MoneyBag]) -> None: ...
@@ -0,0 +1,572 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2020-2022, Frederico Martins
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Currency codec.
+
+Compact binary serialization of currencies and currency arrays.
+
+Simple usage example:
+
+    >>> from multicurrency import CurrencyArray, Euro, USDollar
+    >>> from multicurrency.codec import dumps, loads
+    >>> data = dumps([Euro('1.50'), Euro(-2), USDollar('0.125')])
+    >>> len(data)
+    33
+    >>> [type(c).__name__ for c in loads(data)]
+    ['Euro', 'Euro', 'USDollar']
+    >>> [c.amount for c in loads(data)]
+    [Decimal('1.50'), Decimal('-2'), Decimal('0.125')]
+    >>> data = dumps(CurrencyArray(range(1000), Euro))
+    >>> len(data)
+    8012
+    >>> array, = loads(data)
+    >>> len(array), array.sum().amount
+    (1000, Decimal('499500.00'))
+
+The data is a sequence of records. The currency (type and
+specification) of a record is defined once, by a definition record with
+the name of the currency class (see `multicurrency.currencies`) or,
+for the other currencies, with the whole specification, and then
+referred to by a (small) number.
+
+The amounts are encoded, exactly, as a variable length number of minor
+units (when the exponent of the amount is the one of the currency
+decimal places), as a variable length coefficient and exponent (for
+the other finite amounts) or as text. The currency arrays are encoded
+as blocks of fixed width (64 bits) minor units.
+
+Streams (e.g.: files) are decoded one record at a time with
+`iter_load`. The data of several `dumps` (or `dump`) can be
+concatenated.
+"""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from decimal import MAX_EMAX, MAX_PREC, MIN_EMIN, Context, Decimal
+from importlib import import_module
+from itertools import islice
+from typing import IO, TYPE_CHECKING
+
+from multicurrency import currencies
+from multicurrency.exceptions import CurrencyTypeException
+from multicurrency.fixed import FixedCurrency
+from multicurrency.pycurrency import Currency, CurrencySpec, _currency_spec
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable, Iterator
+
+    from multicurrency.arrays import CurrencyArray
+
+
+CHUNK_SIZE = 65_536
+
+# record tags
+_DEFINE = 0
+_UNITS = 1
+_DECIMAL = 2
+_TEXT = 3
+_BLOCK = 4
+
+# currency kinds (of the definition records)
+_NAMED = 0
+_NAMED_PATTERN = 1
+_GENERIC = 2
+_FIXED = 3
+
+_BYTES = tuple(bytes((byte,)) for byte in range(128))
+_CURRENCIES = currencies._CURRENCIES  # pylint: disable=protected-access
+_EXACT = Context(prec=MAX_PREC, Emax=MAX_EMAX, Emin=MIN_EMIN)
+_SWAP = sys.byteorder != 'little'
+
+
+def _varint(value: int) -> bytes:
+    """Encodes the (non negative) `value` as a variable length number.
+
+    Args:
+        value (int): Value to encode.
+
+    Returns:
+        bytes: seven bits per byte, least significant first.
+    """
+    if value < 0x80:  # noqa: PLR2004
+        return _BYTES[value]
+    if value < 0x4000:  # noqa: PLR2004
+        return bytes((value & 0x7F | 0x80, value >> 7))
+    if value < 0x200000:  # noqa: PLR2004
+        return bytes((
+            value & 0x7F | 0x80,
+            value >> 7 & 0x7F | 0x80,
+            value >> 14))
+    data = bytearray()
+    while value >= 0x80:  # noqa: PLR2004
+        data.append(value & 0x7F | 0x80)
+        value >>= 7
+    data.append(value)
+    return bytes(data)
+
+
+def _signed(value: int) -> bytes:
+    """Encodes the `value` as a (zigzag) variable length number.
+
+    Args:
+        value (int): Value to encode.
+
+    Returns:
+        bytes: encoded value.
+    """
+    return _varint(value << 1 if value >= 0 else (-value << 1) - 1)
+
+
+def _text(value: str) -> bytes:
+    """Encodes the `value` as a length prefixed string.
+
+    Args:
+        value (str): Value to encode.
+
+    Returns:
+        bytes: encoded value.
+    """
+    data = value.encode('utf-8')
+    return _varint(len(data)) + data
+
+
+def _read_varint(data: bytes, position: int) -> tuple[int, int]:
+    """Decodes a variable length number.
+
+    Args:
+        data (bytes): Data.
+        position (int): Position of the number.
+
+    Returns:
+        tuple[int, int]: value and position of the next field.
+
+    Raises:
+        IndexError: If the data ends before the number.
+    """
+    byte = data[position]
+    if byte < 0x80:  # noqa: PLR2004
+        return byte, position + 1
+    value = byte & 0x7F
+    shift = 7
+    while True:
+        position += 1
+        byte = data[position]
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:  # noqa: PLR2004
+            return value, position + 1
+        shift += 7
+
+
+def _read_signed(data: bytes, position: int) -> tuple[int, int]:
+    """Decodes a (zigzag) variable length number.
+
+    Args:
+        data (bytes): Data.
+        position (int): Position of the number.
+
+    Returns:
+        tuple[int, int]: value and position of the next field.
+
+    Raises:
+        IndexError: If the data ends before the number.
+    """
+    value, position = _read_varint(data, position)
+    return (value >> 1) ^ -(value & 1), position
+
+
+def _read_bytes(data: bytes, position: int, size: int) -> tuple[bytes, int]:
+    """Reads `size` bytes.
+
+    Args:
+        data (bytes): Data.
+        position (int): Position of the bytes.
+        size (int): Number of bytes.
+
+    Returns:
+        tuple[bytes, int]: bytes and position of the next field.
+
+    Raises:
+        IndexError: If the data ends before the bytes.
+    """
+    end = position + size
+    if end > len(data):
+        raise IndexError
+    return data[position:end], end
+
+
+def _read_text(data: bytes, position: int) -> tuple[str, int]:
+    """Decodes a length prefixed string.
+
+    Args:
+        data (bytes): Data.
+        position (int): Position of the string.
+
+    Returns:
+        tuple[str, int]: value and position of the next field.
+
+    Raises:
+        IndexError: If the data ends before the string.
+    """
+    size, position = _read_varint(data, position)
+    value, position = _read_bytes(data, position, size)
+    return value.decode('utf-8'), position
+
+
+def _definition(currency: type[Currency], spec: CurrencySpec) -> bytes:
+    """Encodes the definition of a currency type and specification.
+
+    Args:
+        currency (type[Currency]): Currency type.
+        spec (CurrencySpec): Currency specification.
+
+    Returns:
+        bytes: kind and fields of the definition.
+
+    Raises:
+        CurrencyTypeException: If `currency` is not a currency class,
+            `Currency` or `FixedCurrency`.
+    """
+    name = currency.__name__
+    if name in _CURRENCIES and getattr(currencies, name) is currency:
+        if spec is currency._default:  # pylint: disable=protected-access
+            return _BYTES[_NAMED] + _text(name)
+        return _BYTES[_NAMED_PATTERN] + _text(name) + _text(spec.pattern)
+    if currency is Currency:
+        kind = _GENERIC
+    elif currency is FixedCurrency:
+        kind = _FIXED
+    else:
+        raise CurrencyTypeException(currency)
+    return _BYTES[kind] + b''.join(_text(field) for field in (
+        spec.alpha_code,
+        spec.numeric_code,
+        spec.symbol,
+        spec.localized_symbol,
+        spec.convertion,
+        spec.pattern))
+
+
+def _read_definition(
+        data: bytes,
+        position: int) -> tuple[tuple[type[Currency], CurrencySpec], int]:
+    """Decodes the definition of a currency type and specification.
+
+    Args:
+        data (bytes): Data.
+        position (int): Position of the definition.
+
+    Returns:
+        tuple[tuple[type[Currency], CurrencySpec], int]: currency type,
+            specification and position of the next record.
+
+    Raises:
+        IndexError: If the data ends before the definition.
+        ValueError: If the definition is not valid.
+    """
+    kind = data[position]
+    position += 1
+    if kind in (_NAMED, _NAMED_PATTERN):
+        name, position = _read_text(data, position)
+        if name not in _CURRENCIES:
+            msg = f'unknown currency {name!r}.'
+            raise ValueError(msg)
+        currency = getattr(currencies, name)
+        if kind == _NAMED:
+            return (currency, currency._default), position
+        pattern, position = _read_text(data, position)
+        return (currency, currency(0, pattern).spec), position
+    if kind not in (_GENERIC, _FIXED):
+        msg = f'invalid currency definition ({kind}).'
+        raise ValueError(msg)
+    fields = []
+    for _ in range(6):
+        field, position = _read_text(data, position)
+        fields.append(field)
+    currency = Currency if kind == _GENERIC else FixedCurrency
+    return (currency, _currency_spec(*fields)), position
+
+
+def _amount(currency: Currency, places: int) -> tuple[bytes, bytes]:
+    """Encodes the amount of `currency`.
+
+    Args:
+        currency (Currency): Currency.
+        places (int): Decimal places of the currency.
+
+    Returns:
+        tuple[bytes, bytes]: tag and fields of the amount.
+    """
+    if isinstance(currency, FixedCurrency):
+        units = currency._units  # pylint: disable=protected-access
+        return _BYTES[_UNITS], _signed(units)
+    amount = currency._amount  # pylint: disable=protected-access
+    text = str(amount)
+    if 'E' in text or not text[-1].isdigit():
+        sign, digits, exponent = amount.as_tuple()
+        if isinstance(exponent, str) or (sign and not any(digits)):
+            return _BYTES[_TEXT], _text(text)
+        coefficient = int(amount.scaleb(-exponent, _EXACT))
+    else:
+        integral, _, fractional = text.partition('.')
+        coefficient = int(integral + fractional)
+        if not coefficient and text[0] == '-':
+            return _BYTES[_TEXT], _text(text)
+        exponent = -len(fractional)
+    if exponent == -places:
+        return _BYTES[_UNITS], _signed(coefficient)
+    return _BYTES[_DECIMAL], _signed(exponent) + _signed(coefficient)
+
+
+def _block(currencies_: CurrencyArray) -> bytes:
+    """Encodes the minor units of a currency array.
+
+    Args:
+        currencies_ (CurrencyArray): Currency array.
+
+    Returns:
+        bytes: number of elements and their (64 bits, little endian)
+            minor units.
+    """
+    units = currencies_.minor_units
+    if not isinstance(units, array) or _SWAP:
+        units = array('q', units.tobytes())
+    if _SWAP:
+        units.byteswap()
+    return _varint(len(units)) + units.tobytes()
+
+
+def _is_array(item: object) -> bool:
+    """Checks if `item` is a currency array.
+
+    Args:
+        item (object): Item to check.
+
+    Returns:
+        bool: True if a currency array (always False if the arrays
+            module was not imported). False otherwise.
+    """
+    arrays = sys.modules.get('multicurrency.arrays')
+    return arrays is not None and isinstance(item, arrays.CurrencyArray)
+
+
+def _encode(items: Iterable[Currency | CurrencyArray]) -> Iterator[bytes]:
+    """Encodes `items`.
+
+    Args:
+        items (Iterable[Currency | CurrencyArray]): Currencies, or
+            currency arrays, to encode.
+
+    Yields:
+        bytes: records.
+
+    Raises:
+        CurrencyTypeException: If an item is not a currency (of a
+            supported type) or a currency array.
+    """
+    numbers: dict[tuple[type[Currency], CurrencySpec], bytes] = {}
+    key = (None, None)
+    for item in items:
+        # pylint: disable=protected-access
+        block = False
+        if isinstance(item, Currency):
+            currency, spec = item.__class__, item._spec
+        elif _is_array(item):
+            currency, spec, block = item._type, item.spec, True
+        else:
+            raise CurrencyTypeException(item)
+        if currency is not key[0] or spec is not key[1]:
+            key = (currency, spec)
+            number = numbers.get(key)
+            if number is None:
+                number = numbers[key] = _varint(len(numbers))
+                yield _BYTES[_DEFINE] + number + _definition(*key)
+        if block:
+            yield _BYTES[_BLOCK] + number + _block(item)
+        else:
+            tag, fields = _amount(item, spec.decimal_places)
+            yield tag + number + fields
+
+
+def _decode(
+        data: bytes,
+        position: int,
+        definitions: dict[int, tuple[type[Currency], CurrencySpec]]) -> tuple[
+            Currency | CurrencyArray | None, int]:
+    """Decodes a record.
+
+    Args:
+        data (bytes): Data.
+        position (int): Position of the record.
+        definitions (dict[int, tuple[type[Currency], CurrencySpec]]):
+            Currency definitions (updated with the definition records).
+
+    Returns:
+        tuple[Currency | CurrencyArray | None, int]: decoded item (None
+            for the definition records) and position of the next record.
+
+    Raises:
+        IndexError: If the data ends before the record.
+        ValueError: If the record is not valid.
+    """
+    tag = data[position]
+    number = data[position + 1]
+    if number < 0x80:  # noqa: PLR2004
+        position += 2
+    else:
+        number, position = _read_varint(data, position + 1)
+    if tag == _DEFINE:
+        definition, position = _read_definition(data, position)
+        definitions[number] = definition
+        return None, position
+    definition = definitions.get(number)
+    if definition is None:
+        msg = f'undefined currency ({number}).'
+        raise ValueError(msg)
+    currency, spec = definition
+    if tag == _UNITS:
+        units, position = _read_varint(data, position)
+        units = (units >> 1) ^ -(units & 1)
+        if issubclass(currency, FixedCurrency):
+            return currency._from_units(units, spec), position
+        amount = Decimal(units).scaleb(-spec.decimal_places, _EXACT)
+    elif tag == _DECIMAL:
+        exponent, position = _read_signed(data, position)
+        coefficient, position = _read_signed(data, position)
+        amount = Decimal(coefficient).scaleb(exponent, _EXACT)
+    elif tag == _TEXT:
+        text, position = _read_text(data, position)
+        amount = Decimal(text)
+    elif tag == _BLOCK:
+        size, position = _read_varint(data, position)
+        block, position = _read_bytes(data, position, size * 8)
+        units = array('q', block)
+        if _SWAP:
+            units.byteswap()
+        arrays = import_module('multicurrency.arrays')
+        return arrays.CurrencyArray._from_units(
+            units, spec, currency), position
+    else:
+        msg = f'invalid record ({tag}).'
+        raise ValueError(msg)
+    return currency._from_spec(amount, spec), position
+
+
+def dump(
+        items: Currency | CurrencyArray | Iterable[Currency | CurrencyArray],
+        file: IO[bytes],
+        chunk_size: int = CHUNK_SIZE) -> None:
+    """Encodes `items` into the binary `file`.
+
+    Args:
+        items (Currency | CurrencyArray | Iterable[Currency |
+            CurrencyArray]): Currency, currency array or currencies
+            (and currency arrays) to encode.
+        file (IO[bytes]): Binary file.
+        chunk_size (int, optional): Number of records written at once.
+            Defaults to 65_536.
+
+    Raises:
+        CurrencyTypeException: If an item is not a currency (of a
+            supported type) or a currency array.
+    """
+    if isinstance(items, Currency) or _is_array(items):
+        items = (items,)
+    records = _encode(items)
+    while True:
+        data = b''.join(islice(records, chunk_size))
+        if not data:
+            return
+        file.write(data)
+
+
+def dumps(
+        items: Currency | CurrencyArray | Iterable[
+            Currency | CurrencyArray]) -> bytes:
+    """Encodes `items`.
+
+    Args:
+        items (Currency | CurrencyArray | Iterable[Currency |
+            CurrencyArray]): Currency, currency array or currencies
+            (and currency arrays) to encode.
+
+    Returns:
+        bytes: encoded items.
+
+    Raises:
+        CurrencyTypeException: If an item is not a currency (of a
+            supported type) or a currency array.
+    """
+    if isinstance(items, Currency) or _is_array(items):
+        items = (items,)
+    return b''.join(_encode(items))
+
+
+def iter_load(
+        file: IO[bytes],
+        chunk_size: int = CHUNK_SIZE) -> Iterator[Currency | CurrencyArray]:
+    """Decodes the items of the binary `file`, one at a time.
+
+    Args:
+        file (IO[bytes]): Binary file.
+        chunk_size (int, optional): Number of bytes read at once (at
+            least). Defaults to 65_536.
+
+    Yields:
+        Currency | CurrencyArray: decoded item.
+
+    Raises:
+        ValueError: If the data is not valid.
+    """
+    definitions: dict[int, tuple[type[Currency], CurrencySpec]] = {}
+    data = b''
+    position = 0
+    while True:
+        chunk = file.read(max(chunk_size, len(data) - position))
+        data = data[position:] + chunk
+        position = 0
+        end = len(data)
+        while position < end:
+            try:
+                item, position = _decode(data, position, definitions)
+            except IndexError:
+                break
+            if item is not None:
+                yield item
+        if not chunk:
+            if position < end:
+                msg = 'truncated currency data.'
+                raise ValueError(msg)
+            return
+
+
+def loads(data: bytes) -> list[Currency | CurrencyArray]:
+    """Decodes the items of `data`.
+
+    Args:
+        data (bytes): Encoded items.
+
+    Returns:
+        list[Currency | CurrencyArray]: decoded items.
+
+    Raises:
+        ValueError: If the data is not valid.
+    """
+    definitions: dict[int, tuple[type[Currency], CurrencySpec]] = {}
+    items = []
+    position = 0
+    end = len(data)
+    while position < end:
+        try:
+            item, position = _decode(data, position, definitions)
+        except IndexError:
+            msg = 'truncated currency data.'
+            raise ValueError(msg) from None
+        if item is not None:
+            items.append(item)
+    return items
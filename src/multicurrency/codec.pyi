@@ -0,0 +1,11 @@
+from collections.abc import Iterable, Iterator
+from multicurrency.arrays import CurrencyArray
+from multicurrency.pycurrency import Currency
+from typing import IO
+
+CHUNK_SIZE: int
+
+def dump(items: Currency | CurrencyArray | Iterable[Currency | CurrencyArray], file: IO[bytes], chunk_size: int = ...) -> None: ...
+def dumps(items: Currency | CurrencyArray | Iterable[Currency | CurrencyArray]) -> bytes: ...
+def iter_load(file: IO[bytes], chunk_size: int = ...) -> Iterator[Currency | CurrencyArray]: ...
+def loads(data: bytes) -> list[Currency | CurrencyArray]: ...
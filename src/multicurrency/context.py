@@ -0,0 +1,245 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2020-2022, Frederico Martins
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Money contexts.
+
+Precision and rounding of the currency arithmetic and formatting.
+
+Simple usage example:
+
+    >>> from multicurrency import Euro
+    >>> from multicurrency.context import MoneyContext, money_context
+    >>> context = MoneyContext(precision=6, rounding='ROUND_DOWN')
+    >>> with money_context(context):
+    ...     print((Euro(10) / 3).amount)
+    3.33333
+    >>> euro = Euro(10).with_context(context)
+    >>> (euro / 3).amount, (euro * 2 / 3).amount
+    (Decimal('3.33333'), Decimal('6.66666'))
+
+A money context has its own (precomputed) `decimal.Context`, that is
+used, through its methods, by the operations and the formatting of the
+currencies, instead of the `decimal` context of the thread. It can be
+attached to a currency (`Currency.with_context`), and to the results
+of its operations, or be the current one (`money_context`) for a
+block. The current money context is kept in a `contextvars.ContextVar`
+so each thread, and each `asyncio` task, has its own.
+
+The money context of the currency (of the left operand) takes
+precedence over the current one. Without a money context the
+`decimal` context of the thread is used (as before).
+"""
+
+from __future__ import annotations
+
+from contextvars import ContextVar
+from decimal import (
+    ROUND_05UP,
+    ROUND_CEILING,
+    ROUND_DOWN,
+    ROUND_FLOOR,
+    ROUND_HALF_DOWN,
+    ROUND_HALF_EVEN,
+    ROUND_HALF_UP,
+    ROUND_UP,
+    Context,
+)
+from typing import TYPE_CHECKING, Self
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from contextvars import Token
+    from types import TracebackType
+
+
+ROUNDINGS = (
+    ROUND_05UP,
+    ROUND_CEILING,
+    ROUND_DOWN,
+    ROUND_FLOOR,
+    ROUND_HALF_DOWN,
+    ROUND_HALF_EVEN,
+    ROUND_HALF_UP,
+    ROUND_UP)
+
+_CURRENT: ContextVar[MoneyContext | None] = ContextVar(
+    'money_context', default=None)
+
+
+class MoneyContext:
+    """Money context.
+
+    Immutable precision and rounding of the currency operations and
+    formatting.
+
+    Args:
+        precision (int, optional): Number of significant digits.
+            Defaults to 28.
+        rounding (str, optional): Rounding mode. Defaults to
+            'ROUND_HALF_EVEN'.
+
+    Raises:
+        ValueError: If `precision` or `rounding` are not valid.
+    """
+
+    __slots__ = ('precision', 'rounding', 'decimal_context', '_hash')
+
+    def __new__(
+            cls: type[Self],
+            precision: int = 28,
+            rounding: str = ROUND_HALF_EVEN) -> Self:
+        """Class creator.
+
+        Returns:
+            MoneyContext: new object.
+        """
+        if rounding not in ROUNDINGS:
+            msg = f'rounding must be one of {ROUNDINGS}, not {rounding!r}.'
+            raise ValueError(msg)
+        try:
+            decimal_context = Context(prec=precision, rounding=rounding)
+        except (TypeError, ValueError):
+            msg = f'invalid precision ({precision!r}).'
+            raise ValueError(msg) from None
+        self = object.__new__(cls)
+        object.__setattr__(self, 'precision', precision)
+        object.__setattr__(self, 'rounding', rounding)
+        object.__setattr__(self, 'decimal_context', decimal_context)
+        object.__setattr__(self, '_hash', hash((precision, rounding)))
+        return self
+
+    def __delattr__(self: Self, name: str) -> None:
+        """Prevents the removal of attributes.
+
+        Args:
+            name (str): Attribute name.
+
+        Raises:
+            AttributeError: Always.
+        """
+        msg = f'cannot delete attribute {name!r}'
+        raise AttributeError(msg)
+
+    def __eq__(self: Self, other: object) -> bool:
+        """Checks if two money contexts are equal.
+
+        Args:
+            other (object): Money context to compare to.
+
+        Returns:
+            bool: True if equal. False otherwise.
+        """
+        if self is other:
+            return True
+        if isinstance(other, MoneyContext):
+            return (
+                self.precision == other.precision and
+                self.rounding == other.rounding)
+        return NotImplemented
+
+    def __hash__(self: Self) -> int:
+        """Hash representation of this class.
+
+        Returns:
+            int: Hash value.
+        """
+        return self._hash
+
+    def __reduce__(self: Self) -> tuple[object, tuple[int, str]]:
+        """Returns a `tuple` with this class "reduce value".
+
+        Returns:
+            tuple[object, tuple[int, str]]: pickle representation of
+                this money context.
+        """
+        return (self.__class__, (self.precision, self.rounding))
+
+    def __repr__(self: Self) -> str:
+        """String representation of this class.
+
+        Returns:
+            str: representation
+        """
+        return (
+            f'{self.__class__.__name__}('
+            f'precision: {self.precision}, '
+            f'rounding: "{self.rounding}")')
+
+    def __setattr__(self: Self, name: str, value: object) -> None:
+        """Prevents changes to the attributes.
+
+        Args:
+            name (str): Attribute name.
+            value (object): Attribute value.
+
+        Raises:
+            AttributeError: Always.
+        """
+        msg = f'cannot assign to attribute {name!r}'
+        raise AttributeError(msg)
+
+
+class _MoneyContextManager:
+    """Sets the current money context while a block runs.
+
+    Args:
+        context (MoneyContext | None): Money context. None for the
+            `decimal` context of the thread.
+    """
+
+    __slots__ = ('_context', '_token')
+
+    def __init__(self: Self, context: MoneyContext | None) -> None:
+        """Class initializer."""
+        self._context = context
+        self._token: Token[MoneyContext | None] | None = None
+
+    def __enter__(self: Self) -> MoneyContext | None:
+        """Sets the money context.
+
+        Returns:
+            MoneyContext | None: money context.
+        """
+        self._token = _CURRENT.set(self._context)
+        return self._context
+
+    def __exit__(
+            self: Self,
+            kind: type[BaseException] | None,
+            value: BaseException | None,
+            traceback: TracebackType | None) -> None:
+        """Restores the previous money context."""
+        _CURRENT.reset(self._token)
+
+
+def get_money_context() -> MoneyContext | None:
+    """Returns the current money context.
+
+    Returns:
+        MoneyContext | None: money context. None if not set.
+    """
+    return _CURRENT.get()
+
+
+def money_context(context: MoneyContext | None) -> _MoneyContextManager:
+    """Sets the current money context while a block runs.
+
+    Only the current thread (or `asyncio` task) is affected.
+
+    Args:
+        context (MoneyContext | None): Money context. None for the
+            `decimal` context of the thread.
+
+    Returns:
+        _MoneyContextManager: context manager.
+
+    Raises:
+        TypeError: If `context` not of type `MoneyContext`.
+    """
+    if context is not None and not isinstance(context, MoneyContext):
+        msg = f'must be MoneyContext, not {type(context).__qualname__}.'
+        raise TypeError(msg)
+    return _MoneyContextManager(context)
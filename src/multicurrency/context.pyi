@@ -0,0 +1,25 @@
+from decimal import Context
+from types import TracebackType
+from typing import Self
+
+ROUNDINGS: tuple[str, ...]
+
+class MoneyContext:
+    precision: int
+    rounding: str
+    decimal_context: Context
+    def __new__(cls, precision: int = ..., rounding: str = ...) -> Self: ...
+    def __delattr__(self, name: str) -> None: ...
+    def __eq__(self, other: object) -> bool: ...
+    def __hash__(self) -> int: ...
+    def __reduce__(self) -> tuple[object, tuple[int, str]]: ...
+    def __repr__(self) -> str: ...
+    def __setattr__(self, name: str, value: object) -> None: ...
+
+class _MoneyContextManager:
+    def __init__(self, context: MoneyContext | None) -> None: ...
+    def __enter__(self) -> MoneyContext | None: ...
+    def __exit__(self, kind: type[BaseException] | None, value: BaseException | None, traceback: TracebackType | None) -> None: ...
+
+def get_money_context() -> MoneyContext | None: ...
+def money_context(context: MoneyContext | None) -> _MoneyContextManager: ...
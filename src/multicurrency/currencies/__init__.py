@@ -293,312 +293,1872 @@ Table of supported cryptocurrencies:
 | `multicurrency.currencies.crypto.Zcash`         |           ⓩ123,456.78900000 |           ⓩ123,456.78900000 |           123,456.78900000 ZEC |
 """ # pylint: disable=line-too-long  # noqa: E501,W505
 
-from multicurrency.currencies.afghani import Afghani
-from multicurrency.currencies.ariary import MalagasyAriary
-from multicurrency.currencies.baht import Baht
-from multicurrency.currencies.balboa import Balboa
-from multicurrency.currencies.birr import EthiopianBirr
-from multicurrency.currencies.boliviano import Boliviano
-from multicurrency.currencies.cedi import Cedi
-from multicurrency.currencies.colon import CostaRicanColon
-from multicurrency.currencies.crypto import (
-    EOS,
-    Bitcoin,
-    Ethereum,
-    Monero,
-    Ripple,
-    StellarLumens,
-    Tezos,
-    Zcash,
-)
-from multicurrency.currencies.dalasi import Dalasi
-from multicurrency.currencies.denar import Denar
-from multicurrency.currencies.dinar import (
-    AlgerianDinar,
-    BahrainiDinar,
-    IraqiDinar,
-    JordanianDinar,
-    KuwaitiDinar,
-    LibyanDinar,
-    SerbianDinarSR,
-    SerbianDinarXK,
-    TunisianDinar,
-)
-from multicurrency.currencies.dirham import (
-    MoroccanDirham,
-    UAEDirham,
-)
-from multicurrency.currencies.dobra import Dobra
-from multicurrency.currencies.dollar import (
-    AustralianDollar,
-    AustralianDollarAU,
-    AustralianDollarCC,
-    AustralianDollarKI,
-    AustralianDollarMR,
-    AustralianDollarTV,
-    BahamianDollar,
-    BarbadosDollar,
-    BelizeDollar,
-    BermudianDollar,
-    BruneiDollar,
-    BruneiDollarBN,
-    BruneiDollarSG,
-    CanadianDollarEN,
-    CanadianDollarFR,
-    CaymanIslandsDollar,
-    EasternCaribbeanDollar,
-    EasternCaribbeanDollarAG,
-    EasternCaribbeanDollarAI,
-    EasternCaribbeanDollarDM,
-    EasternCaribbeanDollarGD,
-    EasternCaribbeanDollarKN,
-    EasternCaribbeanDollarLC,
-    EasternCaribbeanDollarMS,
-    EasternCaribbeanDollarVC,
-    FijiDollar,
-    GuyanaDollar,
-    HongKongDollar,
-    JamaicanDollar,
-    LiberianDollar,
-    NamibiaDollar,
-    NewZealandDollar,
-    NewZealandDollarCK,
-    NewZealandDollarNU,
-    NewZealandDollarNZ,
-    NewZealandDollarPN,
-    SingaporeDollar,
-    SingaporeDollarBN,
-    SingaporeDollarSG,
-    SolomonIslandsDollar,
-    SurinameDollar,
-    TaiwanDollar,
-    TrinidadandTobagoDollar,
-    USDollar,
-    USDollarAS,
-    USDollarFM,
-    USDollarGU,
-    USDollarHT,
-    USDollarIO,
-    USDollarMH,
-    USDollarMP,
-    USDollarPA,
-    USDollarPC,
-    USDollarPR,
-    USDollarPW,
-    USDollarTC,
-    USDollarVG,
-    USDollarVI,
-    ZimbabweDollar,
-)
-from multicurrency.currencies.dong import Dong
-from multicurrency.currencies.dram import ArmenianDram
-from multicurrency.currencies.escudo import CapeVerdeEscudo
-from multicurrency.currencies.euro import (
-    Euro,
-    EuroAD,
-    EuroAT,
-    EuroBE,
-    EuroCY,
-    EuroDE,
-    EuroEE,
-    EuroES,
-    EuroFI,
-    EuroFR,
-    EuroGR,
-    EuroIE,
-    EuroIT,
-    EuroLT,
-    EuroLU,
-    EuroLV,
-    EuroMC,
-    EuroME,
-    EuroMT,
-    EuroNL,
-    EuroPT,
-    EuroSBA,
-    EuroSI,
-    EuroSK,
-    EuroSM,
-    EuroVA,
-    EuroXK,
-)
-from multicurrency.currencies.florin import ArubanFlorin
-from multicurrency.currencies.forint import Forint
-from multicurrency.currencies.franc import (
-    BurundiFranc,
-    CFAFrancBCEAO,
-    CFAFrancBCEAOBF,
-    CFAFrancBCEAOBJ,
-    CFAFrancBCEAOCI,
-    CFAFrancBCEAOGW,
-    CFAFrancBCEAOML,
-    CFAFrancBCEAONG,
-    CFAFrancBCEAOSN,
-    CFAFrancBCEAOTG,
-    CFAFrancBEAC,
-    CFAFrancBEACCD,
-    CFAFrancBEACCF,
-    CFAFrancBEACCM,
-    CFAFrancBEACGA,
-    CFAFrancBEACGQ,
-    CFAFrancBEACTD,
-    CFPFranc,
-    CFPFrancNC,
-    CFPFrancPF,
-    CFPFrancWF,
-    CongoleseFranc,
-    DjiboutiFranc,
-    GuineaFranc,
-    RwandaFranc,
-    SwissFranc,
-    SwissFrancCH,
-    SwissFrancLI,
-)
-from multicurrency.currencies.fuerte import BolivarFuerte
-from multicurrency.currencies.gourde import Gourde
-from multicurrency.currencies.guarani import Guarani
-from multicurrency.currencies.hryvnia import Hryvnia
-from multicurrency.currencies.kina import Kina
-from multicurrency.currencies.kip import Kip
-from multicurrency.currencies.koruna import CzechKoruna
-from multicurrency.currencies.krona import (
-    IcelandKrona,
-    SwedishKrona,
-)
-from multicurrency.currencies.krone import (
-    DanishKrone,
-    NorwegianKrone,
-)
-from multicurrency.currencies.kuna import CroatianKuna
-from multicurrency.currencies.kwacha import (
-    Kwacha,
-    ZambianKwacha,
-)
-from multicurrency.currencies.kwanza import Kwanza
-from multicurrency.currencies.kyat import Kyat
-from multicurrency.currencies.lari import (
-    GeorgiaLari,
-    Lari,
-    SouthOssetiaLari,
-)
-from multicurrency.currencies.lek import Lek
-from multicurrency.currencies.lempira import Lempira
-from multicurrency.currencies.leone import Leone
-from multicurrency.currencies.leu import (
-    Leu,
-    MoldovanLeu,
-)
-from multicurrency.currencies.lev import BulgarianLev
-from multicurrency.currencies.lilangeni import Lilangeni
-from multicurrency.currencies.lira import (
-    TurkishLira,
-    TurkishLiraCY,
-    TurkishLiraTR,
-)
-from multicurrency.currencies.loti import Loti
-from multicurrency.currencies.manat import (
-    AzerbaijanianManat,
-    Manat,
-)
-from multicurrency.currencies.marka import KonvertibilnaMarka
-from multicurrency.currencies.metical import Metical
-from multicurrency.currencies.naira import Naira
-from multicurrency.currencies.nakfa import Nakfa
-from multicurrency.currencies.ngultrum import Ngultrum
-from multicurrency.currencies.nuevo_sol import NuevoSol
-from multicurrency.currencies.oro import CordobaOro
-from multicurrency.currencies.ouguiya import Ouguiya
-from multicurrency.currencies.paanga import Paanga
-from multicurrency.currencies.pataca import Pataca
-from multicurrency.currencies.peso import (
-    ArgentinePeso,
-    ChileanPeso,
-    ColombianPeso,
-    CubanPeso,
-    DominicanPeso,
-    MexicanPeso,
-    PesoUruguayo,
-    PhilippinePeso,
-)
-from multicurrency.currencies.pound import (
-    EgyptianPound,
-    FalklandIslandsPound,
-    GibraltarPound,
-    LebanesePound,
-    PoundSterling,
-    PoundSterlingGB,
-    PoundSterlingGG,
-    PoundSterlingIM,
-    PoundSterlingIO,
-    SaintHelenaPound,
-    SaintHelenaPoundAI,
-    SaintHelenaPoundTC,
-    SudanesePound,
-    SyrianPound,
-)
-from multicurrency.currencies.pula import Pula
-from multicurrency.currencies.pzloty import PZloty
-from multicurrency.currencies.quetzal import Quetzal
-from multicurrency.currencies.rand import (
-    Rand,
-    RandLS,
-    RandNA,
-    RandZA,
-)
-from multicurrency.currencies.real import BrazilianReal
-from multicurrency.currencies.rial import (
-    IranianRial,
-    QatariRial,
-    RialOmani,
-    YemeniRial,
-)
-from multicurrency.currencies.riel import Riel
-from multicurrency.currencies.ringgit import MalaysianRinggit
-from multicurrency.currencies.riyal import SaudiRiyal
-from multicurrency.currencies.ruble import (
-    BelarusianRuble,
-    RussianRuble,
-    RussianRubleGE,
-    RussianRubleRU,
-)
-from multicurrency.currencies.rufiyaa import Rufiyaa
-from multicurrency.currencies.rupee import (
-    IndianRupee,
-    IndianRupeeBT,
-    IndianRupeeIN,
-    MauritiusRupee,
-    NepaleseRupee,
-    PakistanRupee,
-    SeychellesRupee,
-    SriLankaRupee,
-)
-from multicurrency.currencies.rupiah import Rupiah
-from multicurrency.currencies.shekel import (
-    NewIsraeliShekel,
-    NewIsraeliShekelIL,
-    NewIsraeliShekelPS,
-)
-from multicurrency.currencies.shilling import (
-    KenyanShilling,
-    SomaliShilling,
-    TanzanianShilling,
-    UgandaShilling,
-)
-from multicurrency.currencies.som import Som
-from multicurrency.currencies.somoni import Somoni
-from multicurrency.currencies.sum import UzbekistanSum
-from multicurrency.currencies.taka import Taka
-from multicurrency.currencies.tala import Tala
-from multicurrency.currencies.tenge import Tenge
-from multicurrency.currencies.tugrik import Tugrik
-from multicurrency.currencies.vatu import Vatu
-from multicurrency.currencies.won import (
-    NorthKoreanWon,
-    SouthKoreanWon,
-)
-from multicurrency.currencies.yen import Yen
-from multicurrency.currencies.yuan import Yuan
+from types import MappingProxyType
 
+from multicurrency.pycurrency import _currency_class
+
+
+_CURRENCIES = MappingProxyType({
+    'Afghani': (
+        'afghani',
+        'Afghani (Afghanistan)',
+        ('AFN', '971', '؋', '؋', '۰۱۲۳۴۵۶۷۸۹-',
+         '2\u066B\u066C3%s\u00A0%a')),
+    'AlgerianDinar': (
+        'dinar',
+        'Dinar (Algeria)',
+        ('DZD', '012', 'د.ج.', 'د.ج.', '',
+         '2,.3%a\u00A0%s')),
+    'ArgentinePeso': (
+        'peso',
+        'Peso (Argentina)',
+        ('ARS', '032', '$', 'AR$', '',
+         '2,.3%s\u00A0%a')),
+    'ArmenianDram': (
+        'dram',
+        'Dram (Armenia)',
+        ('AMD', '051', 'Դ', 'Դ', '',
+         '2,\u202F3%a\u00A0%s')),
+    'ArubanFlorin': (
+        'florin',
+        'Florin (Aruba)',
+        ('AWG', '533', 'ƒ', 'ƒ', '',
+         '2.,3%-%s%u')),
+    'AustralianDollar': (
+        'dollar',
+        'Dollar (Australia)',
+        ('AUD', '036', '$', '$', '',
+         '2.,3%s\u00A0%a')),
+    'AustralianDollarAU': (
+        'dollar',
+        'Dollar (Australia)',
+        ('AUD', '036', '$', 'AU$', '',
+         '2.,3%-%s%u')),
+    'AustralianDollarCC': (
+        'dollar',
+        'Dollar (Coconut Islands)',
+        ('AUD', '036', '$', 'CC$', '',
+         '2.,3%-%s%u')),
+    'AustralianDollarKI': (
+        'dollar',
+        'Dollar (Kiribati)',
+        ('AUD', '036', '$', 'KI$', '',
+         '2.,3%-%s%u')),
+    'AustralianDollarMR': (
+        'dollar',
+        'Dollar (Nauru)',
+        ('AUD', '036', '$', 'NR$', '',
+         '2.,3%-%s%u')),
+    'AustralianDollarTV': (
+        'dollar',
+        'Dollar (Tuvalu)',
+        ('AUD', '036', '$', 'TV$', '',
+         '2.,3%-%s%u')),
+    'AzerbaijanianManat': (
+        'manat',
+        'Manat (Azerbaijan)',
+        ('AZN', '944', '₼', '₼', '',
+         '2,.3%a\u00A0%s')),
+    'BahamianDollar': (
+        'dollar',
+        'Dollar (Bahamas)',
+        ('BSD', '044', '$', 'BS$', '',
+         '2.,3%-%s%u')),
+    'BahrainiDinar': (
+        'dinar',
+        'Dinar (Bahrain)',
+        ('BHD', '048', 'د.ب.', 'د.ب.', '٠١٢٣٤٥٦٧٨٩-',
+         '3\u066B\u066C3%s\u00A0%a')),
+    'Baht': (
+        'baht',
+        'Baht (Thailand)',
+        ('THB', '764', '฿', '฿', '',
+         '2.,3%-%s%u')),
+    'Balboa': (
+        'balboa',
+        'Balboa (Panama)',
+        ('PAB', '590', 'B/.', 'B/.', '',
+         '2.,3%s\u00A0%a')),
+    'BarbadosDollar': (
+        'dollar',
+        'Dollar (Barbados)',
+        ('BBD', '052', '$', 'BB$', '',
+         '2.,3%-%s%u')),
+    'BelarusianRuble': (
+        'ruble',
+        'Ruble (Belarus)',
+        ('BYN', '933', 'Br', 'Br', '',
+         '2,\u202F3%a\u00A0%s')),
+    'BelizeDollar': (
+        'dollar',
+        'Dollar (Belize)',
+        ('BZD', '084', '$', 'BZ$', '',
+         '2.,3%-%s%u')),
+    'BermudianDollar': (
+        'dollar',
+        'Dollar (Bermuda)',
+        ('BMD', '060', '$', 'BM$', '',
+         '2.,3%-%s%u')),
+    'Bitcoin': (
+        'crypto',
+        'Crypto',
+        ('XBT', '0', '₿', '₿', '',
+         '8.,3%-%s%u')),
+    'BolivarFuerte': (
+        'fuerte',
+        'Fuerte (Venezuela)',
+        ('VEF', '937', 'Bs.F.', 'Bs.F.', '',
+         '2,.3%s\u00A0%a')),
+    'Boliviano': (
+        'boliviano',
+        'Boliviano (Bolivia)',
+        ('BOB', '068', 'Bs.', 'Bs.', '',
+         '2,.3%s\u00A0%a')),
+    'BrazilianReal': (
+        'real',
+        'Real (Brazil)',
+        ('BRL', '986', 'R$', 'R$', '',
+         '2,.3%s\u00A0%a')),
+    'BruneiDollar': (
+        'dollar',
+        'Dollar (Brunei)',
+        ('BND', '096', '$', '$', '',
+         '2,.3%s\u00A0%a')),
+    'BruneiDollarBN': (
+        'dollar',
+        'Dollar (Brunei)',
+        ('BND', '096', '$', 'BN$', '',
+         '2,.3%s\u00A0%a')),
+    'BruneiDollarSG': (
+        'dollar',
+        'Dollar (Singapore)',
+        ('BND', '096', '$', 'SG$', '',
+         '2,.3%s\u00A0%a')),
+    'BulgarianLev': (
+        'lev',
+        'Lev (Bulgaria)',
+        ('BGN', '975', 'лв.', 'лв.', '',
+         '2,\u00A03%a\u00A0%s')),
+    'BurundiFranc': (
+        'franc',
+        'Franc (Burundi)',
+        ('BIF', '108', '₣', 'BI₣', '',
+         '0,\u202F3%a\u00A0%s')),
+    'CFAFrancBCEAO': (
+        'franc',
+        'Franc (Senegal)',
+        ('XOF', '952', '₣', '₣', '',
+         '0,\u202F3%a\u00A0%s')),
+    'CFAFrancBCEAOBF': (
+        'franc',
+        'Franc (Burkina Faso)',
+        ('XOF', '952', '₣', 'BF₣', '',
+         '0,\u202F3%a\u00A0%s')),
+    'CFAFrancBCEAOBJ': (
+        'franc',
+        'Franc (Benin)',
+        ('XOF', '952', '₣', 'BJ₣', '',
+         '0,\u202F3%a\u00A0%s')),
+    'CFAFrancBCEAOCI': (
+        'franc',
+        "Franc (Côte d'Ivoire)",
+        ('XOF', '952', '₣', 'CI₣', '',
+         '0,\u202F3%a\u00A0%s')),
+    'CFAFrancBCEAOGW': (
+        'franc',
+        'Franc (Guinea-Bissau)',
+        ('XOF', '952', '₣', 'GW₣', '',
+         '0,\u202F3%a\u00A0%s')),
+    'CFAFrancBCEAOML': (
+        'franc',
+        'Franc (Mali)',
+        ('XOF', '952', '₣', 'ML₣', '',
+         '0,\u202F3%a\u00A0%s')),
+    'CFAFrancBCEAONG': (
+        'franc',
+        'Franc (Niger)',
+        ('XOF', '952', '₣', 'NG₣', '',
+         '0,\u202F3%a\u00A0%s')),
+    'CFAFrancBCEAOSN': (
+        'franc',
+        'Franc (Senegal)',
+        ('XOF', '952', '₣', 'SN₣', '',
+         '0,\u202F3%a\u00A0%s')),
+    'CFAFrancBCEAOTG': (
+        'franc',
+        'Franc (Togo)',
+        ('XOF', '952', '₣', 'TG₣', '',
+         '0,\u202F3%a\u00A0%s')),
+    'CFAFrancBEAC': (
+        'franc',
+        'Franc (Cameroon)',
+        ('XAF', '950', '₣', '₣', '',
+         '0,\u202F3%a\u00A0%s')),
+    'CFAFrancBEACCD': (
+        'franc',
+        'Franc (Congo (Brazzaville))',
+        ('XAF', '950', '₣', 'CD₣', '',
+         '0,\u202F3%a\u00A0%s')),
+    'CFAFrancBEACCF': (
+        'franc',
+        'Franc (Central African Republic)',
+        ('XAF', '950', '₣', 'CF₣', '',
+         '0,\u202F3%a\u00A0%s')),
+    'CFAFrancBEACCM': (
+        'franc',
+        'Franc (Cameroon)',
+        ('XAF', '950', '₣', 'CM₣', '',
+         '0,\u202F3%a\u00A0%s')),
+    'CFAFrancBEACGA': (
+        'franc',
+        'Franc (Gabon)',
+        ('XAF', '950', '₣', 'GA₣', '',
+         '0,\u202F3%a\u00A0%s')),
+    'CFAFrancBEACGQ': (
+        'franc',
+        'Franc (Equatorial Guinea)',
+        ('XAF', '950', '₣', 'GQ₣', '',
+         '0,\u202F3%a\u00A0%s')),
+    'CFAFrancBEACTD': (
+        'franc',
+        'Franc (Chad)',
+        ('XAF', '950', '₣', 'TD₣', '',
+         '0,\u202F3%a\u00A0%s')),
+    'CFPFranc': (
+        'franc',
+        'Franc (French Polynesia)',
+        ('XPF', '953', '₣', '₣', '',
+         '0,\u202F3%a\u00A0%s')),
+    'CFPFrancNC': (
+        'franc',
+        'Franc (New Caledonia)',
+        ('XPF', '953', '₣', 'NC₣', '',
+         '0,\u202F3%a\u00A0%s')),
+    'CFPFrancPF': (
+        'franc',
+        'Franc (French Polynesia)',
+        ('XPF', '953', '₣', 'PF₣', '',
+         '0,\u202F3%a\u00A0%s')),
+    'CFPFrancWF': (
+        'franc',
+        'Franc (Wallis and Futuna)',
+        ('XPF', '953', '₣', 'WF₣', '',
+         '0,\u202F3%a\u00A0%s')),
+    'CanadianDollarEN': (
+        'dollar',
+        'Dollar (Canada)',
+        ('CAD', '124', '$', 'CA$', '',
+         '2.,3%-%s%u')),
+    'CanadianDollarFR': (
+        'dollar',
+        'Dollar (Canada)',
+        ('CAD', '124', '$', 'CA$', '',
+         '2,\u202F3%a\u00A0%s')),
+    'CapeVerdeEscudo': (
+        'escudo',
+        'Escudo (Cape Verde)',
+        ('CVE', '132', '', '', '',
+         '2$\u202F3%a%s')),
+    'CaymanIslandsDollar': (
+        'dollar',
+        'Dollar (Cayman Islands)',
+        ('KYD', '136', '$', 'KY$', '',
+         '2.,3%-%s%u')),
+    'Cedi': (
+        'cedi',
+        'Cedi (Ghana)',
+        ('GHS', '936', '₵', '₵', '',
+         '2.,3%-%s%u')),
+    'ChileanPeso': (
+        'peso',
+        'Peso (Chile)',
+        ('CLP', '152', '$', 'CL$', '',
+         '0,.3%-%s%u')),
+    'ColombianPeso': (
+        'peso',
+        'Peso (Colombia)',
+        ('COP', '170', '$', 'CO$', '',
+         '2,.3%s\u00A0%a')),
+    'CongoleseFranc': (
+        'franc',
+        'Franc (Congo (Kinshasa))',
+        ('CDF', '976', '₣', 'CD₣', '',
+         '2,\u202F3%a\u00A0%s')),
+    'CordobaOro': (
+        'oro',
+        'Oro (Nicaragua)',
+        ('NIO', '558', 'C$', 'C$', '',
+         '2.,3%-%s%u')),
+    'CostaRicanColon': (
+        'colon',
+        'Colon (Costa Rica)',
+        ('CRC', '188', '₡', '₡', '',
+         '2,\u202F3%-%s%u')),
+    'CroatianKuna': (
+        'kuna',
+        'Kuna (Croatia)',
+        ('HRK', '191', 'Kn', 'Kn', '',
+         '2,.3%a\u00A0%s')),
+    'CubanPeso': (
+        'peso',
+        'Peso (Cuba)',
+        ('CUP', '192', '$', 'CU$', '',
+         '2.,3%-%s%u')),
+    'CzechKoruna': (
+        'koruna',
+        'Koruna (Czech Republic)',
+        ('CZK', '203', 'Kč', 'Kč', '',
+         '2,\u202F3%a\u00A0%s')),
+    'Dalasi': (
+        'dalasi',
+        'Dalasi (Gambia)',
+        ('GMD', '270', 'D', 'D', '',
+         '2.,3%s\u00A0%a')),
+    'DanishKrone': (
+        'krone',
+        'Krone (Denmark)',
+        ('DKK', '208', 'kr', 'kr', '',
+         '2,.3%a\u00A0%s')),
+    'Denar': (
+        'denar',
+        'Denar (Macedonia)',
+        ('MKD', '807', 'ден.', 'ден.', '',
+         '2,.3%a\u00A0%s')),
+    'DjiboutiFranc': (
+        'franc',
+        'Franc (Djibouti)',
+        ('DJF', '262', '₣', 'DJ₣', '',
+         '0,\u202F3%a\u00A0%s')),
+    'Dobra': (
+        'dobra',
+        'Dobra (Sao Tome and Principe)',
+        ('STN', '930', 'Db', 'Db', '',
+         '2,.3%a\u00A0%s')),
+    'DominicanPeso': (
+        'peso',
+        'Peso (Dominican Republic)',
+        ('DOP', '214', '$', 'DO$', '',
+         '2.,3%-%s%u')),
+    'Dong': (
+        'dong',
+        'Dong (Vietnam)',
+        ('VND', '704', '₫', '₫', '',
+         '0,.3%a\u00A0%s')),
+    'EOS': (
+        'crypto',
+        'Crypto',
+        ('EOS', '0', 'ε', 'ε', '',
+         '4.,3%-%s%u')),
+    'EasternCaribbeanDollar': (
+        'dollar',
+        'Dollar (Organisation of Eastern Caribbean States (OECS))',
+        ('XCD', '951', '$', '$', '',
+         '2.,3%-%s%u')),
+    'EasternCaribbeanDollarAG': (
+        'dollar',
+        'Dollar (Antigua and Barbuda)',
+        ('XCD', '951', '$', 'AG$', '',
+         '2.,3%-%s%u')),
+    'EasternCaribbeanDollarAI': (
+        'dollar',
+        'Dollar (Anguilla)',
+        ('XCD', '951', '$', 'AI$', '',
+         '2.,3%-%s%u')),
+    'EasternCaribbeanDollarDM': (
+        'dollar',
+        'Dollar (Dominica)',
+        ('XCD', '951', '$', 'DM$', '',
+         '2.,3%-%s%u')),
+    'EasternCaribbeanDollarGD': (
+        'dollar',
+        'Dollar (Grenada)',
+        ('XCD', '951', '$', 'GD$', '',
+         '2.,3%-%s%u')),
+    'EasternCaribbeanDollarKN': (
+        'dollar',
+        'Dollar (Saint Kitts and Nevis)',
+        ('XCD', '951', '$', 'KN$', '',
+         '2.,3%-%s%u')),
+    'EasternCaribbeanDollarLC': (
+        'dollar',
+        'Dollar (Saint Lucia)',
+        ('XCD', '951', '$', 'LC$', '',
+         '2.,3%-%s%u')),
+    'EasternCaribbeanDollarMS': (
+        'dollar',
+        'Dollar (Montserrat)',
+        ('XCD', '951', '$', 'MS$', '',
+         '2.,3%-%s%u')),
+    'EasternCaribbeanDollarVC': (
+        'dollar',
+        'Dollar (Saint Vincent and Grenadine)',
+        ('XCD', '951', '$', 'VC$', '',
+         '2.,3%-%s%u')),
+    'EgyptianPound': (
+        'pound',
+        'Pound (Egypt)',
+        ('EGP', '818', 'ج.م.', 'ج.م.', '٠١٢٣٤٥٦٧٨٩-',
+         '2\u066B\u066C3%s\u00A0%a')),
+    'Ethereum': (
+        'crypto',
+        'Crypto',
+        ('ETH', '0', 'Ξ', 'Ξ', '',
+         '18.,3%-%s%u')),
+    'EthiopianBirr': (
+        'birr',
+        'Birr (Ethiopia)',
+        ('ETB', '230', 'ብር', 'ብር', '',
+         '2.,3%s\u00A0%a')),
+    'Euro': (
+        'euro',
+        'Euro',
+        ('EUR', '978', '€', '€', '',
+         '2,.3%a\u00A0%s')),
+    'EuroAD': (
+        'euro',
+        'Euro (Andorra)',
+        ('EUR', '978', '€', 'AD€', '',
+         '2,.3%a\u00A0%s')),
+    'EuroAT': (
+        'euro',
+        'Euro (Austria)',
+        ('EUR', '978', '€', 'AT€', '',
+         '2,.3%s\u00A0%a')),
+    'EuroBE': (
+        'euro',
+        'Euro (Belgium)',
+        ('EUR', '978', '€', 'BE€', '',
+         '2,.3%s\u00A0%a')),
+    'EuroCY': (
+        'euro',
+        'Euro (Cyprus)',
+        ('EUR', '978', '€', 'CY€', '',
+         '2,.3%a\u00A0%s')),
+    'EuroDE': (
+        'euro',
+        'Euro (Germany)',
+        ('EUR', '978', '€', 'DE€', '',
+         '2,.3%a\u00A0%s')),
+    'EuroEE': (
+        'euro',
+        'Euro (Estonia)',
+        ('EUR', '978', '€', 'EE€', '',
+         '2,\u202F3%a\u00A0%s')),
+    'EuroES': (
+        'euro',
+        'Euro (Spain)',
+        ('EUR', '978', '€', 'ES€', '',
+         '2,.3%a\u00A0%s')),
+    'EuroFI': (
+        'euro',
+        'Euro (Finland)',
+        ('EUR', '978', '€', 'FI€', '',
+         '2,\u202F3%a\u00A0%s')),
+    'EuroFR': (
+        'euro',
+        'Euro (France)',
+        ('EUR', '978', '€', 'FR€', '',
+         '2,\u202F3%a\u00A0%s')),
+    'EuroGR': (
+        'euro',
+        'Euro (Greece)',
+        ('EUR', '978', '€', 'GR€', '',
+         '2,.3%a\u00A0%s')),
+    'EuroIE': (
+        'euro',
+        'Euro (Ireland)',
+        ('EUR', '978', '€', 'IR€', '',
+         '2.,3%-%s%u')),
+    'EuroIT': (
+        'euro',
+        'Euro (Italy)',
+        ('EUR', '978', '€', 'IT€', '',
+         '2,.3%a\u00A0%s')),
+    'EuroLT': (
+        'euro',
+        'Euro (Lithuania)',
+        ('EUR', '978', '€', 'LT€', '',
+         '2,\u202F3%a\u00A0%s')),
+    'EuroLU': (
+        'euro',
+        'Euro (Luxembourg)',
+        ('EUR', '978', '€', 'LU€', '',
+         '2,.3%a\u00A0%s')),
+    'EuroLV': (
+        'euro',
+        'Euro (Latvia)',
+        ('EUR', '978', '€', 'LV€', '',
+         '2,\u202F3%a\u00A0%s')),
+    'EuroMC': (
+        'euro',
+        'Euro (Monaco)',
+        ('EUR', '978', '€', 'MC€', '',
+         '2,\u202F3%a\u00A0%s')),
+    'EuroME': (
+        'euro',
+        'Euro (Montenegro)',
+        ('EUR', '978', '€', 'ME€', '',
+         '2,.3%a\u00A0%s')),
+    'EuroMT': (
+        'euro',
+        'Euro (Malta)',
+        ('EUR', '978', '€', 'MT€', '',
+         '2.,3%-%s%u')),
+    'EuroNL': (
+        'euro',
+        'Euro (Netherlands)',
+        ('EUR', '978', '€', 'NL€', '',
+         '2,.3%s\u00A0%a')),
+    'EuroPT': (
+        'euro',
+        'Euro (Portugal)',
+        ('EUR', '978', '€', 'PT€', '',
+         '2,.3%s\u00A0%a')),
+    'EuroSBA': (
+        'euro',
+        'Euro (Akrotiri and Dhekelia)',
+        ('EUR', '978', '€', '€', '',
+         '2,.3%a\u00A0%s')),
+    'EuroSI': (
+        'euro',
+        'Euro (Slovenia)',
+        ('EUR', '978', '€', 'SI€', '',
+         '2,.3%a\u00A0%s')),
+    'EuroSK': (
+        'euro',
+        'Euro (Slovakia)',
+        ('EUR', '978', '€', 'SK€', '',
+         '2,\u202F3%a\u00A0%s')),
+    'EuroSM': (
+        'euro',
+        'Euro (San-Marino)',
+        ('EUR', '978', '€', 'SM€', '',
+         '2,.3%a\u00A0%s')),
+    'EuroVA': (
+        'euro',
+        'Euro (Vatican)',
+        ('EUR', '978', '€', 'VA€', '',
+         '2.,3%-%s%u')),
+    'EuroXK': (
+        'euro',
+        'Euro (Kosovo)',
+        ('EUR', '978', '€', 'XK€', '',
+         '2,\u202F3%a\u00A0%s')),
+    'FalklandIslandsPound': (
+        'pound',
+        'Pound (Falkland Islands)',
+        ('FKP', '238', '£', 'FK£', '',
+         '2.,3%-%s%u')),
+    'FijiDollar': (
+        'dollar',
+        'Dollar (Fiji)',
+        ('FJD', '242', '$', 'FJ$', '',
+         '2.,3%-%s%u')),
+    'Forint': (
+        'forint',
+        'Forint (Hungary)',
+        ('HUF', '348', 'Ft', 'Ft', '',
+         '0,\u202F3%a\u00A0%s')),
+    'GeorgiaLari': (
+        'lari',
+        'Lari (Georgia)',
+        ('GEL', '981', 'ლ', 'GEლ', '',
+         '2,\u202F3%a\u00A0%s')),
+    'GibraltarPound': (
+        'pound',
+        'Pound (Gibraltar)',
+        ('GIP', '292', '£', 'GI£', '',
+         '2.,3%-%s%u')),
+    'Gourde': (
+        'gourde',
+        'Gourde (Haiti)',
+        ('HTG', '332', 'G', 'G', '',
+         '2.,3%s\u00A0%a')),
+    'Guarani': (
+        'guarani',
+        'Guarani (Paraguay)',
+        ('PYG', '600', '₲', '₲', '',
+         '0,.3%s\u00A0%a')),
+    'GuineaFranc': (
+        'franc',
+        'Franc (Guinea)',
+        ('GNF', '324', '₣', 'GN₣', '',
+         '0,\u202F3%a\u00A0%s')),
+    'GuyanaDollar': (
+        'dollar',
+        'Dollar (Guyana)',
+        ('GYD', '328', '$', 'GY$', '',
+         '2.,3%-%s%u')),
+    'HongKongDollar': (
+        'dollar',
+        'Dollar (Hong Kong)',
+        ('HKD', '344', '$', 'HK$', '',
+         '2.,3%-%s%u')),
+    'Hryvnia': (
+        'hryvnia',
+        'Hryvnia (Ukraine)',
+        ('UAH', '980', '₴', '₴', '',
+         '2,\u202F3%a\u00A0%s')),
+    'IcelandKrona': (
+        'krona',
+        'Krona (Iceland)',
+        ('ISK', '352', 'Kr', 'Kr', '',
+         '0,.3%a\u00A0%s')),
+    'IndianRupee': (
+        'rupee',
+        'Rupee (India)',
+        ('INR', '356', '₹', '₹', '',
+         '2.,3%-%s%u')),
+    'IndianRupeeBT': (
+        'rupee',
+        'Rupee (Bhutan)',
+        ('INR', '356', '₹', 'BT₹', '',
+         '2.,3%-%s%u')),
+    'IndianRupeeIN': (
+        'rupee',
+        'Rupee (India)',
+        ('INR', '356', '₹', 'IN₹', '',
+         '2.,3%-%s%u')),
+    'IranianRial': (
+        'rial',
+        'Rial (Iran)',
+        ('IRR', '364', '﷼', '﷼', '۰۱۲۳۴۵۶۷۸۹-',
+         '2\u066B\u066C3%a\u00A0%s')),
+    'IraqiDinar': (
+        'dinar',
+        'Dinar (Iraq)',
+        ('IQD', '368', 'د.ع.', 'د.ع.', '٠١٢٣٤٥٦٧٨٩-',
+         '3\u066B\u066C3%s\u00A0%a')),
+    'JamaicanDollar': (
+        'dollar',
+        'Dollar (Jamaica)',
+        ('JMD', '388', '$', 'JM$', '',
+         '2.,3%-%s%u')),
+    'JordanianDinar': (
+        'dinar',
+        'Dinar (Jordan)',
+        ('JOD', '400', 'د.أ.', 'د.أ.', '٠١٢٣٤٥٦٧٨٩-',
+         '3\u066B\u066C3%s\u00A0%a')),
+    'KenyanShilling': (
+        'shilling',
+        'Shilling (Kenya)',
+        ('KES', '404', 'Ksh', 'Ksh', '',
+         '2.,3%s\u00A0%a')),
+    'Kina': (
+        'kina',
+        'Kina (Papua New Guinea)',
+        ('PGK', '598', 'K', 'K', '',
+         '2.,3%s\u00A0%a')),
+    'Kip': (
+        'kip',
+        'Kip (Laos)',
+        ('LAK', '418', '₭', '₭', '',
+         '2,.3%-%s%u')),
+    'KonvertibilnaMarka': (
+        'marka',
+        'Marka (Bosnia and Herzegovina)',
+        ('BAM', '977', 'КМ', 'КМ', '',
+         '2.,3%a\u00A0%s')),
+    'KuwaitiDinar': (
+        'dinar',
+        'Dinar (Kuwait)',
+        ('KWD', '414', 'د.ك.', 'د.ك.', '٠١٢٣٤٥٦٧٨٩-',
+         '3\u066B\u066C3%s\u00A0%a')),
+    'Kwacha': (
+        'kwacha',
+        'Kwacha (Malawi)',
+        ('MWK', '454', 'MK', 'MK', '',
+         '2.,3%s\u00A0%a')),
+    'Kwanza': (
+        'kwanza',
+        'Kwanza (Angola)',
+        ('AOA', '973', 'Kz', 'Kz', '',
+         '2,\u202F3%a\u00A0%s')),
+    'Kyat': (
+        'kyat',
+        'Kyat (Myanmar (Burma))',
+        ('MMK', '104', 'K', 'K', '၀၁၂၃၄၅၆၇၈၉-',
+         '2.,3%a\u00A0%s')),
+    'Lari': (
+        'lari',
+        'Lari',
+        ('GEL', '981', 'ლ', 'GEლ', '',
+         '2,\u202F3%a\u00A0%s')),
+    'LebanesePound': (
+        'pound',
+        'Pound (Lebanon)',
+        ('LBP', '422', 'ل.ل.', 'ل.ل.', '٠١٢٣٤٥٦٧٨٩-',
+         '0\u066B\u066C3%s\u00A0%a')),
+    'Lek': (
+        'lek',
+        'Lek (Albania)',
+        ('ALL', '008', 'Lek', 'Lek', '',
+         '2,\u202F3%a\u00A0%s')),
+    'Lempira': (
+        'lempira',
+        'Lempira (Honduras)',
+        ('HNL', '340', 'L', 'L', '',
+         '2.,3%s\u00A0%a')),
+    'Leone': (
+        'leone',
+        'Leone (Sierra Leone)',
+        ('SLL', '694', 'Le', 'Le', '',
+         '2.,3%s\u00A0%a')),
+    'Leu': (
+        'leu',
+        'Leu (Romania)',
+        ('RON', '946', 'L', 'L', '',
+         '2,.3%a\u00A0%s')),
+    'LiberianDollar': (
+        'dollar',
+        'Dollar (Liberia)',
+        ('LRD', '430', '$', 'LR$', '',
+         '2.,3%-%s%u')),
+    'LibyanDinar': (
+        'dinar',
+        'Dinar (Libya)',
+        ('LYD', '434', 'د.ل.', 'د.ل.', '',
+         '3,.3%s\u00A0%a')),
+    'Lilangeni': (
+        'lilangeni',
+        'Lilangeni (Swaziland)',
+        ('SZL', '748', 'L', 'L', '',
+         '2.,3%s\u00A0%a')),
+    'Loti': (
+        'loti',
+        'Loti (Lesotho)',
+        ('LSL', '426', 'L', 'L', '',
+         '2.,3%s\u00A0%a')),
+    'MalagasyAriary': (
+        'ariary',
+        'Ariary (Madagascar)',
+        ('MGA', '969', 'Ar', 'Ar', '',
+         '0,\u202F3%a\u00A0%s')),
+    'MalaysianRinggit': (
+        'ringgit',
+        'Ringgit (Malaysia)',
+        ('MYR', '458', 'RM', 'RM', '',
+         '2.,3%s\u00A0%a')),
+    'Manat': (
+        'manat',
+        'Manat (Turkmenistan)',
+        ('TMT', '934', 'm', 'm', '',
+         '2,\u202F3%a\u00A0%s')),
+    'MauritiusRupee': (
+        'rupee',
+        'Rupee (Mauritius)',
+        ('MUR', '480', '₨', '₨', '',
+         '2.,3%s\u00A0%a')),
+    'Metical': (
+        'metical',
+        'Metical (Mozambique)',
+        ('MZN', '943', 'MTn', 'MTn', '',
+         '0,.3%a\u00A0%s')),
+    'MexicanPeso': (
+        'peso',
+        'Peso (Mexico)',
+        ('MXN', '484', '$', 'MX$', '',
+         '2.,3%-%s%u')),
+    'MoldovanLeu': (
+        'leu',
+        'Leu (Moldova)',
+        ('MDL', '498', 'L', 'L', '',
+         '2,.3%a\u00A0%s')),
+    'Monero': (
+        'crypto',
+        'Crypto',
+        ('XMR', '0', 'ɱ', 'ɱ', '',
+         '12.,3%-%s%u')),
+    'MoroccanDirham': (
+        'dirham',
+        'Dirham (Morocco)',
+        ('MAD', '504', 'د.م.', 'د.م.', '٠١٢٣٤٥٦٧٨٩-',
+         '2\u066B\u066C3%a\u00A0%s')),
+    'Naira': (
+        'naira',
+        'Naira (Nigeria)',
+        ('NGN', '566', '₦', '₦', '',
+         '2.,3%-%s%u')),
+    'Nakfa': (
+        'nakfa',
+        'Nakfa (Eritrea)',
+        ('ERN', '232', 'Nfk', 'Nfk', '',
+         '2.,3%s\u00A0%a')),
+    'NamibiaDollar': (
+        'dollar',
+        'Dollar (Namibia)',
+        ('NAD', '516', '$', 'NA$', '',
+         '2.,3%-%s%u')),
+    'NepaleseRupee': (
+        'rupee',
+        'Rupee (Nepal)',
+        ('NPR', '524', 'नेरू', 'नेरू', '०१२३४५६७८९-',
+         '2.,3%s\u00A0%a')),
+    'NewIsraeliShekel': (
+        'shekel',
+        'Shekel (Israel)',
+        ('ILS', '376', '₪', '₪', '',
+         '2.,3%a\u00A0%s')),
+    'NewIsraeliShekelIL': (
+        'shekel',
+        'Shekel (Israel)',
+        ('ILS', '376', '₪', 'IL₪', '',
+         '2.,3%a\u00A0%s')),
+    'NewIsraeliShekelPS': (
+        'shekel',
+        'Shekel (Palestine)',
+        ('ILS', '376', '₪', 'PS₪', '',
+         '2.,3%a\u00A0%s')),
+    'NewZealandDollar': (
+        'dollar',
+        'Dollar (New Zealand)',
+        ('NZD', '554', '$', '$', '',
+         '2.,3%-%s%u')),
+    'NewZealandDollarCK': (
+        'dollar',
+        'Dollar (Cook Islands)',
+        ('NZD', '554', '$', 'CK$', '',
+         '2.,3%-%s%u')),
+    'NewZealandDollarNU': (
+        'dollar',
+        'Dollar (Niue)',
+        ('NZD', '554', '$', 'NU$', '',
+         '2.,3%-%s%u')),
+    'NewZealandDollarNZ': (
+        'dollar',
+        'Dollar (New Zealand)',
+        ('NZD', '554', '$', 'NZ$', '',
+         '2.,3%-%s%u')),
+    'NewZealandDollarPN': (
+        'dollar',
+        'Dollar (Pitcairn Island)',
+        ('NZD', '554', '$', 'PN$', '',
+         '2.,3%-%s%u')),
+    'Ngultrum': (
+        'ngultrum',
+        'Ngultrum (Bhutan)',
+        ('BTN', '064', 'Nu.', 'Nu.', '༠༡༢༣༤༥༦༧༨༩-',
+         '2.,3%s\u00A0%a')),
+    'NorthKoreanWon': (
+        'won',
+        'Won (North Korea)',
+        ('KPW', '408', '₩', '₩', '',
+         '2.,3%s\u00A0%a')),
+    'NorwegianKrone': (
+        'krone',
+        'Krone (Norway)',
+        ('NOK', '578', 'kr', 'kr', '',
+         '2,\u202F3%s\u00A0%a')),
+    'NuevoSol': (
+        'nuevo_sol',
+        'Nuevo Sol (Peru)',
+        ('PEN', '604', 'S/.', 'S/.', '',
+         '2.,3%s\u00A0%a')),
+    'Ouguiya': (
+        'ouguiya',
+        'Ouguiya (Mauritania)',
+        ('MRU', '929', 'أ.م', 'أ.م', '٠١٢٣٤٥٦٧٨٩-',
+         '2\u066B\u066C3%a\u00A0%s')),
+    'PZloty': (
+        'pzloty',
+        'PZloty (Poland)',
+        ('PLN', '985', 'zł', 'zł', '',
+         '2,\u202F3%a\u00A0%s')),
+    'Paanga': (
+        'paanga',
+        'Pa’anga (Tonga)',
+        ('TOP', '776', 'T$', 'T$', '',
+         '2.,3%s\u00A0%a')),
+    'PakistanRupee': (
+        'rupee',
+        'Rupee (Pakistan)',
+        ('PKR', '586', '₨', '₨', '',
+         '2.,3%s\u00A0%a')),
+    'Pataca': (
+        'pataca',
+        'Pataca (Macao)',
+        ('MOP', '446', 'P', 'P', '',
+         '2.,3%s\u00A0%a')),
+    'PesoUruguayo': (
+        'peso',
+        'Peso (Uruguay)',
+        ('UYU', '858', '$', 'UY$', '',
+         '2,.3%s\u00A0%a')),
+    'PhilippinePeso': (
+        'peso',
+        'Peso (Philippines)',
+        ('PHP', '608', '₱', '₱', '',
+         '2.,3%-%s%u')),
+    'PoundSterling': (
+        'pound',
+        'Pound (Great Britain)',
+        ('GBP', '826', '£', '£', '',
+         '2.,3%-%s%u')),
+    'PoundSterlingGB': (
+        'pound',
+        'Pound (Great Britain)',
+        ('GBP', '826', '£', 'GB£', '',
+         '2.,3%-%s%u')),
+    'PoundSterlingGG': (
+        'pound',
+        'Pound (Alderney)',
+        ('GBP', '826', '£', 'GG£', '',
+         '2.,3%-%s%u')),
+    'PoundSterlingIM': (
+        'pound',
+        'Pound (Isle of Man)',
+        ('GBP', '826', '£', 'IM£', '',
+         '2.,3%-%s%u')),
+    'PoundSterlingIO': (
+        'pound',
+        'Pound (British Indian Ocean Territory)',
+        ('GBP', '826', '£', 'IO£', '',
+         '2.,3%-%s%u')),
+    'Pula': (
+        'pula',
+        'Pula (Botswana)',
+        ('BWP', '072', 'P', 'P', '',
+         '2.,3%s\u00A0%a')),
+    'QatariRial': (
+        'rial',
+        'Rial (Qatar)',
+        ('QAR', '634', 'ر.ق.', 'ر.ق.', '٠١٢٣٤٥٦٧٨٩-',
+         '2\u066B\u066C3%s\u00A0%a')),
+    'Quetzal': (
+        'quetzal',
+        'Quetzal (Guatemala)',
+        ('GTQ', '320', 'Q', 'Q', '',
+         '2.,3%s\u00A0%a')),
+    'Rand': (
+        'rand',
+        'Rand (South Africa)',
+        ('ZAR', '710', 'R', 'R', '',
+         '2.\u202F3%s\u00A0%a')),
+    'RandLS': (
+        'rand',
+        'Rand (Lesotho)',
+        ('ZAR', '710', 'R', 'LSR', '',
+         '2.,3%s\u00A0%a')),
+    'RandNA': (
+        'rand',
+        'Rand (Namibia)',
+        ('ZAR', '710', 'R', 'NAR', '',
+         '2.\u202F3%s\u00A0%a')),
+    'RandZA': (
+        'rand',
+        'Rand (South Africa)',
+        ('ZAR', '710', 'R', 'ZAR', '',
+         '2.\u202F3%s\u00A0%a')),
+    'RialOmani': (
+        'rial',
+        'Rial (Oman)',
+        ('OMR', '512', 'ر.ع.', 'ر.ع.', '٠١٢٣٤٥٦٧٨٩-',
+         '3\u066B\u066C3%s\u00A0%a')),
+    'Riel': (
+        'riel',
+        'Riel (Cambodia)',
+        ('KHR', '116', '៛', '៛', '',
+         '2,.3%a%s')),
+    'Ripple': (
+        'crypto',
+        'Crypto',
+        ('XRP', '0', '✕', '✕', '',
+         '6.,3%-%s%u')),
+    'Rufiyaa': (
+        'rufiyaa',
+        'Rufiyaa (Maldives)',
+        ('MVR', '462', 'ރ.', 'ރ.', '',
+         '2.,3%s\u00A0%a')),
+    'Rupiah': (
+        'rupiah',
+        'Rupiah (Indonesia)',
+        ('IDR', '360', 'Rp', 'Rp', '',
+         '2,.3%s\u00A0%a')),
+    'RussianRuble': (
+        'ruble',
+        'Ruble (Russia)',
+        ('RUB', '643', '₽', '₽', '',
+         '2,\u202F3%a\u00A0%s')),
+    'RussianRubleGE': (
+        'ruble',
+        'Ruble (South Ossetia)',
+        ('RUB', '643', '₽', 'GE₽', '',
+         '2,\u202F3%a\u00A0%s')),
+    'RussianRubleRU': (
+        'ruble',
+        'Ruble (Russia)',
+        ('RUB', '643', '₽', 'RU₽', '',
+         '2,\u202F3%a\u00A0%s')),
+    'RwandaFranc': (
+        'franc',
+        'Franc (Rwanda)',
+        ('RWF', '646', '₣', 'RW₣', '',
+         '0,.3%s\u00A0%a')),
+    'SaintHelenaPound': (
+        'pound',
+        'Pound (Saint Helena)',
+        ('SHP', '654', '£', 'SH£', '',
+         '2.,3%-%s%u')),
+    'SaintHelenaPoundAI': (
+        'pound',
+        'Pound (Ascension Island)',
+        ('SHP', '654', '£', 'SH£', '',
+         '2.,3%-%s%u')),
+    'SaintHelenaPoundTC': (
+        'pound',
+        'Pound (Tristan da Cunha)',
+        ('SHP', '654', '£', 'SH£', '',
+         '2.,3%-%s%u')),
+    'SaudiRiyal': (
+        'riyal',
+        'Riyal (Saudi Arabia)',
+        ('SAR', '682', 'ر.س.', 'ر.س.', '٠١٢٣٤٥٦٧٨٩-',
+         '2\u066B\u066C3%s\u00A0%a')),
+    'SerbianDinarSR': (
+        'dinar',
+        'Dinar (Serbia)',
+        ('RSD', '941', 'дин.', 'дин.', '',
+         '2,\u202F3%a\u00A0%s')),
+    'SerbianDinarXK': (
+        'dinar',
+        'Dinar (Kosovo)',
+        ('RSD', '941', 'дин.', 'дин.', '',
+         '2,.3%a\u00A0%s')),
+    'SeychellesRupee': (
+        'rupee',
+        'Rupee (Seychelles)',
+        ('SCR', '690', '₨', '₨', '',
+         '2.,3%s\u00A0%a')),
+    'SingaporeDollar': (
+        'dollar',
+        'Dollar (Singapore)',
+        ('SGD', '702', '$', '$', '',
+         '2.,3%-%s%u')),
+    'SingaporeDollarBN': (
+        'dollar',
+        'Dollar (Brunei)',
+        ('SGD', '702', '$', 'BN$', '',
+         '2.,3%-%s%u')),
+    'SingaporeDollarSG': (
+        'dollar',
+        'Dollar (Singapore)',
+        ('SGD', '702', '$', 'SG$', '',
+         '2.,3%-%s%u')),
+    'SolomonIslandsDollar': (
+        'dollar',
+        'Dollar (Solomon Islands)',
+        ('SBD', '090', '$', 'SB$', '',
+         '2.,3%-%s%u')),
+    'Som': (
+        'som',
+        'Som (Kyrgyzstan)',
+        ('KGS', '417', 'Лв', 'Лв', '',
+         '2,\u202F3%a\u00A0%s')),
+    'SomaliShilling': (
+        'shilling',
+        'Shilling (Somalia)',
+        ('SOS', '706', 'SSh', 'SSh', '',
+         '2.,3%s\u00A0%a')),
+    'Somoni': (
+        'somoni',
+        'Somoni (Tajikistan)',
+        ('TJS', '972', 'ЅМ', 'ЅМ', '',
+         '2.,3%s\u00A0%a')),
+    'SouthKoreanWon': (
+        'won',
+        'Won (South Korea)',
+        ('KRW', '410', '₩', '₩', '',
+         '0.,3%-%s%u')),
+    'SouthOssetiaLari': (
+        'lari',
+        'Lari (South Ossetia)',
+        ('GEL', '981', 'ლ', 'GEლ', '',
+         '2,\u202F3%a\u00A0%s')),
+    'SriLankaRupee': (
+        'rupee',
+        'Rupee (Sri Lanka)',
+        ('LKR', '144', 'රු.', 'රු.', '',
+         '2.,3%s\u00A0%a')),
+    'StellarLumens': (
+        'crypto',
+        'Crypto',
+        ('XLM', '0', '*', '*', '',
+         '7.,3%-%s%u')),
+    'SudanesePound': (
+        'pound',
+        'Pound (Sudan)',
+        ('SDG', '938', 'ج.س', 'ج.س', '٠١٢٣٤٥٦٧٨٩-',
+         '2\u066B\u066C3%a\u00A0%s')),
+    'SurinameDollar': (
+        'dollar',
+        'Dollar (Suriname)',
+        ('SRD', '968', '$', 'SR$', '',
+         '2,.3%s\u00A0%a')),
+    'SwedishKrona': (
+        'krona',
+        'Krona (Sweden)',
+        ('SEK', '752', 'kr', 'kr', '',
+         '2,\u202F3%a\u00A0%s')),
+    'SwissFranc': (
+        'franc',
+        'Franc (Switzerland)',
+        ('CHF', '756', '₣', '₣', '',
+         '2.\u00273%s\u00A0%a')),
+    'SwissFrancCH': (
+        'franc',
+        'Franc (Switzerland)',
+        ('CHF', '756', '₣', 'CH₣', '',
+         '2.\u00273%s\u00A0%a')),
+    'SwissFrancLI': (
+        'franc',
+        'Franc (Liechtenstein)',
+        ('CHF', '756', '₣', 'LI₣', '',
+         '2.\u00273%s\u00A0%a')),
+    'SyrianPound': (
+        'pound',
+        'Pound (Syria)',
+        ('SYP', '760', 'ل.س', 'ل.س', '٠١٢٣٤٥٦٧٨٩-',
+         '2\u066B\u066C3%a\u00A0%s')),
+    'TaiwanDollar': (
+        'dollar',
+        'Dollar (Taiwan)',
+        ('TWD', '901', '$', 'TW$', '',
+         '2.,3%-%s%u')),
+    'Taka': (
+        'taka',
+        'Taka (Bangladesh)',
+        ('BDT', '050', '৳', '৳', '০১২৩৪৫৬৭৮৯-,.',
+         '2.,3%a%s')),
+    'Tala': (
+        'tala',
+        'Tala (Samoa)',
+        ('WST', '882', 'T', 'T', '',
+         '2.,3%s\u00A0%a')),
+    'TanzanianShilling': (
+        'shilling',
+        'Shilling (Tanzania)',
+        ('TZS', '834', 'TSh', 'TSh', '',
+         '2.,3%s\u00A0%a')),
+    'Tenge': (
+        'tenge',
+        'Tenge (Kazakhstan)',
+        ('KZT', '398', '〒', '〒', '',
+         '2,\u202F3%a\u00A0%s')),
+    'Tezos': (
+        'crypto',
+        'Crypto',
+        ('XTZ', '0', 'ꜩ', 'ꜩ', '',
+         '6.,3%-%s%u')),
+    'TrinidadandTobagoDollar': (
+        'dollar',
+        'Dollar (Trinidad and Tobago)',
+        ('TTD', '780', '$', 'TT$', '',
+         '2.,3%-%s%u')),
+    'Tugrik': (
+        'tugrik',
+        'Tugrik (Mongolia)',
+        ('MNT', '496', '₮', '₮', '',
+         '2.,3%s\u00A0%a')),
+    'TunisianDinar': (
+        'dinar',
+        'Dinar (Tunisia)',
+        ('TND', '788', 'د.ت.', 'د.ت.', '',
+         '3,.3%s\u00A0%a')),
+    'TurkishLira': (
+        'lira',
+        'Lira (Turkey)',
+        ('TRY', '949', '₤', '₤', '',
+         '2,.3%-%s%u')),
+    'TurkishLiraCY': (
+        'lira',
+        'Lira (North Cyprus)',
+        ('TRY', '949', '₤', 'CY₤', '',
+         '2,.3%-%s%u')),
+    'TurkishLiraTR': (
+        'lira',
+        'Lira (Turkey)',
+        ('TRY', '949', '₤', 'TR₤', '',
+         '2,.3%-%s%u')),
+    'UAEDirham': (
+        'dirham',
+        'Dirham (UAE)',
+        ('AED', '784', 'د.إ.', 'د.إ.', '٠١٢٣٤٥٦٧٨٩-',
+         '2\u066B\u066C3%s\u00A0%a')),
+    'USDollar': (
+        'dollar',
+        'Dollar (United States of America)',
+        ('USD', '840', '$', 'US$', '',
+         '2.,3%-%s%u')),
+    'USDollarAS': (
+        'dollar',
+        'Dollar (American Samoa)',
+        ('USD', '840', '$', 'AS$', '',
+         '2.,3%-%s%u')),
+    'USDollarFM': (
+        'dollar',
+        'Dollar (Micronesia)',
+        ('USD', '840', '$', 'FM$', '',
+         '2.,3%-%s%u')),
+    'USDollarGU': (
+        'dollar',
+        'Dollar (Guam)',
+        ('USD', '840', '$', 'GU$', '',
+         '2.,3%-%s%u')),
+    'USDollarHT': (
+        'dollar',
+        'Dollar (Haiti)',
+        ('USD', '840', '$', 'HT$', '',
+         '2.,3%-%s%u')),
+    'USDollarIO': (
+        'dollar',
+        'Dollar (British Indian Ocean Territory)',
+        ('USD', '840', '$', 'IO$', '',
+         '2.,3%-%s%u')),
+    'USDollarMH': (
+        'dollar',
+        'Dollar (Marshall Islands)',
+        ('USD', '840', '$', 'MH$', '',
+         '2.,3%-%s%u')),
+    'USDollarMP': (
+        'dollar',
+        'Dollar (Northern Mariana Islands)',
+        ('USD', '840', '$', 'MP$', '',
+         '2.,3%-%s%u')),
+    'USDollarPA': (
+        'dollar',
+        'Dollar (Panama)',
+        ('USD', '840', '$', 'PA$', '',
+         '2.,3%-%s%u')),
+    'USDollarPC': (
+        'dollar',
+        'Dollar (Pacific Remote Islands)',
+        ('USD', '840', '$', 'PC$', '',
+         '2.,3%-%s%u')),
+    'USDollarPR': (
+        'dollar',
+        'Dollar (Puerto Rico)',
+        ('USD', '840', '$', 'PR$', '',
+         '2.,3%-%s%u')),
+    'USDollarPW': (
+        'dollar',
+        'Dollar (Palau)',
+        ('USD', '840', '$', 'PW$', '',
+         '2.,3%-%s%u')),
+    'USDollarTC': (
+        'dollar',
+        'Dollar (Turks and Caicos Islands)',
+        ('USD', '840', '$', 'TC$', '',
+         '2.,3%-%s%u')),
+    'USDollarVG': (
+        'dollar',
+        'Dollar (British Virgin Islands)',
+        ('USD', '840', '$', 'VG$', '',
+         '2.,3%-%s%u')),
+    'USDollarVI': (
+        'dollar',
+        'Dollar (US Virgin Islands)',
+        ('USD', '840', '$', 'VI$', '',
+         '2.,3%-%s%u')),
+    'UgandaShilling': (
+        'shilling',
+        'Shilling (Uganda)',
+        ('UGX', '800', 'USh', 'USh', '',
+         '0.,3%s\u00A0%a')),
+    'UzbekistanSum': (
+        'sum',
+        'Sum (Uzbekistan)',
+        ('UZS', '860', 'сўм', 'сўм', '',
+         '2,\u202F3%a\u00A0%s')),
+    'Vatu': (
+        'vatu',
+        'Vatu (Vanuatu)',
+        ('VUV', '548', 'Vt', 'Vt', '',
+         '0.,3%s\u00A0%a')),
+    'YemeniRial': (
+        'rial',
+        'Rial (Yemen)',
+        ('YER', '886', '﷼', '﷼', '٠١٢٣٤٥٦٧٨٩-',
+         '2\u066B\u066C3%a\u00A0%s')),
+    'Yen': (
+        'yen',
+        'Yen (Japan)',
+        ('JPY', '392', '¥', '¥', '',
+         '0.,3%-%s%u')),
+    'Yuan': (
+        'yuan',
+        'Yuan (China)',
+        ('CNY', '156', '¥', '¥', '',
+         '2.,3%-%s%u')),
+    'ZambianKwacha': (
+        'kwacha',
+        'Kwacha (Zambia)',
+        ('ZMW', '967', 'ZK', 'ZK', '',
+         '2.,3%s\u00A0%a')),
+    'Zcash': (
+        'crypto',
+        'Crypto',
+        ('ZEC', '0', 'ⓩ', 'ⓩ', '',
+         '8.,3%-%s%u')),
+    'ZimbabweDollar': (
+        'dollar',
+        'Dollar (Zimbabwe)',
+        ('ZWL', '932', '$', 'ZW$', '',
+         '2.,3%s\u00A0%a'))})
+
+_ALPHA_CODES = MappingProxyType({
+    'AED': 'UAEDirham',
+    'AFN': 'Afghani',
+    'ALL': 'Lek',
+    'AMD': 'ArmenianDram',
+    'AOA': 'Kwanza',
+    'ARS': 'ArgentinePeso',
+    'AUD': 'AustralianDollar',
+    'AWG': 'ArubanFlorin',
+    'AZN': 'AzerbaijanianManat',
+    'BAM': 'KonvertibilnaMarka',
+    'BBD': 'BarbadosDollar',
+    'BDT': 'Taka',
+    'BGN': 'BulgarianLev',
+    'BHD': 'BahrainiDinar',
+    'BIF': 'BurundiFranc',
+    'BMD': 'BermudianDollar',
+    'BND': 'BruneiDollar',
+    'BOB': 'Boliviano',
+    'BRL': 'BrazilianReal',
+    'BSD': 'BahamianDollar',
+    'BTN': 'Ngultrum',
+    'BWP': 'Pula',
+    'BYN': 'BelarusianRuble',
+    'BZD': 'BelizeDollar',
+    'CAD': 'CanadianDollarEN',
+    'CDF': 'CongoleseFranc',
+    'CHF': 'SwissFranc',
+    'CLP': 'ChileanPeso',
+    'CNY': 'Yuan',
+    'COP': 'ColombianPeso',
+    'CRC': 'CostaRicanColon',
+    'CUP': 'CubanPeso',
+    'CVE': 'CapeVerdeEscudo',
+    'CZK': 'CzechKoruna',
+    'DJF': 'DjiboutiFranc',
+    'DKK': 'DanishKrone',
+    'DOP': 'DominicanPeso',
+    'DZD': 'AlgerianDinar',
+    'EGP': 'EgyptianPound',
+    'EOS': 'EOS',
+    'ERN': 'Nakfa',
+    'ETB': 'EthiopianBirr',
+    'ETH': 'Ethereum',
+    'EUR': 'Euro',
+    'FJD': 'FijiDollar',
+    'FKP': 'FalklandIslandsPound',
+    'GBP': 'PoundSterling',
+    'GEL': 'Lari',
+    'GHS': 'Cedi',
+    'GIP': 'GibraltarPound',
+    'GMD': 'Dalasi',
+    'GNF': 'GuineaFranc',
+    'GTQ': 'Quetzal',
+    'GYD': 'GuyanaDollar',
+    'HKD': 'HongKongDollar',
+    'HNL': 'Lempira',
+    'HRK': 'CroatianKuna',
+    'HTG': 'Gourde',
+    'HUF': 'Forint',
+    'IDR': 'Rupiah',
+    'ILS': 'NewIsraeliShekel',
+    'INR': 'IndianRupee',
+    'IQD': 'IraqiDinar',
+    'IRR': 'IranianRial',
+    'ISK': 'IcelandKrona',
+    'JMD': 'JamaicanDollar',
+    'JOD': 'JordanianDinar',
+    'JPY': 'Yen',
+    'KES': 'KenyanShilling',
+    'KGS': 'Som',
+    'KHR': 'Riel',
+    'KPW': 'NorthKoreanWon',
+    'KRW': 'SouthKoreanWon',
+    'KWD': 'KuwaitiDinar',
+    'KYD': 'CaymanIslandsDollar',
+    'KZT': 'Tenge',
+    'LAK': 'Kip',
+    'LBP': 'LebanesePound',
+    'LKR': 'SriLankaRupee',
+    'LRD': 'LiberianDollar',
+    'LSL': 'Loti',
+    'LYD': 'LibyanDinar',
+    'MAD': 'MoroccanDirham',
+    'MDL': 'MoldovanLeu',
+    'MGA': 'MalagasyAriary',
+    'MKD': 'Denar',
+    'MMK': 'Kyat',
+    'MNT': 'Tugrik',
+    'MOP': 'Pataca',
+    'MRU': 'Ouguiya',
+    'MUR': 'MauritiusRupee',
+    'MVR': 'Rufiyaa',
+    'MWK': 'Kwacha',
+    'MXN': 'MexicanPeso',
+    'MYR': 'MalaysianRinggit',
+    'MZN': 'Metical',
+    'NAD': 'NamibiaDollar',
+    'NGN': 'Naira',
+    'NIO': 'CordobaOro',
+    'NOK': 'NorwegianKrone',
+    'NPR': 'NepaleseRupee',
+    'NZD': 'NewZealandDollar',
+    'OMR': 'RialOmani',
+    'PAB': 'Balboa',
+    'PEN': 'NuevoSol',
+    'PGK': 'Kina',
+    'PHP': 'PhilippinePeso',
+    'PKR': 'PakistanRupee',
+    'PLN': 'PZloty',
+    'PYG': 'Guarani',
+    'QAR': 'QatariRial',
+    'RON': 'Leu',
+    'RSD': 'SerbianDinarSR',
+    'RUB': 'RussianRuble',
+    'RWF': 'RwandaFranc',
+    'SAR': 'SaudiRiyal',
+    'SBD': 'SolomonIslandsDollar',
+    'SCR': 'SeychellesRupee',
+    'SDG': 'SudanesePound',
+    'SEK': 'SwedishKrona',
+    'SGD': 'SingaporeDollar',
+    'SHP': 'SaintHelenaPound',
+    'SLL': 'Leone',
+    'SOS': 'SomaliShilling',
+    'SRD': 'SurinameDollar',
+    'STN': 'Dobra',
+    'SYP': 'SyrianPound',
+    'SZL': 'Lilangeni',
+    'THB': 'Baht',
+    'TJS': 'Somoni',
+    'TMT': 'Manat',
+    'TND': 'TunisianDinar',
+    'TOP': 'Paanga',
+    'TRY': 'TurkishLira',
+    'TTD': 'TrinidadandTobagoDollar',
+    'TWD': 'TaiwanDollar',
+    'TZS': 'TanzanianShilling',
+    'UAH': 'Hryvnia',
+    'UGX': 'UgandaShilling',
+    'USD': 'USDollar',
+    'UYU': 'PesoUruguayo',
+    'UZS': 'UzbekistanSum',
+    'VEF': 'BolivarFuerte',
+    'VND': 'Dong',
+    'VUV': 'Vatu',
+    'WST': 'Tala',
+    'XAF': 'CFAFrancBEAC',
+    'XBT': 'Bitcoin',
+    'XCD': 'EasternCaribbeanDollar',
+    'XLM': 'StellarLumens',
+    'XMR': 'Monero',
+    'XOF': 'CFAFrancBCEAO',
+    'XPF': 'CFPFranc',
+    'XRP': 'Ripple',
+    'XTZ': 'Tezos',
+    'YER': 'YemeniRial',
+    'ZAR': 'Rand',
+    'ZEC': 'Zcash',
+    'ZMW': 'ZambianKwacha',
+    'ZWL': 'ZimbabweDollar'})
+
+_NUMERIC_CODES = MappingProxyType({
+    '008': 'Lek',
+    '012': 'AlgerianDinar',
+    '032': 'ArgentinePeso',
+    '036': 'AustralianDollar',
+    '044': 'BahamianDollar',
+    '048': 'BahrainiDinar',
+    '050': 'Taka',
+    '051': 'ArmenianDram',
+    '052': 'BarbadosDollar',
+    '060': 'BermudianDollar',
+    '064': 'Ngultrum',
+    '068': 'Boliviano',
+    '072': 'Pula',
+    '084': 'BelizeDollar',
+    '090': 'SolomonIslandsDollar',
+    '096': 'BruneiDollar',
+    '104': 'Kyat',
+    '108': 'BurundiFranc',
+    '116': 'Riel',
+    '124': 'CanadianDollarEN',
+    '132': 'CapeVerdeEscudo',
+    '136': 'CaymanIslandsDollar',
+    '144': 'SriLankaRupee',
+    '152': 'ChileanPeso',
+    '156': 'Yuan',
+    '170': 'ColombianPeso',
+    '188': 'CostaRicanColon',
+    '191': 'CroatianKuna',
+    '192': 'CubanPeso',
+    '203': 'CzechKoruna',
+    '208': 'DanishKrone',
+    '214': 'DominicanPeso',
+    '230': 'EthiopianBirr',
+    '232': 'Nakfa',
+    '238': 'FalklandIslandsPound',
+    '242': 'FijiDollar',
+    '262': 'DjiboutiFranc',
+    '270': 'Dalasi',
+    '292': 'GibraltarPound',
+    '320': 'Quetzal',
+    '324': 'GuineaFranc',
+    '328': 'GuyanaDollar',
+    '332': 'Gourde',
+    '340': 'Lempira',
+    '344': 'HongKongDollar',
+    '348': 'Forint',
+    '352': 'IcelandKrona',
+    '356': 'IndianRupee',
+    '360': 'Rupiah',
+    '364': 'IranianRial',
+    '368': 'IraqiDinar',
+    '376': 'NewIsraeliShekel',
+    '388': 'JamaicanDollar',
+    '392': 'Yen',
+    '398': 'Tenge',
+    '400': 'JordanianDinar',
+    '404': 'KenyanShilling',
+    '408': 'NorthKoreanWon',
+    '410': 'SouthKoreanWon',
+    '414': 'KuwaitiDinar',
+    '417': 'Som',
+    '418': 'Kip',
+    '422': 'LebanesePound',
+    '426': 'Loti',
+    '430': 'LiberianDollar',
+    '434': 'LibyanDinar',
+    '446': 'Pataca',
+    '454': 'Kwacha',
+    '458': 'MalaysianRinggit',
+    '462': 'Rufiyaa',
+    '480': 'MauritiusRupee',
+    '484': 'MexicanPeso',
+    '496': 'Tugrik',
+    '498': 'MoldovanLeu',
+    '504': 'MoroccanDirham',
+    '512': 'RialOmani',
+    '516': 'NamibiaDollar',
+    '524': 'NepaleseRupee',
+    '533': 'ArubanFlorin',
+    '548': 'Vatu',
+    '554': 'NewZealandDollar',
+    '558': 'CordobaOro',
+    '566': 'Naira',
+    '578': 'NorwegianKrone',
+    '586': 'PakistanRupee',
+    '590': 'Balboa',
+    '598': 'Kina',
+    '600': 'Guarani',
+    '604': 'NuevoSol',
+    '608': 'PhilippinePeso',
+    '634': 'QatariRial',
+    '643': 'RussianRuble',
+    '646': 'RwandaFranc',
+    '654': 'SaintHelenaPound',
+    '682': 'SaudiRiyal',
+    '690': 'SeychellesRupee',
+    '694': 'Leone',
+    '702': 'SingaporeDollar',
+    '704': 'Dong',
+    '706': 'SomaliShilling',
+    '710': 'Rand',
+    '748': 'Lilangeni',
+    '752': 'SwedishKrona',
+    '756': 'SwissFranc',
+    '760': 'SyrianPound',
+    '764': 'Baht',
+    '776': 'Paanga',
+    '780': 'TrinidadandTobagoDollar',
+    '784': 'UAEDirham',
+    '788': 'TunisianDinar',
+    '800': 'UgandaShilling',
+    '807': 'Denar',
+    '818': 'EgyptianPound',
+    '826': 'PoundSterling',
+    '834': 'TanzanianShilling',
+    '840': 'USDollar',
+    '858': 'PesoUruguayo',
+    '860': 'UzbekistanSum',
+    '882': 'Tala',
+    '886': 'YemeniRial',
+    '901': 'TaiwanDollar',
+    '929': 'Ouguiya',
+    '930': 'Dobra',
+    '932': 'ZimbabweDollar',
+    '933': 'BelarusianRuble',
+    '934': 'Manat',
+    '936': 'Cedi',
+    '937': 'BolivarFuerte',
+    '938': 'SudanesePound',
+    '941': 'SerbianDinarSR',
+    '943': 'Metical',
+    '944': 'AzerbaijanianManat',
+    '946': 'Leu',
+    '949': 'TurkishLira',
+    '950': 'CFAFrancBEAC',
+    '951': 'EasternCaribbeanDollar',
+    '952': 'CFAFrancBCEAO',
+    '953': 'CFPFranc',
+    '967': 'ZambianKwacha',
+    '968': 'SurinameDollar',
+    '969': 'MalagasyAriary',
+    '971': 'Afghani',
+    '972': 'Somoni',
+    '973': 'Kwanza',
+    '975': 'BulgarianLev',
+    '976': 'CongoleseFranc',
+    '977': 'KonvertibilnaMarka',
+    '978': 'Euro',
+    '980': 'Hryvnia',
+    '981': 'Lari',
+    '985': 'PZloty',
+    '986': 'BrazilianReal'})
+
+_COUNTRIES = MappingProxyType({
+    ('AED', 'UAE'): 'UAEDirham',
+    ('AFN', 'Afghanistan'): 'Afghani',
+    ('ALL', 'Albania'): 'Lek',
+    ('AMD', 'Armenia'): 'ArmenianDram',
+    ('AOA', 'Angola'): 'Kwanza',
+    ('ARS', 'Argentina'): 'ArgentinePeso',
+    ('AUD', 'Australia'): 'AustralianDollar',
+    ('AUD', 'Coconut Islands'): 'AustralianDollarCC',
+    ('AUD', 'Kiribati'): 'AustralianDollarKI',
+    ('AUD', 'Nauru'): 'AustralianDollarMR',
+    ('AUD', 'Tuvalu'): 'AustralianDollarTV',
+    ('AWG', 'Aruba'): 'ArubanFlorin',
+    ('AZN', 'Azerbaijan'): 'AzerbaijanianManat',
+    ('BAM', 'Bosnia and Herzegovina'): 'KonvertibilnaMarka',
+    ('BBD', 'Barbados'): 'BarbadosDollar',
+    ('BDT', 'Bangladesh'): 'Taka',
+    ('BGN', 'Bulgaria'): 'BulgarianLev',
+    ('BHD', 'Bahrain'): 'BahrainiDinar',
+    ('BIF', 'Burundi'): 'BurundiFranc',
+    ('BMD', 'Bermuda'): 'BermudianDollar',
+    ('BND', 'Brunei'): 'BruneiDollar',
+    ('BND', 'Singapore'): 'BruneiDollarSG',
+    ('BOB', 'Bolivia'): 'Boliviano',
+    ('BRL', 'Brazil'): 'BrazilianReal',
+    ('BSD', 'Bahamas'): 'BahamianDollar',
+    ('BTN', 'Bhutan'): 'Ngultrum',
+    ('BWP', 'Botswana'): 'Pula',
+    ('BYN', 'Belarus'): 'BelarusianRuble',
+    ('BZD', 'Belize'): 'BelizeDollar',
+    ('CAD', 'Canada'): 'CanadianDollarEN',
+    ('CDF', 'Congo (Kinshasa)'): 'CongoleseFranc',
+    ('CHF', 'Liechtenstein'): 'SwissFrancLI',
+    ('CHF', 'Switzerland'): 'SwissFranc',
+    ('CLP', 'Chile'): 'ChileanPeso',
+    ('CNY', 'China'): 'Yuan',
+    ('COP', 'Colombia'): 'ColombianPeso',
+    ('CRC', 'Costa Rica'): 'CostaRicanColon',
+    ('CUP', 'Cuba'): 'CubanPeso',
+    ('CVE', 'Cape Verde'): 'CapeVerdeEscudo',
+    ('CZK', 'Czech Republic'): 'CzechKoruna',
+    ('DJF', 'Djibouti'): 'DjiboutiFranc',
+    ('DKK', 'Denmark'): 'DanishKrone',
+    ('DOP', 'Dominican Republic'): 'DominicanPeso',
+    ('DZD', 'Algeria'): 'AlgerianDinar',
+    ('EGP', 'Egypt'): 'EgyptianPound',
+    ('ERN', 'Eritrea'): 'Nakfa',
+    ('ETB', 'Ethiopia'): 'EthiopianBirr',
+    ('EUR', 'Akrotiri and Dhekelia'): 'EuroSBA',
+    ('EUR', 'Andorra'): 'EuroAD',
+    ('EUR', 'Austria'): 'EuroAT',
+    ('EUR', 'Belgium'): 'EuroBE',
+    ('EUR', 'Cyprus'): 'EuroCY',
+    ('EUR', 'Estonia'): 'EuroEE',
+    ('EUR', 'Finland'): 'EuroFI',
+    ('EUR', 'France'): 'EuroFR',
+    ('EUR', 'Germany'): 'EuroDE',
+    ('EUR', 'Greece'): 'EuroGR',
+    ('EUR', 'Ireland'): 'EuroIE',
+    ('EUR', 'Italy'): 'EuroIT',
+    ('EUR', 'Kosovo'): 'EuroXK',
+    ('EUR', 'Latvia'): 'EuroLV',
+    ('EUR', 'Lithuania'): 'EuroLT',
+    ('EUR', 'Luxembourg'): 'EuroLU',
+    ('EUR', 'Malta'): 'EuroMT',
+    ('EUR', 'Monaco'): 'EuroMC',
+    ('EUR', 'Montenegro'): 'EuroME',
+    ('EUR', 'Netherlands'): 'EuroNL',
+    ('EUR', 'Portugal'): 'EuroPT',
+    ('EUR', 'San-Marino'): 'EuroSM',
+    ('EUR', 'Slovakia'): 'EuroSK',
+    ('EUR', 'Slovenia'): 'EuroSI',
+    ('EUR', 'Spain'): 'EuroES',
+    ('EUR', 'Vatican'): 'EuroVA',
+    ('FJD', 'Fiji'): 'FijiDollar',
+    ('FKP', 'Falkland Islands'): 'FalklandIslandsPound',
+    ('GBP', 'Alderney'): 'PoundSterlingGG',
+    ('GBP', 'British Indian Ocean Territory'): 'PoundSterlingIO',
+    ('GBP', 'Great Britain'): 'PoundSterling',
+    ('GBP', 'Isle of Man'): 'PoundSterlingIM',
+    ('GEL', 'Georgia'): 'GeorgiaLari',
+    ('GEL', 'South Ossetia'): 'SouthOssetiaLari',
+    ('GHS', 'Ghana'): 'Cedi',
+    ('GIP', 'Gibraltar'): 'GibraltarPound',
+    ('GMD', 'Gambia'): 'Dalasi',
+    ('GNF', 'Guinea'): 'GuineaFranc',
+    ('GTQ', 'Guatemala'): 'Quetzal',
+    ('GYD', 'Guyana'): 'GuyanaDollar',
+    ('HKD', 'Hong Kong'): 'HongKongDollar',
+    ('HNL', 'Honduras'): 'Lempira',
+    ('HRK', 'Croatia'): 'CroatianKuna',
+    ('HTG', 'Haiti'): 'Gourde',
+    ('HUF', 'Hungary'): 'Forint',
+    ('IDR', 'Indonesia'): 'Rupiah',
+    ('ILS', 'Israel'): 'NewIsraeliShekel',
+    ('ILS', 'Palestine'): 'NewIsraeliShekelPS',
+    ('INR', 'Bhutan'): 'IndianRupeeBT',
+    ('INR', 'India'): 'IndianRupee',
+    ('IQD', 'Iraq'): 'IraqiDinar',
+    ('IRR', 'Iran'): 'IranianRial',
+    ('ISK', 'Iceland'): 'IcelandKrona',
+    ('JMD', 'Jamaica'): 'JamaicanDollar',
+    ('JOD', 'Jordan'): 'JordanianDinar',
+    ('JPY', 'Japan'): 'Yen',
+    ('KES', 'Kenya'): 'KenyanShilling',
+    ('KGS', 'Kyrgyzstan'): 'Som',
+    ('KHR', 'Cambodia'): 'Riel',
+    ('KPW', 'North Korea'): 'NorthKoreanWon',
+    ('KRW', 'South Korea'): 'SouthKoreanWon',
+    ('KWD', 'Kuwait'): 'KuwaitiDinar',
+    ('KYD', 'Cayman Islands'): 'CaymanIslandsDollar',
+    ('KZT', 'Kazakhstan'): 'Tenge',
+    ('LAK', 'Laos'): 'Kip',
+    ('LBP', 'Lebanon'): 'LebanesePound',
+    ('LKR', 'Sri Lanka'): 'SriLankaRupee',
+    ('LRD', 'Liberia'): 'LiberianDollar',
+    ('LSL', 'Lesotho'): 'Loti',
+    ('LYD', 'Libya'): 'LibyanDinar',
+    ('MAD', 'Morocco'): 'MoroccanDirham',
+    ('MDL', 'Moldova'): 'MoldovanLeu',
+    ('MGA', 'Madagascar'): 'MalagasyAriary',
+    ('MKD', 'Macedonia'): 'Denar',
+    ('MMK', 'Myanmar (Burma)'): 'Kyat',
+    ('MNT', 'Mongolia'): 'Tugrik',
+    ('MOP', 'Macao'): 'Pataca',
+    ('MRU', 'Mauritania'): 'Ouguiya',
+    ('MUR', 'Mauritius'): 'MauritiusRupee',
+    ('MVR', 'Maldives'): 'Rufiyaa',
+    ('MWK', 'Malawi'): 'Kwacha',
+    ('MXN', 'Mexico'): 'MexicanPeso',
+    ('MYR', 'Malaysia'): 'MalaysianRinggit',
+    ('MZN', 'Mozambique'): 'Metical',
+    ('NAD', 'Namibia'): 'NamibiaDollar',
+    ('NGN', 'Nigeria'): 'Naira',
+    ('NIO', 'Nicaragua'): 'CordobaOro',
+    ('NOK', 'Norway'): 'NorwegianKrone',
+    ('NPR', 'Nepal'): 'NepaleseRupee',
+    ('NZD', 'Cook Islands'): 'NewZealandDollarCK',
+    ('NZD', 'New Zealand'): 'NewZealandDollar',
+    ('NZD', 'Niue'): 'NewZealandDollarNU',
+    ('NZD', 'Pitcairn Island'): 'NewZealandDollarPN',
+    ('OMR', 'Oman'): 'RialOmani',
+    ('PAB', 'Panama'): 'Balboa',
+    ('PEN', 'Peru'): 'NuevoSol',
+    ('PGK', 'Papua New Guinea'): 'Kina',
+    ('PHP', 'Philippines'): 'PhilippinePeso',
+    ('PKR', 'Pakistan'): 'PakistanRupee',
+    ('PLN', 'Poland'): 'PZloty',
+    ('PYG', 'Paraguay'): 'Guarani',
+    ('QAR', 'Qatar'): 'QatariRial',
+    ('RON', 'Romania'): 'Leu',
+    ('RSD', 'Kosovo'): 'SerbianDinarXK',
+    ('RSD', 'Serbia'): 'SerbianDinarSR',
+    ('RUB', 'Russia'): 'RussianRuble',
+    ('RUB', 'South Ossetia'): 'RussianRubleGE',
+    ('RWF', 'Rwanda'): 'RwandaFranc',
+    ('SAR', 'Saudi Arabia'): 'SaudiRiyal',
+    ('SBD', 'Solomon Islands'): 'SolomonIslandsDollar',
+    ('SCR', 'Seychelles'): 'SeychellesRupee',
+    ('SDG', 'Sudan'): 'SudanesePound',
+    ('SEK', 'Sweden'): 'SwedishKrona',
+    ('SGD', 'Brunei'): 'SingaporeDollarBN',
+    ('SGD', 'Singapore'): 'SingaporeDollar',
+    ('SHP', 'Ascension Island'): 'SaintHelenaPoundAI',
+    ('SHP', 'Saint Helena'): 'SaintHelenaPound',
+    ('SHP', 'Tristan da Cunha'): 'SaintHelenaPoundTC',
+    ('SLL', 'Sierra Leone'): 'Leone',
+    ('SOS', 'Somalia'): 'SomaliShilling',
+    ('SRD', 'Suriname'): 'SurinameDollar',
+    ('STN', 'Sao Tome and Principe'): 'Dobra',
+    ('SYP', 'Syria'): 'SyrianPound',
+    ('SZL', 'Swaziland'): 'Lilangeni',
+    ('THB', 'Thailand'): 'Baht',
+    ('TJS', 'Tajikistan'): 'Somoni',
+    ('TMT', 'Turkmenistan'): 'Manat',
+    ('TND', 'Tunisia'): 'TunisianDinar',
+    ('TOP', 'Tonga'): 'Paanga',
+    ('TRY', 'North Cyprus'): 'TurkishLiraCY',
+    ('TRY', 'Turkey'): 'TurkishLira',
+    ('TTD', 'Trinidad and Tobago'): 'TrinidadandTobagoDollar',
+    ('TWD', 'Taiwan'): 'TaiwanDollar',
+    ('TZS', 'Tanzania'): 'TanzanianShilling',
+    ('UAH', 'Ukraine'): 'Hryvnia',
+    ('UGX', 'Uganda'): 'UgandaShilling',
+    ('USD', 'American Samoa'): 'USDollarAS',
+    ('USD', 'British Indian Ocean Territory'): 'USDollarIO',
+    ('USD', 'British Virgin Islands'): 'USDollarVG',
+    ('USD', 'Guam'): 'USDollarGU',
+    ('USD', 'Haiti'): 'USDollarHT',
+    ('USD', 'Marshall Islands'): 'USDollarMH',
+    ('USD', 'Micronesia'): 'USDollarFM',
+    ('USD', 'Northern Mariana Islands'): 'USDollarMP',
+    ('USD', 'Pacific Remote Islands'): 'USDollarPC',
+    ('USD', 'Palau'): 'USDollarPW',
+    ('USD', 'Panama'): 'USDollarPA',
+    ('USD', 'Puerto Rico'): 'USDollarPR',
+    ('USD', 'Turks and Caicos Islands'): 'USDollarTC',
+    ('USD', 'US Virgin Islands'): 'USDollarVI',
+    ('USD', 'United States of America'): 'USDollar',
+    ('UYU', 'Uruguay'): 'PesoUruguayo',
+    ('UZS', 'Uzbekistan'): 'UzbekistanSum',
+    ('VEF', 'Venezuela'): 'BolivarFuerte',
+    ('VND', 'Vietnam'): 'Dong',
+    ('VUV', 'Vanuatu'): 'Vatu',
+    ('WST', 'Samoa'): 'Tala',
+    ('XAF', 'Cameroon'): 'CFAFrancBEAC',
+    ('XAF', 'Central African Republic'): 'CFAFrancBEACCF',
+    ('XAF', 'Chad'): 'CFAFrancBEACTD',
+    ('XAF', 'Congo (Brazzaville)'): 'CFAFrancBEACCD',
+    ('XAF', 'Equatorial Guinea'): 'CFAFrancBEACGQ',
+    ('XAF', 'Gabon'): 'CFAFrancBEACGA',
+    ('XCD', 'Anguilla'): 'EasternCaribbeanDollarAI',
+    ('XCD', 'Antigua and Barbuda'): 'EasternCaribbeanDollarAG',
+    ('XCD', 'Dominica'): 'EasternCaribbeanDollarDM',
+    ('XCD', 'Grenada'): 'EasternCaribbeanDollarGD',
+    ('XCD', 'Montserrat'): 'EasternCaribbeanDollarMS',
+    ('XCD', 'Organisation of Eastern Caribbean States (OECS)'):
+        'EasternCaribbeanDollar',
+    ('XCD', 'Saint Kitts and Nevis'): 'EasternCaribbeanDollarKN',
+    ('XCD', 'Saint Lucia'): 'EasternCaribbeanDollarLC',
+    ('XCD', 'Saint Vincent and Grenadine'): 'EasternCaribbeanDollarVC',
+    ('XOF', 'Benin'): 'CFAFrancBCEAOBJ',
+    ('XOF', 'Burkina Faso'): 'CFAFrancBCEAOBF',
+    ('XOF', "Côte d'Ivoire"): 'CFAFrancBCEAOCI',
+    ('XOF', 'Guinea-Bissau'): 'CFAFrancBCEAOGW',
+    ('XOF', 'Mali'): 'CFAFrancBCEAOML',
+    ('XOF', 'Niger'): 'CFAFrancBCEAONG',
+    ('XOF', 'Senegal'): 'CFAFrancBCEAO',
+    ('XOF', 'Togo'): 'CFAFrancBCEAOTG',
+    ('XPF', 'French Polynesia'): 'CFPFranc',
+    ('XPF', 'New Caledonia'): 'CFPFrancNC',
+    ('XPF', 'Wallis and Futuna'): 'CFPFrancWF',
+    ('YER', 'Yemen'): 'YemeniRial',
+    ('ZAR', 'Lesotho'): 'RandLS',
+    ('ZAR', 'Namibia'): 'RandNA',
+    ('ZAR', 'South Africa'): 'Rand',
+    ('ZMW', 'Zambia'): 'ZambianKwacha',
+    ('ZWL', 'Zimbabwe'): 'ZimbabweDollar'})
 
 __all__ = (
     'Afghani',
@@ -862,3 +2422,36 @@ __all__ = (
     'ZambianKwacha',
     'Zcash',
     'ZimbabweDollar')
+
+
+def __getattr__(name: str) -> type:
+    """Returns the currency `name` (creating it when needed).
+
+    The currencies are created, on first access, from the currencies
+    table (`_CURRENCIES`).
+
+    Args:
+        name (str): Currency (class) name.
+
+    Returns:
+        type: currency class.
+
+    Raises:
+        AttributeError: If `name` is not a supported currency.
+    """
+    if name not in _CURRENCIES:
+        msg = f'module {__name__!r} has no attribute {name!r}'
+        raise AttributeError(msg)
+    module, description, info = _CURRENCIES[name]
+    currency = _currency_class(
+        name, f'{__name__}.{module}', description, info)
+    return globals().setdefault(name, currency)
+
+
+def __dir__() -> list[str]:
+    """Returns the module attributes (including the currencies).
+
+    Returns:
+        list[str]: module attributes.
+    """
+    return sorted({*globals(), *__all__})
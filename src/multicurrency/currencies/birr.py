@@ -4,72 +4,41 @@
 # author: Frederico Martins <http://github.com/fscm>
 # license: SPDX-License-Identifier: MIT
 
-"""Birr currency representation(s)."""
+"""Birr currency representation(s).
 
-from __future__ import annotations
+The currencies of this module are created, on first access, from the
+currencies table (see `multicurrency.currencies`).
+"""
 
-from typing import TYPE_CHECKING, Self, cast
+from multicurrency import currencies
 
-from multicurrency.pycurrency import Currency
 
+__all__ = (
+    'EthiopianBirr')
 
-if TYPE_CHECKING:
-    from decimal import Decimal
 
-
-class EthiopianBirr(Currency):
-    """Birr (Ethiopia) currency representation.
-
-    Simple usage example:
-
-        >>> from multicurrency import EthiopianBirr
-        >>> ethiopian_birr = EthiopianBirr(
-        ...     amount='123456.789')
-        >>> print(ethiopian_birr)
-        ብር 123,456.79
-
-    For more details see `multicurrency.pycurrency.Currency`.
+def __getattr__(name: str) -> type:
+    """Returns the currency `name`.
 
     Args:
-        amount (str | int | float | Decimal): Represented value.
-        pattern (str, optional): Currency format pattern. Defaults to
-            '2.,3%s %a'.
-    """
-
-    __slots__ = ()
+        name (str): Currency (class) name.
 
-    def __new__(  # pylint: disable=signature-differs
-        cls: Self,
-        amount: str | float | Decimal,
-        pattern: str | None = '2.,3%s\u00A0%a',
-    ) -> Self:
-        """Class creator.
+    Returns:
+        type: currency class.
 
-        Returns:
-            EthiopianBirr: new `EthiopianBirr` object.
-        """
-        return cast(
-            EthiopianBirr,
-            super().__new__(
-                cls,
-                amount=amount,
-                alpha_code='ETB',
-                numeric_code='230',
-                symbol='ብር',
-                localized_symbol='ብር',
-                convertion='',
-                pattern=pattern))
+    Raises:
+        AttributeError: If `name` is not a currency of this module.
+    """
+    if name not in __all__:
+        msg = f'module {__name__!r} has no attribute {name!r}'
+        raise AttributeError(msg)
+    return getattr(currencies, name)
 
-    def __recreate__(
-            self: Self,
-            amount: str | float | Decimal,
-    ) -> Self:
-        """Recreates self with a different `amount`.
 
-        Args:
-            amount (str | int | float | Decimal): Represented value.
+def __dir__() -> list[str]:
+    """Returns the module attributes (including the currencies).
 
-        Returns:
-            EthiopianBirr: new opbject.
-        """
-        return self.__class__(amount, self._info[5])
+    Returns:
+        list[str]: module attributes.
+    """
+    return sorted({*globals(), *__all__})
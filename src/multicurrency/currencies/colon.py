@@ -4,72 +4,41 @@
 # author: Frederico Martins <http://github.com/fscm>
 # license: SPDX-License-Identifier: MIT
 
-"""Colon currency representation(s)."""
+"""Colon currency representation(s).
 
-from __future__ import annotations
+The currencies of this module are created, on first access, from the
+currencies table (see `multicurrency.currencies`).
+"""
 
-from typing import TYPE_CHECKING, Self, cast
+from multicurrency import currencies
 
-from multicurrency.pycurrency import Currency
 
+__all__ = (
+    'CostaRicanColon')
 
-if TYPE_CHECKING:
-    from decimal import Decimal
 
-
-class CostaRicanColon(Currency):
-    """Colon (Costa Rica) currency representation.
-
-    Simple usage example:
-
-        >>> from multicurrency import CostaRicanColon
-        >>> costa_rican_colon = CostaRicanColon(
-        ...     amount='123456.789')
-        >>> print(costa_rican_colon)
-        ₡123 456,79
-
-    For more details see `multicurrency.pycurrency.Currency`.
+def __getattr__(name: str) -> type:
+    """Returns the currency `name`.
 
     Args:
-        amount (str | int | float | Decimal): Represented value.
-        pattern (str, optional): Currency format pattern. Defaults to
-            '2, 3%-%s%u'.
-    """
-
-    __slots__ = ()
+        name (str): Currency (class) name.
 
-    def __new__(  # pylint: disable=signature-differs
-        cls: Self,
-        amount: str | float | Decimal,
-        pattern: str | None = '2,\u202F3%-%s%u',
-    ) -> Self:
-        """Class creator.
+    Returns:
+        type: currency class.
 
-        Returns:
-            CostaRicanColon: new `CostaRicanColon` object.
-        """
-        return cast(
-            CostaRicanColon,
-            super().__new__(
-                cls,
-                amount=amount,
-                alpha_code='CRC',
-                numeric_code='188',
-                symbol='₡',
-                localized_symbol='₡',
-                convertion='',
-                pattern=pattern))
+    Raises:
+        AttributeError: If `name` is not a currency of this module.
+    """
+    if name not in __all__:
+        msg = f'module {__name__!r} has no attribute {name!r}'
+        raise AttributeError(msg)
+    return getattr(currencies, name)
 
-    def __recreate__(
-            self: Self,
-            amount: str | float | Decimal,
-    ) -> Self:
-        """Recreates self with a different `amount`.
 
-        Args:
-            amount (str | int | float | Decimal): Represented value.
+def __dir__() -> list[str]:
+    """Returns the module attributes (including the currencies).
 
-        Returns:
-            CostaRicanColon: new opbject.
-        """
-        return self.__class__(amount, self._info[5])
+    Returns:
+        list[str]: module attributes.
+    """
+    return sorted({*globals(), *__all__})
@@ -4,130 +4,42 @@
 # author: Frederico Martins <http://github.com/fscm>
 # license: SPDX-License-Identifier: MIT
 
-"""Dirham currency representation(s)."""
+"""Dirham currency representation(s).
 
-from __future__ import annotations
+The currencies of this module are created, on first access, from the
+currencies table (see `multicurrency.currencies`).
+"""
 
-from typing import TYPE_CHECKING, Self, cast
+from multicurrency import currencies
 
-from multicurrency.pycurrency import Currency
 
+__all__ = (
+    'UAEDirham',
+    'MoroccanDirham')
 
-if TYPE_CHECKING:
-    from decimal import Decimal
 
-
-class UAEDirham(Currency):
-    """Dirham (UAE) currency representation.
-
-    Simple usage example:
-
-        >>> from multicurrency import UAEDirham
-        >>> uae_dirham = UAEDirham(
-        ...     amount='123456.789')
-        >>> print(uae_dirham)
-        د.إ. ١٢٣٬٤٥٦٫٧٩
-
-    For more details see `multicurrency.pycurrency.Currency`.
+def __getattr__(name: str) -> type:
+    """Returns the currency `name`.
 
     Args:
-        amount (str | int | float | Decimal): Represented value.
-        pattern (str, optional): Currency format pattern. Defaults to
-            '2٫٬3%s %a'.
-    """
-
-    __slots__ = ()
-
-    def __new__(  # pylint: disable=signature-differs
-        cls: Self,
-        amount: str | float | Decimal,
-        pattern: str | None = '2\u066B\u066C3%s\u00A0%a',
-    ) -> Self:
-        """Class creator.
-
-        Returns:
-            UAEDirham: new `UAEDirham` object.
-        """
-        return cast(
-            UAEDirham,
-            super().__new__(
-                cls,
-                amount=amount,
-                alpha_code='AED',
-                numeric_code='784',
-                symbol='د.إ.',
-                localized_symbol='د.إ.',
-                convertion='٠١٢٣٤٥٦٧٨٩-',
-                pattern=pattern))
-
-    def __recreate__(
-            self: Self,
-            amount: str | float | Decimal,
-    ) -> Self:
-        """Recreates self with a different `amount`.
-
-        Args:
-            amount (str | int | float | Decimal): Represented value.
+        name (str): Currency (class) name.
 
-        Returns:
-            UAEDirham: new opbject.
-        """
-        return self.__class__(amount, self._info[5])
+    Returns:
+        type: currency class.
 
-
-class MoroccanDirham(Currency):
-    """Dirham (Morocco) currency representation.
-
-    Simple usage example:
-
-        >>> from multicurrency import MoroccanDirham
-        >>> moroccan_dirham = MoroccanDirham(
-        ...     amount='123456.789')
-        >>> print(moroccan_dirham)
-        ١٢٣٬٤٥٦٫٧٩ د.م.
-
-    For more details see `multicurrency.pycurrency.Currency`.
-
-    Args:
-        amount (str | int | float | Decimal): Represented value.
-        pattern (str, optional): Currency format pattern. Defaults to
-            '2٫٬3%a %s'.
+    Raises:
+        AttributeError: If `name` is not a currency of this module.
     """
+    if name not in __all__:
+        msg = f'module {__name__!r} has no attribute {name!r}'
+        raise AttributeError(msg)
+    return getattr(currencies, name)
 
-    __slots__ = ()
-
-    def __new__(  # pylint: disable=signature-differs
-        cls: Self,
-        amount: str | float | Decimal,
-        pattern: str | None = '2\u066B\u066C3%a\u00A0%s',
-    ) -> Self:
-        """Class creator.
-
-        Returns:
-            MoroccanDirham: new `MoroccanDirham` object.
-        """
-        return cast(
-            MoroccanDirham,
-            super().__new__(
-                cls,
-                amount=amount,
-                alpha_code='MAD',
-                numeric_code='504',
-                symbol='د.م.',
-                localized_symbol='د.م.',
-                convertion='٠١٢٣٤٥٦٧٨٩-',
-                pattern=pattern))
 
-    def __recreate__(
-            self: Self,
-            amount: str | float | Decimal,
-    ) -> Self:
-        """Recreates self with a different `amount`.
+def __dir__() -> list[str]:
+    """Returns the module attributes (including the currencies).
 
-        Args:
-            amount (str | int | float | Decimal): Represented value.
-
-        Returns:
-            MoroccanDirham: new opbject.
-        """
-        return self.__class__(amount, self._info[5])
+    Returns:
+        list[str]: module attributes.
+    """
+    return sorted({*globals(), *__all__})
@@ -4,130 +4,42 @@
 # author: Frederico Martins <http://github.com/fscm>
 # license: SPDX-License-Identifier: MIT
 
-"""Krone currency representation(s)."""
+"""Krone currency representation(s).
 
-from __future__ import annotations
+The currencies of this module are created, on first access, from the
+currencies table (see `multicurrency.currencies`).
+"""
 
-from typing import TYPE_CHECKING, Self, cast
+from multicurrency import currencies
 
-from multicurrency.pycurrency import Currency
 
+__all__ = (
+    'DanishKrone',
+    'NorwegianKrone')
 
-if TYPE_CHECKING:
-    from decimal import Decimal
 
-
-class DanishKrone(Currency):
-    """Krone (Denmark) currency representation.
-
-    Simple usage example:
-
-        >>> from multicurrency import DanishKrone
-        >>> danish_krone = DanishKrone(
-        ...     amount='123456.789')
-        >>> print(danish_krone)
-        123.456,79 kr
-
-    For more details see `multicurrency.pycurrency.Currency`.
+def __getattr__(name: str) -> type:
+    """Returns the currency `name`.
 
     Args:
-        amount (str | int | float | Decimal): Represented value.
-        pattern (str, optional): Currency format pattern. Defaults to
-            '2,.3%a %s'.
-    """
-
-    __slots__ = ()
-
-    def __new__(  # pylint: disable=signature-differs
-        cls: Self,
-        amount: str | float | Decimal,
-        pattern: str | None = '2,.3%a\u00A0%s',
-    ) -> Self:
-        """Class creator.
-
-        Returns:
-            DanishKrone: new `DanishKrone` object.
-        """
-        return cast(
-            DanishKrone,
-            super().__new__(
-                cls,
-                amount=amount,
-                alpha_code='DKK',
-                numeric_code='208',
-                symbol='kr',
-                localized_symbol='kr',
-                convertion='',
-                pattern=pattern))
-
-    def __recreate__(
-            self: Self,
-            amount: str | float | Decimal,
-    ) -> Self:
-        """Recreates self with a different `amount`.
-
-        Args:
-            amount (str | int | float | Decimal): Represented value.
+        name (str): Currency (class) name.
 
-        Returns:
-            DanishKrone: new opbject.
-        """
-        return self.__class__(amount, self._info[5])
+    Returns:
+        type: currency class.
 
-
-class NorwegianKrone(Currency):
-    """Krone (Norway) currency representation.
-
-    Simple usage example:
-
-        >>> from multicurrency import NorwegianKrone
-        >>> norwegian_krone = NorwegianKrone(
-        ...     amount='123456.789')
-        >>> print(norwegian_krone)
-        kr 123 456,79
-
-    For more details see `multicurrency.pycurrency.Currency`.
-
-    Args:
-        amount (str | int | float | Decimal): Represented value.
-        pattern (str, optional): Currency format pattern. Defaults to
-            '2, 3%s %a'.
+    Raises:
+        AttributeError: If `name` is not a currency of this module.
     """
+    if name not in __all__:
+        msg = f'module {__name__!r} has no attribute {name!r}'
+        raise AttributeError(msg)
+    return getattr(currencies, name)
 
-    __slots__ = ()
-
-    def __new__(  # pylint: disable=signature-differs
-        cls: Self,
-        amount: str | float | Decimal,
-        pattern: str | None = '2,\u202F3%s\u00A0%a',
-    ) -> Self:
-        """Class creator.
-
-        Returns:
-            NorwegianKrone: new `NorwegianKrone` object.
-        """
-        return cast(
-            NorwegianKrone,
-            super().__new__(
-                cls,
-                amount=amount,
-                alpha_code='NOK',
-                numeric_code='578',
-                symbol='kr',
-                localized_symbol='kr',
-                convertion='',
-                pattern=pattern))
 
-    def __recreate__(
-            self: Self,
-            amount: str | float | Decimal,
-    ) -> Self:
-        """Recreates self with a different `amount`.
+def __dir__() -> list[str]:
+    """Returns the module attributes (including the currencies).
 
-        Args:
-            amount (str | int | float | Decimal): Represented value.
-
-        Returns:
-            NorwegianKrone: new opbject.
-        """
-        return self.__class__(amount, self._info[5])
+    Returns:
+        list[str]: module attributes.
+    """
+    return sorted({*globals(), *__all__})
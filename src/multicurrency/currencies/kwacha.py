@@ -4,130 +4,42 @@
 # author: Frederico Martins <http://github.com/fscm>
 # license: SPDX-License-Identifier: MIT
 
-"""Kwacha currency representation(s)."""
+"""Kwacha currency representation(s).
 
-from __future__ import annotations
+The currencies of this module are created, on first access, from the
+currencies table (see `multicurrency.currencies`).
+"""
 
-from typing import TYPE_CHECKING, Self, cast
+from multicurrency import currencies
 
-from multicurrency.pycurrency import Currency
 
+__all__ = (
+    'Kwacha',
+    'ZambianKwacha')
 
-if TYPE_CHECKING:
-    from decimal import Decimal
 
-
-class Kwacha(Currency):
-    """Kwacha (Malawi) currency representation.
-
-    Simple usage example:
-
-        >>> from multicurrency import Kwacha
-        >>> kwacha = Kwacha(
-        ...     amount='123456.789')
-        >>> print(kwacha)
-        MK 123,456.79
-
-    For more details see `multicurrency.pycurrency.Currency`.
+def __getattr__(name: str) -> type:
+    """Returns the currency `name`.
 
     Args:
-        amount (str | int | float | Decimal): Represented value.
-        pattern (str, optional): Currency format pattern. Defaults to
-            '2.,3%s %a'.
-    """
-
-    __slots__ = ()
-
-    def __new__(  # pylint: disable=signature-differs
-        cls: Self,
-        amount: str | float | Decimal,
-        pattern: str | None = '2.,3%s\u00A0%a',
-    ) -> Self:
-        """Class creator.
-
-        Returns:
-            Kwacha: new `Kwacha` object.
-        """
-        return cast(
-            Kwacha,
-            super().__new__(
-                cls,
-                amount=amount,
-                alpha_code='MWK',
-                numeric_code='454',
-                symbol='MK',
-                localized_symbol='MK',
-                convertion='',
-                pattern=pattern))
-
-    def __recreate__(
-            self: Self,
-            amount: str | float | Decimal,
-    ) -> Self:
-        """Recreates self with a different `amount`.
-
-        Args:
-            amount (str | int | float | Decimal): Represented value.
+        name (str): Currency (class) name.
 
-        Returns:
-            Kwacha: new opbject.
-        """
-        return self.__class__(amount, self._info[5])
+    Returns:
+        type: currency class.
 
-
-class ZambianKwacha(Currency):
-    """Kwacha (Zambia) currency representation.
-
-    Simple usage example:
-
-        >>> from multicurrency import ZambianKwacha
-        >>> zambian_kwacha = ZambianKwacha(
-        ...     amount='123456.789')
-        >>> print(zambian_kwacha)
-        ZK 123,456.79
-
-    For more details see `multicurrency.pycurrency.Currency`.
-
-    Args:
-        amount (str | int | float | Decimal): Represented value.
-        pattern (str, optional): Currency format pattern. Defaults to
-            '2.,3%s %a'.
+    Raises:
+        AttributeError: If `name` is not a currency of this module.
     """
+    if name not in __all__:
+        msg = f'module {__name__!r} has no attribute {name!r}'
+        raise AttributeError(msg)
+    return getattr(currencies, name)
 
-    __slots__ = ()
-
-    def __new__(  # pylint: disable=signature-differs
-        cls: Self,
-        amount: str | float | Decimal,
-        pattern: str | None = '2.,3%s\u00A0%a',
-    ) -> Self:
-        """Class creator.
-
-        Returns:
-            ZambianKwacha: new `ZambianKwacha` object.
-        """
-        return cast(
-            ZambianKwacha,
-            super().__new__(
-                cls,
-                amount=amount,
-                alpha_code='ZMW',
-                numeric_code='967',
-                symbol='ZK',
-                localized_symbol='ZK',
-                convertion='',
-                pattern=pattern))
 
-    def __recreate__(
-            self: Self,
-            amount: str | float | Decimal,
-    ) -> Self:
-        """Recreates self with a different `amount`.
+def __dir__() -> list[str]:
+    """Returns the module attributes (including the currencies).
 
-        Args:
-            amount (str | int | float | Decimal): Represented value.
-
-        Returns:
-            ZambianKwacha: new opbject.
-        """
-        return self.__class__(amount, self._info[5])
+    Returns:
+        list[str]: module attributes.
+    """
+    return sorted({*globals(), *__all__})
@@ -4,188 +4,43 @@
 # author: Frederico Martins <http://github.com/fscm>
 # license: SPDX-License-Identifier: MIT
 
-"""Lari currency representation(s)."""
+"""Lari currency representation(s).
 
-from __future__ import annotations
+The currencies of this module are created, on first access, from the
+currencies table (see `multicurrency.currencies`).
+"""
 
-from typing import TYPE_CHECKING, Self, cast
+from multicurrency import currencies
 
-from multicurrency.pycurrency import Currency
 
+__all__ = (
+    'Lari',
+    'GeorgiaLari',
+    'SouthOssetiaLari')
 
-if TYPE_CHECKING:
-    from decimal import Decimal
 
-
-class Lari(Currency):
-    """Lari currency representation.
-
-    Simple usage example:
-
-        >>> from multicurrency import Lari
-        >>> lari = Lari(
-        ...     amount='123456.789')
-        >>> print(lari)
-        123 456,79 ლ
-
-    For more details see `multicurrency.pycurrency.Currency`.
+def __getattr__(name: str) -> type:
+    """Returns the currency `name`.
 
     Args:
-        amount (str | int | float | Decimal): Represented value.
-        pattern (str, optional): Currency format pattern. Defaults to
-            '2, 3%a %s'.
-    """
-
-    __slots__ = ()
-
-    def __new__(  # pylint: disable=signature-differs
-        cls: Self,
-        amount: str | float | Decimal,
-        pattern: str | None = '2,\u202F3%a\u00A0%s',
-    ) -> Self:
-        """Class creator.
-
-        Returns:
-            Lari: new `Lari` object.
-        """
-        return cast(
-            Lari,
-            super().__new__(
-                cls,
-                amount=amount,
-                alpha_code='GEL',
-                numeric_code='981',
-                symbol='ლ',
-                localized_symbol='GEლ',
-                convertion='',
-                pattern=pattern))
+        name (str): Currency (class) name.
 
-    def __recreate__(
-            self: Self,
-            amount: str | float | Decimal,
-    ) -> Self:
-        """Recreates self with a different `amount`.
+    Returns:
+        type: currency class.
 
-        Args:
-            amount (str | int | float | Decimal): Represented value.
-
-        Returns:
-            Lari: new opbject.
-        """
-        return self.__class__(amount, self._info[5])
-
-
-class GeorgiaLari(Currency):
-    """Lari (Georgia) currency representation.
-
-    Simple usage example:
-
-        >>> from multicurrency import GeorgiaLari
-        >>> georgia_lari = GeorgiaLari(
-        ...     amount='123456.789')
-        >>> print(georgia_lari)
-        123 456,79 ლ
-
-    For more details see `multicurrency.pycurrency.Currency`.
-
-    Args:
-        amount (str | int | float | Decimal): Represented value.
-        pattern (str, optional): Currency format pattern. Defaults to
-            '2, 3%a %s'.
+    Raises:
+        AttributeError: If `name` is not a currency of this module.
     """
+    if name not in __all__:
+        msg = f'module {__name__!r} has no attribute {name!r}'
+        raise AttributeError(msg)
+    return getattr(currencies, name)
 
-    __slots__ = ()
 
-    def __new__(  # pylint: disable=signature-differs
-        cls: Self,
-        amount: str | float | Decimal,
-        pattern: str | None = '2,\u202F3%a\u00A0%s',
-    ) -> Self:
-        """Class creator.
+def __dir__() -> list[str]:
+    """Returns the module attributes (including the currencies).
 
-        Returns:
-            GeorgiaLari: new `GeorgiaLari` object.
-        """
-        return cast(
-            GeorgiaLari,
-            super().__new__(
-                cls,
-                amount=amount,
-                alpha_code='GEL',
-                numeric_code='981',
-                symbol='ლ',
-                localized_symbol='GEლ',
-                convertion='',
-                pattern=pattern))
-
-    def __recreate__(
-            self: Self,
-            amount: str | float | Decimal,
-    ) -> Self:
-        """Recreates self with a different `amount`.
-
-        Args:
-            amount (str | int | float | Decimal): Represented value.
-
-        Returns:
-            GeorgiaLari: new opbject.
-        """
-        return self.__class__(amount, self._info[5])
-
-
-class SouthOssetiaLari(Currency):
-    """Lari (South Ossetia) currency representation.
-
-    Simple usage example:
-
-        >>> from multicurrency import SouthOssetiaLari
-        >>> south_ossetia_lari = SouthOssetiaLari(
-        ...     amount='123456.789')
-        >>> print(south_ossetia_lari)
-        123 456,79 ლ
-
-    For more details see `multicurrency.pycurrency.Currency`.
-
-    Args:
-        amount (str | int | float | Decimal): Represented value.
-        pattern (str, optional): Currency format pattern. Defaults to
-            '2, 3%a %s'.
+    Returns:
+        list[str]: module attributes.
     """
-
-    __slots__ = ()
-
-    def __new__(  # pylint: disable=signature-differs
-        cls: Self,
-        amount: str | float | Decimal,
-        pattern: str | None = '2,\u202F3%a\u00A0%s',
-    ) -> Self:
-        """Class creator.
-
-        Returns:
-            SouthOssetiaLari: new `SouthOssetiaLari` object.
-        """
-        return cast(
-            SouthOssetiaLari,
-            super().__new__(
-                cls,
-                amount=amount,
-                alpha_code='GEL',
-                numeric_code='981',
-                symbol='ლ',
-                localized_symbol='GEლ',
-                convertion='',
-                pattern=pattern))
-
-    def __recreate__(
-            self: Self,
-            amount: str | float | Decimal,
-    ) -> Self:
-        """Recreates self with a different `amount`.
-
-        Args:
-            amount (str | int | float | Decimal): Represented value.
-
-        Returns:
-            SouthOssetiaLari: new opbject.
-        """
-        return self.__class__(amount, self._info[5])
+    return sorted({*globals(), *__all__})
@@ -4,130 +4,42 @@
 # author: Frederico Martins <http://github.com/fscm>
 # license: SPDX-License-Identifier: MIT
 
-"""Leu currency representation(s)."""
+"""Leu currency representation(s).
 
-from __future__ import annotations
+The currencies of this module are created, on first access, from the
+currencies table (see `multicurrency.currencies`).
+"""
 
-from typing import TYPE_CHECKING, Self, cast
+from multicurrency import currencies
 
-from multicurrency.pycurrency import Currency
 
+__all__ = (
+    'MoldovanLeu',
+    'Leu')
 
-if TYPE_CHECKING:
-    from decimal import Decimal
 
-
-class MoldovanLeu(Currency):
-    """Leu (Moldova) currency representation.
-
-    Simple usage example:
-
-        >>> from multicurrency import MoldovanLeu
-        >>> moldovan_leu = MoldovanLeu(
-        ...     amount='123456.789')
-        >>> print(moldovan_leu)
-        123.456,79 L
-
-    For more details see `multicurrency.pycurrency.Currency`.
+def __getattr__(name: str) -> type:
+    """Returns the currency `name`.
 
     Args:
-        amount (str | int | float | Decimal): Represented value.
-        pattern (str, optional): Currency format pattern. Defaults to
-            '2,.3%a %s'.
-    """
-
-    __slots__ = ()
-
-    def __new__(  # pylint: disable=signature-differs
-        cls: Self,
-        amount: str | float | Decimal,
-        pattern: str | None = '2,.3%a\u00A0%s',
-    ) -> Self:
-        """Class creator.
-
-        Returns:
-            MoldovanLeu: new `MoldovanLeu` object.
-        """
-        return cast(
-            MoldovanLeu,
-            super().__new__(
-                cls,
-                amount=amount,
-                alpha_code='MDL',
-                numeric_code='498',
-                symbol='L',
-                localized_symbol='L',
-                convertion='',
-                pattern=pattern))
-
-    def __recreate__(
-            self: Self,
-            amount: str | float | Decimal,
-    ) -> Self:
-        """Recreates self with a different `amount`.
-
-        Args:
-            amount (str | int | float | Decimal): Represented value.
+        name (str): Currency (class) name.
 
-        Returns:
-            MoldovanLeu: new opbject.
-        """
-        return self.__class__(amount, self._info[5])
+    Returns:
+        type: currency class.
 
-
-class Leu(Currency):
-    """Leu (Romania) currency representation.
-
-    Simple usage example:
-
-        >>> from multicurrency import Leu
-        >>> leu = Leu(
-        ...     amount='123456.789')
-        >>> print(leu)
-        123.456,79 L
-
-    For more details see `multicurrency.pycurrency.Currency`.
-
-    Args:
-        amount (str | int | float | Decimal): Represented value.
-        pattern (str, optional): Currency format pattern. Defaults to
-            '2,.3%a %s'.
+    Raises:
+        AttributeError: If `name` is not a currency of this module.
     """
+    if name not in __all__:
+        msg = f'module {__name__!r} has no attribute {name!r}'
+        raise AttributeError(msg)
+    return getattr(currencies, name)
 
-    __slots__ = ()
-
-    def __new__(  # pylint: disable=signature-differs
-        cls: Self,
-        amount: str | float | Decimal,
-        pattern: str | None = '2,.3%a\u00A0%s',
-    ) -> Self:
-        """Class creator.
-
-        Returns:
-            Leu: new `Leu` object.
-        """
-        return cast(
-            Leu,
-            super().__new__(
-                cls,
-                amount=amount,
-                alpha_code='RON',
-                numeric_code='946',
-                symbol='L',
-                localized_symbol='L',
-                convertion='',
-                pattern=pattern))
 
-    def __recreate__(
-            self: Self,
-            amount: str | float | Decimal,
-    ) -> Self:
-        """Recreates self with a different `amount`.
+def __dir__() -> list[str]:
+    """Returns the module attributes (including the currencies).
 
-        Args:
-            amount (str | int | float | Decimal): Represented value.
-
-        Returns:
-            Leu: new opbject.
-        """
-        return self.__class__(amount, self._info[5])
+    Returns:
+        list[str]: module attributes.
+    """
+    return sorted({*globals(), *__all__})
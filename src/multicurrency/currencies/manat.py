@@ -4,130 +4,42 @@
 # author: Frederico Martins <http://github.com/fscm>
 # license: SPDX-License-Identifier: MIT
 
-"""Manat currency representation(s)."""
+"""Manat currency representation(s).
 
-from __future__ import annotations
+The currencies of this module are created, on first access, from the
+currencies table (see `multicurrency.currencies`).
+"""
 
-from typing import TYPE_CHECKING, Self, cast
+from multicurrency import currencies
 
-from multicurrency.pycurrency import Currency
 
+__all__ = (
+    'AzerbaijanianManat',
+    'Manat')
 
-if TYPE_CHECKING:
-    from decimal import Decimal
 
-
-class AzerbaijanianManat(Currency):
-    """Manat (Azerbaijan) currency representation.
-
-    Simple usage example:
-
-        >>> from multicurrency import AzerbaijanianManat
-        >>> azerbaijanian_manat = AzerbaijanianManat(
-        ...     amount='123456.789')
-        >>> print(azerbaijanian_manat)
-        123.456,79 ₼
-
-    For more details see `multicurrency.pycurrency.Currency`.
+def __getattr__(name: str) -> type:
+    """Returns the currency `name`.
 
     Args:
-        amount (str | int | float | Decimal): Represented value.
-        pattern (str, optional): Currency format pattern. Defaults to
-            '2,.3%a %s'.
-    """
-
-    __slots__ = ()
-
-    def __new__(  # pylint: disable=signature-differs
-        cls: Self,
-        amount: str | float | Decimal,
-        pattern: str | None = '2,.3%a\u00A0%s',
-    ) -> Self:
-        """Class creator.
-
-        Returns:
-            AzerbaijanianManat: new `AzerbaijanianManat` object.
-        """
-        return cast(
-            AzerbaijanianManat,
-            super().__new__(
-                cls,
-                amount=amount,
-                alpha_code='AZN',
-                numeric_code='944',
-                symbol='₼',
-                localized_symbol='₼',
-                convertion='',
-                pattern=pattern))
-
-    def __recreate__(
-            self: Self,
-            amount: str | float | Decimal,
-    ) -> Self:
-        """Recreates self with a different `amount`.
-
-        Args:
-            amount (str | int | float | Decimal): Represented value.
+        name (str): Currency (class) name.
 
-        Returns:
-            AzerbaijanianManat: new opbject.
-        """
-        return self.__class__(amount, self._info[5])
+    Returns:
+        type: currency class.
 
-
-class Manat(Currency):
-    """Manat (Turkmenistan) currency representation.
-
-    Simple usage example:
-
-        >>> from multicurrency import Manat
-        >>> manat = Manat(
-        ...     amount='123456.789')
-        >>> print(manat)
-        123 456,79 m
-
-    For more details see `multicurrency.pycurrency.Currency`.
-
-    Args:
-        amount (str | int | float | Decimal): Represented value.
-        pattern (str, optional): Currency format pattern. Defaults to
-            '2, 3%a %s'.
+    Raises:
+        AttributeError: If `name` is not a currency of this module.
     """
+    if name not in __all__:
+        msg = f'module {__name__!r} has no attribute {name!r}'
+        raise AttributeError(msg)
+    return getattr(currencies, name)
 
-    __slots__ = ()
-
-    def __new__(  # pylint: disable=signature-differs
-        cls: Self,
-        amount: str | float | Decimal,
-        pattern: str | None = '2,\u202F3%a\u00A0%s',
-    ) -> Self:
-        """Class creator.
-
-        Returns:
-            Manat: new `Manat` object.
-        """
-        return cast(
-            Manat,
-            super().__new__(
-                cls,
-                amount=amount,
-                alpha_code='TMT',
-                numeric_code='934',
-                symbol='m',
-                localized_symbol='m',
-                convertion='',
-                pattern=pattern))
 
-    def __recreate__(
-            self: Self,
-            amount: str | float | Decimal,
-    ) -> Self:
-        """Recreates self with a different `amount`.
+def __dir__() -> list[str]:
+    """Returns the module attributes (including the currencies).
 
-        Args:
-            amount (str | int | float | Decimal): Represented value.
-
-        Returns:
-            Manat: new opbject.
-        """
-        return self.__class__(amount, self._info[5])
+    Returns:
+        list[str]: module attributes.
+    """
+    return sorted({*globals(), *__all__})
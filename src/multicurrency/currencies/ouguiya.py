@@ -4,72 +4,41 @@
 # author: Frederico Martins <http://github.com/fscm>
 # license: SPDX-License-Identifier: MIT
 
-"""Ouguiya currency representation(s)."""
+"""Ouguiya currency representation(s).
 
-from __future__ import annotations
+The currencies of this module are created, on first access, from the
+currencies table (see `multicurrency.currencies`).
+"""
 
-from typing import TYPE_CHECKING, Self, cast
+from multicurrency import currencies
 
-from multicurrency.pycurrency import Currency
 
+__all__ = (
+    'Ouguiya')
 
-if TYPE_CHECKING:
-    from decimal import Decimal
 
-
-class Ouguiya(Currency):
-    """Ouguiya (Mauritania) currency representation.
-
-    Simple usage example:
-
-        >>> from multicurrency import Ouguiya
-        >>> ouguiya = Ouguiya(
-        ...     amount='123456.789')
-        >>> print(ouguiya)
-        ١٢٣٬٤٥٦٫٧٩ أ.م
-
-    For more details see `multicurrency.pycurrency.Currency`.
+def __getattr__(name: str) -> type:
+    """Returns the currency `name`.
 
     Args:
-        amount (str | int | float | Decimal): Represented value.
-        pattern (str, optional): Currency format pattern. Defaults to
-            '2٫٬3%a %s'.
-    """
-
-    __slots__ = ()
+        name (str): Currency (class) name.
 
-    def __new__(  # pylint: disable=signature-differs
-        cls: Self,
-        amount: str | float | Decimal,
-        pattern: str | None = '2\u066B\u066C3%a\u00A0%s',
-    ) -> Self:
-        """Class creator.
+    Returns:
+        type: currency class.
 
-        Returns:
-            Ouguiya: new `Ouguiya` object.
-        """
-        return cast(
-            Ouguiya,
-            super().__new__(
-                cls,
-                amount=amount,
-                alpha_code='MRU',
-                numeric_code='929',
-                symbol='أ.م',
-                localized_symbol='أ.م',
-                convertion='٠١٢٣٤٥٦٧٨٩-',
-                pattern=pattern))
+    Raises:
+        AttributeError: If `name` is not a currency of this module.
+    """
+    if name not in __all__:
+        msg = f'module {__name__!r} has no attribute {name!r}'
+        raise AttributeError(msg)
+    return getattr(currencies, name)
 
-    def __recreate__(
-            self: Self,
-            amount: str | float | Decimal,
-    ) -> Self:
-        """Recreates self with a different `amount`.
 
-        Args:
-            amount (str | int | float | Decimal): Represented value.
+def __dir__() -> list[str]:
+    """Returns the module attributes (including the currencies).
 
-        Returns:
-            Ouguiya: new opbject.
-        """
-        return self.__class__(amount, self._info[5])
+    Returns:
+        list[str]: module attributes.
+    """
+    return sorted({*globals(), *__all__})
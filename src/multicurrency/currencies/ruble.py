@@ -4,246 +4,44 @@
 # author: Frederico Martins <http://github.com/fscm>
 # license: SPDX-License-Identifier: MIT
 
-"""Ruble currency representation(s)."""
+"""Ruble currency representation(s).
 
-from __future__ import annotations
+The currencies of this module are created, on first access, from the
+currencies table (see `multicurrency.currencies`).
+"""
 
-from typing import TYPE_CHECKING, Self, cast
+from multicurrency import currencies
 
-from multicurrency.pycurrency import Currency
 
+__all__ = (
+    'BelarusianRuble',
+    'RussianRuble',
+    'RussianRubleRU',
+    'RussianRubleGE')
 
-if TYPE_CHECKING:
-    from decimal import Decimal
 
-
-class BelarusianRuble(Currency):
-    """Ruble (Belarus) currency representation.
-
-    Simple usage example:
-
-        >>> from multicurrency import BelarusianRuble
-        >>> belarusian_ruble = BelarusianRuble(
-        ...     amount='123456.789')
-        >>> print(belarusian_ruble)
-        123 456,79 Br
-
-    For more details see `multicurrency.pycurrency.Currency`.
+def __getattr__(name: str) -> type:
+    """Returns the currency `name`.
 
     Args:
-        amount (str | int | float | Decimal): Represented value.
-        pattern (str, optional): Currency format pattern. Defaults to
-            '2, 3%a %s'.
-    """
-
-    __slots__ = ()
-
-    def __new__(  # pylint: disable=signature-differs
-        cls: Self,
-        amount: str | float | Decimal,
-        pattern: str | None = '2,\u202F3%a\u00A0%s',
-    ) -> Self:
-        """Class creator.
-
-        Returns:
-            BelarusianRuble: new `BelarusianRuble` object.
-        """
-        return cast(
-            BelarusianRuble,
-            super().__new__(
-                cls,
-                amount=amount,
-                alpha_code='BYN',
-                numeric_code='933',
-                symbol='Br',
-                localized_symbol='Br',
-                convertion='',
-                pattern=pattern))
-
-    def __recreate__(
-            self: Self,
-            amount: str | float | Decimal,
-    ) -> Self:
-        """Recreates self with a different `amount`.
-
-        Args:
-            amount (str | int | float | Decimal): Represented value.
-
-        Returns:
-            BelarusianRuble: new opbject.
-        """
-        return self.__class__(amount, self._info[5])
-
-
-class RussianRuble(Currency):
-    """Ruble (Russia) currency representation.
-
-    Simple usage example:
-
-        >>> from multicurrency import RussianRuble
-        >>> russian_ruble = RussianRuble(
-        ...     amount='123456.789')
-        >>> print(russian_ruble)
-        123 456,79 ₽
-
-    For more details see `multicurrency.pycurrency.Currency`.
-
-    Args:
-        amount (str | int | float | Decimal): Represented value.
-        pattern (str, optional): Currency format pattern. Defaults to
-            '2, 3%a %s'.
-    """
-
-    __slots__ = ()
-
-    def __new__(  # pylint: disable=signature-differs
-        cls: Self,
-        amount: str | float | Decimal,
-        pattern: str | None = '2,\u202F3%a\u00A0%s',
-    ) -> Self:
-        """Class creator.
-
-        Returns:
-            RussianRuble: new `RussianRuble` object.
-        """
-        return cast(
-            RussianRuble,
-            super().__new__(
-                cls,
-                amount=amount,
-                alpha_code='RUB',
-                numeric_code='643',
-                symbol='₽',
-                localized_symbol='₽',
-                convertion='',
-                pattern=pattern))
-
-    def __recreate__(
-            self: Self,
-            amount: str | float | Decimal,
-    ) -> Self:
-        """Recreates self with a different `amount`.
+        name (str): Currency (class) name.
 
-        Args:
-            amount (str | int | float | Decimal): Represented value.
+    Returns:
+        type: currency class.
 
-        Returns:
-            RussianRuble: new opbject.
-        """
-        return self.__class__(amount, self._info[5])
-
-
-class RussianRubleRU(Currency):
-    """Ruble (Russia) currency representation.
-
-    Simple usage example:
-
-        >>> from multicurrency import RussianRubleRU
-        >>> russian_ruble_ru = RussianRubleRU(
-        ...     amount='123456.789')
-        >>> print(russian_ruble_ru)
-        123 456,79 ₽
-
-    For more details see `multicurrency.pycurrency.Currency`.
-
-    Args:
-        amount (str | int | float | Decimal): Represented value.
-        pattern (str, optional): Currency format pattern. Defaults to
-            '2, 3%a %s'.
+    Raises:
+        AttributeError: If `name` is not a currency of this module.
     """
+    if name not in __all__:
+        msg = f'module {__name__!r} has no attribute {name!r}'
+        raise AttributeError(msg)
+    return getattr(currencies, name)
 
-    __slots__ = ()
-
-    def __new__(  # pylint: disable=signature-differs
-        cls: Self,
-        amount: str | float | Decimal,
-        pattern: str | None = '2,\u202F3%a\u00A0%s',
-    ) -> Self:
-        """Class creator.
-
-        Returns:
-            RussianRubleRU: new `RussianRubleRU` object.
-        """
-        return cast(
-            RussianRubleRU,
-            super().__new__(
-                cls,
-                amount=amount,
-                alpha_code='RUB',
-                numeric_code='643',
-                symbol='₽',
-                localized_symbol='RU₽',
-                convertion='',
-                pattern=pattern))
-
-    def __recreate__(
-            self: Self,
-            amount: str | float | Decimal,
-    ) -> Self:
-        """Recreates self with a different `amount`.
-
-        Args:
-            amount (str | int | float | Decimal): Represented value.
-
-        Returns:
-            RussianRubleRU: new opbject.
-        """
-        return self.__class__(amount, self._info[5])
 
+def __dir__() -> list[str]:
+    """Returns the module attributes (including the currencies).
 
-class RussianRubleGE(Currency):
-    """Ruble (South Ossetia) currency representation.
-
-    Simple usage example:
-
-        >>> from multicurrency import RussianRubleGE
-        >>> russian_ruble_ge = RussianRubleGE(
-        ...     amount='123456.789')
-        >>> print(russian_ruble_ge)
-        123 456,79 ₽
-
-    For more details see `multicurrency.pycurrency.Currency`.
-
-    Args:
-        amount (str | int | float | Decimal): Represented value.
-        pattern (str, optional): Currency format pattern. Defaults to
-            '2, 3%a %s'.
+    Returns:
+        list[str]: module attributes.
     """
-
-    __slots__ = ()
-
-    def __new__(  # pylint: disable=signature-differs
-        cls: Self,
-        amount: str | float | Decimal,
-        pattern: str | None = '2,\u202F3%a\u00A0%s',
-    ) -> Self:
-        """Class creator.
-
-        Returns:
-            RussianRubleGE: new `RussianRubleGE` object.
-        """
-        return cast(
-            RussianRubleGE,
-            super().__new__(
-                cls,
-                amount=amount,
-                alpha_code='RUB',
-                numeric_code='643',
-                symbol='₽',
-                localized_symbol='GE₽',
-                convertion='',
-                pattern=pattern))
-
-    def __recreate__(
-            self: Self,
-            amount: str | float | Decimal,
-    ) -> Self:
-        """Recreates self with a different `amount`.
-
-        Args:
-            amount (str | int | float | Decimal): Represented value.
-
-        Returns:
-            RussianRubleGE: new opbject.
-        """
-        return self.__class__(amount, self._info[5])
+    return sorted({*globals(), *__all__})
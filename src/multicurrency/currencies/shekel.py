@@ -4,188 +4,43 @@
 # author: Frederico Martins <http://github.com/fscm>
 # license: SPDX-License-Identifier: MIT
 
-"""Shekel currency representation(s)."""
+"""Shekel currency representation(s).
 
-from __future__ import annotations
+The currencies of this module are created, on first access, from the
+currencies table (see `multicurrency.currencies`).
+"""
 
-from typing import TYPE_CHECKING, Self, cast
+from multicurrency import currencies
 
-from multicurrency.pycurrency import Currency
 
+__all__ = (
+    'NewIsraeliShekel',
+    'NewIsraeliShekelIL',
+    'NewIsraeliShekelPS')
 
-if TYPE_CHECKING:
-    from decimal import Decimal
 
-
-class NewIsraeliShekel(Currency):
-    """Shekel (Israel) currency representation.
-
-    Simple usage example:
-
-        >>> from multicurrency import NewIsraeliShekel
-        >>> new_israeli_shekel = NewIsraeliShekel(
-        ...     amount='123456.789')
-        >>> print(new_israeli_shekel)
-        123,456.79 ₪
-
-    For more details see `multicurrency.pycurrency.Currency`.
+def __getattr__(name: str) -> type:
+    """Returns the currency `name`.
 
     Args:
-        amount (str | int | float | Decimal): Represented value.
-        pattern (str, optional): Currency format pattern. Defaults to
-            '2.,3%a %s'.
-    """
-
-    __slots__ = ()
-
-    def __new__(  # pylint: disable=signature-differs
-        cls: Self,
-        amount: str | float | Decimal,
-        pattern: str | None = '2.,3%a\u00A0%s',
-    ) -> Self:
-        """Class creator.
-
-        Returns:
-            NewIsraeliShekel: new `NewIsraeliShekel` object.
-        """
-        return cast(
-            NewIsraeliShekel,
-            super().__new__(
-                cls,
-                amount=amount,
-                alpha_code='ILS',
-                numeric_code='376',
-                symbol='₪',
-                localized_symbol='₪',
-                convertion='',
-                pattern=pattern))
+        name (str): Currency (class) name.
 
-    def __recreate__(
-            self: Self,
-            amount: str | float | Decimal,
-    ) -> Self:
-        """Recreates self with a different `amount`.
+    Returns:
+        type: currency class.
 
-        Args:
-            amount (str | int | float | Decimal): Represented value.
-
-        Returns:
-            NewIsraeliShekel: new opbject.
-        """
-        return self.__class__(amount, self._info[5])
-
-
-class NewIsraeliShekelIL(Currency):
-    """Shekel (Israel) currency representation.
-
-    Simple usage example:
-
-        >>> from multicurrency import NewIsraeliShekelIL
-        >>> new_israeli_shekel_il = NewIsraeliShekelIL(
-        ...     amount='123456.789')
-        >>> print(new_israeli_shekel_il)
-        123,456.79 ₪
-
-    For more details see `multicurrency.pycurrency.Currency`.
-
-    Args:
-        amount (str | int | float | Decimal): Represented value.
-        pattern (str, optional): Currency format pattern. Defaults to
-            '2.,3%a %s'.
+    Raises:
+        AttributeError: If `name` is not a currency of this module.
     """
+    if name not in __all__:
+        msg = f'module {__name__!r} has no attribute {name!r}'
+        raise AttributeError(msg)
+    return getattr(currencies, name)
 
-    __slots__ = ()
 
-    def __new__(  # pylint: disable=signature-differs
-        cls: Self,
-        amount: str | float | Decimal,
-        pattern: str | None = '2.,3%a\u00A0%s',
-    ) -> Self:
-        """Class creator.
+def __dir__() -> list[str]:
+    """Returns the module attributes (including the currencies).
 
-        Returns:
-            NewIsraeliShekelIL: new `NewIsraeliShekelIL` object.
-        """
-        return cast(
-            NewIsraeliShekelIL,
-            super().__new__(
-                cls,
-                amount=amount,
-                alpha_code='ILS',
-                numeric_code='376',
-                symbol='₪',
-                localized_symbol='IL₪',
-                convertion='',
-                pattern=pattern))
-
-    def __recreate__(
-            self: Self,
-            amount: str | float | Decimal,
-    ) -> Self:
-        """Recreates self with a different `amount`.
-
-        Args:
-            amount (str | int | float | Decimal): Represented value.
-
-        Returns:
-            NewIsraeliShekelIL: new opbject.
-        """
-        return self.__class__(amount, self._info[5])
-
-
-class NewIsraeliShekelPS(Currency):
-    """Shekel (Palestine) currency representation.
-
-    Simple usage example:
-
-        >>> from multicurrency import NewIsraeliShekelPS
-        >>> new_israeli_shekel_ps = NewIsraeliShekelPS(
-        ...     amount='123456.789')
-        >>> print(new_israeli_shekel_ps)
-        123,456.79 ₪
-
-    For more details see `multicurrency.pycurrency.Currency`.
-
-    Args:
-        amount (str | int | float | Decimal): Represented value.
-        pattern (str, optional): Currency format pattern. Defaults to
-            '2.,3%a %s'.
+    Returns:
+        list[str]: module attributes.
     """
-
-    __slots__ = ()
-
-    def __new__(  # pylint: disable=signature-differs
-        cls: Self,
-        amount: str | float | Decimal,
-        pattern: str | None = '2.,3%a\u00A0%s',
-    ) -> Self:
-        """Class creator.
-
-        Returns:
-            NewIsraeliShekelPS: new `NewIsraeliShekelPS` object.
-        """
-        return cast(
-            NewIsraeliShekelPS,
-            super().__new__(
-                cls,
-                amount=amount,
-                alpha_code='ILS',
-                numeric_code='376',
-                symbol='₪',
-                localized_symbol='PS₪',
-                convertion='',
-                pattern=pattern))
-
-    def __recreate__(
-            self: Self,
-            amount: str | float | Decimal,
-    ) -> Self:
-        """Recreates self with a different `amount`.
-
-        Args:
-            amount (str | int | float | Decimal): Represented value.
-
-        Returns:
-            NewIsraeliShekelPS: new opbject.
-        """
-        return self.__class__(amount, self._info[5])
+    return sorted({*globals(), *__all__})
@@ -4,4 +4,3 @@ from typing import Self
 
 class Tugrik(Currency):
     def __new__(cls, amount: str | float | Decimal, pattern: str | None = ...) -> Self: ...
-    def __recreate__(self, amount: str | float | Decimal) -> Self: ...
@@ -13,6 +13,13 @@ class CurrencyException(Exception):
     """Generic Currency exception."""
 
 
+class CurrencyCodeException(CurrencyException, LookupError):
+    """Unknown currency code."""
+
+    def __init__(self: Self, *args: object) -> None:
+        super().__init__('Unknown currency code.', *args)
+
+
 class CurrencyInvalidDivision(CurrencyException, TypeError):
     """Invalid division."""
 
@@ -49,6 +56,13 @@ class CurrencyMismatchException(CurrencyException, TypeError):
             'Unsupported operation for different currencies.', *args)
 
 
+class CurrencyRateException(CurrencyException, LookupError):
+    """Exchange rate not available."""
+
+    def __init__(self: Self, *args: object) -> None:
+        super().__init__('Exchange rate not available.', *args)
+
+
 class CurrencyTypeException(CurrencyException, TypeError):
     """Invalid operation with objects of type other than `Currency`."""
 
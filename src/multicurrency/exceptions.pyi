@@ -1,5 +1,8 @@
 class CurrencyException(Exception): ...
 
+class CurrencyCodeException(CurrencyException, LookupError):
+    def __init__(self, *args: object) -> None: ...
+
 class CurrencyInvalidDivision(CurrencyException, TypeError):
     def __init__(self, *args: object) -> None: ...
 
@@ -15,5 +18,8 @@ class CurrencyInvalidOperation(CurrencyException, TypeError):
 class CurrencyMismatchException(CurrencyException, TypeError):
     def __init__(self, *args: object) -> None: ...
 
+class CurrencyRateException(CurrencyException, LookupError):
+    def __init__(self, *args: object) -> None: ...
+
 class CurrencyTypeException(CurrencyException, TypeError):
     def __init__(self, *args: object) -> None: ...
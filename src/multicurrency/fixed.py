@@ -0,0 +1,638 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2020-2022, Frederico Martins
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Fixed point currency representation.
+
+Representation of a currency value as an integer number of minor units
+(e.g.: cents), the number of decimal places of the currency `pattern`.
+
+Simple usage example:
+
+    >>> from multicurrency import Euro, FixedCurrency
+    >>> euro = FixedCurrency.from_currency(Euro('1000.005'))
+    >>> print(euro)
+    1.000,00 €
+    >>> euro.minor_units
+    100000
+    >>> print(euro + euro)
+    2.000,00 €
+    >>> print(euro / 3)
+    333,33 €
+
+## Rounding
+
+Amounts are rounded to the minor unit when the currency is created and
+on every operation that would need more decimal places (e.g.:
+multiplication by a fraction, division). The rounding mode is set by the
+`rounding` class attribute (`decimal.ROUND_HALF_EVEN` by default).
+
+    >>> print(euro * Decimal('0.00005'))
+    0,05 €
+
+## Decimal currencies
+
+A `FixedCurrency` is a `multicurrency.pycurrency.Currency`. It can be
+added to, subtracted from and compared with any currency with the same
+alpha code (as either operand). Operations with two fixed point
+currencies, with the same number of decimal places, only use integer
+arithmetic. On other cases the result is computed with the `Decimal`
+amounts and its type is the type of the left operand. Equality (and
+hashing), as with the other currencies, also compares the types.
+
+    >>> print(Euro(1) + euro)
+    1.001,00 €
+    >>> type(Euro(1) - euro).__name__
+    'Euro'
+    >>> Euro(1) < euro, Euro(1000) == euro
+    (True, False)
+    >>> print(euro.to_currency(Euro))
+    1.000,00 €
+"""
+
+from __future__ import annotations
+
+from decimal import ROUND_HALF_EVEN, Decimal
+from typing import TYPE_CHECKING, Self
+
+from multicurrency import pycurrency
+from multicurrency.exceptions import (
+    CurrencyInvalidDivision,
+    CurrencyInvalidMultiplication,
+    CurrencyMismatchException,
+    CurrencyTypeException,
+)
+from multicurrency.pycurrency import (
+    _EXACT,
+    Currency,
+    CurrencySpec,
+    _currency_spec,
+)
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable, Iterator
+
+
+def _to_units(amount: Decimal, places: int, rounding: str) -> int:
+    """Converts `amount` to minor units.
+
+    Args:
+        amount (Decimal): Amount.
+        places (int): Number of decimal places of the minor unit.
+        rounding (str): Rounding mode.
+
+    Returns:
+        int: number of minor units.
+    """
+    return int(amount.scaleb(places, _EXACT).to_integral_value(
+        rounding, _EXACT))
+
+
+def _divide(dividend: int, divisor: int, rounding: str) -> int:
+    """Divides two integers (rounding the quotient only once).
+
+    Args:
+        dividend (int): Dividend.
+        divisor (int): Divisor (not zero).
+        rounding (str): Rounding mode.
+
+    Returns:
+        int: rounded quotient.
+    """
+    quotient, remainder = divmod(abs(dividend), abs(divisor))
+    if not remainder:
+        return -quotient if (dividend < 0) != (divisor < 0) else quotient
+    # the fraction only has to be below, at or above the half
+    double = remainder * 2
+    fraction = (
+        '25' if double < abs(divisor) else
+        '5' if double == abs(divisor) else '75')
+    sign = '-' if (dividend < 0) != (divisor < 0) else ''
+    return int(Decimal(f'{sign}{quotient}.{fraction}').to_integral_value(
+        rounding, _EXACT))
+
+
+class FixedCurrency(Currency):
+    """Fixed point currency representation.
+
+    Stores the currency value as an integer number of minor units. See
+    `multicurrency.pycurrency.Currency` for the meaning of the
+    arguments.
+
+    Args:
+        amount (str | int | float | Decimal): Represented value.
+        alpha_code (str, optionsl): Represented currency alpha code.
+            Defaults to ''.
+        numeric_code (str, optional): Represented currency numeric
+            code. Defaults to 0.
+        symbol (str, optional): Represented currency symbol. Defaults
+            to ''.
+        localized_symbol (str, optional): Represented currency
+            localized symbol. Defaults to ''.
+        convertion (str, optional): String with the numbers from 0 to 9
+            followed by the minus ('-') sign. Defaults to ''.
+        pattern (str, optional): Currency format pattern. Defaults to
+            '2.,3%a%s'.
+    """
+
+    __slots__ = ('_units',)
+
+    rounding: str = ROUND_HALF_EVEN
+
+    _interoperable = True
+
+    def __new__(  # pylint: disable=too-many-arguments
+            cls: Self,
+            amount: str | float | Decimal,
+            alpha_code: str = '',
+            numeric_code: str = '0',
+            symbol: str = '',
+            localized_symbol: str = '',
+            convertion: str = '',
+            pattern: str = r'2.,3%a%s') -> Self:
+        """Class creator.
+
+        Returns:
+            FixedCurrency: new opbject.
+
+        Raises:
+            CurrencyInvalidFormat: If `pattern` is not valid.
+        """
+        spec = _currency_spec(
+            alpha_code,
+            numeric_code,
+            symbol,
+            localized_symbol,
+            convertion,
+            pattern)
+        ingest = pycurrency._float_ingest  # pylint: disable=protected-access
+        if ingest is None:
+            return cls._from_spec(Decimal(amount), spec)
+        return cls._from_spec(ingest(amount, spec), spec)
+
+    @property
+    def _amount(self: Self) -> Decimal:
+        """Decimal: amount (computed from the minor units)."""
+        return Decimal(self._units).scaleb(
+            -self._spec.decimal_places, _EXACT)
+
+    def _operand(self: Self, other: object) -> int | None:
+        """Validates the currency `other` for an operation with this.
+
+        Args:
+            other (object): Currency to operate with.
+
+        Returns:
+            int | None: the minor units of `other` if it is a fixed
+                point currency with the same number of decimal places.
+                None otherwise.
+
+        Raises:
+            CurrencyTypeException: If `other` not instance of
+                'Currency'.
+            CurrencyMismatchException: If `other.alpha_code` is
+                differente from `alpha_code`.
+        """
+        if not isinstance(other, Currency):
+            raise CurrencyTypeException
+        spec = other._spec  # pylint: disable=protected-access
+        if self._spec.alpha_code != spec.alpha_code:
+            raise CurrencyMismatchException
+        if (isinstance(other, FixedCurrency) and
+                self._spec.decimal_places == spec.decimal_places):
+            return other._units
+        return None
+
+    def __abs__(self: Self) -> Self:
+        """Returns the absolute value.
+
+        Returns:
+            FixedCurrency: absolute value.
+        """
+        return self._from_units(abs(self._units), self._spec)
+
+    def __add__(self: Self, other: object) -> Self:
+        """Adds `other` to this.
+
+        Args:
+            other (object): Currency to add.
+
+        Returns:
+            FixedCurrency: result of the adding operation.
+        """
+        if other.__class__ is self.__class__ and other._spec is self._spec:
+            new = object.__new__(self.__class__)
+            new._units = self._units + other._units
+            new._hash = None
+            new._spec = self._spec
+            return new
+        units = self._operand(other)
+        if units is None:
+            return self._recreate(self._amount + other._amount)
+        return self._from_units(self._units + units, self._spec)
+
+    def __bool__(self: Self) -> bool:
+        """Standard truth testing for this class.
+
+        Returns:
+            bool: False if value is zero. True otherwise.
+        """
+        return bool(self._units)
+
+    def __copy__(self: Self) -> Self:
+        """Returns a copy of self.
+
+        Returns:
+            FixedCurrency: copy of this.
+        """
+        return self._from_units(self._units, self._spec)
+
+    def __eq__(self: Self, other: object) -> bool:
+        """Checks if two currencies are equal.
+
+        Args:
+            other (object): Currency to compare to.
+
+        Returns:
+            bool: True if equal. False otherwise.
+        """
+        if other.__class__ is self.__class__ or isinstance(
+                other, self.__class__):
+            spec = self._spec
+            other_spec = other._spec
+            if spec is other_spec:
+                return self._units == other._units
+            if spec.alpha_code != other_spec.alpha_code:
+                return False
+            if spec.decimal_places == other_spec.decimal_places:
+                return self._units == other._units
+            return self._amount == other._amount
+        return False
+
+    def __ge__(self: Self, other: object) -> bool:
+        """Checks if self is greater or equal than `other`.
+
+        Args:
+            other (object): Currency to compare to.
+
+        Returns:
+            bool: True if is greater or equal than `other`. False
+                otherwise.
+        """
+        if other.__class__ is self.__class__ and other._spec is self._spec:
+            return self._units >= other._units
+        units = self._operand(other)
+        if units is None:
+            return self._amount >= other._amount
+        return self._units >= units
+
+    def __gt__(self: Self, other: object) -> bool:
+        """Checks if self is greater than `other`.
+
+        Args:
+            other (object): Currency to compare to.
+
+        Returns:
+            bool: True if is greater than `other`. False otherwise`.
+        """
+        if other.__class__ is self.__class__ and other._spec is self._spec:
+            return self._units > other._units
+        units = self._operand(other)
+        if units is None:
+            return self._amount > other._amount
+        return self._units > units
+
+    def __le__(self: Self, other: object) -> bool:
+        """Checks if self is less or equal than `other`.
+
+        Args:
+            other (object): Currency to compare to.
+
+        Returns:
+            bool: True if is less or equal than `other`. False
+                otherwise.
+        """
+        if other.__class__ is self.__class__ and other._spec is self._spec:
+            return self._units <= other._units
+        units = self._operand(other)
+        if units is None:
+            return self._amount <= other._amount
+        return self._units <= units
+
+    def __lt__(self: Self, other: object) -> bool:
+        """Checks if self is less than `other`.
+
+        Args:
+            other (object): Currency to compare to.
+
+        Returns:
+            bool: True if is less than `other`. False otherwise.
+        """
+        if other.__class__ is self.__class__ and other._spec is self._spec:
+            return self._units < other._units
+        units = self._operand(other)
+        if units is None:
+            return self._amount < other._amount
+        return self._units < units
+
+    def __mul__(self: Self, other: float | Decimal) -> Self:
+        """Returns the multiplication by `other`.
+
+        The multiplication by an `int` is exact. Otherwise the result
+        is rounded to the minor unit.
+
+        Args:
+            other (int | float | Decimal): amount to multiply by.
+
+        Returns:
+            FixedCurrency: Result of the multiplication operation.
+
+        Raises:
+            CurrencyInvalidMultiplication: If `other` not of types
+                `int`, `float` or `Decimal`.
+        """
+        if isinstance(other, int):
+            return self._from_units(self._units * other, self._spec)
+        if not isinstance(other, (float, Decimal)):
+            raise CurrencyInvalidMultiplication
+        units = _EXACT.multiply(Decimal(self._units), Decimal(other))
+        return self._from_units(
+            int(units.to_integral_value(self.rounding)),
+            self._spec)
+
+    def __neg__(self: Self) -> Self:
+        """Returns a currency with the sign switched.
+
+        Returns:
+            FixedCurrency: Currency with the sign switched.
+        """
+        return self._from_units(-self._units, self._spec)
+
+    def __pos__(self: Self) -> Self:
+        """Returns a copy of self.
+
+        Returns:
+            FixedCurrency: copy of this.
+        """
+        return self._from_units(self._units, self._spec)
+
+    def __reduce__(self: Self) -> tuple[object, tuple[object, ...]]:
+        """Returns a `tuple` with this class "reduce value".
+
+        Returns:
+            tuple[object, tuple[object, ...]]: pickle representation of
+                this currency.
+        """
+        return (self.__class__._from_units, (self._units, self._spec))
+
+    def __rsub__(self: Self, other: object) -> Self:
+        """Subtract this from `other`.
+
+        Args:
+            other (object): Currency to subtract from.
+
+        Returns:
+            Currency: result of the subtraction operation (of the type
+                of `other`).
+        """
+        units = self._operand(other)
+        if units is None:
+            return other._recreate(other._amount - self._amount)
+        return self._from_units(units - self._units, self._spec)
+
+    def __sub__(self: Self, other: object) -> Self:
+        """Subtract `other` from this.
+
+        Args:
+            other (object): Currency to subtract.
+
+        Returns:
+            FixedCurrency: result of the subtraction operation.
+        """
+        if other.__class__ is self.__class__ and other._spec is self._spec:
+            new = object.__new__(self.__class__)
+            new._units = self._units - other._units
+            new._hash = None
+            new._spec = self._spec
+            return new
+        units = self._operand(other)
+        if units is None:
+            return self._recreate(self._amount - other._amount)
+        return self._from_units(self._units - units, self._spec)
+
+    def __truediv__(self: Self, other: float | Decimal) -> Self:
+        """Returns the division by `other`.
+
+        The exact quotient is rounded (once) to the minor unit.
+
+        Args:
+            other (int | float | Decimal): amount to divide by.
+
+        Returns:
+            FixedCurrency: Result of the division.
+
+        Raises:
+            CurrencyInvalidDivision: If `other` not of types
+                `int`, `float` or `Decimal` (or not finite).
+            ZeroDivisionError: If dividing by zero
+        """
+        if isinstance(other, int):
+            if other == 0:
+                raise ZeroDivisionError
+            return self._from_units(
+                _divide(self._units, other, self.rounding), self._spec)
+        if not isinstance(other, (float, Decimal)):
+            raise CurrencyInvalidDivision
+        try:
+            numerator, denominator = Decimal(other).as_integer_ratio()
+        except (OverflowError, ValueError):
+            raise CurrencyInvalidDivision from None
+        if numerator == 0:
+            raise ZeroDivisionError
+        return self._from_units(
+            _divide(self._units * denominator, numerator, self.rounding),
+            self._spec)
+
+    __deepcopy__ = __copy__
+    __hash__ = Currency.__hash__
+
+    __rmul__ = __mul__
+
+    @classmethod
+    def _from_spec(
+            cls: type[Self],
+            amount: Decimal,
+            spec: CurrencySpec) -> Self:
+        """Creates a currency from an `amount` and a specification.
+
+        The `amount` is rounded to the minor unit.
+
+        Args:
+            amount (Decimal): Represented value.
+            spec (CurrencySpec): Currency specification.
+
+        Returns:
+            FixedCurrency: new object.
+        """
+        return cls._from_units(
+            _to_units(amount, spec.decimal_places, cls.rounding),
+            spec)
+
+    @classmethod
+    def _from_units(
+            cls: type[Self],
+            units: int,
+            spec: CurrencySpec) -> Self:
+        """Creates a currency from a number of minor units.
+
+        Args:
+            units (int): Number of minor units.
+            spec (CurrencySpec): Currency specification.
+
+        Returns:
+            FixedCurrency: new object.
+        """
+        self = object.__new__(cls)
+        self._units = units
+        self._hash = None
+        self._spec = spec
+        return self
+
+    def _minor_units(self: Self) -> int:
+        """Returns the amount in minor units.
+
+        Returns:
+            int: number of minor units.
+        """
+        return self._units
+
+    def _recreate(self: Self, amount: Decimal) -> Self:
+        """Recreates self with a different `amount`.
+
+        The `amount` is rounded to the minor unit.
+
+        Args:
+            amount (Decimal): Represented value.
+
+        Returns:
+            FixedCurrency: new object.
+        """
+        return self._from_spec(amount, self._spec)
+
+    def _sum(self: Self, currencies: Iterable[object]) -> Self:
+        """Adds `currencies` to this in a single pass.
+
+        The minor units of the fixed point currencies are added as
+        integers. Other currencies are added as `Decimal` and the total
+        is rounded to the minor unit only once, at the end.
+
+        Args:
+            currencies (Iterable[object]): Currencies to add.
+
+        Returns:
+            FixedCurrency: result of the adding operation.
+
+        Raises:
+            CurrencyTypeException: If an element not instance of
+                'Currency'.
+            CurrencyMismatchException: If the `alpha_code` of an
+                element is differente from `alpha_code`.
+        """
+        cls = self.__class__
+        spec = self._spec
+        alpha_code = spec.alpha_code
+        places = spec.decimal_places
+        units = self._units
+        rest = None
+        for currency in currencies:
+            if currency.__class__ is cls and currency._spec is spec:
+                units += currency._units
+                continue
+            if not isinstance(currency, Currency):
+                raise CurrencyTypeException
+            other = currency._spec  # pylint: disable=protected-access
+            if other.alpha_code != alpha_code:
+                raise CurrencyMismatchException
+            if (isinstance(currency, FixedCurrency) and
+                    other.decimal_places == places):
+                units += currency._units
+            elif rest is None:
+                rest = currency._amount  # pylint: disable=protected-access
+            else:
+                rest = _EXACT.add(
+                    rest,
+                    currency._amount)  # pylint: disable=protected-access
+        if rest is not None:
+            units = _to_units(
+                _EXACT.add(Decimal(units).scaleb(-places, _EXACT), rest),
+                places,
+                self.rounding)
+        return self._from_units(units, spec)
+
+    @classmethod
+    def format_many(
+            cls: type[Self],
+            amounts: Iterable[float | Decimal | str],
+            fmt: str = '',
+            **kwargs: str) -> Iterator[str]:
+        """Formats several amounts of this currency.
+
+        The amounts are rounded to minor units as they would be by the
+        class creator. See `Currency.format_many`.
+
+        Args:
+            amounts (Iterable[float | Decimal | str]): Values to format.
+            fmt (str): formating specifications.
+            **kwargs (str): Currency parameters.
+
+        Returns:
+            Iterator[str]: Formated currency values.
+        """
+        spec = cls(0, **kwargs)._spec
+        places = spec.decimal_places
+        rounding = cls.rounding
+        convert = pycurrency._float_ingest  # pylint: disable=protected-access
+        return super().format_many(
+            (Decimal(_to_units(
+                Decimal(amount) if convert is None else convert(amount, spec),
+                places,
+                rounding)).scaleb(-places, _EXACT) for amount in amounts),
+            fmt,
+            **kwargs)
+
+    @classmethod
+    def from_currency(cls: type[Self], currency: Currency) -> Self:
+        """Creates a fixed point currency from `currency`.
+
+        Args:
+            currency (Currency): Currency to convert.
+
+        Returns:
+            FixedCurrency: new object.
+        """
+        return cls._from_spec(
+            currency._amount,  # pylint: disable=protected-access
+            currency._spec)  # pylint: disable=protected-access
+
+    def to_currency(
+            self: Self,
+            currency: type[Currency] = Currency) -> Currency:
+        """Converts this to a `Decimal` based currency.
+
+        Args:
+            currency (type[Currency], optional): Currency type to
+                convert to. Defaults to `Currency`.
+
+        Returns:
+            Currency: new object.
+        """
+        return currency._from_spec(  # pylint: disable=protected-access
+            self._amount, self._spec)
+
+    @property
+    def minor_units(self: Self) -> int:
+        """int: number of minor units."""
+        return self._units
@@ -0,0 +1,34 @@
+from collections.abc import Iterable, Iterator
+from decimal import Decimal
+from multicurrency.pycurrency import Currency, CurrencySpec
+from typing import Self
+
+class FixedCurrency(Currency):
+    rounding: str
+    def __new__(cls, amount: str | float | Decimal, alpha_code: str = ..., numeric_code: str = ..., symbol: str = ..., localized_symbol: str = ..., convertion: str = ..., pattern: str = ...) -> Self: ...
+    def __abs__(self) -> Self: ...
+    def __add__(self, other: object) -> Self: ...
+    def __bool__(self) -> bool: ...
+    def __copy__(self) -> Self: ...
+    def __eq__(self, other: object) -> bool: ...
+    def __ge__(self, other: object) -> bool: ...
+    def __gt__(self, other: object) -> bool: ...
+    def __hash__(self) -> int: ...
+    def __le__(self, other: object) -> bool: ...
+    def __lt__(self, other: object) -> bool: ...
+    def __mul__(self, other: float | Decimal) -> Self: ...
+    def __neg__(self) -> Self: ...
+    def __pos__(self) -> Self: ...
+    def __reduce__(self) -> tuple[object, tuple[object, ...]]: ...
+    def __rsub__(self, other: object) -> Self: ...
+    def __sub__(self, other: object) -> Self: ...
+    def __truediv__(self, other: float | Decimal) -> Self: ...
+    __deepcopy__: Self
+    __rmul__: Self
+    @classmethod
+    def format_many(cls, amounts: Iterable[float | Decimal | str], fmt: str = ..., **kwargs: str) -> Iterator[str]: ...
+    @classmethod
+    def from_currency(cls, currency: Currency) -> Self: ...
+    def to_currency(self, currency: type[Currency] = ...) -> Currency: ...
+    @property
+    def minor_units(self) -> int: ...
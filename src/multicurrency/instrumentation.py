@@ -0,0 +1,371 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2020-2022, Frederico Martins
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Hot path instrumentation.
+
+Counts (and times) the work done by the library: the currencies
+created (by class), the arithmetic operations (by method), the
+formatter and parser calls and the hits and misses of the internal
+caches.
+
+Simple usage example:
+
+    >>> from multicurrency import Euro
+    >>> from multicurrency.instrumentation import instrumented
+    >>> with instrumented() as recording:
+    ...     total = Euro(1) + Euro(2)
+    ...     text = str(total)
+    >>> counters = recording.snapshot()
+    >>> counters['construct.Euro'], counters['arithmetic.__add__']
+    (3, 1)
+    >>> counters['format.calls']
+    1
+
+The instrumentation is off by default and it can be turned on for the
+whole process with `enable` (or by setting the environment variable
+`MULTICURRENCY_INSTRUMENTATION` to '1' before importing the library)
+and off with `disable`. While off, the library methods are the
+original ones, so there is no overhead at all. While on, the methods
+are replaced by probes that count the calls and add up their (wall)
+time by category ('construct', 'arithmetic', 'format' and 'parse').
+The time of a category includes the time of the categories that it
+calls (e.g.: formatting a currency created on the fly). The batch
+formatters (`format_many`) are counted but not timed.
+
+A snapshot is a flat `dict` of counters (e.g.: 'construct.Euro',
+'arithmetic.__add__', 'format.calls', 'cache.formatter.hits') and of
+times in seconds (e.g.: 'time.format'), ready to be exported.
+
+Only the currency classes created before, or while, the
+instrumentation is on (including the ones from
+`multicurrency.currencies`) are instrumented.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import wraps
+from threading import Lock, local
+from time import perf_counter
+from typing import TYPE_CHECKING, Self
+
+from multicurrency import currencies, pycurrency
+from multicurrency.pycurrency import Currency, _Formatter, _Parser
+from multicurrency.registry import currency_type
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable, Iterator
+
+
+ENVIRONMENT_VARIABLE = 'MULTICURRENCY_INSTRUMENTATION'
+
+_ARITHMETIC = (
+    '__abs__',
+    '__add__',
+    '__ceil__',
+    '__divmod__',
+    '__floor__',
+    '__floordiv__',
+    '__mod__',
+    '__mul__',
+    '__neg__',
+    '__pos__',
+    '__rmul__',
+    '__round__',
+    '__rsub__',
+    '__sub__',
+    '__truediv__')
+_CONSTRUCTORS = (
+    '__new__',
+    '__recreate__',
+    '_from_spec',
+    '_from_units',
+    '_recreate')
+_CACHES = {
+    'formatter': pycurrency._formatter,  # pylint: disable=protected-access
+    'parser': pycurrency._parser,  # pylint: disable=protected-access
+    'registry': currency_type,
+    'spec': pycurrency._currency_spec}  # pylint: disable=protected-access
+
+_COUNTS: defaultdict[str, int] = defaultdict(int)
+_TIMES: defaultdict[str, float] = defaultdict(float)
+_CACHE_BASE: dict[str, int] = {}
+_DEPTH = local()
+_LOCK = Lock()
+_SWITCH = Lock()
+# original attributes (owner, name and value) of the probed methods
+_ORIGINALS: list[tuple[object, str, object]] = []
+
+
+def _probe(
+        func: Callable[..., object],
+        category: str,
+        name: str = '',
+        *,
+        constructs: bool = False,
+        timed: bool = True) -> Callable[..., object]:
+    """Returns a probe (counter and timer) for `func`.
+
+    Only the outermost call of a category is counted (e.g.: the
+    `_recreate` of an addition is not counted as a construction on its
+    own).
+
+    Args:
+        func (Callable[..., object]): Function to probe.
+        category (str): Category of the function.
+        name (str, optional): Counter name. Defaults to the class name
+            of the result.
+        constructs (bool, optional): If the result is a new currency
+            (counted by class). Defaults to False.
+        timed (bool, optional): If the time of the calls is added to
+            the category time. Defaults to True.
+
+    Returns:
+        Callable[..., object]: probe.
+    """
+    counts_new = constructs and category != 'construct'
+
+    @wraps(func)
+    def probe(*args: object, **kwargs: object) -> object:
+        depth = _DEPTH.__dict__
+        if depth.get(category):
+            return func(*args, **kwargs)
+        outer = constructs and not depth.get('construct')
+        depth[category] = True
+        if outer:
+            depth['construct'] = True
+        start = perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        finally:
+            elapsed = perf_counter() - start
+            depth[category] = False
+            if outer:
+                depth['construct'] = False
+        with _LOCK:
+            _COUNTS[f'{category}.{name or result.__class__.__name__}'] += 1
+            if timed:
+                _TIMES[category] += elapsed
+            if outer and counts_new and isinstance(result, Currency):
+                _COUNTS[f'construct.{result.__class__.__name__}'] += 1
+        return result
+
+    return probe
+
+
+def _replace(
+        owner: object,
+        name: str,
+        category: str,
+        counter: str = '',
+        **kwargs: bool) -> None:
+    """Replaces the method `name` of `owner` by a probe.
+
+    Args:
+        owner (object): Class (or module) of the method.
+        name (str): Method name.
+        category (str): Category of the method.
+        counter (str, optional): Counter name. Defaults to the class
+            name of the result.
+        **kwargs (bool): Probe options (see `_probe`).
+    """
+    original = vars(owner)[name]
+    if isinstance(original, (classmethod, staticmethod)):
+        probe = original.__class__(
+            _probe(original.__func__, category, counter, **kwargs))
+    else:
+        probe = _probe(original, category, counter, **kwargs)
+    _ORIGINALS.append((owner, name, original))
+    setattr(owner, name, probe)
+
+
+def _instrument(currency: type[Currency]) -> None:
+    """Replaces the constructors and arithmetic methods of `currency`.
+
+    Args:
+        currency (type[Currency]): Currency class.
+    """
+    attributes = vars(currency)
+    for name in _CONSTRUCTORS:
+        if name in attributes:
+            _replace(currency, name, 'construct', constructs=True)
+    for name in _ARITHMETIC:
+        if name in attributes:
+            _replace(
+                currency, name, 'arithmetic', name,
+                constructs=name != '__divmod__')
+
+
+def _subclasses(currency: type[Currency]) -> Iterator[type[Currency]]:
+    """Yields `currency` and all of its subclasses.
+
+    Args:
+        currency (type[Currency]): Currency class.
+
+    Yields:
+        type[Currency]: currency class.
+    """
+    yield currency
+    for subclass in currency.__subclasses__():
+        yield from _subclasses(subclass)
+
+
+def _currency_class(*args: object) -> type[Currency]:
+    """Creates (and instruments) a currency of the currencies table.
+
+    The currency is not instrumented if the instrumentation was turned
+    off meanwhile.
+
+    Returns:
+        type[Currency]: currency class.
+    """
+    create = pycurrency._currency_class  # pylint: disable=protected-access
+    currency = create(*args)
+    with _SWITCH:
+        if _ORIGINALS:
+            _instrument(currency)
+    return currency
+
+
+def _cache_info() -> dict[str, int]:
+    """Returns the hits and misses of the internal caches.
+
+    Returns:
+        dict[str, int]: hits and misses (by cache).
+    """
+    info = {}
+    for name, cache in _CACHES.items():
+        hits, misses, *_ = cache.cache_info()
+        info[f'cache.{name}.hits'] = hits
+        info[f'cache.{name}.misses'] = misses
+    return info
+
+
+def enable() -> None:
+    """Turns the instrumentation on (for the whole process).
+
+    Does nothing if the instrumentation is already on.
+    """
+    with _SWITCH:
+        if _ORIGINALS:
+            return
+        with _LOCK:
+            _CACHE_BASE.update(_cache_info())
+        for currency in dict.fromkeys(_subclasses(Currency)):
+            _instrument(currency)
+        # pylint: disable=protected-access
+        _ORIGINALS.append(
+            (currencies, '_currency_class', currencies._currency_class))
+        currencies._currency_class = _currency_class
+        # pylint: enable=protected-access
+        _replace(_Formatter, '__call__', 'format', 'calls')
+        _replace(_Formatter, 'many', 'format', 'many', timed=False)
+        _replace(_Parser, '__call__', 'parse', 'calls')
+
+
+def disable() -> None:
+    """Turns the instrumentation off.
+
+    The original methods are restored. The counters are kept.
+    """
+    with _SWITCH:
+        while _ORIGINALS:
+            owner, name, original = _ORIGINALS.pop()
+            setattr(owner, name, original)
+
+
+def is_enabled() -> bool:
+    """Checks if the instrumentation is on.
+
+    Returns:
+        bool: True if on. False otherwise.
+    """
+    return bool(_ORIGINALS)
+
+
+def reset() -> None:
+    """Sets all the counters and times to zero."""
+    with _LOCK:
+        _COUNTS.clear()
+        _TIMES.clear()
+        _CACHE_BASE.update(_cache_info())
+
+
+def snapshot() -> dict[str, float]:
+    """Returns the counters and times (since the last `reset`).
+
+    Returns:
+        dict[str, float]: counters and times (in seconds) by name.
+    """
+    with _LOCK:
+        values: dict[str, float] = dict(_COUNTS)
+        values.update(
+            (f'time.{category}', seconds)
+            for category, seconds in _TIMES.items())
+        for name, value in _cache_info().items():
+            values[name] = value - _CACHE_BASE.get(name, 0)
+    return values
+
+
+class Recording:
+    """Counters and times of an `instrumented` block.
+
+    Args:
+        base (dict[str, float]): Snapshot at the start of the block.
+    """
+
+    __slots__ = ('_base', '_end')
+
+    def __init__(self: Self, base: dict[str, float]) -> None:
+        """Class initializer."""
+        self._base = base
+        self._end: dict[str, float] | None = None
+
+    def __repr__(self: Self) -> str:
+        """String representation of this class.
+
+        Returns:
+            str: representation
+        """
+        return f'{self.__class__.__name__}({self.snapshot()})'
+
+    def snapshot(self: Self) -> dict[str, float]:
+        """Returns the counters and times of the block.
+
+        While the block runs, the values are the ones up to now.
+
+        Returns:
+            dict[str, float]: counters and times (in seconds) by name
+                (only the ones that changed).
+        """
+        end = self._end if self._end is not None else snapshot()
+        base = self._base
+        return {
+            name: value - base.get(name, 0)
+            for name, value in end.items()
+            if value != base.get(name, 0)}
+
+
+@contextmanager
+def instrumented() -> Iterator[Recording]:
+    """Turns the instrumentation on while the block runs.
+
+    The instrumentation is left on if it was already on.
+
+    Yields:
+        Recording: counters and times of the block.
+    """
+    enabled = is_enabled()
+    enable()
+    recording = Recording(snapshot())
+    try:
+        yield recording
+    finally:
+        recording._end = snapshot()  # pylint: disable=protected-access
+        if not enabled:
+            disable()
@@ -0,0 +1,16 @@
+from contextlib import AbstractContextManager
+from typing import Self
+
+ENVIRONMENT_VARIABLE: str
+
+def enable() -> None: ...
+def disable() -> None: ...
+def is_enabled() -> bool: ...
+def reset() -> None: ...
+def snapshot() -> dict[str, float]: ...
+
+class Recording:
+    def __init__(self, base: dict[str, float]) -> None: ...
+    def snapshot(self) -> dict[str, float]: ...
+
+def instrumented() -> AbstractContextManager[Recording]: ...
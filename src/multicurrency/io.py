@@ -0,0 +1,482 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2020-2022, Frederico Martins
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Currency input and output.
+
+Streaming readers of currency amounts from CSV and JSON Lines files and
+writers of formated currencies to CSV (or TSV) and fixed-width files.
+
+Simple usage example:
+
+    >>> from multicurrency import CurrencyArray
+    >>> from multicurrency.io import read_csv
+    >>> lines = ['currency,amount', 'EUR,1.5', 'USD,2', 'EUR,0.25']
+    >>> for chunk in read_csv(lines):
+    ...     for currency, amounts in chunk.items():
+    ...         print(currency.__name__, amounts)
+    Euro [Decimal('1.5'), Decimal('0.25')]
+    USDollar [Decimal('2')]
+    >>> columns = {
+    ...     currency: CurrencyArray(amounts, currency)
+    ...     for currency, amounts in chunk.items()}
+
+The files are read one chunk (of at most `chunk_size` rows) at a time.
+Each chunk has the amounts of its rows grouped by currency class (the
+one of the code, and country, of the row. See
+`multicurrency.registry`) ready to be added to per currency containers
+(e.g.: `multicurrency.arrays.CurrencyArray`). Memory use depends on the
+size of the chunks and not on the size of the file.
+
+The amounts are never converted to `float`. Numbers (or strings) are
+converted to `Decimal` and formated values (e.g.: '1.000,50 €') are
+converted with the parser of the currency (see
+`multicurrency.pycurrency.Currency.parse`).
+
+The writers take currencies (or a currency array) and format them with
+the same format specification as `format()`:
+
+    >>> import io
+    >>> from multicurrency import USDollar
+    >>> from multicurrency.io import write_csv, write_fixed
+    >>> dollars = [USDollar('1.5'), USDollar('-1234.5'), USDollar(20)]
+    >>> file = io.StringIO()
+    >>> write_csv(file, dollars, lineterminator='\\n')
+    >>> print(file.getvalue(), end='')
+    currency,amount
+    USD,$1.50
+    USD,"-$1,234.50"
+    USD,$20.00
+    >>> file = io.StringIO()
+    >>> write_fixed(file, CurrencyArray([1, '-0.5', 300], USDollar))
+    >>> print(file.getvalue(), end='')
+    currency  amount
+    USD        $1.00
+    USD       -$0.50
+    USD      $300.00
+
+The formatter is resolved once for each currency specification and the
+output is written in chunks (of `chunk_size` rows), encoded when the
+file is a binary one. The width of the fixed-width columns is computed
+beforehand from the smallest and largest amount of each currency.
+"""
+
+from __future__ import annotations
+
+import sys
+from csv import reader, writer
+from decimal import Decimal
+from io import BufferedIOBase, RawIOBase, StringIO
+from itertools import islice, repeat
+from json import JSONDecoder
+from operator import itemgetter
+from typing import IO, TYPE_CHECKING
+
+from multicurrency.pycurrency import _formatter, _parser
+from multicurrency.registry import currency_type
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable, Hashable, Iterable, Iterator
+
+    from multicurrency.arrays import CurrencyArray
+    from multicurrency.pycurrency import Currency, CurrencySpec
+
+    _Chunk = dict[type[Currency], list[Decimal]]
+
+
+CHUNK_SIZE = 65_536
+
+_DECODER = JSONDecoder(parse_float=Decimal)
+
+
+def _chunks(  # pylint: disable=too-many-arguments
+        rows: Iterator[object],
+        key: Callable[[object], Hashable],
+        amount: Callable[[object], object],
+        country: bool,
+        formatted: bool,
+        chunk_size: int) -> Iterator[_Chunk]:
+    """Groups the amounts of `rows` by currency class, in chunks.
+
+    Args:
+        rows (Iterator[object]): Rows.
+        key (Callable[[object], Hashable]): Code (and country) of a row.
+        amount (Callable[[object], object]): Amount of a row.
+        country (bool): Whether the keys have the country.
+        formatted (bool): Whether the amounts are formated values.
+        chunk_size (int): Maximum number of rows of a chunk.
+
+    Yields:
+        dict[type[Currency], list[Decimal]]: amounts by currency class.
+    """
+    if chunk_size < 1:
+        msg = f'chunk_size must be greater than zero, not {chunk_size}.'
+        raise ValueError(msg)
+    types: dict[Hashable, type[Currency]] = {}
+    converters: dict[type[Currency], Callable[[object], Decimal]] = {}
+    while True:
+        chunk: _Chunk = {}
+        columns: dict[Hashable, list[object]] = {}
+        for row in islice(rows, chunk_size):
+            code = key(row)
+            column = columns.get(code)
+            if column is None:
+                currency = types.get(code)
+                if currency is None:
+                    currency = types[code] = (
+                        currency_type(*code) if country else
+                        currency_type(code))
+                column = chunk.get(currency)
+                if column is None:
+                    column = chunk[currency] = []
+                columns[code] = column
+            column.append(amount(row))
+        if not chunk:
+            return
+        for currency, values in chunk.items():
+            convert = converters.get(currency)
+            if convert is None:
+                convert = converters[currency] = (
+                    _parser(currency(0).spec) if formatted else Decimal)
+            chunk[currency] = list(map(convert, values))
+        yield chunk
+
+
+def read_csv(  # pylint: disable=too-many-arguments
+        lines: Iterable[str],
+        code: str = 'currency',
+        amount: str = 'amount',
+        country: str = '',
+        *,
+        formatted: bool = False,
+        chunk_size: int = CHUNK_SIZE,
+        **fmtparams: object) -> Iterator[_Chunk]:
+    """Reads currency amounts from CSV `lines`.
+
+    The first row must be the header with the names of the columns.
+
+    Args:
+        lines (Iterable[str]): CSV lines (e.g.: a file opened with
+            `newline=''`).
+        code (str, optional): Column with the currency alpha (or
+            numeric) code. Defaults to 'currency'.
+        amount (str, optional): Column with the amount. Defaults to
+            'amount'.
+        country (str, optional): Column with the country of the
+            currency. Defaults to none (the main currency of the code).
+        formatted (bool, optional): Whether the amounts are formated
+            values of the currency (e.g.: '1.000,50 €'). Defaults to
+            False.
+        chunk_size (int, optional): Maximum number of rows of a chunk.
+            Defaults to 65_536.
+        **fmtparams (object): `csv.reader` formatting parameters (e.g.:
+            `delimiter`).
+
+    Yields:
+        dict[type[Currency], list[Decimal]]: amounts by currency class.
+
+    Raises:
+        CurrencyCodeException: If there is no currency for a code (and
+            country).
+        CurrencyInvalidFormat: If a formated amount is not valid.
+        ValueError: If a column is not in the header.
+    """
+    rows = reader(lines, **fmtparams)
+    header = next(rows, None)
+    if header is None:
+        return
+    index = {}
+    for name in (code, amount, country):
+        if name and name not in header:
+            msg = f'column {name!r} not in the header.'
+            raise ValueError(msg)
+        index[name] = header.index(name) if name else None
+    if country:
+        key = itemgetter(index[code], index[country])
+    else:
+        key = itemgetter(index[code])
+    yield from _chunks(
+        rows, key, itemgetter(index[amount]), bool(country), formatted,
+        chunk_size)
+
+
+def read_jsonl(  # pylint: disable=too-many-arguments
+        lines: Iterable[str],
+        code: str = 'currency',
+        amount: str = 'amount',
+        country: str = '',
+        *,
+        formatted: bool = False,
+        chunk_size: int = CHUNK_SIZE) -> Iterator[_Chunk]:
+    """Reads currency amounts from JSON Lines `lines`.
+
+    Each (non blank) line must be a JSON object. Numbers are decoded
+    as `int` or `Decimal` (never `float`).
+
+    Args:
+        lines (Iterable[str]): JSON lines (e.g.: an open file).
+        code (str, optional): Key of the currency alpha (or numeric)
+            code. Defaults to 'currency'.
+        amount (str, optional): Key of the amount. Defaults to
+            'amount'.
+        country (str, optional): Key of the country of the currency.
+            Defaults to none (the main currency of the code).
+        formatted (bool, optional): Whether the amounts are formated
+            values of the currency (e.g.: '1.000,50 €'). Defaults to
+            False.
+        chunk_size (int, optional): Maximum number of rows of a chunk.
+            Defaults to 65_536.
+
+    Yields:
+        dict[type[Currency], list[Decimal]]: amounts by currency class.
+
+    Raises:
+        CurrencyCodeException: If there is no currency for a code (and
+            country).
+        CurrencyInvalidFormat: If a formated amount is not valid.
+        KeyError: If a key is not in a line.
+    """
+    rows = map(_DECODER.decode, filter(str.strip, lines))
+    key = itemgetter(code, country) if country else itemgetter(code)
+    yield from _chunks(
+        rows, key, itemgetter(amount), bool(country), formatted, chunk_size)
+
+
+def _is_array(currencies: object) -> bool:
+    """Checks if `currencies` is a currency array.
+
+    The arrays module (and NumPy) is not imported: without it there
+    are no currency arrays.
+
+    Args:
+        currencies (object): Currencies.
+
+    Returns:
+        bool: True if a currency array. False otherwise.
+    """
+    arrays = sys.modules.get('multicurrency.arrays')
+    return arrays is not None and isinstance(
+        currencies, arrays.CurrencyArray)
+
+
+def _formatted(
+        currencies: Iterable[Currency] | CurrencyArray,
+        fmt: str) -> Iterator[tuple[str, str]]:
+    """Formats `currencies`.
+
+    Args:
+        currencies (Iterable[Currency] | CurrencyArray): Currencies to
+            format.
+        fmt (str): Format specification.
+
+    Returns:
+        Iterator[tuple[str, str]]: alpha code and formated amount of
+            each currency.
+    """
+    if _is_array(currencies):
+        return zip(
+            repeat(currencies.spec.alpha_code), currencies.format_many(fmt))
+    return _formatted_each(currencies, fmt)
+
+
+def _formatted_each(
+        currencies: Iterable[Currency],
+        fmt: str) -> Iterator[tuple[str, str]]:
+    """Formats `currencies` (of any specification).
+
+    Each specification has its own batch formatter (see
+    `multicurrency.pycurrency.Currency.format_many`), fed one amount at
+    a time through a slot.
+
+    Args:
+        currencies (Iterable[Currency]): Currencies to format.
+        fmt (str): Format specification.
+
+    Yields:
+        tuple[str, str]: alpha code and formated amount.
+    """
+    formatters: dict[CurrencySpec, tuple[list[Decimal], Iterator[str]]] = {}
+    for currency in currencies:
+        spec = currency._spec  # pylint: disable=protected-access
+        formatter = formatters.get(spec)
+        if formatter is None:
+            slot = [Decimal(0)]
+            texts = _formatter(spec.pattern, fmt).many(
+                map(slot.__getitem__, repeat(0)), spec)
+            formatter = formatters[spec] = (slot, texts)
+        slot, texts = formatter
+        slot[0] = currency._amount  # pylint: disable=protected-access
+        yield spec.alpha_code, next(texts)
+
+
+def _output(file: IO, encoding: str) -> Callable[[str], object]:
+    """Returns the function that writes text to `file`.
+
+    Args:
+        file (IO): Text or binary file.
+        encoding (str): Encoding of the text (binary files only).
+
+    Returns:
+        Callable[[str], object]: write function.
+    """
+    if isinstance(file, (RawIOBase, BufferedIOBase)):
+        return lambda text: file.write(text.encode(encoding))
+    return file.write
+
+
+def write_csv(  # pylint: disable=too-many-arguments
+        file: IO,
+        currencies: Iterable[Currency] | CurrencyArray,
+        fmt: str = '',
+        code: str = 'currency',
+        amount: str = 'amount',
+        *,
+        header: bool = True,
+        chunk_size: int = CHUNK_SIZE,
+        encoding: str = 'utf-8',
+        **fmtparams: object) -> None:
+    """Writes the formated `currencies` to a CSV `file`.
+
+    Each row has the alpha code and the formated amount of a currency
+    (TSV files can be written with `delimiter='\\t'`).
+
+    Args:
+        file (IO): Text (opened with `newline=''`) or binary file.
+        currencies (Iterable[Currency] | CurrencyArray): Currencies to
+            write.
+        fmt (str, optional): Format specification (see `format()`).
+            Defaults to ''.
+        code (str, optional): Name of the alpha code column. Defaults
+            to 'currency'. No column is written if empty.
+        amount (str, optional): Name of the amount column. Defaults to
+            'amount'.
+        header (bool, optional): Whether to write the header. Defaults
+            to True.
+        chunk_size (int, optional): Number of rows written at once.
+            Defaults to 65_536.
+        encoding (str, optional): Encoding (binary files only).
+            Defaults to 'utf-8'.
+        **fmtparams (object): `csv.writer` formatting parameters (e.g.:
+            `delimiter`).
+
+    Raises:
+        CurrencyInvalidFormat: If `fmt` is not valid.
+        ValueError: If `chunk_size` is not greater than zero.
+    """
+    if chunk_size < 1:
+        msg = f'chunk_size must be greater than zero, not {chunk_size}.'
+        raise ValueError(msg)
+    rows = _formatted(currencies, fmt)
+    if not code:
+        rows = zip(map(itemgetter(1), rows))
+    buffer = StringIO()
+    rows_writer = writer(buffer, **fmtparams)
+    if header:
+        rows_writer.writerow((code, amount) if code else (amount,))
+    write = _output(file, encoding)
+    while True:
+        rows_writer.writerows(islice(rows, chunk_size))
+        text = buffer.getvalue()
+        if not text:
+            return
+        write(text)
+        buffer.seek(0)
+        buffer.truncate()
+
+
+def write_fixed(  # pylint: disable=too-many-arguments,too-many-locals
+        file: IO,
+        currencies: Iterable[Currency] | CurrencyArray,
+        fmt: str = '',
+        code: str = 'currency',
+        amount: str = 'amount',
+        *,
+        header: bool = True,
+        width: int = 0,
+        chunk_size: int = CHUNK_SIZE,
+        encoding: str = 'utf-8') -> None:
+    """Writes the formated `currencies` to a fixed-width `file`.
+
+    Each line has the alpha code (left aligned) and the formated amount
+    (right aligned) of a currency, separated by a space. Unless
+    `width` is given the currencies are read twice (once to find the
+    width of the columns), so iterators are read into a list.
+
+    Args:
+        file (IO): Text or binary file.
+        currencies (Iterable[Currency] | CurrencyArray): Currencies to
+            write.
+        fmt (str, optional): Format specification (see `format()`).
+            Defaults to ''.
+        code (str, optional): Name of the alpha code column. Defaults
+            to 'currency'. No column is written if empty.
+        amount (str, optional): Name of the amount column. Defaults to
+            'amount'.
+        header (bool, optional): Whether to write the header. Defaults
+            to True.
+        width (int, optional): Width of the amount column. Defaults to
+            the width of the widest formated amount (or header).
+        chunk_size (int, optional): Number of lines written at once.
+            Defaults to 65_536.
+        encoding (str, optional): Encoding (binary files only).
+            Defaults to 'utf-8'.
+
+    Raises:
+        CurrencyInvalidFormat: If `fmt` is not valid.
+        ValueError: If `chunk_size` is not greater than zero.
+    """
+    if chunk_size < 1:
+        msg = f'chunk_size must be greater than zero, not {chunk_size}.'
+        raise ValueError(msg)
+    if _is_array(currencies):
+        bounds = {currencies.spec: (
+            [currencies.min().amount, currencies.max().amount]
+            if len(currencies) else [])}
+    else:
+        bounds = {}
+        if not width:
+            currencies = list(currencies)
+            for currency in currencies:
+                spec = currency._spec  # pylint: disable=protected-access
+                value = currency._amount  # pylint: disable=protected-access
+                bound = bounds.get(spec)
+                if bound is None:
+                    bounds[spec] = [value, value]
+                elif value < bound[0]:
+                    bound[0] = value
+                elif value > bound[1]:
+                    bound[1] = value
+    width = width or max((
+        len(_formatter(spec.pattern, fmt)(value, spec))
+        for spec, bound in bounds.items()
+        for value in bound), default=0)
+    width = max(width, len(amount) if header else 0)
+    if code:
+        code_width = max((len(spec.alpha_code) for spec in bounds), default=0)
+        code_width = max(code_width, len(code) if header else 0)
+        template = f'%-{code_width}s %{width}s\n'
+        titles = template % (code, amount)
+    else:
+        template = f'%{width}s\n'
+        titles = template % amount
+    if _is_array(currencies):
+        if code:
+            prefix = f'{currencies.spec.alpha_code:<{code_width}} '
+            template = prefix.replace('%', '%%') + f'%{width}s\n'
+        lines = map(template.__mod__, currencies.format_many(fmt))
+    elif code:
+        lines = map(template.__mod__, _formatted_each(currencies, fmt))
+    else:
+        lines = map(template.__mod__, map(
+            itemgetter(1), _formatted_each(currencies, fmt)))
+    write = _output(file, encoding)
+    if header:
+        write(titles)
+    while True:
+        text = ''.join(islice(lines, chunk_size))
+        if not text:
+            return
+        write(text)
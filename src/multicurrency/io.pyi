@@ -0,0 +1,12 @@
+from collections.abc import Iterable, Iterator
+from decimal import Decimal
+from multicurrency.arrays import CurrencyArray
+from multicurrency.pycurrency import Currency
+from typing import IO
+
+CHUNK_SIZE: int
+
+def read_csv(lines: Iterable[str], code: str = ..., amount: str = ..., country: str = ..., *, formatted: bool = ..., chunk_size: int = ..., **fmtparams: object) -> Iterator[dict[type[Currency], list[Decimal]]]: ...
+def read_jsonl(lines: Iterable[str], code: str = ..., amount: str = ..., country: str = ..., *, formatted: bool = ..., chunk_size: int = ...) -> Iterator[dict[type[Currency], list[Decimal]]]: ...
+def write_csv(file: IO, currencies: Iterable[Currency] | CurrencyArray, fmt: str = ..., code: str = ..., amount: str = ..., *, header: bool = ..., chunk_size: int = ..., encoding: str = ..., **fmtparams: object) -> None: ...
+def write_fixed(file: IO, currencies: Iterable[Currency] | CurrencyArray, fmt: str = ..., code: str = ..., amount: str = ..., *, header: bool = ..., width: int = ..., chunk_size: int = ..., encoding: str = ...) -> None: ...
@@ -38,6 +38,10 @@ The meaning of the various alignment options is as follows:
 All fields are optional although for the first four fields when setting
 one the fields on the left of that are required to be set as well.
 
+The `[gp]` field can also have several group sizes, separated by `;`,
+starting from the decimal sign. The last size is repeated (e.g.: `3;2`
+for the Indian lakh and crore grouping).
+
 The available string currency parts for `[spec]` are:
 
 | Part | Meaning                                                                                                                            |
@@ -66,6 +70,48 @@ formatting feature:
     >>> # Using the `f-string` method
     >>> f'{euro:4%a}'
     '142,857.1429'
+    >>> # Grouping by three and then by two
+    >>> format(euro * 1000, '.,3;2%a')
+    '14,28,57,142.86'
+
+## Floats
+
+A `float` amount is converted exactly (with all the digits of its
+binary value). It can, instead, be converted by its shortest (`repr`)
+digits or straight to the minor units of the currency, for a single
+currency (`from_float`) or for all of them (`set_float_mode`).
+
+    >>> from multicurrency import Euro
+    >>> from multicurrency.pycurrency import set_float_mode
+    >>> Euro(1.1).amount
+    Decimal('1.100000000000000088817841970012523233890533447265625')
+    >>> Euro.from_float(1.1).amount
+    Decimal('1.1')
+    >>> Euro.from_float(2/3, 'minor').amount
+    Decimal('0.67')
+    >>> previous = set_float_mode('repr')
+    >>> Euro(1.1).amount
+    Decimal('1.1')
+    >>> _ = set_float_mode(previous)
+
+## Quantization
+
+The amounts are never rounded by default (only when formatted). With
+the quantization policy on (`set_quantize_rounding`) the amounts are
+rounded to the minor unit of the currency (`CurrencySpec.minor_unit`),
+with the given rounding mode, when the currencies are created and after
+every operation.
+
+    >>> from multicurrency import Euro
+    >>> from multicurrency.pycurrency import set_quantize_rounding
+    >>> Euro(1).spec.minor_unit
+    Decimal('0.01')
+    >>> (Euro(10) / 3).amount
+    Decimal('3.333333333333333333333333333')
+    >>> previous = set_quantize_rounding('ROUND_HALF_UP')
+    >>> (Euro(10) / 3).amount
+    Decimal('3.33')
+    >>> _ = set_quantize_rounding(previous)
 
 ## Supported operations
 
@@ -93,6 +139,19 @@ of the same type.
     >>> print(c1 + c2)
     5.00
 
+### Allocation
+
+Produces a list of `multicurrency.pycurrency.Currency` with the amount
+(in minor units) of the currency distributed by the given ratios
+(`allocate`), or into equal parts (`split`), by the largest remainder
+method. The parts add up to the amount.
+
+    >>> from multicurrency import Currency
+    >>> print(*Currency(1).allocate([1, 2]))
+    0.33 0.67
+    >>> print(*Currency(1).split(3))
+    0.34 0.33 0.33
+
 ### Boolean
 
 Produces 'True' for values of `multicurrency.pycurrency.Currency` other
@@ -259,15 +318,25 @@ objects of the same currency.
 
 from __future__ import annotations
 
-from decimal import Decimal
-from re import (
-    compile as _compile,
-    escape as _escape,
-    match as _match,
-    sub as _sub,
+from decimal import (
+    MAX_EMAX,
+    MAX_PREC,
+    MIN_EMIN,
+    ROUND_HALF_EVEN,
+    Context,
+    Decimal,
+    InvalidOperation,
+    getcontext,
 )
-from typing import Self
-
+from functools import lru_cache
+from heapq import nlargest
+from math import lcm
+from operator import itemgetter
+from re import compile as _compile
+from re import escape as _escape
+from typing import TYPE_CHECKING, Self
+
+from multicurrency.context import _CURRENT, ROUNDINGS, MoneyContext
 from multicurrency.exceptions import (
     CurrencyInvalidDivision,
     CurrencyInvalidFormat,
@@ -277,6 +346,932 @@ from multicurrency.exceptions import (
 )
 
 
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable, Iterable, Iterator
+
+
+_PATTERN = _compile(
+    r'^(?P<decimal_places>\d+)'
+    r'(?P<decimal_sign>[^\d%])'
+    r'(?P<grouping_sign>[^\d%])'
+    r'(?P<grouping_places>\d+(?:;\d+)*)'
+    r'(?P<format>.+)$')
+_FORMAT = _compile(
+    r'^(?P<decimal_places>\d+)?'
+    r'(?P<decimal_sign>[^\d%])?'
+    r'(?P<grouping_sign>[^\d%])?'
+    r'(?P<grouping_places>\d+(?:;\d+)*)?'
+    r'(?P<format>.+)?$')
+_LEADING_DIGITS = _compile(r'^\d+')
+_FORMAT_PARTS = {
+    '%s': '{s}',
+    '%S': '{S}',
+    '%c': '{c}',
+    '%a': '{a}',
+    '%A': '{A}',
+    '%u': '{u}',
+    '%U': '{U}',
+    '%-': '{-}',
+    '%%': '%'}
+_GROUPING_SEPARATOR = ';'
+_AMOUNT_PARTS = frozenset(('{a}', '{A}', '{u}', '{U}', '{-}'))
+_FORMATTER_CACHE_SIZE = 512
+_SPEC_CACHE_SIZE = 1024
+FLOAT_MODES = ('exact', 'repr', 'minor')
+# exact context (of the conversions to, and from, minor units)
+_EXACT = Context(prec=MAX_PREC, Emax=MAX_EMAX, Emin=MIN_EMIN)
+# current money context (see `multicurrency.context`)
+_current_context = _CURRENT.get
+
+
+def _grouping_sizes(grouping_places: str) -> tuple[int, ...]:
+    """Returns the group sizes of the `grouping_places` pattern field.
+
+    The sizes are ordered from the decimal sign (e.g.: '3;2' for the
+    lakh and crore grouping). The last size is repeated and a size of 0
+    (zero) ends the grouping.
+
+    Args:
+        grouping_places (str): Grouping places pattern field.
+
+    Returns:
+        tuple[int, ...]: group sizes.
+    """
+    sizes = [int(size) for size in grouping_places.split(_GROUPING_SEPARATOR)]
+    if 0 in sizes:
+        del sizes[sizes.index(0) + 1:]
+    while len(sizes) > 1 and sizes[-1] == sizes[-2]:
+        sizes.pop()
+    return tuple(sizes)
+
+
+def _group(integral: str, sizes: tuple[int, ...]) -> str:
+    """Groups the digits of `integral` with commas.
+
+    Args:
+        integral (str): Integral part of a number (with an optional
+            leading minus sign).
+        sizes (tuple[int, ...]): Group sizes (see `_grouping_sizes`).
+
+    Returns:
+        str: grouped number.
+    """
+    start = 1 if integral[:1] == '-' else 0
+    end = len(integral)
+    groups = []
+    last = len(sizes) - 1
+    index = 0
+    size = sizes[0]
+    while 0 < size < end - start:
+        groups.append(integral[end - size:end])
+        end -= size
+        if index < last:
+            index += 1
+            size = sizes[index]
+    groups.append(integral[:end])
+    groups.reverse()
+    return ','.join(groups)
+
+
+class _Formatter:
+    """Compiled currency formatter.
+
+    Holds the result of parsing a currency `pattern` merged with a
+    formatting specification so that formatting a value does not have
+    to parse (or compile) anything.
+
+    Args:
+        pattern (str): Currency format pattern.
+        fmt (str): Formatting specifications.
+    """
+
+    __slots__ = (
+        'decimal_places',
+        'decimal_sign',
+        'grouping_sign',
+        'grouping_places',
+        'grouping_sizes',
+        '_grouping',
+        '_localized',
+        '_number_format',
+        '_parts',
+        '_quantum',
+        '_swap',
+        '_tables',
+        '_template')
+
+    def __init__(self: Self, pattern: str, fmt: str) -> None:
+        values = _FORMAT.match(pattern).groupdict()
+        matches = _FORMAT.match(fmt.strip())
+        new_values = {k: v for k, v in matches.groupdict().items() if v}
+        values = {**values, **new_values}
+        self.decimal_places = int(values['decimal_places'])
+        self._quantum = Decimal((0, (1,), -self.decimal_places))
+        self.decimal_sign = values['decimal_sign']
+        self.grouping_sign = values['grouping_sign']
+        self.grouping_sizes = _grouping_sizes(values['grouping_places'])
+        self.grouping_places = self.grouping_sizes[0]
+        self._swap = (self.decimal_sign, self.grouping_sign) != ('.', ',')
+        self._tables: dict[str, dict[int, str]] = {}
+        # grouping by three is done (faster) by the `Decimal` formatter
+        self._number_format = ',f' if self.grouping_sizes == (3,) else 'f'
+        self._grouping = None
+        if self.grouping_sizes not in ((0,), (3,)):
+            self._grouping = self.grouping_sizes
+        template = []
+        currency_format = values['format']
+        index = 0
+        while index < len(currency_format):
+            part = _FORMAT_PARTS.get(currency_format[index:index + 2])
+            if part is None:
+                char = currency_format[index]
+                template.append(char * 2 if char in '{}' else char)
+                index += 1
+            else:
+                template.append(part)
+                index += 2
+        self._parts = tuple(template)
+        self._template = ''.join(template)
+        self._localized = '{a}' in template or '{u}' in template
+
+    def _table(self: Self, spec: CurrencySpec) -> dict[int, str]:
+        """Returns the (cached) translation table for `spec`.
+
+        The table converts the digits and the minus sign (see
+        `CurrencySpec.translation`) and sets the decimal and grouping
+        signs in a single `str.translate` pass.
+
+        Args:
+            spec (CurrencySpec): Currency specification.
+
+        Returns:
+            dict[int, str]: translation table.
+        """
+        table = self._tables.get(spec.convertion)
+        if table is None:
+            table = {}
+            for key in (*spec.translation, ord('.'), ord(','), ord('X')):
+                char = chr(key)
+                value = char.translate(spec.translation).replace(
+                    '.', 'X').replace(',', self.grouping_sign).replace(
+                    'X', self.decimal_sign)
+                if value != char:
+                    table[key] = value
+            self._tables[spec.convertion] = table
+        return table
+
+    def __call__(
+            self: Self,
+            amount: Decimal,
+            spec: CurrencySpec) -> str:
+        """Formats `amount` using the currency `spec`.
+
+        Args:
+            amount (Decimal): Value to format.
+            spec (CurrencySpec): Currency specification.
+
+        Returns:
+            str: Formated value.
+        """
+        context = spec.context or _current_context()
+        unconverted = format(
+            round(amount, self.decimal_places) if context is None else
+            context.decimal_context.quantize(amount, self._quantum),
+            self._number_format)
+        if self._grouping is not None:
+            integral, point, fractional = unconverted.partition('.')
+            unconverted = ''.join((
+                _group(integral, self._grouping),
+                point,
+                fractional))
+        parts = {
+            's': spec.symbol,
+            'S': spec.localized_symbol,
+            'c': spec.alpha_code,
+            'A': unconverted,
+            'U': unconverted.lstrip('-'),
+            '-': '-' * amount.is_signed()}
+        if self._localized:
+            converted = unconverted
+            if spec.translation:
+                converted = converted.translate(self._table(spec))
+            elif self._swap:
+                converted = converted.replace('.', 'X').replace(
+                    ',', self.grouping_sign).replace('X', self.decimal_sign)
+            parts['a'] = converted
+            parts['u'] = converted.lstrip('-')
+        return self._template.format_map(parts)
+
+    def many(
+            self: Self,
+            amounts: Iterable[Decimal],
+            spec: CurrencySpec) -> Iterator[str]:
+        """Formats every amount of `amounts` using the currency `spec`.
+
+        The template is resolved once, with the currency parts (symbols
+        and alpha code) already in place, and only the amount parts are
+        computed for each value.
+
+        Args:
+            amounts (Iterable[Decimal]): Values to format.
+            spec (CurrencySpec): Currency specification.
+
+        Yields:
+            str: Formated value.
+        """
+        constants = {
+            '{s}': spec.symbol,
+            '{S}': spec.localized_symbol,
+            '{c}': spec.alpha_code}
+        fields = [part[1] for part in self._parts if part in _AMOUNT_PARTS]
+        template = ''.join(
+            '%s' if part in _AMOUNT_PARTS else
+            constants.get(part, part[0]).replace('%', '%%')
+            for part in self._parts)
+        if not fields:
+            for _ in amounts:
+                yield template.replace('%%', '%')
+            return
+        values = itemgetter(*fields)
+        places = self.decimal_places
+        context = spec.context or _current_context()
+        quantize = None if context is None else (
+            context.decimal_context.quantize)
+        quantum = self._quantum
+        number_format = self._number_format
+        grouping = self._grouping
+        localized = self._localized
+        translation = self._table(spec) if spec.translation else None
+        decimal_sign = self.decimal_sign
+        grouping_sign = self.grouping_sign
+        swap = self._swap
+        parts = {}
+        for amount in amounts:
+            unconverted = format(
+                round(amount, places) if quantize is None else
+                quantize(amount, quantum),
+                number_format)
+            if grouping is not None:
+                integral, point, fractional = unconverted.partition('.')
+                unconverted = ''.join((
+                    _group(integral, grouping),
+                    point,
+                    fractional))
+            parts['A'] = unconverted
+            parts['U'] = unconverted.lstrip('-')
+            parts['-'] = '-' * amount.is_signed()
+            if localized:
+                converted = unconverted
+                if translation is not None:
+                    converted = converted.translate(translation)
+                elif swap:
+                    converted = converted.replace('.', 'X').replace(
+                        ',', grouping_sign).replace('X', decimal_sign)
+                parts['a'] = converted
+                parts['u'] = converted.lstrip('-')
+            yield template % values(parts)
+
+
+@lru_cache(maxsize=_FORMATTER_CACHE_SIZE)
+def _formatter(pattern: str, fmt: str = '') -> _Formatter:
+    """Returns the (cached) compiled formatter for `pattern` and `fmt`.
+
+    Args:
+        pattern (str): Currency format pattern.
+        fmt (str, optional): Formatting specifications. Defaults to ''.
+
+    Returns:
+        _Formatter: compiled formatter.
+    """
+    return _Formatter(pattern, fmt)
+
+
+def _number(
+        digits: str,
+        minus: str,
+        decimal_sign: str,
+        grouping_sign: str) -> str:
+    """Returns a regular expression (group) that matches a number.
+
+    Args:
+        digits (str): The digits from 0 to 9.
+        minus (str): The minus sign.
+        decimal_sign (str): The decimal sign.
+        grouping_sign (str): The grouping sign.
+
+    Returns:
+        str: regular expression.
+    """
+    if [ord(d) - ord(digits[0]) for d in digits] == list(range(10)):
+        digit = f'[{_escape(digits[0])}-{_escape(digits[-1])}]'
+    else:
+        digit = f'[{_escape(digits)}]'
+    return (
+        f'({_escape(minus)}?{digit}+'
+        f'(?:{_escape(grouping_sign)}{digit}+)*'
+        f'(?:{_escape(decimal_sign)}{digit}+)?)')
+
+
+class _Parser:
+    """Compiled currency parser.
+
+    Parses the strings produced by the formatter (with the default
+    `pattern`, the localized symbol or the international format) of
+    the currencies with a given specification.
+
+    Args:
+        spec (CurrencySpec): Currency specification.
+    """
+
+    __slots__ = ('_expressions', '_localized', '_western')
+
+    def __init__(self: Self, spec: CurrencySpec) -> None:
+        digits = spec.convertion[:10] or '0123456789'
+        minus = spec.convertion[10:11] or '-'
+        decimal_sign = spec.decimal_sign
+        grouping_sign = spec.grouping_sign
+        # `Decimal` reads any (unicode) decimal digits
+        table = None
+        if not digits.isdecimal() or minus != '-':
+            table = {
+                **str.maketrans(digits, '0123456789'),
+                ord(minus): '-',
+                ord(grouping_sign): None,
+                ord(decimal_sign): '.'}
+        self._localized = (grouping_sign, decimal_sign, table)
+        self._western = (',', '.', None)
+        numbers = {
+            'a': _number(digits, minus, decimal_sign, grouping_sign),
+            'A': _number('0123456789', '-', '.', ','),
+            '-': '(-?)'}
+        numbers['u'] = numbers['a']
+        numbers['U'] = numbers['A']
+        symbols = sorted({spec.symbol, spec.localized_symbol}, key=len)
+        constants = {
+            's': f'(?:{"|".join(map(_escape, reversed(symbols)))})',
+            'c': _escape(spec.alpha_code)}
+        constants['S'] = constants['s']
+        self._expressions = []
+        for template in (
+                _PATTERN.match(spec.pattern)['format'],
+                '%A\u00A0%c',
+                '%a'):
+            expression = []
+            kinds = []
+            index = 0
+            while index < len(template):
+                part = template[index:index + 2]
+                if part[0] == '%' and part[1:] in numbers:
+                    expression.append(numbers[part[1]])
+                    kinds.append(part[1])
+                    index += 2
+                elif part[0] == '%' and part[1:] in constants:
+                    expression.append(constants[part[1]])
+                    index += 2
+                elif part == '%%':
+                    expression.append('%')
+                    index += 2
+                else:
+                    char = template[index]
+                    expression.append(
+                        r'\s*' if char.isspace() else _escape(char))
+                    index += 1
+            amounts = [i for i, kind in enumerate(kinds, 1) if kind != '-']
+            if not amounts:
+                continue
+            signs = (
+                self._localized if kinds[amounts[0] - 1] in 'au' else
+                self._western)
+            sign = kinds.index('-') + 1 if '-' in kinds else 0
+            self._expressions.append((
+                _compile(''.join(expression)).fullmatch,
+                amounts[0],
+                *signs,
+                sign))
+
+    def __call__(self: Self, text: str) -> Decimal:
+        """Parses `text`.
+
+        Args:
+            text (str): Formated currency value.
+
+        Returns:
+            Decimal: value.
+
+        Raises:
+            CurrencyInvalidFormat: If `text` is not a formated value of
+                the currency.
+        """
+        text = text.strip()
+        for match, group, grouping, point, table, sign in self._expressions:
+            matches = match(text)
+            if matches is not None:
+                value = matches[group]
+                if table is None:
+                    value = value.replace(grouping, '').replace(point, '.')
+                else:
+                    value = value.translate(table)
+                amount = Decimal(value)
+                if sign and matches[sign] and not amount.is_signed():
+                    return -amount
+                return amount
+        raise CurrencyInvalidFormat(text)
+
+
+@lru_cache(maxsize=_SPEC_CACHE_SIZE)
+def _parser(spec: CurrencySpec) -> _Parser:
+    """Returns the (cached) compiled parser for `spec`.
+
+    Args:
+        spec (CurrencySpec): Currency specification.
+
+    Returns:
+        _Parser: compiled parser.
+    """
+    return _Parser(spec)
+
+
+class CurrencySpec:
+    """Currency specification.
+
+    Immutable representation of the information of a currency (see
+    `multicurrency.pycurrency.Currency` for the meaning of each field).
+    A single specification is shared by all the currencies with the
+    same information, together with the data derived from it (the
+    `pattern` fields, the minor unit, the digits translation table and
+    the default formatter).
+
+    Args:
+        alpha_code (str, optional): Currency alpha code. Defaults to
+            ''.
+        numeric_code (str, optional): Currency numeric code. Defaults
+            to '0'.
+        symbol (str, optional): Currency symbol. Defaults to ''.
+        localized_symbol (str, optional): Currency localized symbol.
+            Defaults to ''.
+        convertion (str, optional): String with the numbers from 0 to 9
+            followed by the minus ('-') sign. Defaults to ''.
+        pattern (str, optional): Currency format pattern. Defaults to
+            '2.,3%a%s'.
+        context (MoneyContext, optional): Money context of the
+            operations and formatting (see `multicurrency.context`).
+            Defaults to None.
+    """
+
+    __slots__ = (
+        'alpha_code',
+        'numeric_code',
+        'symbol',
+        'localized_symbol',
+        'convertion',
+        'pattern',
+        'context',
+        'decimal_places',
+        'decimal_sign',
+        'grouping_sign',
+        'grouping_places',
+        'minor_unit',
+        'translation',
+        'formatter',
+        '_hash')
+
+    def __new__(  # pylint: disable=too-many-arguments
+            cls: Self,
+            alpha_code: str = '',
+            numeric_code: str = '0',
+            symbol: str = '',
+            localized_symbol: str = '',
+            convertion: str = '',
+            pattern: str = r'2.,3%a%s',
+            context: MoneyContext | None = None) -> Self:
+        """Class creator.
+
+        Returns:
+            CurrencySpec: new opbject.
+
+        Raises:
+            CurrencyInvalidFormat: If `pattern` is not valid.
+        """
+        matches = _PATTERN.match(pattern)
+        if not matches:
+            raise CurrencyInvalidFormat
+        self = object.__new__(cls)
+        for name, value in (
+                ('alpha_code', alpha_code),
+                ('numeric_code', numeric_code),
+                ('symbol', symbol),
+                ('localized_symbol', localized_symbol),
+                ('convertion', convertion),
+                ('pattern', pattern),
+                ('context', context),
+                ('decimal_places', int(matches['decimal_places'])),
+                ('decimal_sign', matches['decimal_sign']),
+                ('grouping_sign', matches['grouping_sign']),
+                ('grouping_places', _grouping_sizes(
+                    matches['grouping_places'])[0]),
+                ('minor_unit', Decimal(
+                    (0, (1,), -int(matches['decimal_places'])))),
+                ('translation', str.maketrans(
+                    dict(zip('0123456789-', convertion)))),
+                ('formatter', _formatter(pattern))):
+            object.__setattr__(self, name, value)
+        object.__setattr__(self, '_hash', hash(self.__reduce__()[1]))
+        return self
+
+    def __delattr__(self: Self, name: str) -> None:
+        """Prevents the removal of attributes.
+
+        Args:
+            name (str): Attribute name.
+
+        Raises:
+            AttributeError: Always.
+        """
+        msg = f'cannot delete attribute {name!r}'
+        raise AttributeError(msg)
+
+    def __eq__(self: Self, other: object) -> bool:
+        """Checks if two specifications are equal.
+
+        Args:
+            other (object): Specification to compare to.
+
+        Returns:
+            bool: True if equal. False otherwise.
+        """
+        if self is other:
+            return True
+        if isinstance(other, CurrencySpec):
+            return self.__reduce__()[1] == other.__reduce__()[1]
+        return NotImplemented
+
+    def __hash__(self: Self) -> int:
+        """Hash representation of this class.
+
+        Returns:
+            int: Hash value.
+        """
+        return self._hash
+
+    def __reduce__(self: Self) -> tuple[object, tuple[object, ...]]:
+        """Returns a `tuple` with this class "reduce value".
+
+        The money context is only included when set.
+
+        Returns:
+            tuple[object, tuple[object, ...]]: pickle representation of
+                this specification.
+        """
+        fields = (
+            self.alpha_code,
+            self.numeric_code,
+            self.symbol,
+            self.localized_symbol,
+            self.convertion,
+            self.pattern)
+        if self.context is None:
+            return (_currency_spec, fields)
+        return (_currency_spec, (*fields, self.context))
+
+    def __repr__(self: Self) -> str:
+        """String representation of this class.
+
+        Returns:
+            str: representation
+        """
+        context = '' if self.context is None else f', context: {self.context}'
+        return (
+            f'{self.__class__.__name__}('
+            f'alpha_code: "{self.alpha_code}", '
+            f'numeric_code: "{self.numeric_code}", '
+            f'symbol: "{self.symbol}", '
+            f'localized_symbol: "{self.localized_symbol}", '
+            f'convertion: "{self.convertion}", '
+            rf'pattern: "{self.pattern}"{context})')
+
+    def __setattr__(self: Self, name: str, value: object) -> None:
+        """Prevents changes to the attributes.
+
+        Args:
+            name (str): Attribute name.
+            value (object): Attribute value.
+
+        Raises:
+            AttributeError: Always.
+        """
+        msg = f'cannot assign to attribute {name!r}'
+        raise AttributeError(msg)
+
+
+@lru_cache(maxsize=_SPEC_CACHE_SIZE)
+def _currency_spec(  # pylint: disable=too-many-arguments
+        alpha_code: str,
+        numeric_code: str,
+        symbol: str,
+        localized_symbol: str,
+        convertion: str,
+        pattern: str,
+        context: MoneyContext | None = None) -> CurrencySpec:
+    """Returns the (shared) specification for the given information.
+
+    Args:
+        alpha_code (str): Currency alpha code.
+        numeric_code (str): Currency numeric code.
+        symbol (str): Currency symbol.
+        localized_symbol (str): Currency localized symbol.
+        convertion (str): String with the numbers from 0 to 9 followed
+            by the minus ('-') sign.
+        pattern (str): Currency format pattern.
+        context (MoneyContext, optional): Money context. Defaults to
+            None.
+
+    Returns:
+        CurrencySpec: currency specification.
+    """
+    return CurrencySpec(
+        alpha_code,
+        numeric_code,
+        symbol,
+        localized_symbol,
+        convertion,
+        pattern,
+        context)
+
+
+def _float_exact(amount: object, spec: CurrencySpec) -> Decimal:
+    """Converts `amount` exactly (the default `Decimal` conversion).
+
+    Args:
+        amount (object): Represented value.
+        spec (CurrencySpec): Currency specification.
+
+    Returns:
+        Decimal: converted amount.
+    """
+    return Decimal(amount)
+
+
+def _float_repr(amount: object, spec: CurrencySpec) -> Decimal:
+    """Converts a `float` `amount` by its shortest (`repr`) digits.
+
+    Args:
+        amount (object): Represented value.
+        spec (CurrencySpec): Currency specification.
+
+    Returns:
+        Decimal: converted amount.
+    """
+    if amount.__class__ is float:
+        return Decimal(repr(amount))
+    return Decimal(amount)
+
+
+def _float_minor(amount: object, spec: CurrencySpec) -> Decimal:
+    """Converts a `float` `amount` to the minor units of `spec`.
+
+    The shortest (`repr`) digits are rounded to the decimal places of
+    the currency (with the rounding of the current context). Values
+    that can not be rounded (e.g.: infinity) are kept.
+
+    Args:
+        amount (object): Represented value.
+        spec (CurrencySpec): Currency specification.
+
+    Returns:
+        Decimal: converted amount.
+    """
+    if amount.__class__ is not float:
+        return Decimal(amount)
+    value = Decimal(repr(amount))
+    places = spec.decimal_places
+    if value.is_finite() and value.adjusted() + places < getcontext().prec:
+        return round(value, places)
+    return value
+
+
+_FLOAT_CONVERTERS = {
+    'exact': _float_exact,
+    'repr': _float_repr,
+    'minor': _float_minor}
+# float converter (None for the exact conversion)
+_float_ingest = None
+_float_mode = 'exact'
+# rounding, and exact `Context.quantize`, of the quantization to the
+# minor units (None when off)
+_rounding = None
+_quantizer = None
+# amount converter of the constructors (None for the exact conversion)
+_ingest = None
+
+
+def _quantize(amount: Decimal, spec: CurrencySpec) -> Decimal:
+    """Rounds `amount` to the minor unit of `spec`.
+
+    Uses the rounding of the quantization policy. Values that can not
+    be rounded (e.g.: infinity) are kept.
+
+    Args:
+        amount (Decimal): Amount.
+        spec (CurrencySpec): Currency specification.
+
+    Returns:
+        Decimal: quantized amount.
+    """
+    try:
+        return _quantizer(amount, spec.minor_unit)
+    except InvalidOperation:
+        return amount
+
+
+def _ingest_quantized(amount: object, spec: CurrencySpec) -> Decimal:
+    """Converts (see `set_float_mode`) and quantizes `amount`.
+
+    Args:
+        amount (object): Represented value.
+        spec (CurrencySpec): Currency specification.
+
+    Returns:
+        Decimal: converted amount.
+    """
+    convert = _float_ingest
+    return _quantize(
+        Decimal(amount) if convert is None else convert(amount, spec),
+        spec)
+
+
+def _float_converter(
+        mode: str) -> Callable[[object, CurrencySpec], Decimal]:
+    """Returns the amount converter of the float `mode`.
+
+    Args:
+        mode (str): Float mode ('exact', 'repr' or 'minor').
+
+    Returns:
+        Callable[[object, CurrencySpec], Decimal]: amount converter.
+
+    Raises:
+        ValueError: If `mode` is not a float mode.
+    """
+    try:
+        return _FLOAT_CONVERTERS[mode]
+    except (KeyError, TypeError):
+        msg = f'float mode must be one of {FLOAT_MODES}, not {mode!r}.'
+        raise ValueError(msg) from None
+
+
+def get_float_mode() -> str:
+    """Returns the (global) float mode of the currency constructors.
+
+    Returns:
+        str: float mode ('exact', 'repr' or 'minor').
+    """
+    return _float_mode
+
+
+def set_float_mode(mode: str) -> str:
+    """Sets the (global) float mode of the currency constructors.
+
+    The float modes are:
+        exact: The `float` is converted exactly (default).
+        repr: The `float` is converted by its shortest (`repr`) digits.
+        minor: The `float` is converted by its shortest (`repr`) digits
+            rounded to the decimal places of the currency.
+
+    Only the `float` amounts are affected.
+
+    Args:
+        mode (str): Float mode ('exact', 'repr' or 'minor').
+
+    Returns:
+        str: previous float mode.
+
+    Raises:
+        ValueError: If `mode` is not a float mode.
+    """
+    global _float_ingest, _ingest  # pylint: disable=global-statement
+    global _float_mode  # pylint: disable=global-statement
+    converter = _float_converter(mode)
+    previous = _float_mode
+    _float_ingest = None if converter is _float_exact else converter
+    _float_mode = mode
+    _ingest = _float_ingest if _quantizer is None else _ingest_quantized
+    return previous
+
+
+def get_quantize_rounding() -> str | None:
+    """Returns the rounding of the (global) quantization policy.
+
+    Returns:
+        str | None: rounding mode. None if the policy is off.
+    """
+    return _rounding
+
+
+def set_quantize_rounding(rounding: str | None) -> str | None:
+    """Sets the rounding of the (global) quantization policy.
+
+    While on, the amount of the currencies is rounded to the minor unit
+    of the currency (`CurrencySpec.minor_unit`), with the `rounding`
+    mode, when the currencies are created and after every operation.
+    The policy is off by default (the amounts are never rounded).
+
+    Args:
+        rounding (str | None): Rounding mode (e.g.: 'ROUND_HALF_EVEN').
+            None to turn the policy off.
+
+    Returns:
+        str | None: previous rounding mode.
+
+    Raises:
+        ValueError: If `rounding` is not a rounding mode.
+    """
+    global _rounding, _quantizer  # pylint: disable=global-statement
+    global _ingest  # pylint: disable=global-statement
+    if rounding is not None and rounding not in ROUNDINGS:
+        msg = f'rounding must be one of {ROUNDINGS}, not {rounding!r}.'
+        raise ValueError(msg)
+    previous = _rounding
+    _rounding = rounding
+    if rounding is None:
+        _quantizer = None
+        _ingest = _float_ingest
+    else:
+        _quantizer = Context(
+            prec=MAX_PREC,
+            rounding=rounding,
+            Emax=MAX_EMAX,
+            Emin=MIN_EMIN).quantize
+        _ingest = _ingest_quantized
+    return previous
+
+
+def _weights(ratios: Iterable[object]) -> list[int]:
+    """Returns `ratios` as integer weights (on a common scale).
+
+    Args:
+        ratios (Iterable[object]): Ratios.
+
+    Returns:
+        list[int]: weights.
+
+    Raises:
+        CurrencyInvalidDivision: If a ratio not of types `int`, `float`
+            or `Decimal`.
+        ValueError: If there are no ratios, a ratio is negative (or not
+            finite) or if all the ratios are zero.
+    """
+    fractions = []
+    for ratio in ratios:
+        if isinstance(ratio, int):
+            fractions.append((ratio, 1))
+        elif isinstance(ratio, (float, Decimal)):
+            try:
+                fractions.append(Decimal(ratio).as_integer_ratio())
+            except (OverflowError, ValueError):
+                msg = f'ratios must be finite, not {ratio!r}.'
+                raise ValueError(msg) from None
+        else:
+            raise CurrencyInvalidDivision
+    denominator = lcm(*(d for _, d in fractions))
+    weights = [n * (denominator // d) for n, d in fractions]
+    if not weights or min(weights) < 0 or not any(weights):
+        msg = 'ratios must be non negative with a positive sum.'
+        raise ValueError(msg)
+    return weights
+
+
+def _allocate(units: int, weights: list[int], total: int) -> list[int]:
+    """Distributes `units` by `weights` (largest remainder method).
+
+    Each part gets the (truncated) share of its weight and the units
+    left go, one each, to the parts with the largest remainders (the
+    first ones on ties). The parts add up to `units`.
+
+    Args:
+        units (int): Number of minor units.
+        weights (list[int]): Weights (non negative).
+        total (int): Sum of the weights (positive).
+
+    Returns:
+        list[int]: numbers of minor units (one per weight).
+    """
+    size = abs(units)
+    parts = []
+    remainders = []
+    for weight in weights:
+        quotient, remainder = divmod(size * weight, total)
+        parts.append(quotient)
+        remainders.append(remainder)
+    left = size - sum(parts)
+    if left:
+        for index in nlargest(
+                left, range(len(parts)), key=remainders.__getitem__):
+            parts[index] += 1
+    if units < 0:
+        return [-part for part in parts]
+    return parts
+
+
 class Currency:
     """Currency representation.
 
@@ -319,7 +1314,9 @@ class Currency:
             character).
         [gp] (int+): The number of digits to group the number by
             (integer number with one or more digits). Must be grater
-            or equal to 0 (zero).
+            or equal to 0 (zero). Several sizes can be set, separated
+            by `;`, starting from the decimal sign (e.g.: '3;2'). The
+            last one is repeated.
         [format] (str): The formatting pattern (a string with the
             order of the currency parts).
 
@@ -357,7 +1354,14 @@ class Currency:
 
     __slots__ = (
         '_amount',
-        '_info')
+        '_hash',
+        '_spec')
+
+    # default specification (of the generated currency classes)
+    _default: CurrencySpec | None = None
+    # types that operate with any currency (the operations with them,
+    # that would be rejected, are deferred to their reflected methods)
+    _interoperable: bool = False
 
     def __new__(
             cls: Self,
@@ -377,23 +1381,17 @@ class Currency:
             CurrencyInvalidFormat: If `pattern` is not valid.
         """
         self = object.__new__(cls)
-        self._amount = Decimal(amount)
-        regxpr = (
-            r'^(?P<decimal_places>\d+)'
-            r'(?P<decimal_sign>[^\d%])'
-            r'(?P<grouping_sign>[^\d%])'
-            r'(?P<grouping_places>\d+)'
-            r'(?P<format>.+)$')
-        if _match(regxpr, pattern):
-            self._info = (
-                alpha_code,
-                numeric_code,
-                symbol,
-                localized_symbol,
-                convertion,
-                pattern)
-        else:
-            raise CurrencyInvalidFormat
+        self._hash = None
+        self._spec = _currency_spec(
+            alpha_code,
+            numeric_code,
+            symbol,
+            localized_symbol,
+            convertion,
+            pattern)
+        self._amount = (
+            Decimal(amount) if _ingest is None else
+            _ingest(amount, self._spec))
         return self
 
     def __abs__(self: Self) -> Self:
@@ -402,7 +1400,11 @@ class Currency:
         Returns:
             Currency: absolute value.
         """
-        return self.__recreate__(abs(self._amount))
+        context = self._spec.context or _current_context()
+        if context is None:
+            return self._recreate(abs(self._amount))
+        return self._recreate(
+            context.decimal_context.abs(self._amount))
 
     def __add__(self: Self, other: object) -> Self:
         """Adds `other` to this.
@@ -421,9 +1423,13 @@ class Currency:
         """
         if not isinstance(other, Currency):
             raise CurrencyTypeException
-        if self._info[0] != other.alpha_code:
+        if self._spec.alpha_code != other._spec.alpha_code:
             raise CurrencyMismatchException
-        return self.__recreate__(self._amount + other.amount)
+        context = self._spec.context or _current_context()
+        if context is None:
+            return self._recreate(self._amount + other._amount)
+        return self._recreate(
+            context.decimal_context.add(self._amount, other._amount))
 
     def __bool__(self: Self) -> bool:
         """Standard truth testing for this class.
@@ -439,7 +1445,7 @@ class Currency:
         Returns:
             Currency: result of the ceiling operation.
         """
-        return self.__recreate__(self._amount.__ceil__())
+        return self._recreate(Decimal(self._amount.__ceil__()))
 
     def __copy__(self: Self) -> Self:
         """Returns a copy of self.
@@ -447,7 +1453,7 @@ class Currency:
         Returns:
             Currency: copy of this.
         """
-        return self.__recreate__(self._amount)
+        return self._recreate(self._amount)
 
     def __divmod__(self: Self, other: float | Decimal) -> tuple[Self, Self]:
         """Returns the quocient and remaider of the division.
@@ -467,10 +1473,15 @@ class Currency:
             raise CurrencyInvalidDivision
         if other == 0:
             raise ZeroDivisionError
-        quotient, remainder = self._amount.__divmod__(Decimal(other))
+        context = self._spec.context or _current_context()
+        if context is None:
+            quotient, remainder = self._amount.__divmod__(Decimal(other))
+        else:
+            quotient, remainder = context.decimal_context.divmod(
+                self._amount, Decimal(other))
         return (
-            self.__recreate__(quotient),
-            self.__recreate__(remainder))
+            self._recreate(quotient),
+            self._recreate(remainder))
 
     def __eq__(self: Self, other: object) -> bool:
         """Checks if two currencies are equal.
@@ -481,10 +1492,16 @@ class Currency:
         Returns:
             bool: True if equal. False otherwise.
         """
-        if isinstance(other, self.__class__):
+        if other.__class__ is self.__class__ or isinstance(
+                other, self.__class__):
+            amount = self._amount
+            other_amount = other._amount
+            spec = self._spec
+            other_spec = other._spec
             return (
-                (self._amount, self._info[0]) ==
-                (other.amount, other.alpha_code))
+                (amount is other_amount or amount == other_amount) and
+                (spec is other_spec or
+                 spec.alpha_code == other_spec.alpha_code))
         return False
 
     def __float__(self: Self) -> float:
@@ -501,7 +1518,7 @@ class Currency:
         Returns:
             Currency: result of the flooring operation.
         """
-        return self.__recreate__(self._amount.__floor__())
+        return self._recreate(Decimal(self._amount.__floor__()))
 
     def __floordiv__(self: Self, other: float | Decimal) -> Self:
         """Returns the integral part of the quotient of the division.
@@ -521,8 +1538,11 @@ class Currency:
             raise CurrencyInvalidDivision
         if other == 0:
             raise ZeroDivisionError
-        return self.__recreate__(
-            self._amount.__floordiv__(Decimal(other)))
+        context = self._spec.context or _current_context()
+        if context is None:
+            return self._recreate(self._amount.__floordiv__(Decimal(other)))
+        return self._recreate(
+            context.decimal_context.divide_int(self._amount, Decimal(other)))
 
     def __format__(self: Self, fmt: str = '') -> str:
         """Returns the currency value formated as specified.
@@ -575,50 +1595,7 @@ class Currency:
         if not isinstance(fmt, str):
             msg = f'must be str, not {type(fmt).__qualname__}.'
             raise TypeError(msg)
-        regxpr = (
-            r'^(?P<decimal_places>\d+)?'
-            r'(?P<decimal_sign>[^\d%])?'
-            r'(?P<grouping_sign>[^\d%])?'
-            r'(?P<grouping_places>\d+)?'
-            r'(?P<format>.+)?$')
-        values = _match(regxpr, self._info[5]).groupdict()
-        matches = _match(regxpr, fmt.strip())
-        new_values = {k: v for k, v in matches.groupdict().items() if v}
-        values = {**values, **new_values}
-        decimal_places = int(values['decimal_places'])
-        decimal_sign = values['decimal_sign']
-        grouping_sign = values['grouping_sign']
-        grouping_places = int(values['grouping_places'])
-        currency_format = values['format']
-        parts = f'{round(self._amount, decimal_places):f}'.split('.')
-        parts[0] = _sub(
-            rf'(\d)(?=(\d{{{grouping_places or -1}}})+$)',
-            r'\1,',
-            parts[0])
-        amount = '.'.join(parts)
-        converted = amount
-        if self._info[4]:
-            translator = dict(zip('0123456789-', self._info[4]))
-            converted = ''.join([translator.get(c, c) for c in converted])
-        converted = converted.replace('.', 'X').replace(
-            ',', grouping_sign).replace('X', decimal_sign)
-        amount_unsign = amount.lstrip('-')
-        converted_unsign = converted.lstrip('-')
-        rep = {
-            '%s': self._info[2],
-            '%S': self._info[3],
-            '%c': self._info[0],
-            '%a': converted,
-            '%A': amount,
-            '%u': converted_unsign,
-            '%U': amount_unsign,
-            '%-': '-' * self._amount.is_signed(),
-            '%%': '%'}
-        rep = {_escape(k): v for k, v in rep.items()}
-        pattern = _compile('|'.join(rep.keys()))
-        return pattern.sub(
-            lambda m: rep[_escape(m.group(0))],
-            currency_format)
+        return _formatter(self._spec.pattern, fmt)(self._amount, self._spec)
 
     def __ge__(self: Self, other: object) -> bool:
         """Checks if self is greater or equal than `other`.
@@ -637,8 +1614,10 @@ class Currency:
                 differente from `alpha_code`.
         """
         if not isinstance(other, self.__class__):
+            if getattr(other, '_interoperable', False):
+                return NotImplemented
             raise CurrencyTypeException
-        if self._info[0] != other.alpha_code:
+        if self._spec.alpha_code != other.alpha_code:
             raise CurrencyMismatchException
         return self._amount >= other.amount
 
@@ -658,22 +1637,29 @@ class Currency:
                 differente from `alpha_code`.
         """
         if not isinstance(other, self.__class__):
+            if getattr(other, '_interoperable', False):
+                return NotImplemented
             raise CurrencyTypeException
-        if self._info[0] != other.alpha_code:
+        if self._spec.alpha_code != other.alpha_code:
             raise CurrencyMismatchException
         return self._amount > other.amount
 
     def __hash__(self: Self) -> int:
         """Hash representation of this class.
 
+        The hash is computed once (currencies are immutable).
+
         Returns:
             int: Hash value.
         """
-        return hash((
-            self.__class__,
-            self._amount,
-            self._info[0],
-            self._info[1]))
+        value = self._hash
+        if value is None:
+            value = self._hash = hash((
+                self.__class__,
+                self._amount,
+                self._spec.alpha_code,
+                self._spec.numeric_code))
+        return value
 
     def __int__(self: Self) -> int:
         """Integer representation.
@@ -700,8 +1686,10 @@ class Currency:
                 differente from `alpha_code`.
         """
         if not isinstance(other, self.__class__):
+            if getattr(other, '_interoperable', False):
+                return NotImplemented
             raise CurrencyTypeException
-        if self._info[0] != other.alpha_code:
+        if self._spec.alpha_code != other.alpha_code:
             raise CurrencyMismatchException
         return self._amount <= other.amount
 
@@ -721,8 +1709,10 @@ class Currency:
                 differente from `alpha_code`.
         """
         if not isinstance(other, self.__class__):
+            if getattr(other, '_interoperable', False):
+                return NotImplemented
             raise CurrencyTypeException
-        if self._info[0] != other.alpha_code:
+        if self._spec.alpha_code != other.alpha_code:
             raise CurrencyMismatchException
         return self._amount < other.amount
 
@@ -744,7 +1734,11 @@ class Currency:
             raise CurrencyInvalidDivision
         if other == 0:
             raise ZeroDivisionError
-        return self.__recreate__(self._amount.__mod__(Decimal(other)))
+        context = self._spec.context or _current_context()
+        if context is None:
+            return self._recreate(self._amount.__mod__(Decimal(other)))
+        return self._recreate(
+            context.decimal_context.remainder(self._amount, Decimal(other)))
 
     def __mul__(self: Self, other: float | Decimal) -> Self:
         """Returns the multiplication by `other`.
@@ -761,7 +1755,11 @@ class Currency:
         """
         if not isinstance(other, (int, float, Decimal)):
             raise CurrencyInvalidMultiplication
-        return self.__recreate__(self._amount.__mul__(Decimal(other)))
+        context = self._spec.context or _current_context()
+        if context is None:
+            return self._recreate(self._amount.__mul__(Decimal(other)))
+        return self._recreate(
+            context.decimal_context.multiply(self._amount, Decimal(other)))
 
     def __ne__(self: Self, other: object) -> bool:
         """Checks if two currencies are different.
@@ -780,7 +1778,11 @@ class Currency:
         Returns:
             Currency: Currency with the sign switched.
         """
-        return self.__recreate__(self._amount.__neg__())
+        context = self._spec.context or _current_context()
+        if context is None:
+            return self._recreate(self._amount.__neg__())
+        return self._recreate(
+            context.decimal_context.minus(self._amount))
 
     def __pos__(self: Self) -> Self:
         """Returns a copy of self.
@@ -788,7 +1790,11 @@ class Currency:
         Returns:
             Currency: copy of this.
         """
-        return self.__recreate__(self._amount.__pos__())
+        context = self._spec.context or _current_context()
+        if context is None:
+            return self._recreate(self._amount.__pos__())
+        return self._recreate(
+            context.decimal_context.plus(self._amount))
 
     def __recreate__(
             self: Self,
@@ -801,16 +1807,23 @@ class Currency:
         Returns:
             Currency: new opbject.
         """
-        return self.__class__(amount, *self._info)
+        if _float_ingest is None:
+            return self._recreate(Decimal(amount))
+        return self._recreate(_float_ingest(amount, self._spec))
 
-    def __reduce__(self: Self) -> tuple[type, tuple[object, ...]]:
+    def __reduce__(self: Self) -> tuple[object, tuple[object, ...]]:
         """Returns a `tuple` with this class "reduce value".
 
+        Currencies with the default specification of their (generated)
+        class are recreated with just the class and the amount.
+
         Returns:
-            tuple[type, tuple[object, ...]]: pickle representation of
+            tuple[object, tuple[object, ...]]: pickle representation of
                 this currency.
         """
-        return (self.__class__, (self._amount, *self._info))
+        if self._spec is self._default:
+            return (self.__class__, (str(self._amount),))
+        return (self.__class__._from_spec, (self._amount, self._spec))
 
     def __repr__(self: Self) -> str:
         """String representation of this class.
@@ -821,12 +1834,12 @@ class Currency:
         return (
             f'{self.__class__.__name__}('
             f'amount: {self._amount}, '
-            f'alpha_code: "{self._info[0]}", '
-            f'numeric_code: "{self._info[1]}", '
-            f'symbol: "{self._info[2]}", '
-            f'localized_symbol: "{self._info[3]}", '
-            f'convertion: "{self._info[4]}", '
-            rf'pattern: "{self._info[5]}")')
+            f'alpha_code: "{self._spec.alpha_code}", '
+            f'numeric_code: "{self._spec.numeric_code}", '
+            f'symbol: "{self._spec.symbol}", '
+            f'localized_symbol: "{self._spec.localized_symbol}", '
+            f'convertion: "{self._spec.convertion}", '
+            rf'pattern: "{self._spec.pattern}")')
 
     def __round__(self: Self, precision: int | None = None) -> Self:
         """Round to the nearest integer, or to a given precision.
@@ -837,9 +1850,13 @@ class Currency:
         Returns:
             Currency: rounded currency value.
         """
-        return self.__recreate__(
-            self._amount.__round__(precision) if precision
-                else self._amount.__round__())
+        if not precision:
+            return self._recreate(Decimal(self._amount.__round__()))
+        context = self._spec.context or _current_context()
+        if context is None:
+            return self._recreate(self._amount.__round__(precision))
+        return self._recreate(context.decimal_context.quantize(
+            self._amount, Decimal((0, (1,), -precision))))
 
     def __rsub__(self: Self, other: object) -> Self:
         """Subtract this from `other`.
@@ -858,9 +1875,13 @@ class Currency:
         """
         if not isinstance(other, self.__class__):
             raise CurrencyTypeException
-        if self._info[0] != other.alpha_code:
+        if self._spec.alpha_code != other._spec.alpha_code:
             raise CurrencyMismatchException
-        return self.__recreate__(other.amount - self._amount)
+        context = self._spec.context or _current_context()
+        if context is None:
+            return self._recreate(other._amount - self._amount)
+        return self._recreate(
+            context.decimal_context.subtract(other._amount, self._amount))
 
     def __str__(self: Self) -> str:
         """String value of this class.
@@ -868,7 +1889,7 @@ class Currency:
         Returns:
             str: value
         """
-        return self.__format__()
+        return self._spec.formatter(self._amount, self._spec)
 
     def __sub__(self: Self, other: object) -> Self:
         """Subtract `other` from this.
@@ -886,10 +1907,16 @@ class Currency:
                 differente from `alpha_code`.
         """
         if not isinstance(other, self.__class__):
+            if getattr(other, '_interoperable', False):
+                return NotImplemented
             raise CurrencyTypeException
-        if self._info[0] != other.alpha_code:
+        if self._spec.alpha_code != other._spec.alpha_code:
             raise CurrencyMismatchException
-        return self.__recreate__(self._amount - other.amount)
+        context = self._spec.context or _current_context()
+        if context is None:
+            return self._recreate(self._amount - other._amount)
+        return self._recreate(
+            context.decimal_context.subtract(self._amount, other._amount))
 
     def __truediv__(self: Self, other: float | Decimal) -> Self:
         """Divide this currency by `other`.
@@ -909,12 +1936,213 @@ class Currency:
             raise CurrencyInvalidDivision(self, other)
         if other == 0:
             raise ZeroDivisionError
-        return self.__recreate__(
-            self._amount.__truediv__(Decimal(other)))
+        context = self._spec.context or _current_context()
+        if context is None:
+            return self._recreate(self._amount.__truediv__(Decimal(other)))
+        return self._recreate(
+            context.decimal_context.divide(self._amount, Decimal(other)))
 
     __deepcopy__: Self = __copy__
     __rmul__: Self = __mul__
 
+    @classmethod
+    def _from_units(
+            cls: type[Self],
+            units: int,
+            spec: CurrencySpec) -> Self:
+        """Creates a currency from a number of minor units and `spec`.
+
+        Args:
+            units (int): Number of minor units.
+            spec (CurrencySpec): Currency specification.
+
+        Returns:
+            Currency: new object.
+        """
+        return cls._from_spec(
+            Decimal(units).scaleb(-spec.decimal_places, _EXACT), spec)
+
+    @classmethod
+    def _from_spec(
+            cls: type[Self],
+            amount: Decimal,
+            spec: CurrencySpec) -> Self:
+        """Creates a currency from a (trusted) `amount` and `spec`.
+
+        Skips `__new__` (and the validation of the `pattern`).
+
+        Args:
+            amount (Decimal): Represented value.
+            spec (CurrencySpec): Currency specification.
+
+        Returns:
+            Currency: new opbject.
+        """
+        currency = object.__new__(cls)
+        currency._amount = (
+            amount if _quantizer is None else _quantize(amount, spec))
+        currency._hash = None
+        currency._spec = spec
+        return currency
+
+    def _minor_units(self: Self) -> int:
+        """Returns the amount in minor units (rounded half to even).
+
+        Returns:
+            int: number of minor units.
+        """
+        return int(self._amount.scaleb(
+            self._spec.decimal_places, _EXACT).to_integral_value(
+            ROUND_HALF_EVEN, _EXACT))
+
+    def _recreate(self: Self, amount: Decimal) -> Self:
+        """Recreates self with a different (trusted) `amount`.
+
+        This is the construction path used by the operations. It skips
+        `__new__` (and the validation of the `pattern`) reusing the
+        specification of this currency.
+
+        Args:
+            amount (Decimal): Represented value.
+
+        Returns:
+            Currency: new opbject.
+        """
+        currency = object.__new__(self.__class__)
+        currency._amount = (
+            amount if _quantizer is None else _quantize(amount, self._spec))
+        currency._hash = None
+        currency._spec = self._spec
+        return currency
+
+    def allocate(
+            self: Self,
+            ratios: Iterable[float | Decimal]) -> list[Self]:
+        """Splits this by `ratios` without losing minor units.
+
+        The amount, rounded (half to even) to the minor units of the
+        currency, is distributed by the largest remainder method: each
+        part gets its (truncated) share and the units left go, one
+        each, to the parts with the largest remainders (the first ones
+        on ties). The parts add up to the (rounded) amount.
+
+            >>> from multicurrency import Euro
+            >>> [str(part) for part in Euro(100).allocate([1, 1, 1])]
+            ['33,34\xa0€', '33,33\xa0€', '33,33\xa0€']
+
+        Args:
+            ratios (Iterable[int | float | Decimal]): Ratios (non
+                negative with a positive sum).
+
+        Returns:
+            list[Currency]: parts (one per ratio).
+
+        Raises:
+            CurrencyInvalidDivision: If a ratio not of types `int`,
+                `float` or `Decimal`.
+            ValueError: If there are no ratios, a ratio is negative (or
+                not finite) or if all the ratios are zero.
+        """
+        weights = _weights(ratios)
+        spec = self._spec
+        return [
+            self._from_units(units, spec) for units in _allocate(
+                self._minor_units(), weights, sum(weights))]
+
+    @classmethod
+    def format_many(
+            cls: type[Self],
+            amounts: Iterable[float | Decimal | str],
+            fmt: str = '',
+            **kwargs: str) -> Iterator[str]:
+        """Formats several amounts of this currency.
+
+        The formating specifications are resolved only once. Each
+        string is the same as the one returned by `format(cls(amount,
+        **kwargs), fmt)`.
+
+        Args:
+            amounts (Iterable[float | Decimal | str]): Values to format.
+            fmt (str): formating specifications. See `__format__`.
+            **kwargs (str): Currency parameters (e.g.: `alpha_code`,
+                `pattern`, ...).
+
+        Returns:
+            Iterator[str]: Formated currency values.
+
+        Raises:
+            TypeError: If `fmt` not of type `str`.
+        """
+        if not isinstance(fmt, str):
+            msg = f'must be str, not {type(fmt).__qualname__}.'
+            raise TypeError(msg)
+        spec = cls(0, **kwargs)._spec
+        convert = _ingest
+        return _formatter(spec.pattern, fmt).many(
+            map(Decimal, amounts) if convert is None else
+            (convert(amount, spec) for amount in amounts),
+            spec)
+
+    @classmethod
+    def from_float(
+            cls: type[Self],
+            amount: float,
+            mode: str = 'repr',
+            **kwargs: str) -> Self:
+        """Creates a currency from a `float` with the given float mode.
+
+        The float `mode` is used instead of the global one (see
+        `set_float_mode`).
+
+        Args:
+            amount (float): Represented value.
+            mode (str, optional): Float mode ('exact', 'repr' or
+                'minor'). Defaults to 'repr'.
+            **kwargs (str): Currency parameters (e.g.: `alpha_code`,
+                `pattern`, ...).
+
+        Returns:
+            Currency: new object.
+
+        Raises:
+            ValueError: If `mode` is not a float mode.
+        """
+        converter = _float_converter(mode)
+        spec = cls(0, **kwargs)._spec
+        return cls._from_spec(converter(amount, spec), spec)
+
+    def _sum(self: Self, currencies: Iterable[object]) -> Self:
+        """Adds `currencies` to this in a single pass.
+
+        Args:
+            currencies (Iterable[object]): Currencies to add.
+
+        Returns:
+            Currency: result of the adding operation.
+
+        Raises:
+            CurrencyTypeException: If an element not instance of
+                'Currency'.
+            CurrencyMismatchException: If the `alpha_code` of an
+                element is differente from `alpha_code`.
+        """
+        spec = self._spec
+        alpha_code = spec.alpha_code
+        context = spec.context or _current_context()
+        add = None if context is None else context.decimal_context.add
+        total = self._amount
+        for currency in currencies:
+            if not isinstance(currency, Currency):
+                raise CurrencyTypeException
+            other = currency._spec
+            if other is not spec and other.alpha_code != alpha_code:
+                raise CurrencyMismatchException
+            if add is None:
+                total += currency._amount
+            else:
+                total = add(total, currency._amount)
+        return self._recreate(total)
+
     def international(self: Self, precision: int | None = None) -> str:
         """String value of this class formated with the alpha code.
 
@@ -927,20 +2155,10 @@ class Currency:
             str: value
         """
         if precision is None:
-            regxpr = (
-                r'^(?P<decimal_places>\d+)?'
-                r'(?P<decimal_sign>[^\d%])?'
-                r'(?P<grouping_sign>[^\d%])?'
-                r'(?P<grouping_places>\d+)?'
-                r'(?P<format>.+)?$')
-            values = _match(regxpr, self._info[5]).groupdict()
-            decimal_places = int(values['decimal_places'])
+            fmt = '.,3%A\u00A0%c'
         else:
-            decimal_places = max(precision, 0)
-        parts = f'{round(self._amount, decimal_places):f}'.split('.')
-        parts[0] = _sub(r'(\d)(?=(\d{3})+$)', r'\1,', parts[0])
-        amount = '.'.join(parts)
-        return f'{amount} {self._info[0]}'
+            fmt = f'{max(precision, 0)}.,3%A\u00A0%c'
+        return _formatter(self._spec.pattern, fmt)(self._amount, self._spec)
 
     def is_signed(self: Self) -> bool:
         """Check if the value is preceded with the minus sign.
@@ -961,11 +2179,97 @@ class Currency:
         Returns:
             str: value
         """
-        fmt = self._info[5]
+        fmt = self._spec.pattern
         if precision is not None:
             precision = max(precision, 0)
-            fmt = _sub(r'^\d+', f'{precision}', fmt)
-        return format(self, fmt.replace('%s', '%S'))
+            fmt = _LEADING_DIGITS.sub(f'{precision}', fmt)
+        fmt = fmt.replace('%s', '%S')
+        return _formatter(self._spec.pattern, fmt)(self._amount, self._spec)
+
+    @classmethod
+    def parse(cls: type[Self], text: str, **kwargs: str) -> Self:
+        """Creates a currency from a formated value.
+
+        Inverts the default formating (`str`), the localized one
+        (`localized`) and the international one (`international`) of
+        the currency. The conversion of the digits, the decimal and
+        grouping signs and the symbols are the ones of the currency.
+
+        Args:
+            text (str): Formated currency value.
+            **kwargs (str): Currency parameters (e.g.: `alpha_code`,
+                `pattern`, ...).
+
+        Returns:
+            Currency: new object.
+
+        Raises:
+            CurrencyInvalidFormat: If `text` is not a formated value of
+                the currency.
+            TypeError: If `text` not of type `str`.
+        """
+        if not isinstance(text, str):
+            msg = f'must be str, not {type(text).__qualname__}.'
+            raise TypeError(msg)
+        spec = cls(0, **kwargs)._spec
+        return cls._from_spec(_parser(spec)(text), spec)
+
+    @classmethod
+    def parse_many(
+            cls: type[Self],
+            texts: Iterable[str],
+            **kwargs: str) -> Iterator[Self]:
+        """Creates currencies from formated values.
+
+        The parser is resolved only once. See `parse`.
+
+        Args:
+            texts (Iterable[str]): Formated currency values.
+            **kwargs (str): Currency parameters (e.g.: `alpha_code`,
+                `pattern`, ...).
+
+        Yields:
+            Currency: new object.
+
+        Raises:
+            CurrencyInvalidFormat: If a text is not a formated value of
+                the currency.
+        """
+        spec = cls(0, **kwargs)._spec
+        parser = _parser(spec)
+        create = cls._from_spec
+        for text in texts:
+            yield create(parser(text), spec)
+
+    def split(self: Self, parts: int) -> list[Self]:
+        """Splits this into `parts` (as even as possible) parts.
+
+        The same as `allocate([1] * parts)`: the first parts get the
+        minor units left.
+
+        Args:
+            parts (int): Number of parts (positive).
+
+        Returns:
+            list[Currency]: parts.
+
+        Raises:
+            CurrencyInvalidDivision: If `parts` not of type `int`.
+            ValueError: If `parts` is not positive.
+        """
+        if not isinstance(parts, int):
+            raise CurrencyInvalidDivision
+        if parts < 1:
+            msg = f'parts must be positive, not {parts}.'
+            raise ValueError(msg)
+        units = self._minor_units()
+        quotient, left = divmod(abs(units), parts)
+        if units < 0:
+            quotient, left = -quotient, -left
+        spec = self._spec
+        bigger = self._from_units(quotient + (left > 0) - (left < 0), spec)
+        smaller = self._from_units(quotient, spec)
+        return [bigger] * abs(left) + [smaller] * (parts - abs(left))
 
     def precision(self: Self, precision: int | None = None) -> str:
         """String value of this class formated with `precision`.
@@ -978,10 +2282,76 @@ class Currency:
         Returns:
             str: value
         """
-        if precision is not None:
-            precision = max(precision, 0)
-            return format(self, f'{precision}')
-        return format(self)
+        fmt = '' if precision is None else f'{max(precision, 0)}'
+        return _formatter(self._spec.pattern, fmt)(self._amount, self._spec)
+
+    @classmethod
+    def sum(
+            cls: type[Self],
+            currencies: Iterable[Currency],
+            *,
+            start: Currency | None = None) -> Currency:
+        """Adds the `currencies` in a single pass.
+
+        Gives the same result as `sum(currencies, start)` without
+        creating the intermediate currencies. The type, and
+        specification, of the result are the ones of `start` (or of the
+        first currency). `currencies` can be a generator and is consumed
+        only once.
+
+        Args:
+            currencies (Iterable[Currency]): Currencies to add.
+            start (Currency, optional): Initial value. Defaults to the
+                first currency.
+
+        Returns:
+            Currency: result of the adding operation. Zero, of this
+                type, if there is nothing to add.
+
+        Raises:
+            CurrencyTypeException: If an element not instance of
+                'Currency'.
+            CurrencyMismatchException: If the elements do not have the
+                same alpha code (the one of this class, for the currency
+                classes, e.g.: `Euro`).
+        """
+        iterator = iter(currencies)
+        if start is None:
+            start = next(iterator, None)
+            if start is None:
+                return cls(0)
+        if not isinstance(start, Currency):
+            raise CurrencyTypeException
+        default = cls._default
+        if (default is not None and
+                start._spec.alpha_code != default.alpha_code):
+            raise CurrencyMismatchException
+        return start._sum(iterator)  # pylint: disable=protected-access
+
+    def with_context(self: Self, context: MoneyContext | None) -> Self:
+        """Returns a copy of this with the money `context`.
+
+        The money context is kept by the results of the operations (see
+        `multicurrency.context`).
+
+        Args:
+            context (MoneyContext | None): Money context. None for no
+                money context.
+
+        Returns:
+            Currency: new object.
+
+        Raises:
+            TypeError: If `context` not of type `MoneyContext`.
+        """
+        if context is not None and not isinstance(context, MoneyContext):
+            msg = f'must be MoneyContext, not {type(context).__qualname__}.'
+            raise TypeError(msg)
+        fields = self._spec.__reduce__()[1][:6]
+        if context is None:
+            return self._from_spec(self._amount, _currency_spec(*fields))
+        return self._from_spec(
+            self._amount, _currency_spec(*fields, context))
 
     @property
     def amount(self: Self) -> Decimal:
@@ -991,29 +2361,109 @@ class Currency:
     @property
     def alpha_code(self: Self) -> str:
         """str: alpha_code."""
-        return self._info[0]
+        return self._spec.alpha_code
 
     @property
     def numeric_code(self: Self) -> str:
         """int: numeric_code."""
-        return self._info[1]
+        return self._spec.numeric_code
 
     @property
     def symbol(self: Self) -> str:
         """str: symbol."""
-        return self._info[2]
+        return self._spec.symbol
 
     @property
     def localized_symbol(self: Self) -> str:
         """str: localized_symbol."""
-        return self._info[3]
+        return self._spec.localized_symbol
 
     @property
     def convertion(self: Self) -> str:
         """str: convertion."""
-        return self._info[4]
+        return self._spec.convertion
 
     @property
     def pattern(self: Self) -> str:
         """str: pattern."""
-        return self._info[5]
+        return self._spec.pattern
+
+    @property
+    def spec(self: Self) -> CurrencySpec:
+        """CurrencySpec: specification."""
+        return self._spec
+
+
+_CURRENCY_DOC = """{description} currency representation.
+
+    Simple usage example:
+
+        >>> from multicurrency import {name}
+        >>> {variable} = {name}(
+        ...     amount='123456.789')
+        >>> print({variable})
+        {example}
+
+    For more details see `multicurrency.pycurrency.Currency`.
+
+    Args:
+        amount (str | int | float | Decimal): Represented value.
+        pattern (str, optional): Currency format pattern. Defaults to
+            '{pattern}'.
+    """
+
+
+def _currency_class(
+        name: str,
+        module: str,
+        description: str,
+        info: tuple[str, str, str, str, str, str]) -> type[Currency]:
+    """Creates the `name` currency (a `Currency` subclass).
+
+    The currency constructor only takes the `amount` and the `pattern`
+    and shares the specification of the currency default `pattern`.
+
+    Args:
+        name (str): Currency (class) name.
+        module (str): Currency module name.
+        description (str): Currency description.
+        info (tuple[str, str, str, str, str, str]): Currency alpha
+            code, numeric code, symbol, localized symbol, convertion
+            and default pattern.
+
+    Returns:
+        type[Currency]: currency class.
+    """
+    default = _currency_spec(*info)
+
+    def __new__(  # noqa: N807
+            cls: type[Currency],
+            amount: str | float | Decimal,
+            pattern: str = default.pattern) -> Currency:
+        """Class creator.
+
+        Returns:
+            Currency: new currency object.
+        """
+        self = object.__new__(cls)
+        self._hash = None  # pylint: disable=protected-access
+        self._spec = spec = (  # pylint: disable=protected-access
+            default if pattern == default.pattern else
+            _currency_spec(*info[:5], pattern))
+        self._amount = (  # pylint: disable=protected-access
+            Decimal(amount) if _ingest is None else _ingest(amount, spec))
+        return self
+
+    __new__.__qualname__ = f'{name}.__new__'
+    currency = type(name, (Currency,), {
+        '__module__': module,
+        '__new__': __new__,
+        '__slots__': (),
+        '_default': default})
+    currency.__doc__ = _CURRENCY_DOC.format(
+        description=description,
+        name=name,
+        variable=name.lower(),
+        example=currency('123456.789'),
+        pattern=default.pattern)
+    return currency
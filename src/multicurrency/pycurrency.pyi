@@ -1,5 +1,38 @@
+from collections.abc import Callable, Iterable, Iterator
 from decimal import Decimal
 from typing import Self
+from multicurrency.context import MoneyContext
+
+FLOAT_MODES: tuple[str, ...]
+ROUNDINGS: tuple[str, ...]
+
+def get_float_mode() -> str: ...
+def set_float_mode(mode: str) -> str: ...
+def get_quantize_rounding() -> str | None: ...
+def set_quantize_rounding(rounding: str | None) -> str | None: ...
+
+class CurrencySpec:
+    alpha_code: str
+    numeric_code: str
+    symbol: str
+    localized_symbol: str
+    convertion: str
+    pattern: str
+    context: MoneyContext | None
+    decimal_places: int
+    decimal_sign: str
+    grouping_sign: str
+    grouping_places: int
+    minor_unit: Decimal
+    translation: dict[int, str]
+    formatter: Callable[[Decimal, CurrencySpec], str]
+    def __new__(cls, alpha_code: str = ..., numeric_code: str = ..., symbol: str = ..., localized_symbol: str = ..., convertion: str = ..., pattern: str = ..., context: MoneyContext | None = ...) -> Self: ...
+    def __delattr__(self, name: str) -> None: ...
+    def __eq__(self, other: object) -> bool: ...
+    def __hash__(self) -> int: ...
+    def __reduce__(self) -> tuple[object, tuple[object, ...]]: ...
+    def __repr__(self) -> str: ...
+    def __setattr__(self, name: str, value: object) -> None: ...
 
 class Currency:
     def __new__(cls, amount: str | float | Decimal, alpha_code: str | None = ..., numeric_code: str | None = ..., symbol: str | None = ..., localized_symbol: str | None = ..., convertion: str | None = ..., pattern: str | None = ...) -> Self: ...
@@ -26,17 +59,30 @@ class Currency:
     def __neg__(self) -> Self: ...
     def __pos__(self) -> Self: ...
     def __recreate__(self, amount: str | float | Decimal) -> Self: ...
-    def __reduce__(self) -> tuple[type, tuple[object, ...]]: ...
+    def __reduce__(self) -> tuple[object, tuple[object, ...]]: ...
     def __round__(self, precision: int | None = ...) -> Self: ...
     def __rsub__(self, other: object) -> Self: ...
     def __sub__(self, other: object) -> Self: ...
     def __truediv__(self, other: float | Decimal) -> Self: ...
     __deepcopy__: Self
     __rmul__: Self
+    def allocate(self, ratios: Iterable[float | Decimal]) -> list[Self]: ...
+    @classmethod
+    def format_many(cls, amounts: Iterable[float | Decimal | str], fmt: str = ..., **kwargs: str) -> Iterator[str]: ...
+    @classmethod
+    def from_float(cls, amount: float, mode: str = ..., **kwargs: str) -> Self: ...
     def international(self, precision: int | None = ...) -> str: ...
     def is_signed(self) -> bool: ...
     def localized(self, precision: int | None = ...) -> str: ...
+    @classmethod
+    def parse(cls, text: str, **kwargs: str) -> Self: ...
+    @classmethod
+    def parse_many(cls, texts: Iterable[str], **kwargs: str) -> Iterator[Self]: ...
     def precision(self, precision: int | None = ...) -> str: ...
+    def split(self, parts: int) -> list[Self]: ...
+    @classmethod
+    def sum(cls, currencies: Iterable[Currency], *, start: Currency | None = ...) -> Currency: ...
+    def with_context(self, context: MoneyContext | None) -> Self: ...
     @property
     def amount(self) -> Decimal: ...
     @property
@@ -51,3 +97,5 @@ class Currency:
     def convertion(self) -> str: ...
     @property
     def pattern(self) -> str: ...
+    @property
+    def spec(self) -> CurrencySpec: ...
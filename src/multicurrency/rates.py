@@ -0,0 +1,331 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2020-2022, Frederico Martins
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Exchange rates.
+
+Conversion of currencies using a table of exchange rates.
+
+Simple usage example:
+
+    >>> from multicurrency import Euro
+    >>> from multicurrency.rates import Converter, RateTable
+    >>> rates = RateTable({'USD': '1.25', 'GBP': '0.8'}, base='EUR')
+    >>> rates.rate('USD', 'EUR')
+    Decimal('0.8')
+    >>> rates.rate('GBP', 'USD')
+    Decimal('1.5625')
+    >>> converter = Converter(rates)
+    >>> dollars = converter.convert(Euro(10), 'USD')
+    >>> type(dollars).__name__, dollars.amount
+    ('USDollar', Decimal('12.50'))
+
+A rate is the amount of the second currency that is worth one unit of
+the first one. The inverse of every rate is computed when the rate is
+set. Pairs without a rate are converted through the base currency of
+the table (triangulation) and the resulting cross rates are cached.
+
+The type of the converted currencies is the currency class for the
+alpha code (e.g.: `USDollar` for 'USD') unless set otherwise with the
+`types` of the `Converter`. Codes without a currency class are
+converted to `multicurrency.pycurrency.Currency`.
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import TYPE_CHECKING, Self
+
+from multicurrency.exceptions import (
+    CurrencyCodeException,
+    CurrencyRateException,
+    CurrencyTypeException,
+)
+from multicurrency.pycurrency import Currency
+from multicurrency.registry import currency_type
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable, Iterator, Mapping
+
+    from multicurrency.arrays import CurrencyArray
+    from multicurrency.pycurrency import CurrencySpec
+
+
+_ONE = Decimal(1)
+
+
+def _currency_type(alpha_code: str) -> type[Currency]:
+    """Returns the currency class for `alpha_code`.
+
+    Args:
+        alpha_code (str): Currency alpha code.
+
+    Returns:
+        type[Currency]: currency class (`Currency` if there is none).
+    """
+    try:
+        return currency_type(alpha_code)
+    except CurrencyCodeException:
+        return Currency
+
+
+class RateTable:
+    """Table of exchange rates.
+
+    Args:
+        rates (Mapping[str, float | Decimal | str], optional): Rates of
+            the currencies (by alpha code) for one unit of the `base`
+            currency. Defaults to none.
+        base (str, optional): Alpha code of the base currency (used for
+            triangulation). Defaults to ''.
+
+    Raises:
+        ValueError: If a rate is not greater than zero.
+    """
+
+    __slots__ = ('_base', '_cross', '_rates')
+
+    def __init__(
+            self: Self,
+            rates: Mapping[str, float | Decimal | str] | None = None,
+            base: str = '') -> None:
+        """Class initializer."""
+        self._base = base
+        self._cross: dict[tuple[str, str], Decimal] = {}
+        self._rates: dict[tuple[str, str], Decimal] = {}
+        for alpha_code, rate in (rates or {}).items():
+            self.set(base, alpha_code, rate)
+
+    def __contains__(self: Self, pair: object) -> bool:
+        """Checks if there is a rate (direct or inverse) for `pair`.
+
+        Args:
+            pair (object): Tuple with the two alpha codes.
+
+        Returns:
+            bool: True if there is a rate. False otherwise.
+        """
+        return pair in self._rates
+
+    def __len__(self: Self) -> int:
+        """Returns the number of rates (including the inverses).
+
+        Returns:
+            int: number of rates.
+        """
+        return len(self._rates)
+
+    def __repr__(self: Self) -> str:
+        """String representation of this class.
+
+        Returns:
+            str: representation
+        """
+        return (
+            f'{self.__class__.__name__}('
+            f'base: "{self._base}", rates: {len(self._rates)})')
+
+    def rate(self: Self, from_code: str, to_code: str) -> Decimal:
+        """Returns the rate to convert `from_code` to `to_code`.
+
+        Args:
+            from_code (str): Alpha code of the currency to convert from.
+            to_code (str): Alpha code of the currency to convert to.
+
+        Returns:
+            Decimal: rate.
+
+        Raises:
+            CurrencyRateException: If there is no rate (direct or
+                through the base currency) for the pair.
+        """
+        pair = (from_code, to_code)
+        rate = self._rates.get(pair)
+        if rate is not None:
+            return rate
+        rate = self._cross.get(pair)
+        if rate is not None:
+            return rate
+        if from_code == to_code:
+            return _ONE
+        base = self._base
+        first = _ONE if from_code == base else self._rates.get(
+            (from_code, base))
+        second = _ONE if to_code == base else self._rates.get(
+            (base, to_code))
+        if first is None or second is None:
+            raise CurrencyRateException(from_code, to_code)
+        rate = self._cross[pair] = first * second
+        return rate
+
+    def set(
+            self: Self,
+            from_code: str,
+            to_code: str,
+            rate: float | Decimal | str) -> None:
+        """Sets the rate to convert `from_code` to `to_code`.
+
+        The inverse rate is set as well. The cached cross rates are
+        discarded.
+
+        Args:
+            from_code (str): Alpha code of the currency to convert from.
+            to_code (str): Alpha code of the currency to convert to.
+            rate (float | Decimal | str): Amount of `to_code` for one
+                unit of `from_code`.
+
+        Raises:
+            ValueError: If `rate` is not greater than zero.
+        """
+        rate = Decimal(rate)
+        if not rate > 0:
+            msg = f'invalid rate for {from_code}/{to_code}: {rate}'
+            raise ValueError(msg)
+        self._rates[(from_code, to_code)] = rate
+        self._rates[(to_code, from_code)] = _ONE / rate
+        self._cross.clear()
+
+    @property
+    def base(self: Self) -> str:
+        """str: alpha code of the base currency."""
+        return self._base
+
+
+class Converter:
+    """Currency converter.
+
+    Args:
+        rates (RateTable): Exchange rates.
+        types (Mapping[str, type[Currency]], optional): Currency class
+            to convert to (by alpha code). Defaults to the currency
+            class of the alpha code.
+    """
+
+    __slots__ = ('_rates', '_targets', '_types')
+
+    def __init__(
+            self: Self,
+            rates: RateTable,
+            types: Mapping[str, type[Currency]] | None = None) -> None:
+        """Class initializer."""
+        self._rates = rates
+        self._targets: dict[str, tuple[type[Currency], CurrencySpec]] = {}
+        self._types = dict(types or {})
+
+    def _target(
+            self: Self,
+            alpha_code: str) -> tuple[type[Currency], CurrencySpec]:
+        """Returns the (cached) currency class and spec for `alpha_code`.
+
+        Args:
+            alpha_code (str): Currency alpha code.
+
+        Returns:
+            tuple[type[Currency], CurrencySpec]: currency class and
+                specification.
+        """
+        target = self._targets.get(alpha_code)
+        if target is None:
+            currency = self._types.get(alpha_code)
+            if currency is None:
+                currency = _currency_type(alpha_code)
+            if currency is Currency:
+                spec = currency(0, alpha_code=alpha_code).spec
+            else:
+                spec = currency(0).spec
+            target = self._targets[alpha_code] = (currency, spec)
+        return target
+
+    def convert(self: Self, currency: Currency, to_code: str) -> Currency:
+        """Converts `currency` to the currency `to_code`.
+
+        Args:
+            currency (Currency): Currency to convert.
+            to_code (str): Alpha code of the currency to convert to.
+
+        Returns:
+            Currency: converted currency.
+
+        Raises:
+            CurrencyTypeException: If `currency` not instance of
+                'Currency'.
+            CurrencyRateException: If there is no rate for the
+                conversion.
+        """
+        if not isinstance(currency, Currency):
+            raise CurrencyTypeException
+        rate = self._rates.rate(currency.alpha_code, to_code)
+        target, spec = self._targets.get(to_code) or self._target(to_code)
+        return target._from_spec(  # pylint: disable=protected-access
+            currency.amount * rate, spec)
+
+    def convert_array(
+            self: Self,
+            array: CurrencyArray,
+            to_code: str) -> CurrencyArray:
+        """Converts the currency `array` to the currency `to_code`.
+
+        The rate is resolved once. The converted minor units are
+        rounded half to even.
+
+        Args:
+            array (CurrencyArray): Currency array to convert.
+            to_code (str): Alpha code of the currency to convert to.
+
+        Returns:
+            CurrencyArray: converted currency array.
+
+        Raises:
+            CurrencyRateException: If there is no rate for the
+                conversion.
+        """
+        source = array.spec
+        rate = self._rates.rate(source.alpha_code, to_code)
+        target, spec = self._target(to_code)
+        places = spec.decimal_places - source.decimal_places
+        units = (array * rate.scaleb(places)).minor_units
+        return array._from_units(  # pylint: disable=protected-access
+            units, spec, target)
+
+    def convert_many(
+            self: Self,
+            currencies: Iterable[Currency],
+            to_code: str) -> Iterator[Currency]:
+        """Converts every currency of `currencies` to the currency
+        `to_code`.
+
+        The rate is resolved once for each alpha code.
+
+        Args:
+            currencies (Iterable[Currency]): Currencies to convert.
+            to_code (str): Alpha code of the currency to convert to.
+
+        Yields:
+            Currency: converted currency.
+
+        Raises:
+            CurrencyTypeException: If an element not instance of
+                'Currency'.
+            CurrencyRateException: If there is no rate for the
+                conversion.
+        """
+        target, spec = self._target(to_code)
+        create = target._from_spec  # pylint: disable=protected-access
+        rates = {}
+        for currency in currencies:
+            if not isinstance(currency, Currency):
+                raise CurrencyTypeException
+            alpha_code = currency.alpha_code
+            rate = rates.get(alpha_code)
+            if rate is None:
+                rate = rates[alpha_code] = self._rates.rate(
+                    alpha_code, to_code)
+            yield create(currency.amount * rate, spec)
+
+    @property
+    def rates(self: Self) -> RateTable:
+        """RateTable: exchange rates."""
+        return self._rates
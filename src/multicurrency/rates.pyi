@@ -0,0 +1,22 @@
+from collections.abc import Iterable, Iterator, Mapping
+from decimal import Decimal
+from multicurrency.arrays import CurrencyArray
+from multicurrency.pycurrency import Currency
+from typing import Self
+
+class RateTable:
+    def __init__(self, rates: Mapping[str, float | Decimal | str] | None = ..., base: str = ...) -> None: ...
+    def __contains__(self, pair: object) -> bool: ...
+    def __len__(self) -> int: ...
+    def rate(self, from_code: str, to_code: str) -> Decimal: ...
+    def set(self, from_code: str, to_code: str, rate: float | Decimal | str) -> None: ...
+    @property
+    def base(self) -> str: ...
+
+class Converter:
+    def __init__(self, rates: RateTable, types: Mapping[str, type[Currency]] | None = ...) -> None: ...
+    def convert(self, currency: Currency, to_code: str) -> Currency: ...
+    def convert_array(self, array: CurrencyArray, to_code: str) -> CurrencyArray: ...
+    def convert_many(self, currencies: Iterable[Currency], to_code: str) -> Iterator[Currency]: ...
+    @property
+    def rates(self) -> RateTable: ...
@@ -0,0 +1,101 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2020-2022, Frederico Martins
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Currency registry.
+
+Lookup of the currency classes by alpha code, numeric code and country.
+
+Simple usage example:
+
+    >>> from multicurrency.registry import currency_type, from_code
+    >>> currency_type('EUR').__name__
+    'Euro'
+    >>> currency_type(978).__name__
+    'Euro'
+    >>> currency_type('AUD', 'Kiribati').__name__
+    'AustralianDollarKI'
+    >>> dollar = from_code('840', '1.5')
+    >>> type(dollar).__name__, dollar.amount
+    ('USDollar', Decimal('1.5'))
+
+The lookups use the (generated) indexes of the currencies table. Only
+the currency class that is found is created (see
+`multicurrency.currencies`). When several classes share the same code
+the main one (e.g.: `Euro` for 'EUR') is used unless a country is
+given.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from multicurrency import currencies
+from multicurrency.exceptions import CurrencyCodeException
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from decimal import Decimal
+
+    from multicurrency.pycurrency import Currency
+
+
+# pylint: disable=protected-access
+_ALPHA_CODES = currencies._ALPHA_CODES
+_COUNTRIES = currencies._COUNTRIES
+_CURRENCIES = currencies._CURRENCIES
+_NUMERIC_CODES = currencies._NUMERIC_CODES
+# pylint: enable=protected-access
+
+
+@lru_cache(maxsize=1024)
+def currency_type(code: str | int, country: str = '') -> type[Currency]:
+    """Returns the currency class for `code`.
+
+    Args:
+        code (str | int): Currency alpha code (e.g.: 'EUR') or numeric
+            code (e.g.: '978' or 978).
+        country (str, optional): Country of the currency (e.g.:
+            'Andorra'). Defaults to the main currency of the code.
+
+    Returns:
+        type[Currency]: currency class.
+
+    Raises:
+        CurrencyCodeException: If there is no currency for `code` (and
+            `country`).
+    """
+    if isinstance(code, int):
+        code = f'{code:03}'
+    name = _ALPHA_CODES.get(code) or _NUMERIC_CODES.get(code)
+    if name is not None and country:
+        name = _COUNTRIES.get((_CURRENCIES[name][2][0], country))
+    if name is None:
+        raise CurrencyCodeException(code, country)
+    return getattr(currencies, name)
+
+
+def from_code(
+        code: str | int,
+        amount: str | float | Decimal,
+        country: str = '') -> Currency:
+    """Creates a currency from its code.
+
+    Args:
+        code (str | int): Currency alpha code (e.g.: 'EUR') or numeric
+            code (e.g.: '978' or 978).
+        amount (str | int | float | Decimal): Represented value.
+        country (str, optional): Country of the currency (e.g.:
+            'Andorra'). Defaults to the main currency of the code.
+
+    Returns:
+        Currency: new object.
+
+    Raises:
+        CurrencyCodeException: If there is no currency for `code` (and
+            `country`).
+    """
+    return currency_type(code, country)(amount)
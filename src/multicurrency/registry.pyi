@@ -0,0 +1,5 @@
+from decimal import Decimal
+from multicurrency.pycurrency import Currency
+
+def currency_type(code: str | int, country: str = ...) -> type[Currency]: ...
+def from_code(code: str | int, amount: str | float | Decimal, country: str = ...) -> Currency: ...
@@ -52,15 +52,63 @@ Table of supported cryptocurrencies:
 ${table_cryptocurrencies}
 """ # pylint: disable=line-too-long  # noqa: E501,W505
 
-% for module, info in sorted(currencies.items()):
-from multicurrency.currencies.${module} import <%
-    classes = [c.class_name for c in info['currencies']]
-    if len(classes) > 1:
-        _classes_ = "(\n    " + ",\n    ".join(sorted(classes)) + ",\n)"
-    else:
-        _classes_ = classes[0]
-%>${_classes_}
-% endfor
+from types import MappingProxyType
+
+from multicurrency.pycurrency import _currency_class
+
+
+_CURRENCIES = MappingProxyType({<%
+    rows = []
+    for module, info in currencies.items():
+        for c in info['currencies']:
+            _country_ = f' ({c.country})' if c.country else ''
+            _description_ = f'{c.main_class}{_country_}'
+            rows.append((c.class_name, (
+                f"'{c.class_name}': (\n"
+                f"        '{module}',\n"
+                f"        {_description_!r},\n"
+                f"        ('{c.alpha_code}', '{c.numeric_code}', "
+                f"'{c.symbol}', '{c.localized_symbol}', "
+                f"'{c.convertion}',\n"
+                f"         '{c.pattern}'))")))
+    _rows_ = ",\n    ".join(row for _, row in sorted(rows))
+%>
+    ${_rows_}})
+<%
+    alpha_codes = {}
+    numeric_codes = {}
+    countries = {}
+    for info in currencies.values():
+        for c in info['currencies']:
+            key = (c.country != '', len(c.class_name), c.class_name)
+            for index, code in (
+                    (alpha_codes, c.alpha_code),
+                    (numeric_codes, c.numeric_code),
+                    (countries, (c.alpha_code, c.country))):
+                if code in ('0', (c.alpha_code, '')):
+                    continue
+                if code not in index or key < index[code][0]:
+                    index[code] = (key, c.class_name)
+    _alpha_codes_ = ",\n    ".join(
+        f"'{code}': '{name}'"
+        for code, (_, name) in sorted(alpha_codes.items()))
+    _numeric_codes_ = ",\n    ".join(
+        f"'{code}': '{name}'"
+        for code, (_, name) in sorted(numeric_codes.items()))
+    _countries_ = ",\n    ".join(
+        f"{code!r}: '{name}'"
+        if len(f"    {code!r}: '{name}',") <= 79 else
+        f"{code!r}:\n        '{name}'"
+        for code, (_, name) in sorted(countries.items()))
+%>
+_ALPHA_CODES = MappingProxyType({
+    ${_alpha_codes_}})
+
+_NUMERIC_CODES = MappingProxyType({
+    ${_numeric_codes_}})
+
+_COUNTRIES = MappingProxyType({
+    ${_countries_}})
 <%
     all_list = []
     for info in currencies.values():
@@ -68,6 +116,38 @@ from multicurrency.currencies.${module} import <%
             all_list.append(currency.class_name)
     _all_list_ = "'" + "',\n    '".join(sorted(all_list)) + "'"
 %>
-
 __all__ = (
     ${_all_list_})
+
+
+def __getattr__(name: str) -> type:
+    """Returns the currency `name` (creating it when needed).
+
+    The currencies are created, on first access, from the currencies
+    table (`_CURRENCIES`).
+
+    Args:
+        name (str): Currency (class) name.
+
+    Returns:
+        type: currency class.
+
+    Raises:
+        AttributeError: If `name` is not a supported currency.
+    """
+    if name not in _CURRENCIES:
+        msg = f'module {__name__!r} has no attribute {name!r}'
+        raise AttributeError(msg)
+    module, description, info = _CURRENCIES[name]
+    currency = _currency_class(
+        name, f'{__name__}.{module}', description, info)
+    return globals().setdefault(name, currency)
+
+
+def __dir__() -> list[str]:
+    """Returns the module attributes (including the currencies).
+
+    Returns:
+        list[str]: module attributes.
+    """
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,324 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2020-2022, Frederico Martins
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Tests for the CurrencyArray module."""
+
+import pickle
+from decimal import Decimal
+from pytest import fixture, importorskip, mark, raises
+from multicurrency import (
+    Afghani,
+    Currency,
+    CurrencyArray,
+    CurrencyInvalidDivision,
+    CurrencyInvalidMultiplication,
+    CurrencyMismatchException,
+    CurrencyTypeException,
+    Ethereum,
+    Euro,
+    FixedCurrency,
+    Yen)
+from multicurrency import arrays
+
+
+@fixture(params=['array', 'numpy'], autouse=True)
+def backend(request, monkeypatch):
+    if request.param == 'numpy':
+        importorskip('numpy')
+    else:
+        monkeypatch.setattr(arrays, '_numpy', None)
+    return request.param
+
+
+def euros(*amounts):
+    return CurrencyArray(amounts, Euro)
+
+
+def test_arrays_default():
+    prices = euros('1.50', 2.25, 10, Decimal('0.125'), '-0.135')
+    assert len(prices) == 5
+    assert prices.spec is Euro(0).spec
+    assert list(prices.minor_units) == [150, 225, 1000, 12, -14]
+    assert prices.amounts == [
+        Decimal('1.50'),
+        Decimal('2.25'),
+        Decimal('10.00'),
+        Decimal('0.12'),
+        Decimal('-0.14')]
+    assert prices[0] == Euro('1.5')
+    assert type(prices[-1]) is Euro
+    assert prices.to_currencies() == [
+        Euro('1.5'), Euro('2.25'), Euro(10), Euro('0.12'), Euro('-0.14')]
+    assert prices.__repr__() == (
+        'CurrencyArray([1.50, 2.25, 10.00, 0.12, -0.14], alpha_code: "EUR")')
+    assert euros(*range(8)).__repr__() == (
+        'CurrencyArray([0.00, 1.00, 2.00, ..., 5.00, 6.00, 7.00], '
+        'alpha_code: "EUR")')
+
+
+def test_arrays_generic():
+    generic = CurrencyArray(['1.2345'], alpha_code='XBT', pattern='4.,3%a')
+    assert list(generic.minor_units) == [12345]
+    assert type(generic[0]) is Currency
+    assert generic[0].alpha_code == 'XBT'
+    assert list(CurrencyArray([1], Yen).minor_units) == [1]
+    assert len(CurrencyArray()) == 0
+
+
+def test_arrays_from_currencies():
+    currencies = [Euro('1.005'), FixedCurrency.from_currency(Euro(2)), Euro(3)]
+    array = CurrencyArray.from_currencies(currencies)
+    assert list(array.minor_units) == [100, 200, 300]
+    assert type(array[0]) is Euro
+    fixed = CurrencyArray.from_currencies([FixedCurrency(1, alpha_code='EUR')])
+    assert type(fixed[0]) is FixedCurrency
+    assert fixed[0].minor_units == 100
+    with raises(ValueError):
+        _ = CurrencyArray.from_currencies([])
+    with raises(CurrencyTypeException):
+        _ = CurrencyArray.from_currencies([1])
+    with raises(CurrencyMismatchException):
+        _ = CurrencyArray.from_currencies([Euro(1), Yen(1)])
+
+
+@mark.parametrize('operation,result', [
+    (lambda a, b: a + b, [101, 202, 303]),
+    (lambda a, b: a - b, [99, 198, 297]),
+    (lambda a, b: b - a, [-99, -198, -297]),
+    (lambda a, b: a + Euro('0.01'), [101, 201, 301]),
+    (lambda a, b: a - Euro('0.01'), [99, 199, 299]),
+    (lambda a, b: a + Currency('0.005', alpha_code='EUR'), [100, 200, 300]),
+    (lambda a, b: a + FixedCurrency('0.01', alpha_code='EUR'), [101, 201, 301]),
+    (lambda a, b: a + CurrencyArray(
+        ['0.001', '0.015', '0.025'], alpha_code='EUR', pattern='3.,3%a'),
+        [100, 202, 302]),
+    (lambda a, b: -a, [-100, -200, -300]),
+    (lambda a, b: abs(-a), [100, 200, 300])
+])
+def test_arrays_add_sub(operation, result):
+    array = euros(1, 2, 3)
+    other = euros('0.01', '0.02', '0.03')
+    assert list(operation(array, other).minor_units) == result
+
+
+@mark.parametrize('other,exception', [
+    (1, CurrencyTypeException),
+    (Decimal(1), CurrencyTypeException),
+    (Yen(1), CurrencyMismatchException),
+    (CurrencyArray([1, 2], Yen), CurrencyMismatchException),
+    (CurrencyArray([1], Euro), ValueError)
+])
+def test_arrays_add_invalid(other, exception):
+    array = euros(1, 2)
+    with raises(exception):
+        _ = array + other
+    with raises(exception):
+        _ = array < other
+
+
+@mark.parametrize('operation,result', [
+    (lambda a: a * 3, [300, -450, 3]),
+    (lambda a: 3 * a, [300, -450, 3]),
+    (lambda a: a * Decimal('0.5'), [50, -75, 0]),
+    (lambda a: a * 0.5, [50, -75, 0]),
+    (lambda a: a * 1.5, [150, -225, 2]),
+    (lambda a: a * [1, 2, 3], [100, -300, 3]),
+    (lambda a: a * [Decimal('0.5'), 0.5, 2], [50, -75, 2]),
+    (lambda a: a / 2, [50, -75, 0]),
+    (lambda a: a / 3, [33, -50, 0]),
+    (lambda a: a / Decimal('-0.5'), [-200, 300, -2]),
+    (lambda a: a / 0.25, [400, -600, 4])
+])
+def test_arrays_mul_div(operation, result):
+    array = CurrencyArray([1, '-1.5', '0.005'], Euro)
+    assert list(array.minor_units) == [100, -150, 0]
+    array = CurrencyArray([1, '-1.5', '0.01'], Euro)
+    assert list(operation(array).minor_units) == result
+
+
+def test_arrays_mul_div_invalid():
+    array = euros(1, 2)
+    with raises(CurrencyInvalidMultiplication):
+        _ = array * '2'
+    with raises(CurrencyInvalidMultiplication):
+        _ = array * Euro(1)
+    with raises(CurrencyInvalidMultiplication):
+        _ = array * ['1', '2']
+    with raises(ValueError):
+        _ = array * [1, 2, 3]
+    with raises(CurrencyInvalidDivision):
+        _ = array / '2'
+    with raises(ZeroDivisionError):
+        _ = array / 0
+
+
+@mark.parametrize('value', [
+    float('inf'), float('-inf'), float('nan'),
+    Decimal('Infinity'), Decimal('NaN'), Decimal('sNaN')
+])
+def test_arrays_mul_div_not_finite(value):
+    array = euros(1, 2)
+    with raises(CurrencyInvalidMultiplication):
+        _ = array * value
+    with raises(CurrencyInvalidMultiplication):
+        _ = array * [1, value]
+    with raises(CurrencyInvalidMultiplication):
+        _ = value * array
+    with raises(CurrencyInvalidDivision):
+        _ = array / value
+
+
+def test_arrays_large_values():
+    array = CurrencyArray([2 ** 62 // 100, 1], alpha_code='EUR')
+    assert array.sum().amount == Decimal(2 ** 62 // 100 + 1)
+    assert list((array * 2).minor_units) == [2 ** 63 - 8, 200]
+    assert list((array * Decimal('0.5')).minor_units) == [2 ** 61 - 2, 50]
+    big = CurrencyArray([2 ** 62 // 100] * 4, alpha_code='EUR')
+    assert big.sum().amount == Decimal(2 ** 62 // 100 * 4)
+    with raises(OverflowError):
+        _ = big * 4
+
+
+def test_arrays_reductions():
+    array = euros('1.5', '-2.25', '10')
+    assert array.sum() == Euro('9.25')
+    assert array.min() == Euro('-2.25')
+    assert array.max() == Euro(10)
+    assert type(array.sum()) is Euro
+    assert euros().sum() == Euro(0)
+    with raises(ValueError):
+        _ = euros().min()
+    with raises(ValueError):
+        _ = euros().max()
+
+
+@mark.parametrize('operation,result', [
+    (lambda a, b: a < b, [True, False, False]),
+    (lambda a, b: a <= b, [True, True, False]),
+    (lambda a, b: a > b, [False, False, True]),
+    (lambda a, b: a >= b, [False, True, True]),
+    (lambda a, b: a == b, [False, True, False]),
+    (lambda a, b: a != b, [True, False, True]),
+    (lambda a, b: a < Euro(2), [True, False, False]),
+    (lambda a, b: a == Euro(2), [False, True, False]),
+    (lambda a, b: a >= Euro(2), [False, True, True])
+])
+def test_arrays_compare(operation, result):
+    array = euros(1, 2, 3)
+    other = euros(2, 2, 2)
+    assert list(operation(array, other)) == result
+
+
+def test_arrays_select():
+    array = euros(1, 2, 3, 4)
+    assert list(array[1:3].minor_units) == [200, 300]
+    assert list(array[::-2].minor_units) == [400, 200]
+    assert list(array[array > Euro(2)].minor_units) == [300, 400]
+    assert list(array[[True, False, False, True]].minor_units) == [100, 400]
+    assert array[3] == Euro(4)
+    assert [str(euro) for euro in array[:2]] == ['1,00\xa0€', '2,00\xa0€']
+    with raises(IndexError):
+        _ = array[[True, False]]
+    with raises(IndexError):
+        _ = array[4]
+
+
+@mark.parametrize('fmt', ['', '4', '.,2', '%a\u00A0%S'])
+def test_arrays_format_many(fmt):
+    array = euros('1234567.891', '-0.005', 0)
+    expected = [format(euro, fmt) for euro in array]
+    assert list(array.format_many(fmt)) == expected
+    afghani = CurrencyArray(['-1234.5', '0.01'], Afghani)
+    expected = [format(element, fmt) for element in afghani]
+    assert list(afghani.format_many(fmt)) == expected
+    with raises(TypeError):
+        _ = array.format_many(2)
+
+
+def test_arrays_pickle():
+    array = euros(1, 2, '3.33')
+    new = pickle.loads(pickle.dumps(array))
+    assert list(new.minor_units) == [100, 200, 333]
+    assert new.spec == array.spec
+    assert type(new[0]) is Euro
+    with raises(TypeError):
+        _ = hash(array)
+
+
+@mark.parametrize('ratios', [
+    [1, 1, 1],
+    [7, 2, 1],
+    [Decimal('0.5'), 0.25, 0, 0.25],
+    [3],
+    [2 ** 40, 1]
+])
+def test_arrays_allocate(ratios, backend):
+    array = euros(100, '-100', '0.05', '-0.01', 0, '1234.56')
+    columns = array.allocate(ratios)
+    assert len(columns) == len(ratios)
+    assert [type(column) for column in columns] == [CurrencyArray] * len(
+        ratios)
+    for index, euro in enumerate(array):
+        assert [column[index] for column in columns] == euro.allocate(ratios)
+    total = columns[0]
+    for column in columns[1:]:
+        total = total + column
+    assert list(total.minor_units) == list(array.minor_units)
+    assert columns[0].spec is array.spec
+    if backend == 'numpy':
+        numpy = importorskip('numpy')
+        assert [
+            list(column.minor_units)
+            for column in array.allocate(numpy.array(ratios))] == [
+            list(column.minor_units) for column in columns]
+
+
+def test_arrays_allocate_large_values():
+    array = CurrencyArray([2 ** 62, -(2 ** 62), 1], Yen)
+    columns = array.allocate([2, 1])
+    assert [list(column.minor_units) for column in columns] == [
+        [(2 ** 63 + 1) // 3, -((2 ** 63 + 1) // 3), 1],
+        [(2 ** 62 - 1) // 3, -((2 ** 62 - 1) // 3), 0]]
+    assert list(array.split(2)[0].minor_units) == [2 ** 61, -(2 ** 61), 1]
+    assert [len(column) for column in euros().allocate([1, 2])] == [0, 0]
+
+
+@mark.parametrize('parts', [1, 2, 3, 7])
+def test_arrays_split(parts):
+    array = euros(100, '-100', '0.05', '-0.01', 0)
+    columns = array.split(parts)
+    assert [list(column.minor_units) for column in columns] == [
+        list(column.minor_units) for column in array.allocate([1] * parts)]
+    with raises(ValueError):
+        _ = array.split(0)
+    with raises(CurrencyInvalidDivision):
+        _ = array.split('2')
+
+
+def test_arrays_allocate_invalid():
+    with raises(ValueError):
+        _ = euros(1).allocate([])
+    with raises(ValueError):
+        _ = euros(1).allocate([1, -1])
+    with raises(CurrencyInvalidDivision):
+        _ = euros(1).allocate([1, 'a'])
+
+
+def test_arrays_add_sub_overflow():
+    array = CurrencyArray(['5', '-5'], Ethereum)
+    with raises(OverflowError):
+        _ = array + array
+    with raises(OverflowError):
+        _ = array - (-array)
+    with raises(OverflowError):
+        _ = array + Ethereum(5)
+    with raises(OverflowError):
+        _ = CurrencyArray(['10'], Ethereum)
+    big = CurrencyArray([2 ** 62, -(2 ** 62)], Yen)
+    assert list((big + CurrencyArray([2 ** 62 - 1, 0], Yen)).minor_units) == [
+        2 ** 63 - 1, -(2 ** 62)]
+    assert list((big - Yen(2 ** 62)).minor_units) == [0, -(2 ** 63)]
+    assert list((big + Yen(-(2 ** 62))).minor_units) == [0, -(2 ** 63)]
@@ -0,0 +1,82 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2020-2022, Frederico Martins
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Tests for the MoneyBag module."""
+
+import pickle
+from decimal import Decimal
+from pytest import mark, raises
+from multicurrency import (
+    Currency,
+    CurrencyTypeException,
+    Euro,
+    FixedCurrency,
+    MoneyBag,
+    USDollar)
+
+
+def test_bags_default():
+    bag = MoneyBag([Euro('1.5'), USDollar(2), Euro('0.25')])
+    assert len(bag) == 2
+    assert list(bag) == ['EUR', 'USD']
+    assert 'EUR' in bag
+    assert 'GBP' not in bag
+    assert bag['EUR'] == Euro('1.75')
+    assert type(bag['USD']) is USDollar
+    assert bag.currencies() == [Euro('1.75'), USDollar(2)]
+    assert bag.__repr__() == 'MoneyBag(EUR: 1.75, USD: 2)'
+    assert bag
+    assert not MoneyBag()
+    with raises(KeyError):
+        _ = bag['GBP']
+    with raises(TypeError):
+        _ = hash(bag)
+
+
+@mark.parametrize('operation,totals', [
+    (lambda b: b + Euro(1), {'EUR': Decimal(2), 'USD': Decimal(1)}),
+    (lambda b: b + MoneyBag([USDollar(2), Currency(3, 'GBP')]), {
+        'EUR': Decimal(1), 'USD': Decimal(3), 'GBP': Decimal(3)}),
+    (lambda b: b + Currency('0.001', 'EUR'), {
+        'EUR': Decimal('1.001'), 'USD': Decimal(1)}),
+    (lambda b: b + FixedCurrency('0.01', 'USD'), {
+        'EUR': Decimal(1), 'USD': Decimal('1.01')})
+])
+def test_bags_add(operation, totals):
+    bag = MoneyBag([Euro(1), USDollar(1)])
+    result = operation(bag)
+    assert {code: result[code].amount for code in result} == totals
+    assert bag == MoneyBag([Euro(1), USDollar(1)])
+    bag += result
+    assert bag == result + MoneyBag([Euro(1), USDollar(1)])
+
+
+def test_bags_update():
+    bag = MoneyBag()
+    bag.update(Euro(i) for i in range(10))
+    bag.update([MoneyBag([USDollar(1)]), Euro(5)])
+    assert bag['EUR'] == Euro(50)
+    assert bag['USD'] == USDollar(1)
+    bag.add(USDollar(-1))
+    assert not bag['USD']
+    for invalid in [1, Decimal(1), '1']:
+        with raises(CurrencyTypeException):
+            bag.add(invalid)
+        with raises(CurrencyTypeException):
+            bag.update([invalid])
+        with raises(CurrencyTypeException):
+            bag += invalid
+    assert bag != {'EUR': Decimal(50)}
+
+
+def test_bags_pickle():
+    bag = MoneyBag([Euro('1.5'), USDollar(2), FixedCurrency(1, 'GBP')])
+    new = pickle.loads(pickle.dumps(bag))
+    assert new == bag
+    assert [type(c) for c in new.currencies()] == [
+        Euro, USDollar, FixedCurrency]
+    assert bag.copy() == bag
+    assert bag.copy() is not bag
@@ -0,0 +1,182 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2020-2022, Frederico Martins
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Tests for the currency codec module."""
+
+import os
+import pickle
+import subprocess
+import sys
+from decimal import Decimal
+from io import BytesIO
+from pytest import mark, raises
+from multicurrency import (
+    Currency,
+    CurrencyArray,
+    CurrencyTypeException,
+    FixedCurrency,
+    currencies)
+from multicurrency.codec import dump, dumps, iter_load, loads
+
+
+class CustomCurrency(Currency):
+    """Currency subclass (not supported by the codec)."""
+
+    __slots__ = ()
+
+
+AMOUNTS = [
+    '0',
+    '1',
+    '-1.5',
+    '0.01',
+    '123456.789',
+    '-0.00000001',
+    '1E+30',
+    '-0',
+    '-0.00',
+    '12345678901234567890123456789.0123456789',
+    'NaN',
+    '-Infinity']
+
+
+def _same(new, currency):
+    assert type(new) is type(currency)
+    assert new.spec is currency.spec
+    assert str(new.amount) == str(currency.amount)
+
+
+@mark.parametrize('name', currencies.__all__)
+def test_codec_currencies(name):
+    currency = getattr(currencies, name)
+    ledger = [currency(amount) for amount in AMOUNTS]
+    ledger.append(currency('7.5', pattern='4.,3%a %c'))
+    for new, old in zip(loads(dumps(ledger)), ledger, strict=True):
+        _same(new, old)
+
+
+@mark.parametrize('currency', [
+    Currency('-12.5', alpha_code='XBT', symbol='₿', pattern='8.,3%-%s%u'),
+    Currency(1),
+    FixedCurrency('-12.345', alpha_code='XAU', pattern='3.,3%a%s'),
+    FixedCurrency.from_currency(currencies.Euro('1.23')),
+    currencies.Euro(Decimal('0.1') + Decimal('0.2'))
+])
+def test_codec_currency(currency):
+    new, = loads(dumps(currency))
+    _same(new, currency)
+    if isinstance(currency, FixedCurrency):
+        assert new.minor_units == currency.minor_units
+
+
+@mark.parametrize('array', [
+    CurrencyArray(['1.5', -2, '0.01'], currencies.Euro),
+    CurrencyArray(
+        [Decimal(2 ** 62).scaleb(-8), Decimal(-2 ** 62).scaleb(-8)],
+        currencies.Bitcoin),
+    CurrencyArray([], currencies.Afghani),
+    CurrencyArray([1, 2], alpha_code='XXX', pattern='3.,3%a%s'),
+    CurrencyArray([1, 2], FixedCurrency, alpha_code='XXX')
+])
+def test_codec_array(array):
+    data = dumps(array)
+    assert len(data) < 24 + 8 * len(array) + 64
+    new, = loads(data)
+    assert isinstance(new, CurrencyArray)
+    assert new.spec is array.spec
+    assert new.to_currencies() == array.to_currencies()
+    assert [type(c) for c in new] == [type(c) for c in array]
+
+
+def test_codec_size():
+    ledger = [currencies.Euro(Decimal(i) / 100) for i in range(1000)]
+    data = dumps(ledger)
+    assert len(data) < 5 * len(ledger)
+    assert len(data) < len(pickle.dumps(ledger)) / 2
+    assert data.count(b'Euro') == 1
+
+
+@mark.parametrize('chunk_size', [1, 3, 65_536])
+def test_codec_iter_load(chunk_size):
+    items = [
+        currencies.Euro('1.5'),
+        CurrencyArray(range(100), currencies.USDollar),
+        currencies.USDollar('-2'),
+        currencies.Euro(3)]
+    file = BytesIO()
+    dump(items, file, chunk_size=2)
+    dump(items[::-1], file)
+    file.seek(0)
+    loaded = list(iter_load(file, chunk_size=chunk_size))
+    assert len(loaded) == 8
+    for new, old in zip(loaded, items + items[::-1], strict=True):
+        if isinstance(old, CurrencyArray):
+            assert new.to_currencies() == old.to_currencies()
+        else:
+            _same(new, old)
+    assert len(loads(file.getvalue())) == 8
+
+
+def test_codec_lazy():
+    stream = BytesIO(dumps([currencies.Euro(1), currencies.Euro(2)]) + b'\x07')
+    items = iter_load(stream)
+    assert next(items) == currencies.Euro(1)
+    assert next(items) == currencies.Euro(2)
+    with raises(ValueError):
+        next(items)
+
+
+@mark.parametrize('data', [
+    b'\x01\x00\x02',
+    b'\x00\x00\x00\x07Unknown\x01\x00\x02',
+    b'\x00\x00\x09',
+    b'\x07\x00',
+    dumps(currencies.Euro('1.5'))[:-1],
+    dumps(CurrencyArray([1, 2], currencies.Euro))[:-1]
+])
+def test_codec_invalid(data):
+    with raises(ValueError):
+        _ = loads(data)
+    with raises(ValueError):
+        _ = list(iter_load(BytesIO(data)))
+
+
+@mark.parametrize('item', [
+    [1],
+    [currencies.Euro(1), 'EUR'],
+    CustomCurrency(1)
+])
+def test_codec_invalid_type(item):
+    with raises(CurrencyTypeException):
+        _ = dumps(item)
+
+
+def test_codec_pickle():
+    euro = currencies.Euro('1.50')
+    data = pickle.dumps(euro)
+    assert b'_currency_spec' not in data
+    assert len(data) < 80
+    new = pickle.loads(data)
+    _same(new, euro)
+    custom = currencies.Euro('1.50', pattern='4.,3%a')
+    _same(pickle.loads(pickle.dumps(custom)), custom)
+
+
+def test_codec_lazy():
+    code = (
+        'import sys; from multicurrency import Euro;'
+        'from multicurrency.codec import dumps, loads;'
+        'items = [Euro(1), Euro("0.5")];'
+        'assert loads(dumps(items)) == items;'
+        'print("multicurrency.arrays" in sys.modules, "numpy" in sys.modules)')
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    output = subprocess.run(
+        [sys.executable, '-c', code],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True).stdout
+    assert output.split() == ['False', 'False']
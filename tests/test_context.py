@@ -0,0 +1,214 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2020-2022, Frederico Martins
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Tests for the context module."""
+
+import asyncio
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal, getcontext, localcontext
+from math import ceil, floor
+from pytest import mark, raises
+from multicurrency import (
+    Currency,
+    Euro,
+    FixedCurrency,
+    MoneyContext,
+    Yen,
+    money_context)
+from multicurrency.context import get_money_context
+
+
+ROUNDINGS = [
+    'ROUND_CEILING',
+    'ROUND_DOWN',
+    'ROUND_FLOOR',
+    'ROUND_HALF_DOWN',
+    'ROUND_HALF_EVEN',
+    'ROUND_HALF_UP',
+    'ROUND_UP',
+    'ROUND_05UP']
+
+OPERATIONS = [
+    lambda: Euro(1_000/7) + Euro(2/3),
+    lambda: Euro(1_000/7) - Euro(2/3),
+    lambda: Euro(2/3) - Euro(1_000/7),
+    lambda: Euro(1_000/7) * Decimal('1.0125'),
+    lambda: 3 * Euro(1_000/7),
+    lambda: Euro(1_000) / 7,
+    lambda: Euro(1_000/7) // Decimal('0.7'),
+    lambda: Euro(1_000/7) % Decimal('0.7'),
+    lambda: divmod(Euro(1_000/7), Decimal('0.7'))[1],
+    lambda: -Euro(1_000/7),
+    lambda: +Euro(1_000/7),
+    lambda: abs(Euro(-1_000/7)),
+    lambda: round(Euro(1_000/7), 3),
+    lambda: ceil(Euro(1_000/7)),
+    lambda: floor(Euro(1_000/7)),
+    lambda: Euro.sum([Euro(1_000/7)] * 9)
+]
+
+
+def test_context():
+    context = MoneyContext(12, 'ROUND_UP')
+    assert context.precision == 12
+    assert context.rounding == 'ROUND_UP'
+    assert context.decimal_context.prec == 12
+    assert context.decimal_context.rounding == 'ROUND_UP'
+    assert MoneyContext() == MoneyContext(28, 'ROUND_HALF_EVEN')
+    assert context == MoneyContext(12, 'ROUND_UP')
+    assert context != MoneyContext(12, 'ROUND_DOWN')
+    assert context != (12, 'ROUND_UP')
+    assert hash(context) == hash(MoneyContext(12, 'ROUND_UP'))
+    assert pickle.loads(pickle.dumps(context)) == context
+    assert repr(context) == (
+        'MoneyContext(precision: 12, rounding: "ROUND_UP")')
+    with raises(AttributeError):
+        context.precision = 2
+    with raises(AttributeError):
+        del context.rounding
+
+
+@mark.parametrize('precision,rounding', [
+    (0, 'ROUND_UP'),
+    (-1, 'ROUND_UP'),
+    ('28', 'ROUND_UP'),
+    (28, 'UP'),
+    (28, None)
+])
+def test_context_invalid(precision, rounding):
+    with raises(ValueError):
+        MoneyContext(precision, rounding)
+
+
+@mark.parametrize('operation', OPERATIONS)
+@mark.parametrize('rounding', ROUNDINGS)
+def test_context_operations(operation, rounding):
+    with localcontext(prec=9, rounding=rounding):
+        expected = operation()
+    context = MoneyContext(9, rounding)
+    with money_context(context) as current:
+        assert current is context
+        assert get_money_context() is context
+        result = operation()
+    assert get_money_context() is None
+    assert str(result.amount) == str(expected.amount)
+    assert result.spec.context is None
+
+
+@mark.parametrize('rounding', ROUNDINGS)
+def test_context_format(rounding):
+    euro = Euro(1_000/7)
+    with localcontext(rounding=rounding):
+        expected = [euro.precision(3), format(euro, '4.,3%A'), str(-euro)]
+        many = list(Euro.format_many([1/3, -2/3], '1%a'))
+        international = euro.international(4)
+    context = MoneyContext(rounding=rounding)
+    with money_context(context):
+        assert [
+            euro.precision(3), format(euro, '4.,3%A'), str(-euro)] == expected
+        assert list(Euro.format_many([1/3, -2/3], '1%a')) == many
+    euro = euro.with_context(context)
+    assert [euro.precision(3), format(euro, '4.,3%A'), str(-euro)] == (
+        expected)
+    assert euro.international(4) == international
+
+
+def test_context_format_precision():
+    euro = Euro(1_000/7)
+    with money_context(MoneyContext(precision=10)):
+        with raises(ArithmeticError):
+            euro.precision(25)
+        assert euro.precision(5) == Euro(1_000/7).precision(5)
+    assert euro.precision(25) == '142,8571428571428612031013472\xa0€'
+
+
+def test_context_with_context():
+    context = MoneyContext(6, 'ROUND_DOWN')
+    euro = Euro(1_000).with_context(context)
+    assert euro.__class__ is Euro
+    assert euro == Euro(1_000)
+    assert euro.spec.context is context
+    assert euro.spec != Euro(1).spec
+    assert euro.spec is Euro(2).with_context(
+        MoneyContext(6, 'ROUND_DOWN')).spec
+    results = [euro / 7, euro * (1/3), (euro / 7) * 3, euro.__copy__()]
+    for result in results:
+        assert result.spec is euro.spec
+    assert [str(result.amount) for result in results] == [
+        '142.857', '333.333', '428.571', '1000']
+    with money_context(MoneyContext(20, 'ROUND_UP')):
+        assert str((euro / 7).amount) == '142.857'
+        assert str((Euro(1_000) / 7).amount) == '142.85714285714285715'
+        assert str((euro.with_context(None) / 7).amount) == (
+            '142.85714285714285715')
+    assert str((Euro(1_000) / 7).amount) == str(Decimal(1_000) / 7)
+    assert euro.with_context(None).spec is Euro(1).spec
+    unpickled = pickle.loads(pickle.dumps(euro))
+    assert unpickled.spec is euro.spec
+    assert 'context: MoneyContext(precision: 6' in repr(euro.spec)
+    assert 'context' not in repr(Euro(1).spec)
+    assert Euro(1).spec.__reduce__()[1] == (
+        'EUR', '978', '€', '€', '', '2,.3%a\xa0%s')
+
+
+def test_context_with_context_types():
+    context = MoneyContext(4)
+    yen = Yen(1_000).with_context(context)
+    assert (yen / 3).amount == Decimal('333.3')
+    custom = Currency(1_000, alpha_code='EUR').with_context(context)
+    assert (custom / 3).amount == Decimal('333.3')
+    assert custom.spec.alpha_code == 'EUR'
+    fixed = FixedCurrency('10.00', alpha_code='EUR').with_context(context)
+    assert fixed.__class__ is FixedCurrency
+    assert fixed.minor_units == 1000
+    assert (fixed / 3).minor_units == 333
+    with raises(TypeError):
+        Euro(1).with_context((4, 'ROUND_UP'))
+    with raises(TypeError):
+        money_context('ROUND_UP')
+
+
+def test_context_nested():
+    outer = MoneyContext(5)
+    inner = MoneyContext(3)
+    with money_context(outer):
+        with money_context(inner):
+            assert str((Euro(1) / 3).amount) == '0.333'
+            with money_context(None):
+                assert (Euro(1) / 3).amount == Decimal(1) / 3
+        assert str((Euro(1) / 3).amount) == '0.33333'
+    assert get_money_context() is None
+    assert getcontext().prec == 28
+
+
+def test_context_asyncio():
+
+    async def divide(context: MoneyContext) -> str:
+        with money_context(context):
+            await asyncio.sleep(0)
+            result = Euro(1) / 3
+            await asyncio.sleep(0)
+            return str((result / 3).amount)
+
+    async def main() -> list[str]:
+        return await asyncio.gather(*(
+            divide(MoneyContext(precision)) for precision in range(2, 8)))
+
+    assert asyncio.run(main()) == [
+        '0.11', '0.111', '0.1111', '0.11111', '0.111111', '0.1111111']
+    assert get_money_context() is None
+
+
+def test_context_threads():
+
+    def divide(precision: int) -> str:
+        with money_context(MoneyContext(precision)):
+            return str((Euro(2) / 3).amount)
+
+    with ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(divide, range(2, 10)))
+    assert results == [f'0.{"6" * (n - 1)}7' for n in range(2, 10)]
@@ -8,18 +8,22 @@
 
 from pytest import mark, raises
 from multicurrency.exceptions import (
+    CurrencyCodeException,
     CurrencyException,
     CurrencyInvalidDivision,
     CurrencyInvalidFormat,
     CurrencyInvalidMultiplication,
     CurrencyInvalidOperation,
     CurrencyMismatchException,
+    CurrencyRateException,
     CurrencyTypeException)
 
 
 @mark.parametrize('exception,message,expected', [
     (CurrencyException, None, r"^$"),
     (CurrencyException, 'extra message', r"^extra message$"),
+    (CurrencyCodeException, None, r"^Unknown currency code.$"),
+    (CurrencyCodeException, 'extra message', r"^\('Unknown currency code.', 'extra message'\)$"),
     (CurrencyInvalidDivision, None, r"^Unsupported division operation.$"),
     (CurrencyInvalidDivision, 'extra message', r"^\('Unsupported division operation.', 'extra message'\)$"),
     (CurrencyInvalidFormat, None, r"^Invalid currency format.$"),
@@ -30,6 +34,8 @@ from multicurrency.exceptions import (
     (CurrencyInvalidOperation, 'extra message', r"^\('Unsupported operation.', 'extra message'\)$"),
     (CurrencyMismatchException, None, r"^Unsupported operation for different currencies.$"),
     (CurrencyMismatchException, 'extra message', r"^\('Unsupported operation for different currencies.', 'extra message'\)$"),
+    (CurrencyRateException, None, r"^Exchange rate not available.$"),
+    (CurrencyRateException, 'extra message', r"^\('Exchange rate not available.', 'extra message'\)$"),
     (CurrencyTypeException, None, r"^Unsupported operation with non-Currency object.$"),
     (CurrencyTypeException, 'extra message', r"^\('Unsupported operation with non-Currency object.', 'extra message'\)$")
 ])
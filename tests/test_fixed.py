@@ -0,0 +1,407 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2020-2022, Frederico Martins
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Tests for the FixedCurrency module."""
+
+import pickle
+from decimal import ROUND_DOWN, Decimal
+from pytest import mark, raises
+from multicurrency import (
+    Currency,
+    CurrencyInvalidDivision,
+    CurrencyInvalidFormat,
+    CurrencyInvalidMultiplication,
+    CurrencyMismatchException,
+    CurrencyTypeException,
+    Euro,
+    FixedCurrency,
+    Yen,
+    pycurrency)
+
+
+class TruncatedCurrency(FixedCurrency):
+    """Fixed point currency that rounds towards zero."""
+
+    __slots__ = ()
+
+    rounding = ROUND_DOWN
+
+
+@mark.parametrize('amount,pattern,units,printed', [
+    ('3.14', '2.,3%a', 314, '3.14'),
+    (3.14, '2.,3%a', 314, '3.14'),
+    (10, '2.,3%a', 1000, '10.00'),
+    (Decimal('-10'), '2.,3%a', -1000, '-10.00'),
+    ('0.125', '2.,3%a', 12, '0.12'),
+    ('0.135', '2.,3%a', 14, '0.14'),
+    ('1234.5', '0.,3%a', 1234, '1,234'),
+    ('1.2345', '4.,3%a', 12345, '1.2345')
+])
+def test_fixed_default(amount, pattern, units, printed):
+    fixed = FixedCurrency(amount, alpha_code='EUR', pattern=pattern)
+    assert fixed.minor_units == units
+    assert fixed.amount == Decimal(units).scaleb(-fixed.spec.decimal_places)
+    assert fixed.alpha_code == 'EUR'
+    assert isinstance(fixed, Currency)
+    assert fixed.__str__() == printed
+    assert not hasattr(fixed, '__dict__')
+
+
+@mark.parametrize('currency,fmt,printed', [
+    (FixedCurrency, '', ['0.12', '-1.00', '1,234.57']),
+    (FixedCurrency, '4', ['0.1200', '-1.0000', '1,234.5700']),
+    (TruncatedCurrency, '4', ['0.1200', '-0.9900', '1,234.5600'])
+])
+def test_fixed_format_many(currency, fmt, printed):
+    amounts = ['0.125', '-0.999', 1234.567]
+    assert list(currency.format_many(amounts, fmt)) == printed
+    assert printed == [format(currency(amount), fmt) for amount in amounts]
+
+
+def test_fixed_invalid_pattern():
+    with raises(CurrencyInvalidFormat):
+        _ = FixedCurrency(1, pattern='-2.,3%a')
+
+
+def test_fixed_from_currency():
+    euro = Euro('1234.565')
+    fixed = FixedCurrency.from_currency(euro)
+    assert fixed.minor_units == 123456
+    assert fixed.spec is euro.spec
+    assert fixed.__str__() == '1.234,56\xa0€'
+    assert fixed.to_currency().__class__ is Currency
+    assert fixed.to_currency(Euro) == Euro('1234.56')
+    assert FixedCurrency.from_currency(Yen(10.5)).minor_units == 10
+
+
+@mark.parametrize('other,result', [
+    (FixedCurrency('0.01', alpha_code='EUR'), 100),
+    (FixedCurrency('0.001', alpha_code='EUR', pattern='3.,3%a'), 99),
+    (Currency('0.001', alpha_code='EUR'), 99),
+    (Currency('0.005', alpha_code='EUR'), 100),
+    (Currency('0.015', alpha_code='EUR'), 100),
+    (Currency('0.016', alpha_code='EUR'), 101)
+])
+def test_fixed_add(other, result):
+    fixed = FixedCurrency('0.99', alpha_code='EUR')
+    assert (fixed + other).minor_units == result
+    assert type(fixed + other) is FixedCurrency
+
+
+def test_fixed_add_currency():
+    fixed = FixedCurrency('0.99', alpha_code='EUR')
+    other = Currency('0.001', alpha_code='EUR')
+    assert type(other + fixed) is Currency
+    assert (other + fixed).amount == Decimal('0.991')
+    assert type(other - fixed) is Currency
+    assert (other - fixed).amount == Decimal('-0.989')
+    assert (fixed - other).minor_units == 99
+    assert (fixed - FixedCurrency(1, alpha_code='EUR')).minor_units == -1
+    assert (Currency(1, alpha_code='EUR') - fixed).amount == Decimal('0.01')
+    assert FixedCurrency(1, alpha_code='EUR').__rsub__(fixed).minor_units == -1
+    assert type(Euro(1) + FixedCurrency.from_currency(Euro(1))) is Euro
+
+
+@mark.parametrize('other,exception', [
+    (1, CurrencyTypeException),
+    (Decimal(1), CurrencyTypeException),
+    (FixedCurrency(1, alpha_code='USD'), CurrencyMismatchException),
+    (Currency(1, alpha_code='USD'), CurrencyMismatchException)
+])
+def test_fixed_operation_invalid(other, exception):
+    fixed = FixedCurrency(1, alpha_code='EUR')
+    with raises(exception):
+        _ = fixed + other
+    with raises(exception):
+        _ = fixed - other
+    with raises(exception):
+        _ = fixed < other
+
+
+@mark.parametrize('other,lower,equal', [
+    (FixedCurrency('1.01', alpha_code='EUR'), True, False),
+    (FixedCurrency(1, alpha_code='EUR'), False, True),
+    (FixedCurrency('0.999', alpha_code='EUR', pattern='3.,3%a'), False, False),
+    (FixedCurrency('1.000', alpha_code='EUR', pattern='3.,3%a'), False, True),
+    (Currency('1.001', alpha_code='EUR'), True, False),
+    (Currency('0.999', alpha_code='EUR'), False, False)
+])
+def test_fixed_compare(other, lower, equal):
+    fixed = FixedCurrency(1, alpha_code='EUR')
+    assert (fixed < other) is lower
+    assert (fixed <= other) is (lower or equal)
+    assert (fixed > other) is not (lower or equal)
+    assert (fixed >= other) is not lower
+    assert (other > fixed) is lower
+    assert (other >= fixed) is (lower or equal)
+    assert (other < fixed) is not (lower or equal)
+    assert (other <= fixed) is not lower
+    assert (other == fixed) is equal
+    assert (fixed == other) is equal
+
+
+@mark.parametrize('other,lower,equal', [
+    (Euro('1.01'), True, False),
+    (Euro(1), False, True),
+    (Euro('0.999'), False, False)
+])
+def test_fixed_compare_currency(other, lower, equal):
+    fixed = FixedCurrency(1, alpha_code='EUR')
+    assert (fixed < other) is lower
+    assert (other > fixed) is lower
+    assert (other >= fixed) is (lower or equal)
+    assert (other < fixed) is not (lower or equal)
+    assert (other <= fixed) is not lower
+    assert ((fixed >= other) and (fixed <= other)) is equal
+    assert fixed != other
+    assert other != fixed
+
+
+@mark.parametrize('first,second', [
+    (FixedCurrency('1.50', alpha_code='EUR'), Euro('1.50')),
+    (FixedCurrency.from_currency(Euro('1.50')), Euro('1.50')),
+    (FixedCurrency('1.50', alpha_code='EUR'), FixedCurrency(
+        '1.500', alpha_code='EUR', pattern='3.,3%a')),
+    (FixedCurrency('1.50', alpha_code='EUR'), TruncatedCurrency(
+        '1.50', alpha_code='EUR')),
+    (FixedCurrency.from_currency(Euro(1)), Euro(1))
+])
+def test_fixed_equal_types(first, second):
+    for one, other in ((first, second), (second, first)):
+        if one == other:
+            assert hash(one) == hash(other)
+    assert len({first, second}) == (1 if first == second else 2)
+    assert (first == second) is (second == first)
+
+
+def test_fixed_sub_currency():
+    fixed = FixedCurrency('0.25', alpha_code='EUR')
+    assert type(Euro(1) - fixed) is Euro
+    assert (Euro(1) - fixed).amount == Decimal('0.75')
+    assert (fixed - Euro(1)).minor_units == -75
+    with raises(CurrencyMismatchException):
+        _ = Euro(1) - FixedCurrency(1, alpha_code='USD')
+    with raises(CurrencyMismatchException):
+        _ = Euro(1) < FixedCurrency(1, alpha_code='USD')
+    with raises(CurrencyTypeException):
+        _ = Euro(1) - Currency(1, alpha_code='EUR')
+
+
+@mark.parametrize('amount,units', [
+    (10 ** 30 + 1, 10 ** 32 + 100),
+    (Decimal('123456789012345678901234567890.12'),
+     12345678901234567890123456789012),
+    (-(10 ** 40) - 1, -(10 ** 42) - 100)
+])
+def test_fixed_large_amounts(amount, units):
+    fixed = FixedCurrency(amount, alpha_code='EUR')
+    assert fixed.minor_units == units
+    assert fixed.amount.as_tuple().digits == tuple(
+        int(digit) for digit in str(abs(units)))
+    assert (fixed * 3).minor_units == units * 3
+    assert (fixed * Decimal('1.5')).minor_units == units * 3 // 2
+
+
+def test_fixed_equal():
+    fixed = FixedCurrency(1, alpha_code='EUR')
+    assert fixed == FixedCurrency('1.00', alpha_code='EUR', symbol='€')
+    assert fixed == FixedCurrency(1, alpha_code='EUR', pattern='4.,3%a')
+    assert fixed != FixedCurrency(1, alpha_code='USD')
+    assert fixed != FixedCurrency(2, alpha_code='EUR')
+    assert fixed != Currency(1, alpha_code='EUR')
+    assert fixed != Euro(1)
+    assert Euro(1) != fixed
+    assert fixed != 1
+    assert hash(fixed) == hash(
+        FixedCurrency(1, alpha_code='EUR', pattern='4.,3%a'))
+
+
+@mark.parametrize('first,second,equal', [
+    (FixedCurrency(1, alpha_code='EUR'),
+     FixedCurrency('1.00', alpha_code='EUR'), True),
+    (FixedCurrency(1, alpha_code='EUR'),
+     FixedCurrency('1.000', alpha_code='EUR', pattern='3.,3%a'), True),
+    (FixedCurrency('1.5', alpha_code='EUR'),
+     FixedCurrency('1.500', alpha_code='EUR', pattern='3.,3%a'), True),
+    (FixedCurrency('1.25', alpha_code='EUR'),
+     FixedCurrency('1.2', alpha_code='EUR', pattern='1.,3%a'), False),
+    (FixedCurrency(1, alpha_code='EUR'),
+     FixedCurrency(1, alpha_code='GBP'), False)
+])
+def test_fixed_equal_hash(first, second, equal):
+    assert (first == second) is equal
+    assert (first != second) is not equal
+    assert hash(first) == hash(first)
+    if equal:
+        assert hash(first) == hash(second)
+        assert len({first, second}) == 1
+
+
+@mark.parametrize('operation,units', [
+    (lambda c: c * 3, 300),
+    (lambda c: 3 * c, 300),
+    (lambda c: c * Decimal('0.333'), 33),
+    (lambda c: c * 0.5, 50),
+    (lambda c: c / 4, 25),
+    (lambda c: c / 3, 33),
+    (lambda c: c / 8, 12),
+    (lambda c: c / Decimal('1.6'), 62),
+    (lambda c: -c, -100),
+    (lambda c: abs(-c), 100),
+    (lambda c: +c, 100),
+    (lambda c: c // 3, 0),
+    (lambda c: c % Decimal('0.3'), 10),
+    (lambda c: round(c * Decimal('1.5')), 200)
+])
+def test_fixed_arithmetic(operation, units):
+    fixed = FixedCurrency(1, alpha_code='EUR')
+    result = operation(fixed)
+    assert type(result) is FixedCurrency
+    assert result.minor_units == units
+
+
+@mark.parametrize('operation,units', [
+    (lambda c: c * Decimal('0.335'), 33),
+    (lambda c: c / 3, 33),
+    (lambda c: c / Decimal('-1.6'), -62),
+    (lambda c: c + Currency('0.009', alpha_code='EUR'), 100)
+])
+def test_fixed_rounding(operation, units):
+    truncated = TruncatedCurrency(1, alpha_code='EUR')
+    assert TruncatedCurrency('0.999', alpha_code='EUR').minor_units == 99
+    result = operation(truncated)
+    assert type(result) is TruncatedCurrency
+    assert result.minor_units == units
+
+
+@mark.parametrize('currencies,start,units', [
+    ([FixedCurrency('0.01', alpha_code='EUR')] * 3, None, 3),
+    ([FixedCurrency('0.01', alpha_code='EUR', pattern='3.,3%a')] * 3,
+        FixedCurrency(0, alpha_code='EUR'), 3),
+    ([Currency('0.005', alpha_code='EUR')] * 3,
+        FixedCurrency(0, alpha_code='EUR'), 2),
+    ([Currency('0.005', alpha_code='EUR'), FixedCurrency(1, alpha_code='EUR')],
+        FixedCurrency(0, alpha_code='EUR'), 100),
+    ((TruncatedCurrency('0.1', alpha_code='EUR') for _ in range(3)),
+        TruncatedCurrency('0.009', alpha_code='EUR'), 30),
+    ([FixedCurrency('12345678901234567890123456789.01', alpha_code='EUR'),
+        Euro('0.001')], None, 1234567890123456789012345678901),
+    ([Euro('12345678901234567890123456789.01'), Euro('0.001')],
+        FixedCurrency(0, alpha_code='EUR'), 1234567890123456789012345678901)
+])
+def test_fixed_sum(currencies, start, units):
+    total = FixedCurrency.sum(currencies, start=start)
+    assert total.minor_units == units
+    assert isinstance(total, FixedCurrency)
+    with raises(CurrencyMismatchException):
+        _ = FixedCurrency.sum([total, FixedCurrency(1, alpha_code='USD')])
+    with raises(CurrencyTypeException):
+        _ = FixedCurrency.sum([total, 1])
+
+
+def test_fixed_arithmetic_invalid():
+    fixed = FixedCurrency(1, alpha_code='EUR')
+    with raises(CurrencyInvalidMultiplication):
+        _ = fixed * '2'
+    with raises(CurrencyInvalidDivision):
+        _ = fixed / '2'
+    with raises(ZeroDivisionError):
+        _ = fixed / 0
+    with raises(ZeroDivisionError):
+        _ = fixed / Decimal('0.0')
+    with raises(CurrencyInvalidDivision):
+        _ = fixed / float('inf')
+    with raises(CurrencyInvalidDivision):
+        _ = fixed / Decimal('NaN')
+
+
+@mark.parametrize('units,divisor,result,truncated', [
+    (10 ** 30 + 3, 2, 10 ** 30 // 2 + 2, 10 ** 30 // 2 + 1),
+    (10 ** 30 + 1, 2, 10 ** 30 // 2, 10 ** 30 // 2),
+    (-(10 ** 30) - 3, 2, -(10 ** 30 // 2) - 2, -(10 ** 30 // 2) - 1),
+    (10 ** 40 + 1, 3, (10 ** 40 + 1) // 3 + 1, (10 ** 40 + 1) // 3),
+    (10 ** 40 + 2, Decimal('3'), (10 ** 40 + 2) // 3, (10 ** 40 + 2) // 3),
+    (10 ** 30 + 3, 0.5, 2 * 10 ** 30 + 6, 2 * 10 ** 30 + 6),
+    (10 ** 30 + 1, Decimal('-0.4'), -(25 * 10 ** 29) - 2,
+     -(25 * 10 ** 29) - 2),
+    (7, Decimal('1.5'), 5, 4),
+    (5, 2, 2, 2),
+    (7, 2, 4, 3),
+    (-7, 2, -4, -3)
+])
+def test_fixed_division_exact(units, divisor, result, truncated):
+    fixed = FixedCurrency._from_units(units, FixedCurrency(0, 'EUR').spec)
+    assert (fixed / divisor).minor_units == result
+    truncating = TruncatedCurrency._from_units(units, fixed.spec)
+    assert (truncating / divisor).minor_units == truncated
+
+
+def test_fixed_copy_pickle():
+    fixed = FixedCurrency.from_currency(Euro('1.23'))
+    for new in [
+            fixed.__copy__(),
+            fixed.__deepcopy__(),
+            pickle.loads(pickle.dumps(fixed))]:
+        assert new == fixed
+        assert new.spec == fixed.spec
+        assert new.minor_units == 123
+    assert not FixedCurrency(0)
+    assert FixedCurrency('0.01')
+
+
+@mark.parametrize('mode,units', [
+    ('exact', 28),
+    ('repr', 29),
+    ('minor', 29)
+])
+def test_fixed_float_mode(mode, units):
+    fixed = TruncatedCurrency.from_float(0.29, mode, alpha_code='EUR')
+    assert fixed.minor_units == units
+    previous = pycurrency.set_float_mode(mode)
+    try:
+        assert TruncatedCurrency(0.29).minor_units == units
+    finally:
+        pycurrency.set_float_mode(previous)
+    assert TruncatedCurrency(0.29).minor_units == 28
+
+
+@mark.parametrize('mode', ['exact', 'repr', 'minor'])
+def test_fixed_format_many_float_mode(mode):
+    amounts = [0.29, 2.675, 1 / 3, '0.299']
+    previous = pycurrency.set_float_mode(mode)
+    try:
+        for currency in (FixedCurrency, TruncatedCurrency):
+            assert list(currency.format_many(
+                amounts, '', alpha_code='EUR')) == [
+                format(currency(amount, alpha_code='EUR'), '')
+                for amount in amounts]
+    finally:
+        pycurrency.set_float_mode(previous)
+
+
+def test_fixed_quantize():
+    previous = pycurrency.set_quantize_rounding('ROUND_UP')
+    try:
+        assert TruncatedCurrency('0.299').minor_units == 29
+        assert (TruncatedCurrency(1) / 3).minor_units == 33
+        assert FixedCurrency('0.125').minor_units == 12
+        amounts = ['0.125', '0.299', 2.675, 1 / 3]
+        for currency in (FixedCurrency, TruncatedCurrency):
+            assert list(currency.format_many(amounts, '4.,3%a')) == [
+                format(currency(amount), '4.,3%a') for amount in amounts]
+    finally:
+        pycurrency.set_quantize_rounding(previous)
+
+
+def test_fixed_allocate():
+    fixed = FixedCurrency(100, alpha_code='EUR')
+    parts = fixed.allocate([1, 1, 1])
+    assert [part.minor_units for part in parts] == [3334, 3333, 3333]
+    assert all(type(part) is FixedCurrency for part in parts)
+    assert sum(parts, fixed * 0) == fixed
+    parts = TruncatedCurrency('-0.05').split(3)
+    assert [part.minor_units for part in parts] == [-2, -2, -1]
+    assert all(type(part) is TruncatedCurrency for part in parts)
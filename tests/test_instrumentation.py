@@ -0,0 +1,169 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2020-2022, Frederico Martins
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Tests for the instrumentation module."""
+
+import os
+import subprocess
+import sys
+from decimal import Decimal
+from pytest import fixture, mark
+from multicurrency import (
+    Currency,
+    Euro,
+    FixedCurrency,
+    PoundSterling,
+    currencies,
+    instrumentation)
+from multicurrency.instrumentation import (
+    disable,
+    enable,
+    instrumented,
+    is_enabled,
+    reset,
+    snapshot)
+from multicurrency.pycurrency import _Formatter
+
+
+@fixture(autouse=True)
+def switched_off():
+    disable()
+    reset()
+    yield
+    disable()
+
+
+def test_instrumentation_off():
+    add = vars(Currency)['__add__']
+    new = vars(Euro)['__new__']
+    call = vars(_Formatter)['__call__']
+    create = vars(currencies)['_currency_class']
+    enable()
+    assert is_enabled()
+    assert vars(Currency)['__add__'] is not add
+    enable()
+    disable()
+    assert not is_enabled()
+    assert vars(Currency)['__add__'] is add
+    assert vars(Euro)['__new__'] is new
+    assert vars(_Formatter)['__call__'] is call
+    assert vars(currencies)['_currency_class'] is create
+    _ = Euro(1) + Euro(2)
+    assert not {k: v for k, v in snapshot().items() if v}
+
+
+@mark.parametrize('operation,counters', [
+    (lambda: Euro(1), {'construct.Euro': 1}),
+    (lambda: Currency(1, alpha_code='EUR'), {'construct.Currency': 1}),
+    (lambda: Euro(1) + Euro(2), {
+        'construct.Euro': 3, 'arithmetic.__add__': 1}),
+    (lambda: Euro(1) * 2, {'construct.Euro': 2, 'arithmetic.__mul__': 1}),
+    (lambda: 2 * Euro(1), {'construct.Euro': 2, 'arithmetic.__rmul__': 1}),
+    (lambda: divmod(Euro(7), 2), {
+        'construct.Euro': 3, 'arithmetic.__divmod__': 1}),
+    (lambda: Euro(1).__copy__(), {'construct.Euro': 2}),
+    (lambda: Euro(1).__recreate__(2), {'construct.Euro': 2}),
+    (lambda: FixedCurrency(1, alpha_code='EUR'), {
+        'construct.FixedCurrency': 1}),
+    (lambda: FixedCurrency(1, alpha_code='EUR') * 3, {
+        'construct.FixedCurrency': 2, 'arithmetic.__mul__': 1}),
+    (lambda: str(Euro(1)), {'construct.Euro': 1, 'format.calls': 1}),
+    (lambda: list(Euro.format_many([1, 2])), {
+        'construct.Euro': 1, 'format.many': 1}),
+    (lambda: Euro.parse('1,00 €'), {
+        'construct.Euro': 2, 'parse.calls': 1})
+])
+def test_instrumentation_counters(operation, counters):
+    with instrumented() as recording:
+        operation()
+    values = recording.snapshot()
+    assert {
+        name: value for name, value in values.items()
+        if not name.startswith(('time.', 'cache.'))} == counters
+    for name in counters:
+        if name != 'format.many':
+            assert values[f'time.{name.split(".")[0]}'] > 0
+    assert not is_enabled()
+
+
+def test_instrumentation_recording():
+    euro = Euro(1)
+    with instrumented() as recording:
+        _ = euro + euro
+        assert recording.snapshot()['arithmetic.__add__'] == 1
+        _ = euro + euro
+    _ = euro + euro
+    assert recording.snapshot()['arithmetic.__add__'] == 2
+    assert 'Recording(' in repr(recording)
+
+
+def test_instrumentation_snapshot():
+    enable()
+    with instrumented():
+        _ = Euro(1) + Euro(1)
+    assert is_enabled()
+    _ = Euro(1)
+    values = snapshot()
+    assert values['construct.Euro'] == 4
+    assert values['arithmetic.__add__'] == 1
+    assert isinstance(values['time.construct'], float)
+    reset()
+    assert snapshot().get('construct.Euro') is None
+
+
+def test_instrumentation_cache():
+    with instrumented() as recording:
+        for _ in range(3):
+            _ = format(Euro(1), '7.,3%a')
+    values = recording.snapshot()
+    assert values['format.calls'] == 3
+    assert values['cache.formatter.misses'] == 1
+    assert values['cache.formatter.hits'] == 2
+
+
+def test_instrumentation_new_class():
+    name = 'PoundSterling'
+    module, description, info = currencies._CURRENCIES[name]
+    with instrumented() as recording:
+        currency = currencies._currency_class(
+            name, f'multicurrency.currencies.{module}', description, info)
+        _ = currency(1) - currency(Decimal('0.5'))
+    assert currency is not PoundSterling
+    counters = recording.snapshot()
+    assert counters[f'construct.{name}'] == 3
+    assert counters['arithmetic.__sub__'] == 1
+    assert not hasattr(vars(currency)['__new__'].__func__, '__wrapped__')
+    assert currency(1) == currency(1)
+
+
+def test_instrumentation_new_class_disabled():
+    name = 'PoundSterling'
+    module, description, info = currencies._CURRENCIES[name]
+    currency = instrumentation._currency_class(
+        name, f'multicurrency.currencies.{module}', description, info)
+    assert not is_enabled()
+    assert not hasattr(vars(currency)['__new__'].__func__, '__wrapped__')
+    _ = currency(1) + currency(2)
+    assert not {
+        k: v for k, v in snapshot().items()
+        if v and not k.startswith('cache.')}
+
+
+def test_instrumentation_environment():
+    env = dict(os.environ, **{instrumentation.ENVIRONMENT_VARIABLE: '1'})
+    env['PYTHONPATH'] = os.pathsep.join(sys.path)
+    process = subprocess.run(
+        [
+            sys.executable,
+            '-c',
+            'from multicurrency import Euro; '
+            'from multicurrency.instrumentation import is_enabled, snapshot;'
+            'Euro(1); print(is_enabled(), snapshot()["construct.Euro"])'],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True)
+    assert process.stdout.split() == ['True', '1']
@@ -0,0 +1,245 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2020-2022, Frederico Martins
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Tests for the currency input module."""
+
+import os
+import subprocess
+import sys
+from csv import reader
+from decimal import Decimal
+from io import BytesIO, StringIO
+from pytest import mark, raises
+from multicurrency import (
+    CurrencyArray,
+    CurrencyCodeException,
+    CurrencyInvalidFormat,
+    currencies)
+from multicurrency.io import read_csv, read_jsonl, write_csv, write_fixed
+
+
+CSV = [
+    'id,currency,country,amount',
+    '1,EUR,,1.10',
+    '2,USD,,2',
+    '3,978,Portugal,0.1',
+    '4,EUR,,-3.5',
+    '5,XBT,,0.00000001']
+
+JSONL = [
+    '{"currency": "EUR", "amount": 1.10}\n',
+    '{"currency": "USD", "amount": 2}\n',
+    '\n',
+    '{"currency": 978, "country": "Portugal", "amount": "0.1"}\n',
+    '{"currency": "EUR", "amount": -3.5}\n',
+    '{"currency": "XBT", "amount": 0.00000001}\n']
+
+
+def _merge(chunks):
+    merged = {}
+    for chunk in chunks:
+        for currency, amounts in chunk.items():
+            merged.setdefault(currency, []).extend(amounts)
+    return merged
+
+
+@mark.parametrize('chunks', [
+    read_csv(CSV),
+    read_jsonl(JSONL)
+])
+def test_io_read(chunks):
+    assert _merge(chunks) == {
+        currencies.Euro: [Decimal('1.10'), Decimal('0.1'), Decimal('-3.5')],
+        currencies.USDollar: [Decimal(2)],
+        currencies.Bitcoin: [Decimal('0.00000001')]}
+
+
+@mark.parametrize('chunks', [
+    read_csv(CSV, country='country'),
+    read_jsonl(
+        [line.replace('{', '{"country": "", ', 1) if 'country' not in line
+         else line for line in JSONL],
+        country='country')
+])
+def test_io_read_country(chunks):
+    merged = _merge(chunks)
+    assert merged[currencies.EuroPT] == [Decimal('0.1')]
+    assert merged[currencies.Euro] == [Decimal('1.10'), Decimal('-3.5')]
+
+
+def test_io_read_amounts_exact():
+    chunk, = read_jsonl(['{"currency": "EUR", "amount": 0.1}'])
+    amount, = chunk[currencies.Euro]
+    assert str(amount) == '0.1'
+    assert isinstance(amount, Decimal)
+
+
+@mark.parametrize('chunk_size,sizes', [
+    (1, [1, 1, 1, 1, 1]),
+    (2, [2, 2, 1]),
+    (5, [5]),
+    (65_536, [5])
+])
+def test_io_read_chunks(chunk_size, sizes):
+    chunks = list(read_csv(CSV, chunk_size=chunk_size))
+    assert [sum(map(len, chunk.values())) for chunk in chunks] == sizes
+
+
+def test_io_read_lazy():
+    def lines():
+        yield 'currency,amount'
+        while True:
+            yield 'EUR,1'
+    chunks = read_csv(lines(), chunk_size=10)
+    assert next(chunks) == {currencies.Euro: [Decimal(1)] * 10}
+    assert next(chunks) == {currencies.Euro: [Decimal(1)] * 10}
+
+
+def test_io_read_formatted():
+    lines = [
+        'currency;amount',
+        f'EUR;{currencies.Euro("-1234.5")}',
+        f'AFN;{currencies.Afghani("1234.5")}',
+        f'EUR;{currencies.Euro(7).international()}']
+    assert _merge(read_csv(lines, formatted=True, delimiter=';')) == {
+        currencies.Euro: [Decimal('-1234.50'), Decimal('7.00')],
+        currencies.Afghani: [Decimal('1234.50')]}
+    with raises(CurrencyInvalidFormat):
+        _ = list(read_jsonl(
+            ['{"currency": "EUR", "amount": "1.5 $"}'], formatted=True))
+
+
+def test_io_read_empty():
+    assert not list(read_csv([]))
+    assert not list(read_csv(['currency,amount']))
+    assert not list(read_jsonl([]))
+
+
+def test_io_read_invalid():
+    with raises(CurrencyCodeException):
+        _ = list(read_csv(['currency,amount', 'XXX,1']))
+    with raises(CurrencyCodeException):
+        _ = list(read_csv(
+            ['currency,country,amount', 'EUR,Japan,1'], country='country'))
+    with raises(ValueError):
+        _ = list(read_csv(['code,amount', 'EUR,1']))
+    with raises(ValueError):
+        _ = list(read_csv(CSV, chunk_size=0))
+    with raises(KeyError):
+        _ = list(read_jsonl(['{"amount": 1}']))
+
+
+LEDGER = [
+    currencies.Euro('1234.5'),
+    currencies.Afghani('-7'),
+    currencies.Euro('-0.125'),
+    currencies.USDollar('1000000'),
+    currencies.Bitcoin('0.00000001')]
+
+
+@mark.parametrize('fmt', ['', '%c%a', '4%a %s', '.,3%A'])
+@mark.parametrize('chunk_size', [1, 2, 65_536])
+def test_io_write_csv(fmt, chunk_size):
+    file = StringIO(newline='')
+    write_csv(file, LEDGER, fmt, chunk_size=chunk_size)
+    file.seek(0)
+    lines = file.read().splitlines()
+    assert lines[0] == 'currency,amount'
+    assert [line.split(',', 1)[0] for line in lines[1:]] == [
+        currency.alpha_code for currency in LEDGER]
+    file.seek(0)
+    assert list(reader(file))[1:] == [
+        [currency.alpha_code, format(currency, fmt)] for currency in LEDGER]
+
+
+def test_io_write_csv_round_trip():
+    file = StringIO(newline='')
+    write_csv(file, LEDGER, delimiter='\t')
+    file.seek(0)
+    merged = {}
+    for chunk in read_csv(file, formatted=True, delimiter='\t'):
+        for currency, amounts in chunk.items():
+            merged.setdefault(currency, []).extend(amounts)
+    assert merged == {
+        currencies.Euro: [Decimal('1234.50'), Decimal('-0.12')],
+        currencies.Afghani: [Decimal(-7)],
+        currencies.USDollar: [Decimal(1000000)],
+        currencies.Bitcoin: [Decimal('0.00000001')]}
+
+
+def test_io_write_csv_options():
+    file = BytesIO()
+    array = CurrencyArray(['1.5', 2], currencies.Afghani)
+    write_csv(file, array, code='', header=False, lineterminator='\n')
+    assert file.getvalue().decode() == ''.join(
+        f'{currency}\n' for currency in array)
+    file = BytesIO()
+    write_csv(file, LEDGER[:1], encoding='utf-16')
+    assert file.getvalue().decode('utf-16') == (
+        'currency,amount\r\nEUR,"1.234,50\u00A0€"\r\n')
+    file = StringIO()
+    write_csv(file, [])
+    assert file.getvalue() == 'currency,amount\r\n'
+    with raises(ValueError):
+        write_csv(StringIO(), LEDGER, chunk_size=0)
+
+
+@mark.parametrize('currencies_,fmt', [
+    (LEDGER, ''),
+    (iter(LEDGER), '%c%a'),
+    (CurrencyArray(['-1000000.5', 0, '9.99'], currencies.Euro), ''),
+    (CurrencyArray(['-1.5', '1234567.89'], currencies.Afghani), '%a'),
+    (CurrencyArray([], currencies.Euro), '')
+])
+def test_io_write_fixed(currencies_, fmt):
+    expected = list(currencies_)
+    if not isinstance(currencies_, CurrencyArray):
+        currencies_ = iter(expected)
+    file = StringIO()
+    write_fixed(file, currencies_, fmt, chunk_size=2)
+    lines = file.getvalue().splitlines()
+    assert len({len(line) for line in lines}) == 1
+    assert lines[0].split() == ['currency', 'amount']
+    assert [line[:3] for line in lines[1:]] == [
+        currency.alpha_code for currency in expected]
+    assert [line[9:].lstrip(' ') for line in lines[1:]] == [
+        format(currency, fmt) for currency in expected]
+    width = max(len(format(currency, fmt)) for currency in expected) if (
+        expected) else 0
+    assert len(lines[0]) == 9 + max(width, len('amount'))
+
+
+def test_io_write_fixed_options():
+    file = BytesIO()
+    write_fixed(file, LEDGER[:2], code='', header=False, width=12)
+    assert file.getvalue().decode() == ''.join(
+        f'{format(currency):>12}\n' for currency in LEDGER[:2])
+    file = StringIO()
+    write_fixed(file, CurrencyArray([5, -10], currencies.USDollar), '%c')
+    assert file.getvalue() == (
+        'currency amount\n'
+        'USD         USD\n'
+        'USD         USD\n')
+    with raises(ValueError):
+        write_fixed(StringIO(), LEDGER, chunk_size=0)
+
+
+def test_io_lazy():
+    code = (
+        'import io, sys; from multicurrency import Euro;'
+        'from multicurrency.io import read_csv, write_csv, write_fixed;'
+        'write_csv(io.StringIO(), [Euro(1)]);'
+        'write_fixed(io.StringIO(), [Euro(1)]);'
+        'list(read_csv(io.StringIO("currency,amount\\nEUR,1\\n")));'
+        'print("multicurrency.arrays" in sys.modules, "numpy" in sys.modules)')
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    output = subprocess.run(
+        [sys.executable, '-c', code],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True).stdout
+    assert output.split() == ['False', 'False']
@@ -8,6 +8,7 @@
 
 import math
 import pickle
+import re
 from decimal import Decimal, localcontext
 from pytest import mark, raises
 from multicurrency import (
@@ -15,8 +16,15 @@ from multicurrency import (
     CurrencyInvalidFormat,
     CurrencyInvalidMultiplication,
     CurrencyMismatchException,
-    CurrencyTypeException)
-from multicurrency.pycurrency import Currency
+    CurrencyTypeException,
+    currencies)
+from multicurrency import pycurrency
+from multicurrency.currencies import euro
+from multicurrency.pycurrency import (
+    Currency,
+    CurrencySpec,
+    _currency_class,
+    _formatter)
 
 
 euro_minus_one = Currency(amount=-1, alpha_code='EUR')
@@ -139,6 +147,64 @@ def test_pycurrency_recreate(amount, new_amount):
     assert new.amount == new_amount
 
 
+class CustomCurrency(Currency):
+    """Currency with a different creator signature."""
+
+    __slots__ = ()
+
+    def __new__(cls, amount, pattern='3.,3%a%s'):
+        return super().__new__(
+            cls,
+            amount=amount,
+            alpha_code='XXX',
+            symbol='¤',
+            pattern=pattern)
+
+
+def test_pycurrency_recreate_trusted():
+    custom = CustomCurrency(1, pattern='1.,3%s%a')
+    for new in [
+            custom + CustomCurrency(2),
+            custom - CustomCurrency(2),
+            custom * 3,
+            custom / 3,
+            -custom,
+            round(custom),
+            custom.__recreate__(3)]:
+        assert type(new) is CustomCurrency
+        assert new.spec is custom.spec
+    assert (custom * 3).amount == Decimal(3)
+    assert round(custom).amount == Decimal(1)
+    assert (custom / 3).__str__() == '¤0.3'
+
+
+def test_pycurrency_currency_class():
+    info = ('XXX', '999', '¤', 'X¤', '', '1.,3%s%a')
+    custom = _currency_class('Custom', __name__, 'Custom (Test)', info)
+    default = custom(1000)
+    assert issubclass(custom, Currency)
+    assert custom.__name__ == 'Custom'
+    assert custom.__module__ == __name__
+    assert custom.__doc__.startswith('Custom (Test) currency')
+    assert '¤123,456.8' in custom.__doc__
+    assert not hasattr(default, '__dict__')
+    assert default.spec is custom(1).spec
+    assert default.spec == CurrencySpec(*info)
+    assert custom(amount=1, pattern='2.,3%a%S').__str__() == '1.00X¤'
+    assert custom(1, pattern='2.,3%a%S').alpha_code == 'XXX'
+
+
+def test_pycurrency_currency_class_pickle():
+    assert euro.Euro is currencies.Euro
+    assert pickle.loads(pickle.dumps(currencies.Euro)) is euro.Euro
+    assert pickle.loads(pickle.dumps(euro.Euro(1))) == euro.Euro(1)
+    with raises(AttributeError):
+        _ = euro.USDollar
+    with raises(AttributeError):
+        _ = currencies.Unknown
+    assert 'EuroPT' in dir(euro)
+
+
 @mark.parametrize('amount,pattern,exception,printed', [
     (1000, '4.,3%a', None, '1,000.0000'),
     (1000, '1.,3%a', None, '1,000.0'),
@@ -158,6 +224,12 @@ def test_pycurrency_decimal_places(amount, pattern, exception, printed):
     (10000, '2.,4%a', None, '1,0000.00'),
     (10000, '2.,1%a', None, '1,0,0,0,0.00'),
     (10000, '2.,0%a', None, '10000.00'),
+    (-123456789, '2.,3;2%a', None, '-12,34,56,789.00'),
+    (1234567890, '0.,3;2;4%a', None, '1,2345,67,890'),
+    (123456789, '0.,3;0%a', None, '123456,789'),
+    (123456789, '0.,0;3%a', None, '123456789'),
+    (123456789, '0.,3;3%a', None, '123,456,789'),
+    (10000, '2.,3;%a', None, ';10,000.00'),
     (10000, '2.,-2%a', CurrencyInvalidFormat, 'Invalid currency format')
 ])
 def test_pycurrency_grouping_places(amount, pattern, exception, printed):
@@ -167,6 +239,32 @@ def test_pycurrency_grouping_places(amount, pattern, exception, printed):
     else:
         default = Currency(amount=amount, pattern=pattern)
         assert default.__str__() == printed
+        assert default.spec.grouping_places == int(pattern[3])
+        assert Currency.parse(printed, pattern=pattern) == default
+
+
+@mark.parametrize('fmt,printed', [
+    ('.,3;2', '₹12,34,56,789.12'),
+    ('0.,3;2', '₹12,34,56,789'),
+    ('.,2;3', '₹1,234,567,89.12'),
+    ('.,3;2%A %c', '12,34,56,789.12 INR')
+])
+def test_pycurrency_grouping_sizes(fmt, printed):
+    rupee = currencies.IndianRupee('123456789.123')
+    assert format(rupee, fmt) == printed
+    assert list(currencies.IndianRupee.format_many(
+        [rupee.amount], fmt)) == [printed]
+
+
+@mark.parametrize('places', [1, 2, 4, 7])
+def test_pycurrency_grouping_regex(places):
+    expression = re.compile(rf'(\d)(?=(\d{{{places}}})+$)')
+    for digits in range(1, 20):
+        value = Decimal('-9876543210987654321'[:digits + 1])
+        for amount in (value, -value):
+            assert format(
+                Currency(amount), f'0.,{places}%a') == expression.sub(
+                r'\1,', f'{amount:f}')
 
 
 @mark.parametrize('amount,convertion,printed', [
@@ -223,6 +321,37 @@ def test_pycurrency_comparison_eq(first, second, equal):
         assert not first.__eq__(second)
 
 
+@mark.parametrize('first,second', [
+    (currencies.Euro(1), currencies.Euro('1.00')),
+    (currencies.Euro('-0'), currencies.Euro(0)),
+    (Currency(1, alpha_code='EUR'), Currency('1.0', alpha_code='EUR')),
+    (euro_one, euro_one.__copy__()),
+    (euro_one, pickle.loads(pickle.dumps(euro_one))),
+    (euro_one, euro_one_other)
+])
+def test_pycurrency_hash_cache(first, second):
+    assert first == second
+    for currency in (first, second):
+        expected = hash((
+            currency.__class__,
+            currency.amount,
+            currency.alpha_code,
+            currency.numeric_code))
+        assert hash(currency) == expected
+        assert hash(currency) == expected
+    assert len({first, second}) == (
+        1 if first.numeric_code == second.numeric_code else 2)
+    assert {first: 1}.get(second) == (
+        1 if first.numeric_code == second.numeric_code else None)
+
+
+def test_pycurrency_comparison_eq_nan():
+    nan = currencies.Euro('NaN')
+    assert nan == nan
+    assert nan == nan.__copy__()
+    assert nan != currencies.Euro('NaN')
+
+
 @mark.parametrize('first,second,greater_equal,exception', [
     (euro_one, euro_one, True, None),
     (euro_one, euro_one_other, True, None),
@@ -421,6 +550,43 @@ def test_pycurrency_math_sub(first, second, result, exception):
         assert second.__rsub__(first) == result
 
 
+@mark.parametrize('currencies,start,result,exception', [
+    ([euro_one, euro_two, euro_minus_one], None, euro_two, None),
+    ((c for c in [euro_one, euro_two]), euro_three, Currency(6, 'EUR'), None),
+    ([], None, Currency(0), None),
+    ([], euro_one, euro_one, None),
+    ([euro.Euro(1), euro_two], None, euro.Euro(3), None),
+    ([euro_one, usd_one], None, None, CurrencyMismatchException),
+    ([usd_one], euro_one, None, CurrencyMismatchException),
+    ([euro_one, 1.00], None, None, CurrencyTypeException),
+    ([1.00], None, None, CurrencyTypeException)
+])
+def test_pycurrency_sum(currencies, start, result, exception):
+    if exception:
+        with raises(exception):
+            Currency.sum(currencies, start=start)
+    else:
+        total = Currency.sum(currencies, start=start)
+        assert total == result
+        assert type(total) is type(result)
+        assert total.spec == result.spec
+
+
+def test_pycurrency_sum_class():
+    euros = [euro.Euro('0.1')] * 10
+    assert euro.Euro.sum(euros) == sum(euros[1:], euros[0])
+    assert euro.Euro.sum([]).__repr__() == euro.Euro(0).__repr__()
+    assert type(euro.Euro.sum([euro_one])) is Currency
+    dollars = [currencies.USDollar(1), currencies.USDollar(2)]
+    with raises(CurrencyMismatchException):
+        euro.Euro.sum(dollars)
+    with raises(CurrencyMismatchException):
+        euro.Euro.sum([], start=currencies.USDollar(1))
+    with raises(CurrencyMismatchException):
+        euro.Euro.sum([euro_one, currencies.USDollar(1)])
+    assert currencies.USDollar.sum(dollars) == currencies.USDollar(3)
+
+
 @mark.parametrize('dividend,divisor,result,exception', [
     (euro_three, 3, euro_one, None),
     (euro_one, -1, euro_minus_one, None),
@@ -583,6 +749,144 @@ def test_pycurrency_format(currency, pattern, result, exception):
         assert currency.__format__(pattern) == result
 
 
+@mark.parametrize('amount,pattern,printed', [
+    (1000, '2.,3{%a}', '{1,000.00}'),
+    (1000, '2.,3%%a', '%a'),
+    (1000, '2.,3%x%a', '%x1,000.00'),
+    (-1000, '2.,3%-%U%', '-1,000.00%'),
+    (1000, '2.,4%a', '1000.00'),
+    (123456789, '0.,4%a', '1,2345,6789')
+])
+def test_pycurrency_format_pattern_parts(amount, pattern, printed):
+    assert Currency(amount=amount, pattern=pattern).__str__() == printed
+
+
+def test_pycurrency_format_cache():
+    formatter = _formatter('2,.3%a %s', '4')
+    assert _formatter('2,.3%a %s', '4') is formatter
+    assert _formatter('2,.3%a %s', '3') is not formatter
+    assert formatter.decimal_places == 4
+    assert formatter.decimal_sign == ','
+    assert formatter.grouping_sign == '.'
+    assert formatter.grouping_places == 3
+
+
+@mark.parametrize('convertion,fmt', [
+    ('٠١٢٣٤٥٦٧٨٩-', ''),
+    ('٠١٢٣٤٥٦٧٨٩-', '.,'),
+    ('٠١٢٣٤٥٦٧٨٩-', '.X'),
+    ('٠١٢٣٤٥٦٧٨٩-', 'X.'),
+    ('۰۱۲۳۴۵۶۷۸۹−', '4٫٬2'),
+    ('0123456789X', ',.'),
+    ('.,X3456789-', '')
+])
+def test_pycurrency_format_convertion(convertion, fmt):
+    currency = Currency(
+        '-1234567.891', convertion=convertion, pattern='2٫٬3%a %s')
+    formatter = _formatter(currency.pattern, fmt)
+    converted = format(currency, f'{fmt}%A').translate(
+        currency.spec.translation).replace('.', 'X').replace(
+        ',', formatter.grouping_sign).replace('X', formatter.decimal_sign)
+    assert format(currency, f'{fmt}%a') == converted
+    assert list(Currency.format_many(
+        [currency.amount], f'{fmt}%a', convertion=convertion,
+        pattern=currency.pattern)) == [converted]
+
+
+@mark.parametrize('fmt', [
+    '', '4', '.,2', '0', '%a\u00A0%S', '%-%U%c', '{%s}%a%%', '.X%a', '%c%%'
+])
+def test_pycurrency_format_many(fmt):
+    amounts = ['0', '-1234567.895', 1/7*-1_000_000, Decimal('12.345')]
+    for name in currencies.__all__:
+        currency = getattr(currencies, name)
+        expected = [format(currency(amount), fmt) for amount in amounts]
+        assert list(currency.format_many(amounts, fmt)) == expected
+    for currency in [euro_custom, kyat_custom]:
+        kwargs = {
+            'alpha_code': currency.alpha_code,
+            'numeric_code': currency.numeric_code,
+            'symbol': '{%s}',
+            'localized_symbol': currency.localized_symbol,
+            'convertion': currency.convertion,
+            'pattern': currency.pattern}
+        expected = [
+            format(Currency(amount, **kwargs), fmt) for amount in amounts]
+        assert list(Currency.format_many(amounts, fmt, **kwargs)) == expected
+
+
+@mark.parametrize('currency,text,amount', [
+    (euro.Euro, '123.456,79\u00A0€', '123456.79'),
+    (euro.Euro, ' -123.456,79 € ', '-123456.79'),
+    (euro.Euro, '123,456.79 EUR', '123456.79'),
+    (euro.Euro, '1.234', '1234'),
+    (euro.Euro, '0,125\u00A0€', '0.125'),
+    (euro.EuroPT, 'PT€ 1,5', '1.5'),
+    (currencies.AustralianDollar, '123,456.79 AUD', '123456.79'),
+    (currencies.AustralianDollarKI, '-KI$1.00', '-1'),
+    (currencies.BahrainiDinar, 'د.ب.\u00A0١٢٣٬٤٥٦٫٧٨٩', '123456.789'),
+    (currencies.Afghani, '؋ -۱۲۳', '-123'),
+    (currencies.ArmenianDram, '1\u202F234,5 Դ', '1234.5')
+])
+def test_pycurrency_parse(currency, text, amount):
+    parsed = currency.parse(text)
+    assert type(parsed) is currency
+    assert parsed.amount == Decimal(amount)
+    assert list(currency.parse_many([text, text])) == [parsed, parsed]
+
+
+@mark.parametrize('formatter,precision', [
+    (lambda c: c.__str__(), None),
+    (lambda c: c.localized(), None),
+    (lambda c: c.international(), None),
+    (lambda c: format(c, '%a'), None),
+    (lambda c: format(c, '5'), 5)
+])
+def test_pycurrency_parse_format(formatter, precision):
+    amounts = ['0', '-1234567.891', '123456.789', Decimal('0.5')]
+    for name in currencies.__all__:
+        currency = getattr(currencies, name)
+        places = precision or currency(0).spec.decimal_places
+        for amount in amounts:
+            text = formatter(currency(amount))
+            expected = round(Decimal(amount), places)
+            assert currency.parse(text).amount == expected, text
+
+
+@mark.parametrize('text,kwargs', [
+    ('1,,0', {}),
+    ('1.00 €', {'symbol': '$'}),
+    ('EUR 1.00', {'alpha_code': 'EUR'}),
+    ('1..0', {}),
+    ('1.0.', {}),
+    ('', {}),
+    ('€', {'symbol': '€'})
+])
+def test_pycurrency_parse_invalid(text, kwargs):
+    with raises(CurrencyInvalidFormat):
+        _ = Currency.parse(text, **kwargs)
+    with raises(CurrencyInvalidFormat):
+        _ = list(Currency.parse_many([text], **kwargs))
+
+
+def test_pycurrency_parse_generic():
+    custom = Currency.parse('-€142.857,14', **{
+        'alpha_code': 'EUR', 'symbol': '€', 'localized_symbol': 'PT€',
+        'pattern': r'2,.3%-%s%u'})
+    assert custom.amount == Decimal('-142857.14')
+    assert custom.spec.pattern == r'2,.3%-%s%u'
+    assert Currency.parse('1,234.5').amount == Decimal('1234.5')
+    with raises(TypeError):
+        _ = Currency.parse(1)
+
+
+def test_pycurrency_format_many_invalid():
+    with raises(TypeError):
+        _ = Currency.format_many([1], 2)
+    with raises(CurrencyInvalidFormat):
+        _ = Currency.format_many([1], pattern='%a')
+
+
 @mark.parametrize('value,result', [
     (1/7, 0),
     ('0.3', 0),
@@ -624,6 +928,38 @@ def test_pycurrency_reduce():
     assert euro_custom_negative == unpickled_currency
 
 
+def test_pycurrency_reduce_subclass():
+    custom = CustomCurrency(-1000, pattern='1.,3%s%a')
+    unpickled_currency = pickle.loads(pickle.dumps(custom))
+    assert type(unpickled_currency) is CustomCurrency
+    assert unpickled_currency == custom
+    assert unpickled_currency.spec is custom.spec
+    assert unpickled_currency.__str__() == '¤-1,000.0'
+
+
+def test_pycurrency_spec():
+    spec = euro_custom.spec
+    assert isinstance(spec, CurrencySpec)
+    assert spec == CurrencySpec(
+        'EUR', '978', '€', 'PT€', '0123456789-', '2,.3%-%s%u')
+    assert spec.decimal_places == 2
+    assert spec.decimal_sign == ','
+    assert spec.grouping_sign == '.'
+    assert spec.grouping_places == 3
+    assert euro_custom_negative.spec is spec
+    assert (euro_custom * 2).spec is spec
+    assert Currency(1).spec is Currency(2).spec
+    assert Currency(1).spec is not Currency(1, pattern='3.,3%a').spec
+    with raises(AttributeError):
+        spec.pattern = '3.,3%a'
+
+
+@mark.parametrize('pattern', ['', '2.,%a', '.,3%a', '2.3%a'])
+def test_pycurrency_spec_invalid(pattern):
+    with raises(CurrencyInvalidFormat):
+        CurrencySpec(pattern=pattern)
+
+
 @mark.parametrize('value, decimals, rounded', [
     (1/7, 0, 0),
     (1/7, 2, 0.14),
@@ -731,3 +1067,217 @@ def test_pycurrency_rounding(currency, rounding, results):
             context.prec = precision
             test_currency = currency
             assert test_currency.precision(precision) == result
+
+
+@mark.parametrize('mode,amount,result', [
+    ('exact', 1.1, Decimal(1.1)),
+    ('exact', '1.1', Decimal('1.1')),
+    ('repr', 1.1, Decimal('1.1')),
+    ('repr', 1/7, Decimal('0.14285714285714285')),
+    ('repr', 1e-7, Decimal('1E-7')),
+    ('repr', 2, Decimal('2')),
+    ('minor', 1/7, Decimal('0.14')),
+    ('minor', 2.675, Decimal('2.68')),
+    ('minor', 1e30, Decimal('1E+30')),
+    ('minor', -0.0, Decimal('-0.00')),
+    ('minor', Decimal('0.125'), Decimal('0.125')),
+    ('minor', float('inf'), Decimal('Infinity'))
+])
+def test_pycurrency_from_float(mode, amount, result):
+    currency = currencies.Euro.from_float(amount, mode)
+    assert currency.__class__ is currencies.Euro
+    assert currency.amount == result
+    assert str(currency.amount) == str(result)
+    custom = Currency.from_float(amount, mode, alpha_code='EUR')
+    assert str(custom.amount) == str(result)
+    previous = pycurrency.set_float_mode(mode)
+    try:
+        assert pycurrency.get_float_mode() == mode
+        assert str(currencies.Euro(amount).amount) == str(result)
+        assert str(custom.__recreate__(amount).amount) == str(result)
+        assert str(Currency(amount).amount) == str(
+            Currency.from_float(amount, mode).amount)
+    finally:
+        pycurrency.set_float_mode(previous)
+    assert pycurrency.get_float_mode() == 'exact'
+    assert currencies.Euro(amount).amount.compare_total(
+        Decimal(amount)) == 0
+
+
+def test_pycurrency_from_float_places():
+    yen = currencies.Yen.from_float(1234.5678, 'minor')
+    assert str(yen.amount) == '1235'
+    dinar = currencies.BahrainiDinar.from_float(0.1 + 0.2, 'minor')
+    assert str(dinar.amount) == '0.300'
+    custom = Currency.from_float(1 / 3, 'minor', pattern='4.,3%a')
+    assert str(custom.amount) == '0.3333'
+
+
+@mark.parametrize('mode', ['', 'Repr', None, 'decimal'])
+def test_pycurrency_float_mode_invalid(mode):
+    with raises(ValueError):
+        pycurrency.set_float_mode(mode)
+    with raises(ValueError):
+        currencies.Euro.from_float(1.1, mode)
+    assert pycurrency.get_float_mode() == 'exact'
+
+
+@mark.parametrize('mode', ['exact', 'repr', 'minor'])
+@mark.parametrize('fmt', ['', '4.,3%a', '.,0'])
+def test_pycurrency_format_many_float_mode(mode, fmt):
+    amounts = [2.675, 0.29, 1 / 3, 1.005, '1.005', Decimal('2.675')]
+    previous = pycurrency.set_float_mode(mode)
+    try:
+        expected = [
+            format(currencies.Euro(amount), fmt) for amount in amounts]
+        assert list(currencies.Euro.format_many(amounts, fmt)) == expected
+        assert list(Currency.format_many(
+            amounts, fmt, pattern='1.,3%a')) == [
+            format(Currency(amount, pattern='1.,3%a'), fmt)
+            for amount in amounts]
+    finally:
+        pycurrency.set_float_mode(previous)
+    if mode != 'exact' and not fmt:
+        assert expected[0] == '2,68\xa0€'
+
+
+@mark.parametrize('currency,minor_unit', [
+    (currencies.Euro(1), Decimal('0.01')),
+    (currencies.Yen(1), Decimal('1')),
+    (currencies.BahrainiDinar(1), Decimal('0.001')),
+    (currencies.Ethereum(1), Decimal('1E-18')),
+    (Currency(1, pattern='4.,3%a'), Decimal('0.0001'))
+])
+def test_pycurrency_minor_unit(currency, minor_unit):
+    assert str(currency.spec.minor_unit) == str(minor_unit)
+    assert currency.spec.minor_unit.as_tuple().digits == (1,)
+
+
+@mark.parametrize('rounding,operation,amount', [
+    ('ROUND_HALF_EVEN', lambda: currencies.Euro('0.125'), '0.12'),
+    ('ROUND_HALF_UP', lambda: currencies.Euro('0.125'), '0.13'),
+    ('ROUND_DOWN', lambda: currencies.Euro(1/7), '0.14'),
+    ('ROUND_UP', lambda: currencies.Euro(1) / 3, '0.34'),
+    ('ROUND_HALF_UP', lambda: currencies.Yen(1_000) * Decimal('1.0125'),
+     '1013'),
+    ('ROUND_HALF_UP', lambda: currencies.Euro(100) * Decimal('1.0125') *
+     Decimal('1.0125'), '102.52'),
+    ('ROUND_HALF_UP', lambda: divmod(currencies.Euro(10), 3)[0], '3.00'),
+    ('ROUND_HALF_UP', lambda: Currency(2, pattern='3.,3%a') / 3, '0.667'),
+    ('ROUND_HALF_UP', lambda: currencies.Euro.sum(
+        [currencies.Euro('0.004')] * 3), '0.00'),
+    ('ROUND_HALF_UP', lambda: currencies.Euro(1).__recreate__(0.125),
+     '0.13'),
+    ('ROUND_HALF_UP', lambda: currencies.Euro.parse('1,005 €'), '1.01'),
+    ('ROUND_HALF_UP', lambda: currencies.Euro('Infinity'), 'Infinity'),
+    ('ROUND_HALF_UP', lambda: -currencies.Euro('1E+30'),
+     '-1000000000000000000000000000000.00')
+])
+def test_pycurrency_quantize(rounding, operation, amount):
+    assert pycurrency.get_quantize_rounding() is None
+    previous = pycurrency.set_quantize_rounding(rounding)
+    try:
+        assert pycurrency.get_quantize_rounding() == rounding
+        assert str(operation().amount) == amount
+    finally:
+        pycurrency.set_quantize_rounding(previous)
+    assert pycurrency.get_quantize_rounding() is None
+    assert str((currencies.Euro(1) / 3).amount) == str(Decimal(1) / 3)
+
+
+def test_pycurrency_quantize_float_mode():
+    pycurrency.set_quantize_rounding('ROUND_DOWN')
+    try:
+        assert str(currencies.Euro(0.29).amount) == '0.28'
+        pycurrency.set_float_mode('repr')
+        assert str(currencies.Euro(0.29).amount) == '0.29'
+        pycurrency.set_quantize_rounding(None)
+        assert str(currencies.Euro(0.29).amount) == '0.29'
+    finally:
+        pycurrency.set_float_mode('exact')
+        pycurrency.set_quantize_rounding(None)
+    assert currencies.Euro(0.29).amount == Decimal(0.29)
+
+
+@mark.parametrize('rounding', ['ROUND_HALF_UP', 'ROUND_DOWN', 'ROUND_UP'])
+@mark.parametrize('mode', ['exact', 'repr'])
+@mark.parametrize('fmt', ['', '4.,3%a', '.,1'])
+def test_pycurrency_format_many_quantize(rounding, mode, fmt):
+    amounts = ['0.125', 0.125, 2.675, Decimal('1.005'), '-0.125', 1 / 3]
+    previous_rounding = pycurrency.set_quantize_rounding(rounding)
+    previous_mode = pycurrency.set_float_mode(mode)
+    try:
+        assert list(currencies.Euro.format_many(amounts, fmt)) == [
+            format(currencies.Euro(amount), fmt) for amount in amounts]
+        assert list(Currency.format_many(
+            amounts, fmt, pattern='1.,3%a')) == [
+            format(Currency(amount, pattern='1.,3%a'), fmt)
+            for amount in amounts]
+        if rounding == 'ROUND_HALF_UP' and not fmt:
+            assert list(currencies.Euro.format_many(['0.125'])) == [
+                '0,13\xa0€']
+    finally:
+        pycurrency.set_float_mode(previous_mode)
+        pycurrency.set_quantize_rounding(previous_rounding)
+
+
+@mark.parametrize('rounding', ['', 'round_half_up', 'HALF_UP', 1])
+def test_pycurrency_quantize_invalid(rounding):
+    with raises(ValueError):
+        pycurrency.set_quantize_rounding(rounding)
+    assert pycurrency.get_quantize_rounding() is None
+
+
+@mark.parametrize('currency,ratios,amounts', [
+    (currencies.Euro(100), [1, 1, 1], ['33.34', '33.33', '33.33']),
+    (currencies.Euro(-100), [1, 1, 1], ['-33.34', '-33.33', '-33.33']),
+    (currencies.Euro('0.05'), [3, 7], ['0.02', '0.03']),
+    (currencies.Euro(10), [0.5, 0.25, 0.25], ['5.00', '2.50', '2.50']),
+    (currencies.Euro(10), [Decimal('0.7'), 0, Decimal('0.3')], [
+        '7.00', '0.00', '3.00']),
+    (currencies.Euro('0.01'), [1, 1], ['0.01', '0.00']),
+    (currencies.Euro('1.005'), [1], ['1.00']),
+    (currencies.Yen(1_000), [1, 2, 3], ['167', '333', '500']),
+    (currencies.BahrainiDinar(1), [1] * 3, ['0.334', '0.333', '0.333']),
+    (Currency(1, pattern='4.,3%a'), [2, 1], ['0.6667', '0.3333'])
+])
+def test_pycurrency_allocate(currency, ratios, amounts):
+    parts = currency.allocate(ratios)
+    assert [part.amount for part in parts] == [
+        Decimal(amount) for amount in amounts]
+    assert all(part.spec is currency.spec for part in parts)
+    assert all(type(part) is type(currency) for part in parts)
+    assert sum(parts, currency * 0) == round(
+        currency, currency.spec.decimal_places)
+
+
+@mark.parametrize('ratios,exception', [
+    ([], ValueError),
+    ([0, 0], ValueError),
+    ([1, -1, 1], ValueError),
+    ([1, float('nan')], ValueError),
+    ([1, Decimal('Infinity')], ValueError),
+    ([1, '1'], CurrencyInvalidDivision),
+    ([1, None], CurrencyInvalidDivision)
+])
+def test_pycurrency_allocate_invalid(ratios, exception):
+    with raises(exception):
+        currencies.Euro(1).allocate(ratios)
+
+
+@mark.parametrize('currency,parts,amounts', [
+    (currencies.Euro(100), 3, ['33.34', '33.33', '33.33']),
+    (currencies.Euro('-0.05'), 3, ['-0.02', '-0.02', '-0.01']),
+    (currencies.Euro('0.02'), 4, ['0.01', '0.01', '0.00', '0.00']),
+    (currencies.Euro(1), 1, ['1.00']),
+    (currencies.Yen(1_000), 7, ['143'] * 6 + ['142'])
+])
+def test_pycurrency_split(currency, parts, amounts):
+    result = currency.split(parts)
+    assert [part.amount for part in result] == [
+        Decimal(amount) for amount in amounts]
+    assert result == currency.allocate([1] * parts)
+    with raises(ValueError):
+        currency.split(0)
+    with raises(CurrencyInvalidDivision):
+        currency.split(2.0)
@@ -0,0 +1,131 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2020-2022, Frederico Martins
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Tests for the exchange rates module."""
+
+import os
+import subprocess
+import sys
+from decimal import Decimal
+from pytest import fixture, mark, raises
+from multicurrency import (
+    Converter,
+    Currency,
+    CurrencyArray,
+    CurrencyRateException,
+    CurrencyTypeException,
+    Euro,
+    EuroPT,
+    FixedCurrency,
+    Lari,
+    PoundSterling,
+    RateTable,
+    USDollar,
+    Yen)
+
+
+@fixture
+def rates():
+    return RateTable({'USD': '1.25', 'GBP': '0.8', 'JPY': 160}, base='EUR')
+
+
+@mark.parametrize('from_code,to_code,rate', [
+    ('EUR', 'USD', Decimal('1.25')),
+    ('USD', 'EUR', Decimal('0.8')),
+    ('GBP', 'USD', Decimal('1.5625')),
+    ('USD', 'JPY', Decimal(128)),
+    ('JPY', 'JPY', Decimal(1)),
+    ('EUR', 'EUR', Decimal(1))
+])
+def test_rates_rate(rates, from_code, to_code, rate):
+    assert rates.rate(from_code, to_code) == rate
+    assert rates.rate(from_code, to_code) == rate
+
+
+def test_rates_table(rates):
+    assert len(rates) == 6
+    assert ('USD', 'EUR') in rates
+    assert ('USD', 'GBP') not in rates
+    assert rates.base == 'EUR'
+    assert rates.__repr__() == 'RateTable(base: "EUR", rates: 6)'
+    assert rates.rate('GBP', 'USD') == Decimal('1.5625')
+    rates.set('GBP', 'USD', '1.6')
+    assert rates.rate('GBP', 'USD') == Decimal('1.6')
+    assert rates.rate('USD', 'GBP') == Decimal('0.625')
+    assert rates.rate('JPY', 'GBP') == Decimal('0.005')
+    with raises(CurrencyRateException):
+        _ = rates.rate('EUR', 'CHF')
+    with raises(CurrencyRateException):
+        _ = RateTable({'USD': 1}).rate('USD', 'EUR')
+    for invalid in [0, '-1']:
+        with raises(ValueError):
+            rates.set('EUR', 'CHF', invalid)
+
+
+@mark.parametrize('currency,to_code,result', [
+    (Euro(10), 'USD', USDollar('12.5')),
+    (USDollar(10), 'GBP', PoundSterling('6.4')),
+    (EuroPT(10), 'EUR', Euro(10)),
+    (FixedCurrency(10, 'EUR'), 'JPY', Yen(1600)),
+    (Currency(1, 'GBP'), 'USD', USDollar('1.5625'))
+])
+def test_rates_convert(rates, currency, to_code, result):
+    converter = Converter(rates)
+    converted = converter.convert(currency, to_code)
+    assert converted == result
+    assert type(converted) is type(result)
+    assert converted.spec is result.spec
+    assert list(converter.convert_many([currency] * 2, to_code)) == [
+        result, result]
+
+
+def test_rates_convert_types(rates):
+    rates.set('EUR', 'GEL', 3)
+    rates.set('EUR', 'XBX', 2)
+    converter = Converter(rates, types={'USD': Currency})
+    assert converter.rates is rates
+    assert type(converter.convert(Euro(1), 'GEL')) is Lari
+    assert type(converter.convert(Euro(1), 'USD')) is Currency
+    other = converter.convert(Euro(1), 'XBX')
+    assert type(other) is Currency
+    assert other.alpha_code == 'XBX'
+    with raises(CurrencyTypeException):
+        _ = converter.convert(1, 'USD')
+    with raises(CurrencyTypeException):
+        _ = list(converter.convert_many([Euro(1), 1], 'USD'))
+    with raises(CurrencyRateException):
+        _ = converter.convert(Euro(1), 'CHF')
+
+
+@mark.parametrize('amounts,currency,to_code,units', [
+    (['1', '0.01', '-2.5'], Euro, 'USD', [125, 1, -312]),
+    (['1', '0.01', '-2.5'], Euro, 'JPY', [160, 2, -400]),
+    ([100, 3, -7], Yen, 'GBP', [50, 2, -4])
+])
+def test_rates_convert_array(rates, amounts, currency, to_code, units):
+    converter = Converter(rates)
+    array = CurrencyArray(amounts, currency)
+    converted = converter.convert_array(array, to_code)
+    assert list(converted.minor_units) == units
+    target = type(converter.convert(currency(0), to_code))
+    assert converted.spec is target(0).spec
+    assert type(converted[0]) is target
+
+
+def test_rates_lazy():
+    code = (
+        'import sys; from multicurrency.rates import Converter, RateTable;'
+        'from multicurrency import Euro;'
+        'Converter(RateTable({"USD": 2}, base="EUR")).convert(Euro(1), "USD");'
+        'print("multicurrency.arrays" in sys.modules, "numpy" in sys.modules)')
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    output = subprocess.run(
+        [sys.executable, '-c', code],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True).stdout
+    assert output.split() == ['False', 'False']
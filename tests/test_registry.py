@@ -0,0 +1,77 @@
+# -*- coding: UTF-8 -*-
+#
+# copyright: 2020-2022, Frederico Martins
+# author: Frederico Martins <http://github.com/fscm>
+# license: SPDX-License-Identifier: MIT
+
+"""Tests for the currency registry module."""
+
+import subprocess
+import sys
+from decimal import Decimal
+from pytest import mark, raises
+from multicurrency import (
+    CurrencyCodeException,
+    currencies,
+    currency_type,
+    from_code)
+
+
+@mark.parametrize('code,country,name', [
+    ('EUR', '', 'Euro'),
+    ('978', '', 'Euro'),
+    (978, '', 'Euro'),
+    ('EUR', 'Andorra', 'EuroAD'),
+    (978, 'Portugal', 'EuroPT'),
+    ('AUD', '', 'AustralianDollar'),
+    ('AUD', 'Kiribati', 'AustralianDollarKI'),
+    ('GEL', '', 'Lari'),
+    ('CAD', '', 'CanadianDollarEN'),
+    ('XBT', '', 'Bitcoin'),
+    (8, '', 'Lek')
+])
+def test_registry_currency_type(code, country, name):
+    assert currency_type(code, country) is getattr(currencies, name)
+
+
+@mark.parametrize('code,country', [
+    ('XXX', ''),
+    ('0', ''),
+    (0, ''),
+    ('eur', ''),
+    ('EUR', 'Japan')
+])
+def test_registry_currency_type_invalid(code, country):
+    with raises(CurrencyCodeException):
+        _ = currency_type(code, country)
+
+
+def test_registry_from_code():
+    euro = from_code('EUR', '1.5')
+    assert euro == currencies.Euro('1.5')
+    assert type(euro) is currencies.Euro
+    assert from_code(840, Decimal(2)).alpha_code == 'USD'
+    assert type(from_code('EUR', 1, 'Andorra')) is currencies.EuroAD
+
+
+def test_registry_codes():
+    for name in currencies.__all__:
+        currency = getattr(currencies, name)(0)
+        assert currency_type(currency.alpha_code)(0).alpha_code == (
+            currency.alpha_code)
+        if currency.numeric_code != '0':
+            assert currency_type(currency.numeric_code)(0).alpha_code == (
+                currency.alpha_code)
+
+
+def test_registry_lazy():
+    code = (
+        'import multicurrency.registry as r, multicurrency.currencies as c;'
+        'r.from_code("EUR", 1); r.from_code(784, 1);'
+        'print(sorted(n for n in c.__all__ if n in vars(c)))')
+    output = subprocess.run(
+        [sys.executable, '-c', code],
+        capture_output=True,
+        check=True,
+        text=True).stdout
+    assert output.strip() == "['Euro', 'UAEDirham']"